@@ -0,0 +1,189 @@
+"""
+Find the files affected by a list of changed files.
+
+The affected files are those that depend on the changed files, directly or
+indirectly, including the changed files themselves.  This can be used to run
+only the tests affected by a change, e.g.:
+
+  git diff --name-only | sfood-affected --tests -d deps - | xargs py.test
+
+The changed files are given as arguments, read from stdin ('-'), or obtained
+from git with --git.  The filenames read from stdin are relative to the top of
+the git repository, like those output by git diff, unless they exist relative
+to the current directory.  The dependencies are read from a dependencies file (see
+sfood), or if none is given, found by processing the given paths (or the
+current directory).
+"""
+# This file is part of the Snakefood open source package.
+# See http://furius.ca/snakefood/ for licensing details.
+
+import sys, os, re, logging
+from os.path import *
+from subprocess import Popen, PIPE
+
+from six import print_
+
+from snakefood.util import def_ignores, setup_logging
+from snakefood.depends import read_depends, InvalidDepends
+from snakefood.roots import find_roots
+from snakefood.gendeps import LiveDepends
+from snakefood.graphlib import DependencyGraph
+
+__all__ = ('ReverseIndex', 'git_changed_files', 'git_toplevel')
+
+
+# Default pattern for the names of test files.
+def_test_pattern = r'(^|/)(test_[^/]*|[^/]*_test)\.py$'
+
+
+class ReverseIndex(DependencyGraph):
+    """An index of the files that depend on each file of a dependency graph.
+
+    The reverse adjacency of the graph gives the nodes that depend on each
+    node, so that the reverse closure can be computed in time proportional to
+    its size.
+    """
+    def find_files(self, filenames):
+        """Return the set of ids of the nodes for the given filenames.  Filenames
+        that are not in the graph are ignored."""
+        bypath = dict((join(*node), i) for node, i in self.ids.iteritems()
+                      if node[0] is not None)
+        found = set()
+        for fn in filenames:
+            fn = realpath(fn)
+            if basename(fn) == '__init__.py':
+                fn = dirname(fn)
+            i = bypath.get(fn)
+            if i is None:
+                logging.info("File '%s' is not in the dependencies." % fn)
+            else:
+                found.add(i)
+        return found
+
+    def closure(self, ids):
+        "Return the set of ids of the nodes that depend on 'ids', transitively."
+        return self.reachable(ids, reverse=True)
+
+
+def git(*args):
+    "Run git with the given arguments and return the lines of its output."
+    p = Popen(('git',) + args, stdout=PIPE)
+    out, _ = p.communicate()
+    if p.returncode != 0:
+        raise SystemExit("Error running git %s." % ' '.join(args))
+    return out.splitlines()
+
+
+def git_toplevel():
+    """Return the top directory of the git repository of the current directory,
+    or None if it is not in one."""
+    try:
+        p = Popen(('git', 'rev-parse', '--show-toplevel'),
+                  stdout=PIPE, stderr=PIPE)
+    except OSError:
+        return None
+    out, _ = p.communicate()
+    if p.returncode != 0 or not out.strip():
+        return None
+    return out.splitlines()[0]
+
+
+def git_changed_files(rev):
+    """Return the list of the files changed since 'rev', according to git.  The
+    names output by git are relative to the top of the repository."""
+    topdir = git('rev-parse', '--show-toplevel')[0]
+    return [join(topdir, fn) for fn in git('diff', '--name-only', rev)]
+
+
+def scan_depends(paths, ignores, follow=False):
+    "Return the dependencies of the files under the given paths."
+    inroots = find_roots(paths, ignores)
+    basepath = sys.path
+    sys.path = inroots + sys.path
+    procargs = (0, True, False, None, 'ast')
+    live = LiveDepends(paths, ignores, inroots, basepath, procargs, follow=follow)
+    live.update(None)
+    return live.get_edges()
+
+
+def main():
+    import optparse
+    parser = optparse.OptionParser(__doc__.strip())
+
+    parser.add_option('-d', '--depends', action='store', metavar='FILE',
+                      help="Read the dependencies from the given file.")
+
+    parser.add_option('-s', '--scan', action='append', metavar='PATH',
+                      default=[],
+                      help="Find the dependencies of the files under the given "
+                      "path (default: the current directory).")
+
+    parser.add_option('-g', '--git', action='store', metavar='REV',
+                      help="Add the files changed since the given revision, "
+                      "according to git diff.")
+
+    parser.add_option('-t', '--tests', action='store_true',
+                      help="Only output the affected test files.")
+
+    parser.add_option('--test-pattern', action='store', default=def_test_pattern,
+                      help="Regular expression matching the names of test files, "
+                      "relative to their root (default: %default).")
+
+    parser.add_option('-I', '--ignore', dest='ignores', action='append',
+                      default=def_ignores,
+                      help="Add the given directory name to the list to be ignored.")
+
+    parser.add_option('--strict', action='store_true',
+                      help="Fail on the first invalid line of the dependencies "
+                      "instead of skipping it with a warning.")
+
+    parser.add_option('-v', '--verbose', action='count', default=0,
+                      help="Output more debugging information")
+    parser.add_option('-q', '--quiet', action='count', default=0,
+                      help="Output less debugging information")
+
+    opts, args = parser.parse_args()
+    opts.verbose -= opts.quiet
+    setup_logging(opts.verbose)
+
+    if opts.depends and opts.scan:
+        parser.error("Use either --depends or --scan, not both.")
+
+    # Get the list of changed files.
+    changed = []
+    for arg in args:
+        if arg == '-':
+            topdir = git_toplevel()
+            for fn in filter(None, (x.strip() for x in sys.stdin)):
+                # Note: the names output by git diff are relative to the top
+                # of the repository, not to the current directory.
+                if topdir is not None and not isabs(fn) and not exists(fn):
+                    fn = join(topdir, fn)
+                changed.append(fn)
+        else:
+            changed.append(arg)
+    if opts.git:
+        changed.extend(git_changed_files(opts.git))
+    if not changed:
+        logging.warning("No changed files.")
+
+    # Index the dependencies.
+    if opts.depends:
+        f = open(opts.depends)
+        try:
+            index = ReverseIndex(read_depends(f, opts.strict))
+        except InvalidDepends, e:
+            raise SystemExit(e)
+        finally:
+            f.close()
+    else:
+        index = ReverseIndex(scan_depends(opts.scan or ['.'], opts.ignores))
+
+    affected = index.closure(index.find_files(changed))
+
+    test_re = re.compile(opts.test_pattern)
+    nodes = index.nodes
+    for root, fn in sorted(nodes[i] for i in affected):
+        if opts.tests and not test_re.search(fn):
+            continue
+        print_(join(root, fn))
@@ -0,0 +1,103 @@
+"""
+Persistent on-disk cache for the imports extracted from source files.
+
+The cache maps a hash of a file's contents (plus the cache format version and
+the version of the Python grammar) to the list of import tuples and
+'__future__' features found in it, so that unchanged files do not need to be
+parsed again.  Entries are written atomically (write to a temporary file, then
+rename), so many processes can safely share a common cache directory.
+"""
+# This file is part of the Snakefood open source package.
+# See http://furius.ca/snakefood/ for licensing details.
+
+import os, sys, errno, marshal, tempfile, logging
+from os.path import *
+
+try:
+    from hashlib import sha1
+except ImportError:
+    from sha import new as sha1
+
+__all__ = ('ParseCache', 'CACHE_VERSION')
+
+
+# Version of the format of the cached values. Bump this whenever the extraction
+# code changes in a way that would produce different results for the same
+# source.
+CACHE_VERSION = 1
+
+
+class ParseCache(object):
+    """A directory of cached extraction results, keyed by content hash.
+
+    Values are stored with marshal and must therefore only contain basic types
+    (tuples, lists, sets, strings, numbers and None).
+    """
+    def __init__(self, dirname):
+        self.dirname = abspath(dirname)
+        self.hits = 0
+        self.misses = 0
+
+        # Files created by mkstemp() are private; make the entries readable
+        # by others according to the umask, for sharing the cache directory.
+        umask = os.umask(0)
+        os.umask(umask)
+        self.mode = 0666 & ~umask
+
+    def key(self, contents, *tags):
+        "Compute the cache key for the given source contents and tags."
+        h = sha1('%s:%d.%d:' % ((CACHE_VERSION,) + sys.version_info[:2]))
+        for tag in tags:
+            h.update('%s:' % tag)
+        h.update(contents)
+        return h.hexdigest()
+
+    def _filename(self, key):
+        return join(self.dirname, key[:2], key[2:])
+
+    def get(self, key):
+        "Return the value cached under 'key', or None if not present."
+        try:
+            f = open(self._filename(key), 'rb')
+            try:
+                value = marshal.load(f)
+            finally:
+                f.close()
+        except (IOError, OSError):
+            value = None
+        except (EOFError, ValueError, TypeError):
+            logging.debug("Ignoring corrupt cache entry '%s'." % key)
+            value = None
+
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def put(self, key, value):
+        "Store 'value' under 'key'. Errors are logged and otherwise ignored."
+        fn = self._filename(key)
+        dn = dirname(fn)
+        try:
+            try:
+                os.makedirs(dn)
+            except OSError, e:
+                if e.errno != errno.EEXIST:
+                    raise
+            fd, tmpfn = tempfile.mkstemp(dir=dn, prefix='.tmp')
+            try:
+                f = os.fdopen(fd, 'wb')
+                try:
+                    marshal.dump(value, f)
+                finally:
+                    f.close()
+                os.chmod(tmpfn, self.mode)
+                # Note: rename() is atomic, concurrent writers of the same
+                # entry write identical contents anyway.
+                os.rename(tmpfn, fn)
+            except:
+                os.remove(tmpfn)
+                raise
+        except (IOError, OSError, ValueError), e:
+            logging.warning("Could not write cache entry '%s': %s" % (fn, e))
@@ -86,9 +86,7 @@ def main():
 
         # (Optionally) Compute the list of names that are being assigned to.
         if opts.do_missing or opts.debug:
-            vis = AssignVisitor()
-            compiler.walk(ast, vis)
-            assign_names = vis.finalize()
+            assign_names = get_assigned_names(ast)
 
         # (Optionally) Check for potentially missing imports (this cannot be
         # precise, we are only providing a heuristic here).
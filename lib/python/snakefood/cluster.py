@@ -10,8 +10,8 @@ for relative filenames.
 import sys
 from itertools import imap
 
-from snakefood.fallback.collections import defaultdict
-from snakefood.depends import read_depends, output_depends
+from snakefood.depends import read_depends, InvalidDepends
+from snakefood.graphlib import DependencyGraph
 
 
 
@@ -43,24 +43,21 @@ def main():
     parser.add_option('-f', '--from-file', action='store',
                       help="Read cluster list from the given filename.")
 
+    parser.add_option('--strict', action='store_true',
+                      help="Fail on the first invalid line of the dependencies "
+                      "instead of skipping it with a warning.")
+
     opts, clusters = parser.parse_args()
 
     if opts.from_file:
         clusters.extend(read_clusters(opts.from_file))
 
-    depends = read_depends(sys.stdin)
-
-    clusfiles = defaultdict(set)
-    for (froot, f), (troot, t) in depends:
-        cfrom = apply_cluster(clusters, froot, f)
-        cto = apply_cluster(clusters, troot, t)
-
-        # Skip self-dependencies that may occur.
-        if cfrom == cto:
-            cto = (None, None)
-
-        clusfiles[cfrom].add(cto)
+    try:
+        graph = DependencyGraph(read_depends(sys.stdin, opts.strict))
+    except InvalidDepends, e:
+        raise SystemExit(e)
 
-    output_depends(clusfiles)
+    # Note: self-dependencies that may occur are replaced by (None, None).
+    graph.map_nodes(lambda node: apply_cluster(clusters, *node)).write()
 
 
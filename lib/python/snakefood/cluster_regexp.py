@@ -8,8 +8,8 @@ import sys
 import re
 from itertools import imap
 
-from snakefood.fallback.collections import defaultdict
-from snakefood.depends import read_depends, output_depends
+from snakefood.depends import read_depends, InvalidDepends
+from snakefood.graphlib import DependencyGraph
 
 
 def iterpairs(thelist):
@@ -21,6 +21,11 @@ def iterpairs(thelist):
 def main():
     import optparse
     parser = optparse.OptionParser(__doc__.strip())
+
+    parser.add_option('--strict', action='store_true',
+                      help="Fail on the first invalid line of the dependencies "
+                      "instead of skipping it with a warning.")
+
     opts, renames = parser.parse_args()
 
     if len(renames) % 2:
@@ -29,25 +34,17 @@ def main():
     renames = [(re.compile(regexp), target)
                for regexp, target in iterpairs(renames)]
 
-    depends = read_depends(sys.stdin)
-
-    clusfiles = defaultdict(set)
-    for (froot, f), (troot, t) in depends:
+    def rename_node(node):
+        root, fn = node
         for rename, target in renames:
-            if rename.match(f):
-                f = target
-                break
-        cfrom = (froot, f)
-        for rename, target in renames:
-            if t and rename.match(t):
-                t = target
-                break
-        cto = (troot, t)
-
-        # Skip self-dependencies that may occur.
-        if cfrom == cto:
-            cto = (None, None)
+            if fn and rename.match(fn):
+                return root, target
+        return node
 
-        clusfiles[cfrom].add(cto)
+    try:
+        graph = DependencyGraph(read_depends(sys.stdin, opts.strict))
+    except InvalidDepends, e:
+        raise SystemExit(e)
 
-    output_depends(clusfiles)
+    # Note: self-dependencies that may occur are replaced by (None, None).
+    graph.map_nodes(rename_node).write()
@@ -10,7 +10,8 @@ from os.path import *
 
 from six import print_
 
-from snakefood.depends import read_depends, flatten_depends
+from snakefood.depends import read_depends, InvalidDepends
+from snakefood.graphlib import DependencyGraph
 
 
 
@@ -26,6 +27,10 @@ def main():
     parser.add_option('-i', '--insert-package-inits', action='store_true',
                       help="Automatically create missing __init__.py in intervening directories.")
 
+    parser.add_option('--strict', action='store_true',
+                      help="Fail on the first invalid line of the dependencies "
+                      "instead of skipping it with a warning.")
+
     opts, args = parser.parse_args()
 
     if len(args) != 1:
@@ -36,9 +41,12 @@ def main():
         logging.error("Cannot overwrite '%s'." % dest)
         sys.exit(1)
 
-    depends = list(read_depends(sys.stdin))
+    try:
+        graph = DependencyGraph(read_depends(sys.stdin, opts.strict))
+    except InvalidDepends, e:
+        raise SystemExit(e)
 
-    for droot, drel in flatten_depends(depends):
+    for droot, drel in graph.flatten():
         srcfn = join(droot, drel)
         if isdir(srcfn):
             drel = join(drel, '__init__.py')
@@ -0,0 +1,344 @@
+"""
+A SQLite database of the dependencies, written by sfood --db.
+
+The database holds the graph output by the last run of sfood, in indexed
+tables, so that questions about the dependencies (see sfood-query) are answered
+without reading the whole graph:
+
+  nodes       The (root, path) nodes, with their full filename and the
+              directory of their package.  The special targets of the files
+              without dependencies and of the truncated files have a NULL
+              root.
+  edges       The (src, dst) dependencies, indexed both ways.
+  files       The metadata of the processed files: their size and
+              modification time when they were processed, and their number of
+              imports and errors.
+  imports     The imports of the processed files, when available: their line,
+              kind and module, and the node they resolve to.
+  unresolved  The names of the imports that could not be resolved.
+
+Updating the database from a run only touches the rows that changed: the
+edges of the files whose dependencies have not changed, and the metadata of
+the files that have not changed, are left as they are.
+"""
+# This file is part of the Snakefood open source package.
+# See http://furius.ca/snakefood/ for licensing details.
+
+import os, logging
+from os.path import *
+from itertools import groupby
+from operator import itemgetter
+
+from snakefood.find import ERROR_IMPORT
+
+__all__ = ('DependencyDB', 'DB_VERSION', 'node_package')
+
+
+# Version of the schema of the database.
+DB_VERSION = 1
+
+schema = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS nodes (
+    id INTEGER PRIMARY KEY,
+    root TEXT,
+    path TEXT,
+    filename TEXT,
+    package TEXT
+);
+CREATE UNIQUE INDEX IF NOT EXISTS nodes_key ON nodes (root, path);
+CREATE INDEX IF NOT EXISTS nodes_filename ON nodes (filename);
+CREATE INDEX IF NOT EXISTS nodes_package ON nodes (root, package);
+CREATE TABLE IF NOT EXISTS edges (
+    src INTEGER NOT NULL,
+    dst INTEGER NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS edges_src ON edges (src, dst);
+CREATE INDEX IF NOT EXISTS edges_dst ON edges (dst, src);
+CREATE TABLE IF NOT EXISTS files (
+    node INTEGER PRIMARY KEY,
+    filename TEXT NOT NULL,
+    size INTEGER,
+    mtime REAL,
+    nimports INTEGER,
+    nerrors INTEGER
+);
+CREATE TABLE IF NOT EXISTS imports (
+    node INTEGER NOT NULL,
+    line INTEGER,
+    kind TEXT,
+    module TEXT,
+    dst INTEGER
+);
+CREATE INDEX IF NOT EXISTS imports_node ON imports (node);
+CREATE TABLE IF NOT EXISTS unresolved (
+    node INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    line INTEGER
+);
+CREATE INDEX IF NOT EXISTS unresolved_node ON unresolved (node);
+CREATE INDEX IF NOT EXISTS unresolved_name ON unresolved (name);
+"""
+
+
+def node_package(path):
+    """Return the directory of the package of node 'path', relative to its root:
+    the path of a package directory, or the directory of a module."""
+    if path is None:
+        return None
+    if splitext(path)[1]:
+        return dirname(path)
+    return path
+
+
+def _text(s):
+    "Return 's' as a string that SQLite stores as TEXT."
+    if isinstance(s, str):
+        return s.decode('utf8', 'replace')
+    return s
+
+
+class DependencyDB(object):
+    """A SQLite database of dependencies, in file 'filename'.  Raise a
+    ValueError if the file is not a database of a known version."""
+
+    def __init__(self, filename):
+        import sqlite3
+        self.filename = filename
+        self.conn = sqlite3.connect(filename)
+        self.conn.text_factory = str
+        try:
+            self.conn.executescript(schema)
+            row = self.conn.execute(
+                "SELECT value FROM meta WHERE key = 'version'").fetchone()
+        except sqlite3.DatabaseError, e:
+            raise ValueError("Invalid database '%s': %s" % (filename, e))
+        if row is None:
+            self.conn.execute("INSERT INTO meta VALUES ('version', ?)",
+                              (str(DB_VERSION),))
+            self.conn.commit()
+        elif row[0] != str(DB_VERSION):
+            raise ValueError("Database '%s' has version %s, not %d." %
+                             (filename, row[0], DB_VERSION))
+        self.ids = None       # (root, path) -> node id
+        self.changed = 0
+
+    def close(self):
+        self.conn.close()
+
+    def node_id(self, node):
+        "Return the id of 'node', adding it if necessary."
+        try:
+            return self.ids[node]
+        except KeyError:
+            pass
+        root, path = node
+        filename = join(root, path) if root is not None else None
+        cursor = self.conn.execute(
+            "INSERT INTO nodes (root, path, filename, package) "
+            "VALUES (?, ?, ?, ?)",
+            (_text(root), _text(path), _text(filename),
+             _text(node_package(path) if root is not None else None)))
+        i = self.ids[node] = cursor.lastrowid
+        return i
+
+    def update(self, allfiles, files):
+        """Update the database to the dictionary of (from -> list of targets)
+        'allfiles', and the metadata of the processed 'files', a list of
+        (filename, node, errors, details) tuples, where 'details' are those of
+        resolve_imports(), or None if not available."""
+        conn = self.conn
+        execute = conn.execute
+        self.changed = 0
+        self.ids = dict(((root, path), i) for i, root, path in execute(
+            "SELECT id, root, path FROM nodes"))
+
+        # The edges.
+        old = {}
+        for src, rows in groupby(execute("SELECT src, dst FROM edges "
+                                         "ORDER BY src, dst"), itemgetter(0)):
+            old[src] = set(dst for _, dst in rows)
+        new = {}
+        for from_, targets in allfiles.iteritems():
+            new[self.node_id(from_)] = set(map(self.node_id, targets))
+        edited = set(old) - set(new)    # the sources whose edges changed
+        for src in edited:
+            execute("DELETE FROM edges WHERE src = ?", (src,))
+            self.changed += 1
+        for src, dsts in new.iteritems():
+            olddsts = old.get(src, set())
+            if dsts == olddsts:
+                continue
+            edited.add(src)
+            self.changed += 1
+            conn.executemany("DELETE FROM edges WHERE src = ? AND dst = ?",
+                             [(src, dst) for dst in olddsts - dsts])
+            conn.executemany("INSERT INTO edges VALUES (?, ?)",
+                             [(src, dst) for dst in dsts - olddsts])
+
+        # The metadata of the files.  How the imports of a file resolve also
+        # depends on the other files, so the rows of a file are rewritten if its
+        # edges or its resolved imports changed, even if the file did not.
+        oldfiles = dict((node, (filename, size, mtime))
+                        for node, filename, size, mtime in execute(
+                            "SELECT node, filename, size, mtime FROM files"))
+        newfiles = set()
+        for fn, node, errors, details in files:
+            try:
+                st = os.stat(fn)
+            except OSError:
+                continue
+            i = self.node_id(node)
+            newfiles.add(i)
+            stamp = (fn, st.st_size, st.st_mtime)
+            if details is not None:
+                imports = [(lineno, kind, modname, self.file_id(modfile))
+                           for lineno, kind, modname, modfile, _ in details]
+                unresolved = [(name, lineno)
+                              for lineno, _, _, _, name in details if name]
+            else:
+                # Note: the details are not available for the results reused
+                # from a state file, whose imports resolve as before.
+                imports = None
+                unresolved = [(name, None)
+                              for err, name in errors if err == ERROR_IMPORT]
+            if (oldfiles.get(i) == stamp and i not in edited and
+                (imports is None or self.file_rows(i) == (imports, unresolved))):
+                continue
+            self.changed += 1
+            self.delete_file(i)
+            execute("INSERT INTO files VALUES (?, ?, ?, ?, ?, ?)",
+                    (i, _text(fn), st.st_size, st.st_mtime,
+                     len(imports) if imports is not None else None,
+                     len(errors)))
+            if imports is not None:
+                conn.executemany("INSERT INTO imports VALUES (?, ?, ?, ?, ?)",
+                                 [(i,) + row for row in imports])
+            conn.executemany("INSERT INTO unresolved VALUES (?, ?, ?)",
+                             [(i,) + row for row in unresolved])
+        for i in set(oldfiles) - newfiles:
+            self.changed += 1
+            self.delete_file(i)
+
+        # Remove the nodes that are no longer used.
+        execute("DELETE FROM nodes WHERE id NOT IN (SELECT src FROM edges) "
+                "AND id NOT IN (SELECT dst FROM edges) "
+                "AND id NOT IN (SELECT node FROM files) "
+                "AND id NOT IN (SELECT dst FROM imports WHERE dst IS NOT NULL)")
+        conn.commit()
+        self.ids = None
+
+    def file_id(self, fn):
+        "Return the id of the node of file 'fn', if it is in the graph."
+        if fn is None:
+            return None
+        if basename(fn) == '__init__.py':
+            fn = dirname(fn)
+        row = self.conn.execute("SELECT id FROM nodes WHERE filename = ?",
+                                (_text(fn),)).fetchone()
+        return row[0] if row else None
+
+    def file_rows(self, i):
+        "Return the (imports, unresolved) rows of the file of node 'i'."
+        execute = self.conn.execute
+        return (execute("SELECT line, kind, module, dst FROM imports "
+                        "WHERE node = ? ORDER BY rowid", (i,)).fetchall(),
+                execute("SELECT name, line FROM unresolved "
+                        "WHERE node = ? ORDER BY rowid", (i,)).fetchall())
+
+    def delete_file(self, i):
+        "Delete the metadata of the file of node 'i'."
+        for table in 'files', 'imports', 'unresolved':
+            self.conn.execute("DELETE FROM %s WHERE node = ?" % table, (i,))
+
+    def iter_depends(self):
+        "Generate the ((root, fn), (root, fn)) dependencies, in sorted order."
+        query = """
+            SELECT s.root, s.path, d.root, d.path
+            FROM edges e JOIN nodes s ON s.id = e.src JOIN nodes d ON d.id = e.dst
+            ORDER BY s.root, s.path, d.root, d.path
+            """
+        for sroot, spath, droot, dpath in self.conn.execute(query):
+            yield (sroot, spath), (droot, dpath)
+
+    def find_files(self, filenames):
+        """Return the list of ids of the nodes for the given filenames.
+        Filenames that are not in the graph are ignored."""
+        found = []
+        for fn in filenames:
+            i = self.file_id(realpath(fn))
+            if i is None:
+                logging.warning("File '%s' is not in the dependencies." % fn)
+            elif i not in found:
+                found.append(i)
+        return found
+
+    def depends(self, ids, reverse=False, transitive=False):
+        """Return the sorted filenames of the nodes that the nodes 'ids' depend
+        on, or that depend on them if 'reverse' is true, directly or
+        transitively, excluding the nodes 'ids' themselves."""
+        if not ids:
+            return []
+        src, dst = ('dst', 'src') if reverse else ('src', 'dst')
+        idlist = ', '.join(map(str, ids))
+        if transitive:
+            query = """
+                WITH RECURSIVE reach(id) AS (
+                    SELECT id FROM nodes WHERE id IN (%s)
+                    UNION SELECT e.%s FROM edges e JOIN reach r ON e.%s = r.id)
+                SELECT n.filename FROM reach JOIN nodes n ON n.id = reach.id
+                WHERE n.root IS NOT NULL AND n.id NOT IN (%s)
+                ORDER BY n.filename
+                """ % (idlist, dst, src, idlist)
+        else:
+            query = """
+                SELECT DISTINCT n.filename FROM edges e JOIN nodes n ON n.id = e.%s
+                WHERE e.%s IN (%s) AND n.root IS NOT NULL AND n.id NOT IN (%s)
+                ORDER BY n.filename
+                """ % (dst, src, idlist, idlist)
+        return [fn for fn, in self.conn.execute(query)]
+
+    def find_path(self, start, end):
+        """Return the filenames of the nodes of a shortest path of dependencies
+        from node 'start' to node 'end', or None if there is none."""
+        execute = self.conn.execute
+        parents = {start: None}
+        level = [start]
+        while level and end not in parents:
+            nextlevel = []
+            for i in level:
+                for j, in execute("SELECT dst FROM edges WHERE src = ?", (i,)):
+                    if j not in parents:
+                        parents[j] = i
+                        nextlevel.append(j)
+            level = nextlevel
+        if end not in parents:
+            return None
+        path = []
+        i = end
+        while i is not None:
+            path.append(execute("SELECT filename FROM nodes WHERE id = ?",
+                                (i,)).fetchone()[0])
+            i = parents[i]
+        path.reverse()
+        return path
+
+    def fan(self):
+        """Return the list of (package, fan-in, fan-out) of the packages, sorted
+        by package: the numbers of distinct other packages that depend on the
+        package, and that the package depends on."""
+        counts = {}
+        for column, (src, dst) in enumerate((('dst', 'src'), ('src', 'dst'))):
+            for root, package, count in self.conn.execute("""
+                SELECT s.root, s.package, COUNT(DISTINCT d.root || '/' || d.package)
+                FROM edges e JOIN nodes s ON s.id = e.%s JOIN nodes d ON d.id = e.%s
+                WHERE s.root IS NOT NULL AND d.root IS NOT NULL
+                  AND (d.root != s.root OR d.package != s.package)
+                GROUP BY s.root, s.package
+                """ % (src, dst)):
+                counts.setdefault((root, package), [0, 0])[column] = count
+        return [(join(root, package) if package else root, fanin, fanout)
+                for (root, package), (fanin, fanout) in sorted(counts.iteritems())]
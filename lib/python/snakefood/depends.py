@@ -4,24 +4,150 @@ Routines that manipulate, read and convert lists of dependencies.
 # This file is part of the Snakefood open source package.
 # See http://furius.ca/snakefood/ for licensing details.
 
-import sys, logging
+import sys, re, zlib, logging
 from operator import itemgetter
+from itertools import chain
+from cStringIO import StringIO
 
+from snakefood.sfb import is_binary, iter_sfb, write_sfb, compress, decompress
+from snakefood.sfb import SFB_MAGIC
+from snakefood.jsonl import is_jsonl, parse_record
 
+__all__ = ('read_depends', 'parse_depends', 'output_depends',
+           'eliminate_redundant_depends', 'flatten_depends', 'TRUNCATED',
+           'InvalidDepends')
 
-def read_depends(f):
-    "Generator for the dependencies read from the given file object."
-    for line in f:
-        try:
-            yield eval(line)
-        except Exception:
-            logging.warning("Invalid line: '%s'" % line)
 
-def output_depends(depdict):
+# The target of the marker edges of the files whose dependencies were not
+# followed because of the limits of --follow-depth and --follow-roots.
+TRUNCATED = (None, '...')
+
+# The lines output by output_depends(): the repr() of a pair of (root, fn)
+# pairs of strings or None.
+_value = r"""(None|u?'[^'\\]*(?:\\.[^'\\]*)*'|u?"[^"\\]*(?:\\.[^"\\]*)*")"""
+line_re = re.compile(
+    r'\s*\(\s*\(\s*%s\s*,\s*%s\s*\)\s*,\s*\(\s*%s\s*,\s*%s\s*\)\s*\)\s*$' %
+    ((_value,) * 4))
+
+
+class InvalidDepends(ValueError):
+    "A line of a dependencies file is not valid."
+
+
+def parse_value(s):
+    "Return the value of the repr() 's' of a string or None."
+    if s == 'None':
+        return None
+    if s[0] == 'u':
+        s = s[2:-1]
+        return s.decode('unicode_escape') if '\\' in s else unicode(s)
+    s = s[1:-1]
+    return s.decode('string_escape') if '\\' in s else s
+
+
+def parse_depends(line, roots=None):
+    """Parse a line of a dependencies file, without evaluating it.  Return the
+    ((root, fn), (root, fn)) dependency, or None if the line is not valid.  If
+    a dictionary 'roots' is given, the root strings are interned in it."""
+    if roots is None:
+        roots = {}
+
+    # Fast path for the lines without escapes, as output by output_depends().
+    if '\\' not in line:
+        parts = line.split("'")
+        nparts = len(parts)
+        if nparts == 9:
+            if (parts[0] == '((' and parts[2] == ', ' and parts[4] == '), (' and
+                parts[6] == ', ' and parts[8].rstrip() == '))'):
+                froot, troot = parts[1], parts[5]
+                return ((roots.setdefault(froot, froot), parts[3]),
+                        (roots.setdefault(troot, troot), parts[7]))
+        elif nparts == 5:
+            if (parts[0] == '((' and parts[2] == ', ' and
+                parts[4].rstrip() == '), (None, None))'):
+                froot = parts[1]
+                return (roots.setdefault(froot, froot), parts[3]), (None, None)
+
+    mo = line_re.match(line)
+    if mo is None:
+        return None
+    froot, ffn, troot, tfn = map(parse_value, mo.groups())
+    return ((roots.setdefault(froot, froot), ffn),
+            (roots.setdefault(troot, troot), tfn))
+
+
+def read_depends(f, strict=False, name=None):
+    """Generator for the dependencies read from the given file object, or
+    iterable of lines.  Files in the sfb and jsonl formats and compressed files
+    are detected (see snakefood.sfb and snakefood.jsonl).  Invalid lines are
+    skipped with a warning, or if 'strict' is true, raise InvalidDepends.
+    'name' is the name of the file for the messages."""
+    if name is None:
+        name = getattr(f, 'name', '<input>')
+    if hasattr(f, 'readline'):
+        head = f.readline()
+        if is_binary(head):
+            try:
+                data = decompress(head + f.read())
+            except (ValueError, IOError, zlib.error), e:
+                raise InvalidDepends("%s: %s" % (name, e))
+            if data.startswith(SFB_MAGIC):
+                try:
+                    for dep in iter_sfb(data):
+                        yield dep
+                except ValueError, e:
+                    raise InvalidDepends("%s: %s" % (name, e))
+                return
+            f = data.splitlines(True)
+        else:
+            f = chain([head], f)
+    f = iter(f)
+    try:
+        head = next(f)
+    except StopIteration:
+        return
+    f = chain([head], f)
+
+    roots = {}
+    jsonl = is_jsonl(head)
+    for lineno, line in enumerate(f, 1):
+        if jsonl:
+            if not line.strip():
+                continue
+            try:
+                dep = parse_record(line, roots)
+            except ValueError:
+                dep = False
+            if dep is None:
+                continue
+        else:
+            dep = parse_depends(line, roots)
+        if not dep:
+            if not line.strip():
+                continue
+            msg = "%s:%d: Invalid line: '%s'" % (name, lineno, line.rstrip('\n'))
+            if strict:
+                raise InvalidDepends(msg)
+            logging.warning(msg)
+            continue
+        yield dep
+
+def output_depends(depdict, outfile=None, format='text', compression=None):
     """Given a dictionary of (from -> list of targets), generate an appropriate
-    output file."""
+    output file.  The output goes to stdout, unless 'outfile' is given.
+    'format' is 'text' or 'sfb', and 'compression' None, 'gzip' or 'zstd'."""
+    outfile = outfile or sys.stdout
+    if compression is not None:
+        buf = StringIO()
+        output_depends(depdict, buf, format)
+        outfile.write(compress(buf.getvalue(), compression))
+        return
+    if format == 'sfb':
+        write_sfb(depdict, outfile)
+        return
+
     # Output the dependencies.
-    write = sys.stdout.write
+    write = outfile.write
     for (from_root, from_), targets in sorted(depdict.iteritems(),
                                              key=itemgetter(0)):
         for to_root, to_ in sorted(targets):
@@ -43,7 +169,7 @@ def flatten_depends(depends):
     """Yield the list of dependency pairs to a single list of (root, relfn)
     pairs, in the order that they appear. The list is guaranteed to be unique
     (we remove duplicates)."""
-    seen = set([(None, None)])
+    seen = set([(None, None), TRUNCATED])
     for dep in depends:
         for pair in dep:
             if pair in seen:
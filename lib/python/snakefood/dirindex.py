@@ -0,0 +1,153 @@
+"""
+An index of directory listings, used to find modules without probing.
+
+Finding a module with the import machinery (imp.find_module) tries to open a
+file for every possible suffix in every directory of the search path.  This
+index instead lists each directory once and answers the lookups of module names
+from an in-memory map of names to their kind (package, source module, compiled
+module or extension).  The semantics follow those of the import machinery: in
+each directory, a package takes precedence over modules, and modules are
+searched for in the order of imp.get_suffixes().
+"""
+# This file is part of the Snakefood open source package.
+# See http://furius.ca/snakefood/ for licensing details.
+
+import os, sys, imp
+from os.path import *
+
+__all__ = ('DirectoryIndex',)
+
+
+# Kinds of modules found in a directory.
+PACKAGE = imp.PKG_DIRECTORY
+SOURCE = imp.PY_SOURCE
+COMPILED = imp.PY_COMPILED
+EXTENSION = imp.C_EXTENSION
+
+# The suffixes of module files, in order of precedence.
+suffixes = [(suffix, kind) for suffix, _, kind in imp.get_suffixes()]
+
+# Files that make a directory a package.
+init_files = ('__init__.py', '__init__.pyc')
+
+
+class Listing(object):
+    "A snapshot of the contents of a single directory."
+
+    def __init__(self, dn):
+        try:
+            self.mtime = os.stat(dn).st_mtime
+            names = os.listdir(dn)
+        except OSError:
+            self.mtime = None
+            names = []
+        self.entries = frozenset(names)
+
+        # Map of module name to (kind, filename), for module files.  Packages
+        # are detected lazily, see DirectoryIndex.find_in_dir().
+        self.modules = {}
+        ranks = {}
+        for name in names:
+            for rank, (suffix, kind) in enumerate(suffixes):
+                if name.endswith(suffix):
+                    modname = name[:-len(suffix)]
+                    if rank < ranks.get(modname, len(suffixes)):
+                        ranks[modname] = rank
+                        self.modules[modname] = (kind, join(dn, name))
+        self.packages = {}
+
+
+class DirectoryIndex(object):
+    """An index of the directories in which modules are searched for.
+
+    If 'revalidate' is true, the modification time of a directory is checked on
+    each lookup, and the directory is listed again if it has changed.
+    """
+    def __init__(self, revalidate=False):
+        self.revalidate = revalidate
+        self.listings = {}
+        self.zipimporters = {}
+
+    def listing(self, dn):
+        "Return the listing for directory 'dn'."
+        dn = dn or os.curdir
+        try:
+            listing = self.listings[dn]
+        except KeyError:
+            listing = self.listings[dn] = Listing(dn)
+        else:
+            if self.revalidate:
+                try:
+                    mtime = os.stat(dn).st_mtime
+                except OSError:
+                    mtime = None
+                if mtime != listing.mtime:
+                    listing = self.listings[dn] = Listing(dn)
+        return listing
+
+    def clear(self):
+        "Forget all the directory listings."
+        self.listings.clear()
+        self.zipimporters.clear()
+
+    def find_module(self, name, parentdir=None):
+        """Find module 'name' in directory 'parentdir', or on sys.path if it is
+        None.  Returns the filename of the module, or of the '__init__' module
+        for packages.  Returns None if the module is not found, or if it has no
+        filename (e.g. builtins and modules in zip files)."""
+        if parentdir is not None:
+            return self.find_in_dir(name, parentdir)
+
+        if name in sys.builtin_module_names:
+            return None
+        for dn in sys.path:
+            listing = self.listing(dn)
+            if listing.mtime is None:
+                if self.find_in_zip(name, dn):
+                    return None
+                continue
+            fn = self.find_in_dir(name, dn, listing)
+            if fn is not None:
+                return fn
+
+    def find_in_dir(self, name, dn, listing=None):
+        "Find module 'name' in directory 'dn'."
+        dn = dn or os.curdir
+        if listing is None:
+            listing = self.listing(dn)
+        if name not in listing.entries and name not in listing.modules:
+            return None
+
+        # Check for a package.
+        try:
+            pkgdir = listing.packages[name]
+        except KeyError:
+            pkgdir = None
+            if name in listing.entries:
+                subdn = join(dn, name)
+                sublisting = self.listing(subdn)
+                for initfn in init_files:
+                    if initfn in sublisting.entries and isfile(join(subdn, initfn)):
+                        pkgdir = subdn
+                        break
+            listing.packages[name] = pkgdir
+        if pkgdir is not None:
+            return self.find_in_dir('__init__', pkgdir)
+
+        try:
+            return listing.modules[name][1]
+        except KeyError:
+            return None
+
+    def find_in_zip(self, name, archive):
+        "Return true if 'name' can be imported from the zip file 'archive'."
+        try:
+            importer = self.zipimporters[archive]
+        except KeyError:
+            try:
+                from zipimport import zipimporter, ZipImportError
+                importer = zipimporter(archive)
+            except (ImportError, ZipImportError):
+                importer = None
+            self.zipimporters[archive] = importer
+        return importer is not None and importer.find_module(name) is not None
@@ -0,0 +1,292 @@
+"""
+An index of the installed distributions, for resolving third-party imports.
+
+The metadata of the distributions installed in the directories of the module
+search path (the RECORD files of '.dist-info' directories, and the
+installed-files.txt files of '.egg-info' directories) list the files that they
+installed.  From these, the index maps the name of each module to its file,
+and each file to its distribution, so that the modules of the distributions
+are found with a dictionary lookup instead of probing every entry of the search
+path, and so that the dependencies can be aggregated by distribution.
+
+Reading the metadata of all the distributions takes time, so the index is
+cached on disk, for each directory, and read again from the metadata only
+for the directories whose modification time has changed, i.e. when
+distributions have been installed or removed.
+"""
+# This file is part of the Snakefood open source package.
+# See http://furius.ca/snakefood/ for licensing details.
+
+import os, sys, re, errno, marshal, tempfile, logging
+from os.path import *
+
+from snakefood.fscache import fscache
+
+__all__ = ('Distribution', 'DistributionIndex', 'read_distribution',
+           'default_cache_dir')
+
+
+# Version of the format of the cache file.
+INDEX_VERSION = 1
+
+try:
+    from importlib.machinery import EXTENSION_SUFFIXES
+except ImportError:
+    import imp
+    EXTENSION_SUFFIXES = [suffix for suffix, _, kind in imp.get_suffixes()
+                          if kind == imp.C_EXTENSION]
+
+identifier_re = re.compile('[A-Za-z_][A-Za-z0-9_]*$')
+
+metadata_suffixes = ('.dist-info', '.egg-info')
+
+
+def default_cache_dir():
+    "Return the default directory for the cache of the index."
+    return join(os.environ.get('XDG_CACHE_HOME') or expanduser('~/.cache'),
+                'snakefood')
+
+
+class Distribution(object):
+    """An installed distribution: its name and version, the directory where it
+    is installed, the name of its metadata directory, and the map of the names
+    of its modules to their filenames, relative to 'sitedir'."""
+
+    def __init__(self, name, version, sitedir, metadir, modules):
+        self.name = name
+        self.version = version
+        self.sitedir = sitedir
+        self.metadir = metadir
+        self.modules = modules
+
+    def __repr__(self):
+        return '<Distribution %s %s>' % (self.name, self.version)
+
+    def node(self):
+        "Return the (root, relfn) node that stands for the distribution."
+        return self.sitedir, self.metadir
+
+
+def read_distribution(sitedir, metadir):
+    """Read the metadata of the distribution in metadata directory 'metadir' of
+    directory 'sitedir'.  Return None if it is not readable."""
+    mdn = join(sitedir, metadir)
+    if metadir.endswith('.dist-info'):
+        headers = read_headers(join(mdn, 'METADATA'))
+        files = [line.split(',')[0] for line in read_lines(join(mdn, 'RECORD'))]
+    else:
+        headers = read_headers(join(mdn, 'PKG-INFO'))
+        files = [normpath(join(metadir, x))
+                 for x in read_lines(join(mdn, 'installed-files.txt'))]
+    if headers is None:
+        return None
+
+    name, version = headers.get('Name'), headers.get('Version')
+    if not name:
+        name, _, version = metadir.rsplit('.', 1)[0].partition('-')
+        version = version.split('-')[0]
+    return Distribution(name, version, sitedir, metadir, module_files(files))
+
+
+def read_lines(fn):
+    "Return the non-empty lines of file 'fn', or an empty list."
+    try:
+        f = open(fn)
+        try:
+            return filter(None, (x.strip() for x in f))
+        finally:
+            f.close()
+    except IOError:
+        return []
+
+
+def read_headers(fn):
+    "Return the map of the headers of metadata file 'fn', or None."
+    try:
+        f = open(fn)
+    except IOError:
+        return None
+    headers = {}
+    try:
+        for line in f:
+            line = line.rstrip('\r\n')
+            if not line:
+                break
+            name, sep, value = line.partition(':')
+            if sep and not name.startswith((' ', '\t')):
+                headers.setdefault(name, value.strip())
+    finally:
+        f.close()
+    return headers
+
+
+def module_files(files):
+    """Return the map of the names of the modules found in the list of
+    filenames 'files' (relative to the installation directory) to their
+    filenames.  Packages take precedence over modules, and extension modules
+    over source modules, like with the import machinery.  Note that the
+    packages of the modules may be installed by other distributions."""
+    found = {}  # name -> (precedence, filename)
+    for fn in files:
+        comps = fn.split('/')
+        last = comps[-1]
+        for suffix in ['.py'] + EXTENSION_SUFFIXES:
+            if last.endswith(suffix):
+                modname = last[:-len(suffix)]
+                break
+        else:
+            continue
+        if modname == '__init__':
+            comps, prec = comps[:-1], 2
+        else:
+            comps, prec = comps[:-1] + [modname], int(suffix != '.py')
+        if not comps or not all(identifier_re.match(x) for x in comps):
+            continue # e.g. scripts installed in '../../../bin'.
+        name = '.'.join(comps)
+        if prec > found.get(name, (-1,))[0]:
+            found[name] = (prec, fn)
+    return dict((name, fn) for name, (_, fn) in found.iteritems())
+
+
+class DistributionIndex(object):
+    """The index of the distributions installed in the given directories, in
+    the order of the module search path.
+
+    When more than one directory provides a top-level name, the first one
+    wins, as with the search path.  Within a directory, distributions can
+    share a top-level package (e.g. namespace packages).
+    """
+    def __init__(self, path, cachefn=None):
+        self.cachefn = cachefn
+        self.sitedirs = []      # The directories with distributions.
+        self.dists = []
+        self.toplevel = {}      # top-level name -> sitedir
+        self.modules = {}       # sitedir -> (module name -> relative filename)
+        self.owners = {}        # filename or package directory -> Distribution
+        self.shadows = {}       # top-level name -> result of shadowing check
+
+        cached = self.load()
+        updated = dict(cached)
+        for dn in path:
+            dn = fscache.realpath(dn or os.curdir)
+            if dn in self.modules:
+                continue
+            entry = self.read_dir(dn, cached.get(dn))
+            if entry is None:
+                continue
+            updated[dn] = entry
+            if entry[1]:
+                self.add_dir(dn, entry[1])
+        if updated != cached:
+            self.save(updated)
+
+    def read_dir(self, dn, cached):
+        """Return a pair of the modification time of directory 'dn' and the list
+        of the distributions in it, or None if it has no distributions.  'cached'
+        is the pair from the cache, or None."""
+        listing = fscache.listing(dn)
+        if listing is None:
+            return None
+        metadirs = sorted(x for x in listing[0] if x.endswith(metadata_suffixes))
+        if not metadirs:
+            return None
+        try:
+            mtime = os.stat(dn).st_mtime
+        except OSError:
+            return None
+        if cached is not None and cached[0] == mtime:
+            return cached
+
+        logging.info("Indexing the distributions in '%s'." % dn)
+        dists = []
+        for metadir in metadirs:
+            if not fscache.isdir(join(dn, metadir)):
+                continue
+            dist = read_distribution(dn, metadir)
+            if dist is not None:
+                dists.append((dist.name, dist.version, metadir, dist.modules))
+        return mtime, dists
+
+    def add_dir(self, dn, dists):
+        "Add the distributions found in directory 'dn'."
+        self.sitedirs.append(dn)
+        modules = self.modules[dn] = {}
+        for name, version, metadir, distmods in dists:
+            dist = Distribution(name, version, dn, metadir, distmods)
+            self.dists.append(dist)
+            for modname, relfn in distmods.iteritems():
+                modules.setdefault(modname, relfn)
+                fn = join(dn, relfn)
+                self.owners.setdefault(fn, dist)
+                if basename(fn) == '__init__.py':
+                    self.owners.setdefault(dirname(fn), dist)
+
+        # Keep only the modules within packages, which can be imported.
+        for modname in sorted(modules, key=len):
+            parent = modname.rpartition('.')[0]
+            if parent and not (parent in modules and
+                               modules[parent].endswith('__init__.py')):
+                del modules[modname]
+            else:
+                self.toplevel.setdefault(modname.split('.')[0], dn)
+
+    def lookup(self, modname):
+        """Return the directory that provides the top-level package of
+        'modname', or None if no distribution provides it."""
+        return self.toplevel.get(modname.split('.')[0])
+
+    def find_module(self, modname):
+        "Return the filename of module 'modname', or None if not found."
+        dn = self.lookup(modname)
+        if dn is not None:
+            relfn = self.modules[dn].get(modname)
+            if relfn is not None:
+                return join(dn, relfn)
+
+    def distribution(self, fn):
+        "Return the distribution that installed file or package 'fn', or None."
+        return self.owners.get(fn)
+
+    def load(self):
+        "Return the cached directories, or an empty map."
+        if self.cachefn is None:
+            return {}
+        try:
+            f = open(self.cachefn, 'rb')
+            try:
+                version, dirs = marshal.load(f)
+            finally:
+                f.close()
+        except (IOError, OSError):
+            return {}
+        except (EOFError, ValueError, TypeError):
+            logging.debug("Ignoring corrupt index '%s'." % self.cachefn)
+            return {}
+        if version != INDEX_VERSION:
+            return {}
+        return dirs
+
+    def save(self, dirs):
+        "Save the given directories to the cache, atomically."
+        if self.cachefn is None:
+            return
+        dn = dirname(self.cachefn)
+        try:
+            try:
+                os.makedirs(dn)
+            except OSError, e:
+                if e.errno != errno.EEXIST:
+                    raise
+            fd, tmpfn = tempfile.mkstemp(dir=dn, prefix='.tmp')
+            try:
+                f = os.fdopen(fd, 'wb')
+                try:
+                    marshal.dump((INDEX_VERSION, dirs), f)
+                finally:
+                    f.close()
+                os.rename(tmpfn, self.cachefn)
+            except:
+                os.remove(tmpfn)
+                raise
+        except (IOError, OSError, ValueError), e:
+            logging.warning("Could not write index '%s': %s" % (self.cachefn, e))
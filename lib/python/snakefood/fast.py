@@ -0,0 +1,296 @@
+"""
+Fast import extraction using the tokenizer instead of the compiler AST.
+
+This produces the same list of (modname, rname, lname, lineno, level, pragma)
+tuples as the ImportVisitor, including the names listed in '__all__' and the
+pragma strings that follow import statements, but without building a syntax
+tree.  This is much faster on large modules.  It does not detect all syntax
+errors though, and does not provide name usage information (see
+--ignore-unused), for which the AST is still required.
+"""
+# This file is part of the Snakefood open source package.
+# See http://furius.ca/snakefood/ for licensing details.
+
+import re, logging
+from tokenize import generate_tokens, TokenError
+from tokenize import NAME, OP, STRING, NUMBER, COMMENT, NL, NEWLINE, \
+     INDENT, DEDENT, ENDMARKER
+from cStringIO import StringIO
+from ast import literal_eval
+
+__all__ = ('get_source_imports',)
+
+
+# Keywords that start a compound statement, whose header ends with a colon.
+compound_keywords = frozenset(
+    'if elif else try except finally for while with def class'.split())
+
+# Tokens that structure the source into statements: strings, comments and line
+# continuations (which are skipped over), newlines, brackets and separators.
+_structure_re = re.compile(r'''
+  [uUbB]?[rR]?(?:
+      \'\'\'[^'\\]*(?:(?:\\.|'(?!''))[^'\\]*)*\'\'\'
+    | """[^"\\]*(?:(?:\\.|"(?!""))[^"\\]*)*"""
+    | '[^'\\\n]*(?:\\.[^'\\\n]*)*'
+    | "[^"\\\n]*(?:\\.[^"\\\n]*)*"
+  )
+  | \#[^\n]*
+  | \\\n
+  | [\n()\[\]{};:]
+''', re.X | re.S)
+
+_word_re = re.compile(r'\s*([A-Za-z_]\w*)')
+_interesting_re = re.compile(r'(import|from|__all__)\b')
+
+# Tokens that end a logical line.
+_end_types = frozenset((NEWLINE, INDENT, DEDENT, ENDMARKER))
+_skip_types = frozenset((COMMENT, NL))
+_literal_types = frozenset((STRING, NUMBER))
+
+
+def get_source_imports(fn, contents):
+    """
+    Given the source 'contents' of file 'fn', return a list of module tuples for
+    the imports found and the set of '__future__' features, like
+    get_ast_imports() does. If the file cannot be tokenized, log an error and
+    return (None, None).
+    """
+    scanner = ImportScanner()
+    try:
+        scanner.scan(contents)
+    except (TokenError, SyntaxError, IndexError), e:
+        # Note: IndentationError is a subclass of SyntaxError; IndexError is
+        # raised on truncated import statements.
+        if isinstance(e, SyntaxError):
+            err = '%s:%s: %s' % (fn, e.lineno or '--', e.msg)
+        elif isinstance(e, TokenError):
+            err = '%s:%s: %s' % (fn, e.args[1][0], e.args[0])
+        else:
+            err = '%s:--: invalid syntax' % fn
+        logging.error("Error processing file '%s':\n%s" % (fn, err))
+        return None, None
+    return scanner.finalize()
+
+
+class ImportScanner(object):
+    """Statement-level scanner over the tokens of a source file.
+
+    The accumulation of imports and pragmas mirrors the ImportVisitor: an import
+    statement followed by a statement consisting of a single literal uses that
+    literal as its pragma, and assignments do not terminate the pending
+    imports.
+    """
+    def __init__(self):
+        self.modules = []
+        self.recent = []
+        self.future = set()
+
+    def scan(self, contents):
+        """Split the source in simple statements and process those that may
+        contribute imports or pragmas."""
+        depth = 0
+        start, lineno = 0, 1  # Start of the current statement.
+        lastpos = 0           # Position at which 'lineno' was computed.
+        for mo in _structure_re.finditer(contents):
+            c = mo.group()[0]
+            if c in '([{':
+                depth += 1
+                continue
+            elif c in ')]}':
+                depth -= 1
+                continue
+            elif c == '\n':
+                if depth > 0:
+                    continue
+            elif c == ';' or c == ':':
+                if depth > 0:
+                    continue
+                if c == ':':
+                    word = _word_re.match(contents, start)
+                    if not (word and word.group(1) in compound_keywords):
+                        continue
+                    # The header of a compound statement, possibly
+                    # followed by a simple statement on the same line.
+                    self.accept_imports()
+                    start = mo.end()
+                    continue
+            else:
+                # Skip over strings, comments and line continuations.
+                continue
+
+            end = mo.start()
+            lineno += contents.count('\n', lastpos, start)
+            lastpos = start
+            self.process(contents[start:end], lineno)
+            start = mo.end()
+
+        lineno += contents.count('\n', lastpos, start)
+        self.process(contents[start:], lineno)
+
+    def process(self, text, lineno):
+        "Process the source text of a single simple statement."
+        text = text.strip()
+        if not text or text[0] == '#':
+            return
+        # Only the statements that can produce imports, or which come right
+        # after an import statement, need to be looked at more closely.
+        if not (self.recent or _interesting_re.match(text)):
+            return
+        stmt = []
+        readline = StringIO(text).readline
+        for toktype, tok, (no, _), _, _ in generate_tokens(readline):
+            if toktype in _skip_types or toktype in _end_types:
+                continue
+            stmt.append((toktype, tok, lineno + no - 1))
+        if stmt:
+            self.statement(stmt)
+
+    def statement(self, stmt):
+        "Process the list of tokens of a single simple statement."
+        first = stmt[0][1]
+        if first == 'import' and stmt[0][0] == NAME:
+            self.accept_imports()
+            self.import_(stmt)
+
+        elif first == 'from' and stmt[0][0] == NAME:
+            self.accept_imports()
+            self.from_(stmt)
+
+        elif is_literal(stmt):
+            self.accept_imports(literal_value(stmt))
+
+        elif is_assignment(stmt):
+            # Note: assignments do not flush the pending imports.
+            self.assign(stmt)
+
+        else:
+            self.accept_imports()
+
+    def import_(self, stmt):
+        lineno = stmt[0][2]
+        for names in split_commas(stmt[1:]):
+            modname, as_ = parse_alias(names)
+            self.recent.append((modname, None, as_ or modname, lineno, 0))
+
+    def from_(self, stmt):
+        lineno = stmt[0][2]
+        i, level = 1, 0
+        while stmt[i][1] == '.':
+            level += 1
+            i += 1
+        modparts = []
+        while stmt[i][1] != 'import' or stmt[i][0] != NAME:
+            modparts.append(stmt[i][1])
+            i += 1
+        modname = ''.join(modparts)
+
+        rest = [x for x in stmt[i+1:] if x[1] not in '()']
+        if modname == '__future__':
+            for names in split_commas(rest):
+                self.future.add(parse_alias(names)[0])
+            return
+        for names in split_commas(rest):
+            name, as_ = parse_alias(names)
+            if name == '*':
+                # We really don't know...
+                mod = (modname, None, None, lineno, level)
+            else:
+                mod = (modname, name, as_ or name, lineno, level)
+            self.recent.append(mod)
+
+    # For package initialization files, fetch the __all__ list, which implies
+    # an implicit import if the package is being imported via from-import (see
+    # ImportVisitor.visitAssign).
+    def assign(self, stmt):
+        if not (len(stmt) > 2 and stmt[0][1] == '__all__' and
+                stmt[1][1] == '=' and stmt[0][0] == NAME):
+            return
+        rhs = stmt[2:]
+        if any(x[1] == '=' and x[0] == OP for x in rhs):
+            return # Chained assignment.
+        if rhs[0][1] in '[(' and matching_close(rhs) == len(rhs)-1:
+            rhs = rhs[1:-1]
+        elif not any(x[1] == ',' for x in rhs):
+            return
+        lineno = stmt[0][2]
+        for elem in split_commas(rhs):
+            if elem and all(x[0] == STRING for x in elem):
+                modname = literal_value(elem)
+                self.recent.append((modname, None, modname, lineno, 0))
+
+    def accept_imports(self, pragma=None):
+        self.modules.extend((m, r, l, n, lvl, pragma)
+                            for (m, r, l, n, lvl) in self.recent)
+        self.recent = []
+
+    def finalize(self):
+        self.accept_imports()
+        return self.modules, self.future
+
+
+def is_literal(stmt):
+    "Return true if the statement consists of a single constant."
+    if len(stmt) == 1:
+        return stmt[0][0] in _literal_types
+    return all(x[0] == STRING for x in stmt)
+
+def literal_value(tokens):
+    "Return the value of a number or of (implicitly concatenated) strings."
+    if len(tokens) == 1:
+        return literal_eval(tokens[0][1])
+    return ''.join(literal_eval(x[1]) for x in tokens)
+
+def is_assignment(stmt):
+    "Return true if the statement is a plain assignment."
+    depth = 0
+    for toktype, tok, _ in stmt:
+        if toktype != OP:
+            continue
+        if tok in '([{':
+            depth += 1
+        elif tok in ')]}':
+            depth -= 1
+        elif tok == '=' and depth == 0:
+            return True
+    return False
+
+def matching_close(tokens):
+    "Return the index of the bracket closing the first token of 'tokens'."
+    depth = 0
+    for i, (toktype, tok, _) in enumerate(tokens):
+        if toktype != OP:
+            continue
+        if tok in '([{':
+            depth += 1
+        elif tok in ')]}':
+            depth -= 1
+            if depth == 0:
+                return i
+    return -1
+
+def split_commas(tokens):
+    "Split a list of tokens on the commas that are not within brackets."
+    groups, group = [], []
+    depth = 0
+    for x in tokens:
+        tok = x[1]
+        if x[0] == OP:
+            if tok in '([{':
+                depth += 1
+            elif tok in ')]}':
+                depth -= 1
+            elif tok == ',' and depth == 0:
+                groups.append(group)
+                group = []
+                continue
+        group.append(x)
+    if group:
+        groups.append(group)
+    return groups
+
+def parse_alias(tokens):
+    "Parse a 'dotted.name [as name]' list of tokens."
+    names = [x[1] for x in tokens]
+    if len(names) > 2 and names[-2] == 'as':
+        return ''.join(names[:-2]), names[-1]
+    return ''.join(names), None
@@ -2,11 +2,11 @@
 A helper module to build simple filter scripts.
 """
 
-from six import print_
-
 import sys
 from os.path import join
 
+from snakefood.depends import read_depends, InvalidDepends
+
 
 def do_filter(populate_parser=None):
     import optparse
@@ -21,9 +21,8 @@ def do_filter(populate_parser=None):
         else:
             f = open(fn)
 
-        for line in f.xreadlines():
-            try:
-                yield eval(line)
-            except Exception, e:
-                print_(e, sys.stderr)
-                raise SystemExit
+        try:
+            for dep in read_depends(f, True):
+                yield dep
+        except InvalidDepends, e:
+            raise SystemExit(e)
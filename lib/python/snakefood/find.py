@@ -8,15 +8,20 @@ This could be considered the core of snakefood, and where all the complexity liv
 import sys, os, logging
 import compiler
 from compiler.visitor import ASTVisitor
-from compiler.ast import Discard, Const, AssName, List, Tuple
-from compiler.consts import OP_ASSIGN
 from os.path import *
 
-from snakefood.roots import find_package_root
-from snakefood.local import filter_unused_imports
-
-__all__ = ('find_dependencies', 'find_imports',
-           'parse_python_source',
+from snakefood.roots import find_package_root, clear_root_indexes, relfile
+from snakefood.fscache import fscache
+from snakefood import stdlib
+from snakefood.local import filter_unused_imports, scan_ast, ImportVisitor
+from snakefood.fast import get_source_imports
+from snakefood.dirindex import DirectoryIndex
+from snakefood.util import LRUCache
+
+__all__ = ('find_dependencies', 'resolve_imports', 'find_imports',
+           'get_import_names',
+           'parse_python_source', 'get_file_imports', 'use_directory_index',
+           'use_distribution_index', 'clear_caches', 'ImportScope',
            'ImportVisitor', 'get_local_names', 'check_duplicate_imports',
            'ERROR_IMPORT', 'ERROR_SYMBOL', 'ERROR_UNUSED')
 
@@ -30,23 +35,40 @@ WARNING_OPTIONAL = "    Line %d: Pragma suppressing import '%s'"
 def find_dependencies(fn, verbose, process_pragmas,
                       ignore_unused=False,
                       warning_lambda=logging.warning,
-                      debug_lambda=logging.debug):
-    "Returns a list of the files 'fn' depends on."
+                      debug_lambda=logging.debug,
+                      cache=None, parser='ast'):
+    """Returns a list of the files 'fn' depends on.  If 'cache' is a ParseCache,
+    it is used to avoid parsing files that have not changed.  'parser' selects
+    the import extractor (see get_file_imports())."""
     file_errors = []
 
-    ast, _ = parse_python_source(fn)
-    if ast is None:
-        return [], file_errors
-    found_imports, future_imports = get_ast_imports(ast)
+    found_imports, future_imports, unused_imports = get_file_imports(
+        fn, ignore_unused, cache, parser)
     if found_imports is None:
         return [], file_errors
 
-    # Filter out the unused imports if requested.
-    if ignore_unused:
-        found_imports, unused_imports = filter_unused_imports(ast, found_imports)
-        for modname, rname, lname, lineno, level, pragma in unused_imports:
-            file_errors.append((ERROR_UNUSED, lname))
+    # Report the unused imports that were filtered out.
+    for modname, rname, lname, lineno, level, pragma in unused_imports:
+        file_errors.append((ERROR_UNUSED, lname))
+
+    files, errors = resolve_imports(fn, found_imports, future_imports,
+                                    verbose, process_pragmas,
+                                    warning_lambda, debug_lambda)
+    file_errors.extend(errors)
+    return files, file_errors
 
+def resolve_imports(fn, found_imports, future_imports, verbose, process_pragmas,
+                    warning_lambda=logging.warning,
+                    debug_lambda=logging.debug,
+                    scope=None, details=None):
+    """Find the files for the imports found in file 'fn' (see
+    get_file_imports()).  Returns the list of files and the list of errors.  If
+    'scope' is an ImportScope, the imports out of scope are skipped.  If
+    'details' is a list, a (lineno, kind, modname, filename, unresolved) tuple
+    is appended to it for each import resolved, where 'kind' is one of
+    'import', 'from' or 'relative', and 'unresolved' the name that could not
+    be imported, if any."""
+    file_errors = []
     output_code = (verbose >= 2)
     source_lines = None
     if output_code:
@@ -57,6 +79,7 @@ def find_dependencies(fn, verbose, process_pragmas,
     assert not isdir(fn)
     dn = dirname(fn)
     seenset = set()
+    local = scope is not None and scope.is_local(fn)
     for x in found_imports:
         mod, rname, lname, lineno, level, pragma = x
         if process_pragmas and pragma == 'OPTIONAL':
@@ -71,6 +94,9 @@ def find_dependencies(fn, verbose, process_pragmas,
         if sig in seenset:
             continue
         seenset.add(sig)
+        if scope is not None and not scope.contains(mod, dn, level,
+                                                    absolute_import, local):
+            continue
         modfile, errors = find_dotted_module(mod, rname, dn, level, absolute_import)
         if errors:
             file_errors.extend(errors)
@@ -83,20 +109,102 @@ def find_dependencies(fn, verbose, process_pragmas,
                 if output_code:
                     efun(ERROR_SOURCE % source_lines[lineno-1].rstrip())
 
+        # Note: the files of the standard library table are already canonical,
+        # and may not exist when targeting another version.
+        if modfile is not None and (stdlib.target is None or
+                                    stdlib.target.relfile(modfile) is None):
+            modfile = fscache.realpath(modfile)
+        if details is not None:
+            kind = 'relative' if level > 0 else ('import' if rname is None
+                                                 else 'from')
+            unresolved = None
+            for err, name in errors or ():
+                if err is ERROR_IMPORT:
+                    unresolved = name
+            details.append((lineno, kind, mod, modfile, unresolved))
         if modfile is None:
             continue
-        files.append(realpath(modfile))
+        files.append(modfile)
 
     return files, file_errors
 
-def find_imports(fn, verbose, ignores):
-    "Yields a list of the module names the file 'fn' depends on."
+class ImportScope(object):
+    """The imports to resolve, when only the dependencies on the files of the
+    input roots 'inroots' are wanted ('internal' is true), or only those on the
+    files of other roots ('internal' is false).
+
+    An import is classified from its first component only: relative imports
+    have the scope of the importing file, and absolute imports that of the
+    file found for their top-level module.  The submodules of the imports out
+    of scope are therefore never looked for.  Note that the errors for these
+    imports are not reported either.  The classifications are memoized, so a
+    new scope must be used when the files change.
+    """
+    def __init__(self, inroots, ignores, internal):
+        self.inroots = frozenset(inroots)
+        self.ignores = ignores
+        self.internal = internal
+        self.toplevel = {}   # top-level name -> whether it is in scope
+        self.relative = {}   # (parentdir, name) -> whether found relatively
+
+    def in_roots(self, fn):
+        "Return true if file 'fn' is within the input roots."
+        return relfile(fn, self.ignores)[0] in self.inroots
+
+    def is_local(self, fn):
+        "Return true if the imports relative to file 'fn' are in scope."
+        return self.in_roots(fn) == self.internal
+
+    def contains(self, modname, parentdir, level, absolute_import, local):
+        """Return true if the import of 'modname' from directory 'parentdir' is
+        in scope.  'local' is the result of is_local() for the importing file."""
+        # Note: builtins take precedence, even over relative imports.
+        fn = _find_builtin(modname)
+        if fn is not None:
+            return self.in_roots(fn) == self.internal
+        if level > 0 or not modname:
+            return local
+        if not absolute_import:
+            key = (parentdir, modname)
+            try:
+                found = self.relative[key]
+            except KeyError:
+                found = self.relative[key] = bool(
+                    _import_relative(modname, parentdir, 1))
+            if found:
+                return local
+
+        name = modname.split('.')[0]
+        try:
+            return self.toplevel[name]
+        except KeyError:
+            pass
+        fn, _ = find_dotted_module(name, None, None, 0, True)
+        if fn is None:
+            result = True # Let the resolution report the error.
+        else:
+            if stdlib.target is None or stdlib.target.relfile(fn) is None:
+                fn = fscache.realpath(fn)
+            result = self.in_roots(fn) == self.internal
+        self.toplevel[name] = result
+        return result
+
+
+def get_import_names(found_imports):
+    """Return the set of all the module names that the imports refer to,
+    including those of the parent packages and of the imported symbols."""
+    names = set()
+    for modname, rname, _, _, _, _ in found_imports:
+        names.update(modname.split('.'))
+        if rname is not None:
+            names.add(rname)
+    names.discard('')
+    return names
 
-    ast, _ = parse_python_source(fn)
-    if ast is None:
-        raise StopIteration
+def find_imports(fn, verbose, ignores, cache=None, parser='ast'):
+    "Yields a list of the module names the file 'fn' depends on."
 
-    found_imports, future_imports = get_ast_imports(ast)
+    found_imports, _, _ = get_file_imports(fn, False, cache, parser)
     if found_imports is None:
         raise StopIteration
 
@@ -127,89 +235,6 @@ def find_imports(fn, verbose, ignores):
         yield (modname, lineno, islocal)
 
 
-class ImportVisitor(object):
-    """AST visitor for grabbing the import statements.
-
-    This visitor produces a list of
-
-       (module-name, remote-name, local-name, line-no, pragma)
-
-    * remote-name is the name off the symbol in the imported module.
-    * local-name is the name of the object given in the importing module.
-    """
-    def __init__(self):
-        self.modules = []
-        self.recent = []
-        self.future = set()
-
-    def visitImport(self, node):
-        self.accept_imports()
-        self.recent.extend((x[0], None, x[1] or x[0], node.lineno, 0)
-                           for x in node.names)
-
-    def visitFrom(self, node):
-        self.accept_imports()
-        modname = node.modname
-        if modname == '__future__':
-            for name, as_ in node.names:
-                self.future.add(name)
-            return
-        for name, as_ in node.names:
-            if name == '*':
-                # We really don't know...
-                mod = (modname, None, None, node.lineno, node.level)
-            else:
-                mod = (modname, name, as_ or name, node.lineno, node.level)
-            self.recent.append(mod)
-
-    # For package initialization files, try to fetch the __all__ list, which
-    # implies an implicit import if the package is being imported via
-    # from-import; from the documentation:
-    #
-    #  The import statement uses the following convention: if a package's
-    #  __init__.py code defines a list named __all__, it is taken to be the list
-    #  of module names that should be imported when from package import * is
-    #  encountered. It is up to the package author to keep this list up-to-date
-    #  when a new version of the package is released. Package authors may also
-    #  decide not to support it, if they don't see a use for importing * from
-    #  their package.
-    def visitAssign(self, node):
-        lhs = node.nodes
-        if (len(lhs) == 1 and
-            isinstance(lhs[0], AssName) and
-            lhs[0].name == '__all__' and
-            lhs[0].flags == OP_ASSIGN):
-
-            rhs = node.expr
-            if isinstance(rhs, (List, Tuple)):
-                for namenode in rhs:
-                    # Note: maybe we should handle the case of non-consts.
-                    if isinstance(namenode, Const):
-                        modname = namenode.value
-                        mod = (modname, None, modname, node.lineno, 0)#node.level
-                        self.recent.append(mod)
-
-    def default(self, node):
-        pragma = None
-        if self.recent:
-            if isinstance(node, Discard):
-                children = node.getChildren()
-                if len(children) == 1 and isinstance(children[0], Const):
-                    const_node = children[0]
-                    pragma = const_node.value
-
-        self.accept_imports(pragma)
-
-    def accept_imports(self, pragma=None):
-        self.modules.extend((m, r, l, n, lvl, pragma)
-                            for (m, r, l, n, lvl) in self.recent)
-        self.recent = []
-
-    def finalize(self):
-        self.accept_imports()
-        return self.modules, self.future
-
-
 def check_duplicate_imports(found_imports):
     """
     Heuristically check for duplicate imports, and return two lists:
@@ -262,31 +287,38 @@ def parse_python_source(fn):
 
     If the file has a syntax error in it, the first argument will be None.
     """
-    # Read the file's contents to return it.
-    # Note: we make sure to use universal newlines.
+    contents = read_python_source(fn)
+    if contents is None:
+        return None, None
+    return parse_python_contents(fn, contents), contents.splitlines()
+
+def read_python_source(fn):
+    """Read the contents of file 'fn', with universal newlines.  Returns None if
+    the file cannot be read."""
     try:
-        contents = open(fn, 'rU').read()
-        lines = contents.splitlines()
+        return open(fn, 'rU').read()
     except (IOError, OSError), e:
         logging.error("Could not read file '%s'." % fn)
-        return None, None
+        return None
 
-    # Convert the file to an AST.
+def parse_python_contents(fn, contents):
+    """Convert the source 'contents' of file 'fn' to an AST. If the file has a
+    syntax error in it, log it and return None."""
     try:
         ast = compiler.parse(contents)
     except SyntaxError, e:
         err = '%s:%s: %s' % (fn, e.lineno or '--', e.msg)
         logging.error("Error processing file '%s':\n%s" %
                       (fn, err))
-        return None, lines
+        return None
     except TypeError, e:
         # Note: this branch untested, applied from a user-submitted patch.
         err = '%s: %s' % (fn, str(e))
         logging.error("Error processing file '%s':\n%s" %
                       (fn, err))
-        return None, lines
+        return None
 
-    return ast, lines
+    return ast
 
 def get_ast_imports(ast):
     """
@@ -295,10 +327,61 @@ def get_ast_imports(ast):
         (modname, remote-name, local-name, lineno, pragma)
     """
     assert ast is not None
-    vis = ImportVisitor()
-    compiler.walk(ast, vis, ImportWalker(vis))
-    found_imports, future_imports = vis.finalize()
-    return found_imports, future_imports
+    scan = scan_ast(ast)
+    return scan.found_imports, scan.future_imports
+
+def get_file_imports(fn, ignore_unused=False, cache=None, parser='ast'):
+    """
+    Parse the file 'fn' and return three things:
+
+    1. The list of import tuples found, as for get_ast_imports();
+    2. The set of '__future__' features imported;
+    3. The list of unused imports removed from the first list, if
+       'ignore_unused' is true (otherwise this is empty).
+
+    If the file cannot be read or parsed, the first element is None.  If
+    'cache' is provided, results are looked up and stored in it by contents,
+    so that unchanged files are not parsed again.
+
+    'parser' is either 'ast', to extract the imports from the compiler AST, or
+    'fast', to extract them from the tokens.  The fast parser does not provide
+    name usage information, so the AST is always used if 'ignore_unused' is
+    set.
+    """
+    contents = read_python_source(fn)
+    if contents is None:
+        return None, None, None
+
+    assert parser in ('ast', 'fast'), parser
+    if ignore_unused:
+        parser = 'ast'
+
+    if cache is not None:
+        key = cache.key(contents, parser, ignore_unused and 'unused' or '')
+        value = cache.get(key)
+        if value is not None:
+            return value
+
+    # Note: we do not cache failures, so that errors are reported on every run.
+    unused_imports = []
+    if parser == 'fast':
+        found_imports, future_imports = get_source_imports(fn, contents)
+        if found_imports is None:
+            return None, None, None
+    else:
+        ast = parse_python_contents(fn, contents)
+        if ast is None:
+            return None, None, None
+
+        found_imports, future_imports = get_ast_imports(ast)
+        if ignore_unused:
+            found_imports, unused_imports = filter_unused_imports(ast,
+                                                                  found_imports)
+
+    value = (found_imports, future_imports, unused_imports)
+    if cache is not None:
+        cache.put(key, value)
+    return value
 
 
 # **WARNING** This is where all the evil lies.  Risk and peril.  Watch out.
@@ -313,7 +396,10 @@ else:
 exceptions = ('os.path',)
 builtin_module_names = sys.builtin_module_names + exceptions
 
-module_cache = {}
+# Cache of the module lookups, including the failed ones, keyed by (parentdir,
+# level, dotted name, absolute_import); see resolve_module().  The size is
+# bounded to avoid growing without limit when following large trees.
+resolve_cache = LRUCache(100000)
 
 def find_dotted_module(modname, rname, parentdir, level, absolute_import):
     """
@@ -334,30 +420,22 @@ def find_dotted_module(modname, rname, parentdir, level, absolute_import):
     'absolute_import' use semantics defined in https://www.python.org/dev/peps/pep-0328/
     """
     # Check for builtins.
-    if modname in builtin_module_names:
-        return join(libpath, modname), None
+    fn = _find_builtin(modname)
+    if fn is not None:
+        return fn, None
 
     if modname == '':
         # Check for "from ... import xyz"
         # However, xyz could be a symbol in ./__init__.py
         assert rname is not None
         assert level > 0
-        fn = _import_relative(rname, parentdir, level)
+        fn = resolve_module(rname, parentdir, level, True)
         if not fn:
             return parentdir, [
                 (ERROR_SYMBOL, '.'*level + rname)
             ]
         return fn, []
-    if absolute_import:
-        if level == 0:
-            fn = _import_module(modname)
-        else:
-            fn = _import_relative(modname, parentdir, level)
-    else:
-        fn = _import_relative(modname, parentdir, level)
-        if not fn and level == 0:
-            fn = _import_module(modname)
-
+    fn = resolve_module(modname, parentdir, level, absolute_import)
     if not fn:
         return None, [
             (ERROR_IMPORT, modname)
@@ -365,7 +443,7 @@ def find_dotted_module(modname, rname, parentdir, level, absolute_import):
 
     # If this is a from-form, try the target symbol as a module.
     if rname and _supports_submodules(fn):
-        fn2 = _import_relative(rname, dirname(fn), 1)
+        fn2 = resolve_module(rname, dirname(fn), 1, True)
         if not fn2:
             return fn, [
                 (ERROR_SYMBOL, '.'.join((modname, rname)))
@@ -374,24 +452,126 @@ def find_dotted_module(modname, rname, parentdir, level, absolute_import):
     return fn, []
 
 
+def _find_builtin(modname):
+    "Return the filename for builtin module 'modname', or None."
+    if stdlib.target is not None:
+        return stdlib.target.find_builtin(modname)
+    elif modname in builtin_module_names:
+        return join(libpath, modname)
+
+
 def _supports_submodules(fn):
     # Only folders and __init__.py's can have submodules
-    return isdir(fn) or fn.endswith('/__init__.py')
+    return fn.endswith('/__init__.py') or isdir(fn)
+
 
+def resolve_module(modname, parentdir, level, absolute_import):
+    """Find the file for module 'modname' imported from directory 'parentdir',
+    with the given relative import 'level' and import semantics.  Returns None
+    if it cannot be found.  The results are memoized in 'resolve_cache'."""
+    if absolute_import and level == 0:
+        parentdir = None # Does not depend on the importing directory.
+    key = (parentdir, level, modname, absolute_import)
+    try:
+        return resolve_cache[key]
+    except KeyError:
+        pass
+
+    if absolute_import:
+        if level == 0:
+            fn = _import_module(modname)
+        else:
+            fn = _import_relative(modname, parentdir, level)
+    else:
+        fn = _import_relative(modname, parentdir, level)
+        if not fn and level == 0:
+            # Note: the absolute lookup is shared by all the directories.
+            fn = resolve_module(modname, None, 0, True)
+
+    resolve_cache[key] = fn
+    return fn
 
 def _import_module(modname):
+    names = modname.split('.')
+    table = stdlib.target
+    if table is not None:
+        # The directories that come before the library on the search path,
+        # e.g. the input roots, take precedence over the modules of the table.
+        before, after = _search_path()
+        for dn in before:
+            if find_dotted(names[:1], dn):
+                return find_dotted(names, dn)
+        if modname in table:
+            return table.find_module(modname)
+    if distindex is not None:
+        sitedir = distindex.lookup(modname)
+        if sitedir is not None:
+            dn = _shadowing_dir(names[0], sitedir)
+            if dn is not None:
+                return find_dotted(names, dn)
+            # Note: files that are not listed in the metadata, e.g. generated
+            # ones, are looked for in the directory of the distribution.
+            return (distindex.find_module(modname) or
+                    find_dotted(names, sitedir))
+    if table is not None:
+        for dn in after:
+            fn = find_dotted(names, dn)
+            if fn:
+                return fn
+        return None
+    return find_dotted(names)
+
+# The module search paths without the library of the running interpreter, by
+# module search path.
+_search_paths = {}
+
+def _search_path():
+    """Return the directories of the module search path that come before and
+    after the library of the running interpreter, without it, since its modules
+    are not those of the target version."""
+    key = tuple(sys.path)
     try:
-        return module_cache[modname]
+        return _search_paths[key]
     except KeyError:
-        names = modname.split('.')
-        fn = find_dotted(names)
-        module_cache[modname] = fn
-        return fn
+        path = _search_paths[key] = stdlib.split_library_dirs(sys.path,
+                                                              realpath(libpath))
+        return path
+
+def _shadowing_dir(name, sitedir):
+    """Return the directory of the module search path before directory
+    'sitedir' in which top-level module 'name' is found, or None.  The
+    directories of the installed distributions are not searched."""
+    try:
+        return distindex.shadows[name]
+    except KeyError:
+        pass
+    found = None
+    if stdlib.target is None:
+        path = sys.path
+    else:
+        path = sum(_search_path(), [])
+    for dn in path:
+        rdn = fscache.realpath(dn or os.curdir)
+        if rdn == sitedir:
+            break
+        if rdn in distindex.modules:
+            continue
+        if find_dotted([name], dn):
+            found = dn
+            break
+    distindex.shadows[name] = found
+    return found
 
 
 def _import_relative(modname, parentdir, level):
     for i in range(level - 1):
         parentdir = dirname(parentdir)
+    table = stdlib.target
+    if table is not None:
+        package = table.package_name(parentdir)
+        if package is not None:
+            return table.find_module(package and '%s.%s' % (package, modname)
+                                     or modname)
     names = modname.split('.')
     return find_dotted(names, parentdir)
 
@@ -404,6 +584,39 @@ except ImportError:
     except ImportError:
         from snakefood.fallback.pkgutil import ImpImporter
 
+# The index of directory listings used to find modules, or None to use the
+# import machinery (see use_directory_index()).
+dirindex = None
+
+def use_directory_index(revalidate=False):
+    """Find modules from an index of directory listings instead of probing the
+    filesystem with the import machinery for each name.  If 'revalidate' is
+    true, the listings are refreshed when the directories are modified."""
+    global dirindex
+    dirindex = DirectoryIndex(revalidate)
+
+# The index of the installed distributions, or None to search for their modules
+# like the others (see use_distribution_index()).
+distindex = None
+
+def use_distribution_index(index):
+    """Find the modules of the installed distributions from DistributionIndex
+    'index'.  The modules found in the directories of the search path that come
+    before them still take precedence."""
+    global distindex
+    distindex = index
+
+def clear_caches():
+    """Forget the results of the module lookups and the package roots, e.g.
+    after the files on the search path have changed."""
+    resolve_cache.clear()
+    clear_root_indexes()
+    fscache.clear()
+    if dirindex is not None:
+        dirindex.clear()
+    if distindex is not None:
+        distindex.shadows.clear()
+
 def find_dotted(names, parentdir=None):
     """
     Dotted import.  'names' is a list of path components, 'parentdir' is the
@@ -411,10 +624,13 @@ def find_dotted(names, parentdir=None):
     """
     filename = None
     for name in names:
-        mod = ImpImporter(parentdir).find_module(name)
-        if not mod:
-            break
-        filename = mod.get_filename()
+        if dirindex is not None:
+            filename = dirindex.find_module(name, parentdir)
+        else:
+            mod = ImpImporter(parentdir).find_module(name)
+            if not mod:
+                break
+            filename = mod.get_filename()
         if not filename:
             break
         parentdir = dirname(filename)
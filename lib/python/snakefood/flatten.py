@@ -9,7 +9,8 @@ from os.path import join
 
 from six import print_
 
-from snakefood.depends import read_depends, flatten_depends
+from snakefood.depends import read_depends, InvalidDepends
+from snakefood.graphlib import DependencyGraph
 
 
 
@@ -17,8 +18,16 @@ from snakefood.depends import read_depends, flatten_depends
 def main():
     import optparse
     parser = optparse.OptionParser(__doc__.strip())
+
+    parser.add_option('--strict', action='store_true',
+                      help="Fail on the first invalid line of the dependencies "
+                      "instead of skipping it with a warning.")
+
     opts, args = parser.parse_args()
 
-    depends = read_depends(sys.stdin)
-    for droot, drel in flatten_depends(depends):
+    try:
+        graph = DependencyGraph(read_depends(sys.stdin, opts.strict))
+    except InvalidDepends, e:
+        raise SystemExit(e)
+    for droot, drel in graph.flatten():
         print_(join(droot, drel))
@@ -0,0 +1,134 @@
+"""
+Bounded following of the dependencies.
+
+With --follow, the files that the processed files depend on are processed in
+turn, until no new files are found.  The frontier bounds this expansion: each
+file is reached at a depth, the smallest number of hops from an input file, and
+only the files within the maximum depth are processed.  The files whose
+package root or top-level name matches one of the given patterns are at depth
+0, so that the expansion goes on without limit through them (e.g. the
+packages of a project), and only goes a few hops into the others (e.g.
+third-party libraries).
+
+The files that are reached but not processed because of the limits are the
+truncated nodes of the graph; they are marked with an edge to TRUNCATED.
+"""
+# This file is part of the Snakefood open source package.
+# See http://furius.ca/snakefood/ for licensing details.
+
+from os.path import *
+from fnmatch import fnmatch
+
+from snakefood.depends import TRUNCATED
+from snakefood.roots import relfile
+from snakefood.util import is_python
+
+__all__ = ('FollowFrontier', 'mark_truncated', 'truncated_nodes')
+
+
+
+class FollowFrontier(object):
+    """The depths of the files reached while following the dependencies.
+
+    'maxdepth' is the maximum number of hops to follow from the input files,
+    or None for no limit, and 'patterns' the shell-style patterns of the
+    package roots or top-level names of the files that are followed without
+    limit.  If patterns are given, 'maxdepth' defaults to 0.
+    """
+    def __init__(self, maxdepth=None, patterns=(), ignores=()):
+        if maxdepth is None and patterns:
+            maxdepth = 0
+        self.maxdepth = maxdepth
+        self.patterns = list(patterns)
+        self.ignores = ignores
+        self.depths = {}      # filename -> smallest depth it was reached at
+        self.follows = {}     # filename -> followed files, for processed files
+        self.matches = {}     # root or name -> whether it matches a pattern
+
+    def add_input(self, fn):
+        "Add input file 'fn', which is always processed."
+        self.depths[fn] = 0
+
+    def within(self, fn):
+        "Return true if file 'fn' is within the depth limit."
+        depth = self.depths.get(fn)
+        return depth is not None and (self.maxdepth is None or
+                                      depth <= self.maxdepth)
+
+    def unbounded(self, fn):
+        "Return true if file 'fn' is in a root that is followed without limit."
+        if not self.patterns:
+            return False
+        if basename(fn) == '__init__.py':
+            fn = dirname(fn)
+        node = relfile(fn, self.ignores)
+        if node is None:
+            return False
+        root, relfn = node
+        name = relfn.split('/')[0].split('.')[0]
+        for key in root, name:
+            try:
+                matches = self.matches[key]
+            except KeyError:
+                matches = self.matches[key] = any(fnmatch(key, pattern)
+                                                  for pattern in self.patterns)
+            if matches:
+                return True
+        return False
+
+    def expand(self, fn, follow):
+        """Record the files 'follow' that processed file 'fn' depends on, and
+        return the list of the files that must be processed next."""
+        self.follows[fn] = follow
+        todo = []
+        stack = [fn]
+        while stack:
+            fn = stack.pop()
+            depth = self.depths[fn] + 1
+            for dfn in self.follows[fn]:
+                ddepth = 0 if self.unbounded(dfn) else depth
+                old = self.depths.get(dfn)
+                if old is not None and old <= ddepth:
+                    continue
+                wasin = self.within(dfn)
+                self.depths[dfn] = ddepth
+                if not self.within(dfn):
+                    continue
+                # A file that is reached through a shorter path is processed if
+                # it was beyond the limit, and if it was processed already,
+                # the files it depends on are reached through it again.
+                if dfn in self.follows:
+                    stack.append(dfn)
+                elif not wasin:
+                    todo.append(dfn)
+        return todo
+
+    def truncated(self):
+        """Return the source files that were reached but not processed.  Other
+        files, e.g. extension modules, have no dependencies to follow."""
+        return [fn for fn in self.depths
+                if not self.within(fn) and is_python(fn)]
+
+
+def truncated_nodes(truncated, targets, ignores):
+    "Return the nodes of the files 'truncated' that are in the set 'targets'."
+    nodes = []
+    for fn in truncated:
+        if basename(fn) == '__init__.py':
+            fn = dirname(fn)
+        node = relfile(fn, ignores)
+        if node in targets:
+            nodes.append(node)
+    return nodes
+
+
+def mark_truncated(allfiles, truncated, ignores):
+    """Add an edge to TRUNCATED to the dependencies 'allfiles' for each of the
+    files 'truncated' that appears as a target.  Return the marked nodes."""
+    targets = set()
+    for tolist in allfiles.itervalues():
+        targets.update(tolist)
+    marked = truncated_nodes(truncated, targets, ignores)
+    for node in marked:
+        allfiles.setdefault(node, set()).add(TRUNCATED)
+    return marked
@@ -0,0 +1,235 @@
+"""
+A cache of the metadata of the filesystem, shared by the code that looks at it.
+
+Finding the roots, resolving the real paths of modules and recognizing Python
+scripts by their first line all query the same directories and files many
+times over.  On network filesystems, these queries are the main cost.  This
+cache lists each directory once, recording the kind of its entries (with the
+d_type of the directory entries when scandir is available), and answers the
+existence, directory, real path and script queries from the listings.
+
+The cache counts the system calls that it makes, and the system calls that the
+same queries would have made without it.
+"""
+# This file is part of the Snakefood open source package.
+# See http://furius.ca/snakefood/ for licensing details.
+
+import os, re, stat
+from os.path import *
+
+try:
+    from os import scandir
+except ImportError:
+    try:
+        from scandir import scandir
+    except ImportError:
+        scandir = None
+
+__all__ = ('FileSystemCache', 'fscache')
+
+
+# Kinds of directory entries.
+FILE, DIR, LINK_FILE, LINK_DIR, LINK_BROKEN = range(5)
+LINKS = (LINK_FILE, LINK_DIR, LINK_BROKEN)
+
+# Regular expression for the first line of Python scripts.
+shebang_re = re.compile("#!.*\\bpython")
+
+
+class FileSystemCache(object):
+    """The directory listings, real paths and script detections of a run.
+
+    'syscalls' counts the system calls made, and 'queries' the system calls
+    that the same queries would have made without the cache (approximately:
+    one per stat, one per component of a real path, three per opened file).
+    """
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        "Forget everything, e.g. after files have been added or deleted."
+        self.listings = {}   # dn -> (list of names, map of name -> kind)
+        self.realpaths = {}
+        self.pythons = {}
+        self.syscalls = 0
+        self.queries = 0
+
+    def listing(self, dn):
+        """Return a pair of the list of entries of directory 'dn', in the order
+        of the directory, and a map of the names to their kind, or None if the
+        directory cannot be listed."""
+        dn = dn or os.curdir
+        try:
+            return self.listings[dn]
+        except KeyError:
+            pass
+        try:
+            if scandir is not None:
+                listing = self.scan(dn)
+            else:
+                listing = self.list(dn)
+        except OSError:
+            listing = None
+        self.listings[dn] = listing
+        return listing
+
+    def scan(self, dn):
+        names, kinds = [], {}
+        self.syscalls += 1
+        for entry in scandir(dn):
+            name = entry.name
+            names.append(name)
+            if entry.is_symlink():
+                kind = self.link_kind(join(dn, name))
+            else:
+                kind = DIR if entry.is_dir(follow_symlinks=False) else FILE
+            kinds[name] = kind
+        return names, kinds
+
+    def list(self, dn):
+        names, kinds = os.listdir(dn), {}
+        self.syscalls += 1
+        for name in names:
+            fn = join(dn, name)
+            self.syscalls += 1
+            try:
+                mode = os.lstat(fn).st_mode
+            except OSError:
+                continue
+            if stat.S_ISLNK(mode):
+                kind = self.link_kind(fn)
+            else:
+                kind = DIR if stat.S_ISDIR(mode) else FILE
+            kinds[name] = kind
+        return names, kinds
+
+    def link_kind(self, fn):
+        "Return the kind of symbolic link 'fn'."
+        self.syscalls += 1
+        try:
+            mode = os.stat(fn).st_mode
+        except OSError:
+            return LINK_BROKEN
+        return LINK_DIR if stat.S_ISDIR(mode) else LINK_FILE
+
+    def listdir(self, dn):
+        "Return the list of the names of the entries of directory 'dn'."
+        self.queries += 1
+        listing = self.listing(dn)
+        if listing is None:
+            raise OSError("Cannot list directory '%s'." % dn)
+        return listing[0]
+
+    def kind(self, fn):
+        "Return the kind of the entry for path 'fn', or None if not found."
+        dn, name = split(fn)
+        if not name:
+            # The top of the filesystem, or a trailing separator.
+            self.syscalls += 1
+            return DIR if isdir(fn) else None
+        listing = self.listing(dn)
+        if listing is None:
+            self.syscalls += 1
+            try:
+                mode = os.stat(fn).st_mode
+            except OSError:
+                return None
+            return DIR if stat.S_ISDIR(mode) else FILE
+        return listing[1].get(name)
+
+    def exists(self, fn):
+        self.queries += 1
+        return self.kind(fn) not in (None, LINK_BROKEN)
+
+    def isdir(self, fn):
+        self.queries += 1
+        return self.kind(fn) in (DIR, LINK_DIR)
+
+    def isfile(self, fn):
+        self.queries += 1
+        return self.kind(fn) in (FILE, LINK_FILE)
+
+    def walk(self, top):
+        """Generate the (dirpath, dirnames, filenames) triples of the directory
+        tree under 'top', like os.walk().  Like os.walk(), the subdirectories
+        can be pruned by removing them from 'dirnames', and the symbolic links
+        to directories are listed but not walked into."""
+        listing = self.listing(top)
+        self.queries += 1
+        if listing is None:
+            return
+        names, kinds = listing
+        self.queries += len(names)
+        dirs, files = [], []
+        for name in names:
+            if kinds.get(name) in (DIR, LINK_DIR):
+                dirs.append(name)
+            else:
+                files.append(name)
+        yield top, dirs, files
+        for name in dirs:
+            if kinds.get(name) == DIR:
+                for x in self.walk(join(top, name)):
+                    yield x
+
+    def realpath(self, fn):
+        """Return the canonical path of 'fn', eliminating symbolic links, like
+        os.path.realpath()."""
+        path = fn
+        if not isabs(path):
+            path = join(os.getcwd(), path)
+        self.queries += path.count(os.sep)
+        try:
+            return self.realpaths[fn]
+        except KeyError:
+            pass
+        if os.pardir in path.split(os.sep):
+            # Symbolic links have to be resolved before the parent directories.
+            self.syscalls += path.count(os.sep)
+            rpath = realpath(path)
+        else:
+            rpath = self.resolve(normpath(path))
+        self.realpaths[fn] = rpath
+        return rpath
+
+    def resolve(self, path):
+        "Return the real path of the absolute and normalized 'path'."
+        try:
+            return self.realpaths[path]
+        except KeyError:
+            pass
+        dn, name = split(path)
+        if not name:
+            rpath = path
+        else:
+            rpath = join(self.resolve(dn), name)
+            if self.kind(rpath) in LINKS:
+                self.syscalls += rpath.count(os.sep)
+                rpath = realpath(rpath)
+        self.realpaths[path] = rpath
+        return rpath
+
+    def is_python(self, fn):
+        "Return true if file 'fn' is a Python script."
+        self.queries += 3
+        try:
+            return self.pythons[fn]
+        except KeyError:
+            pass
+        result = False
+        if self.kind(fn) in (FILE, LINK_FILE):
+            self.syscalls += 3
+            try:
+                f = open(fn)
+                try:
+                    result = bool(shebang_re.match(f.read(64)))
+                finally:
+                    f.close()
+            except IOError:
+                pass
+        self.pythons[fn] = result
+        return result
+
+
+# The cache used by the functions of this package.
+fscache = FileSystemCache()
@@ -16,16 +16,38 @@ dependencies on anything.
 # This file is part of the Snakefood open source package.
 # See http://furius.ca/snakefood/ for licensing details.
 
-import sys, logging
+import sys, os, logging
 from os.path import *
 from operator import itemgetter
+from collections import deque
+
+try:
+    from hashlib import sha1
+except ImportError:
+    from sha import new as sha1
 
 from six import print_
 
 from snakefood.util import iter_pyfiles, setup_logging, def_ignores, is_python
-from snakefood.depends import output_depends
-from snakefood.find import find_dependencies
+from snakefood.depends import output_depends, TRUNCATED
+from snakefood.find import get_file_imports, resolve_imports, get_import_names
+from snakefood.find import use_directory_index, resolve_cache, clear_caches
+from snakefood.find import use_distribution_index, ImportScope
 from snakefood.find import ERROR_IMPORT, ERROR_SYMBOL, ERROR_UNUSED
+from snakefood.cache import ParseCache
+from snakefood.fscache import fscache
+from snakefood.parallel import make_processor
+from snakefood.state import DependencyState, module_name
+from snakefood.watch import watch_changes
+from snakefood.ignore import IgnoreRules
+from snakefood.stdlib import load_table, set_target
+from snakefood.dists import DistributionIndex, default_cache_dir
+from snakefood.subgraphs import SubgraphCache
+from snakefood.frontier import FollowFrontier, mark_truncated, truncated_nodes
+from snakefood.sfb import compressions
+from snakefood.jsonl import JsonlWriter
+from snakefood.db import DependencyDB
+from snakefood.stream import StreamWriter
 from snakefood.fallback.collections import defaultdict
 from snakefood.roots import *
 
@@ -56,6 +78,34 @@ def gendeps():
                       default=def_ignores,
                       help="Add the given directory name to the list to be ignored.")
 
+    parser.add_option('-X', '--exclude', dest='excludes', action='append',
+                      default=[], metavar='PATTERN',
+                      help="Ignore the files and directories that match the given "
+                      "gitignore-style pattern, relative to the input directories "
+                      "(e.g. 'node_modules/', '*.egg-info', '/build').")
+
+    parser.add_option('--gitignore', action='store_true',
+                      help="Ignore the files and directories that match the "
+                      "patterns of the .gitignore files found in the input "
+                      "directories.")
+
+    parser.add_option('--git-files', action='store_true',
+                      help="Find the files of the input directories that are "
+                      "within git work trees with 'git ls-files', i.e. the "
+                      "tracked files and the untracked files that are not "
+                      "ignored, instead of walking the directories.")
+
+    parser.add_option('--walk-threads', action='store', type='int', default=1,
+                      metavar='N',
+                      help="Walk the subdirectories of the input directories in "
+                      "parallel with the given number of threads.")
+
+    parser.add_option('--shard', action='store', metavar='K/N',
+                      help="Only process the K-th of N deterministic shards of "
+                      "the input files, split by a hash of their path relative "
+                      "to their package root, e.g. on each of N machines.  The "
+                      "outputs of the shards can be merged with sfood-merge.")
+
     parser.add_option('-v', '--verbose', action='count', default=0,
                       help="Output more debugging information")
     parser.add_option('-q', '--quiet', action='count', default=0,
@@ -65,6 +115,21 @@ def gendeps():
                       help="Follow the modules depended upon and trace their dependencies. "
                       "WARNING: This can be slow.  Use --internal to limit the scope.")
 
+    parser.add_option('--follow-depth', action='store', type='int', metavar='N',
+                      help="Follow the dependencies at most N hops away from the "
+                      "input files, or from the files of the --follow-roots "
+                      "roots (implies --follow).  The files whose dependencies "
+                      "are not followed are marked with an edge to %r." %
+                      (TRUNCATED,))
+
+    parser.add_option('--follow-roots', action='append', default=[],
+                      metavar='PATTERN',
+                      help="Follow the dependencies without limit through the "
+                      "files whose package root or top-level package or module "
+                      "name matches the given shell-style pattern, and only "
+                      "within --follow-depth hops (default: 0) through the "
+                      "others (implies --follow).")
+
     parser.add_option('--print-roots', action='store_true',
                       help="Only print the package roots corresponding to the input files."
                       "This is mostly used for testing and troubleshooting.")
@@ -76,6 +141,123 @@ def gendeps():
     parser.add_option('-u', '--ignore-unused', action='store_true',
                       help="Automatically ignore unused imports. (See sfood-checker.)")
 
+    parser.add_option('--cache-dir', action='store',
+                      default=os.environ.get('SFOOD_CACHE_DIR'),
+                      help="Cache the imports parsed from each file in the given "
+                      "directory, so that unchanged files do not get parsed again "
+                      "on subsequent runs. The directory may be shared between "
+                      "concurrent runs. (Default: $SFOOD_CACHE_DIR.)")
+
+    parser.add_option('--cache-subgraphs', action='store_true',
+                      help="With --follow, also cache the dependencies of the "
+                      "files outside of the input roots in the --cache-dir "
+                      "directory, for each distribution (with --dist-index) or "
+                      "package root, and reuse them until the distribution or "
+                      "the files of the root change.")
+
+    parser.add_option('--parser', action='store', type='choice',
+                      choices=('ast', 'fast'), default='ast',
+                      help="Select how imports are extracted from source files: "
+                      "'ast' uses the compiler AST, 'fast' only uses the tokenizer "
+                      "and is much faster, but does not report all syntax errors. "
+                      "The AST is always used with --ignore-unused.")
+
+    parser.add_option('-j', '--jobs', action='store', type='int', default=1,
+                      help="Process files in parallel with the given number of "
+                      "worker processes.")
+
+    parser.add_option('--resolver', action='store', type='choice',
+                      choices=('imp', 'index'), default='imp',
+                      help="Select how modules are found: 'imp' uses the import "
+                      "machinery, which probes the filesystem for each name; "
+                      "'index' lists each directory of the search path and of "
+                      "packages only once, and answers lookups from memory.")
+
+    parser.add_option('--revalidate', action='store_true',
+                      help="With --resolver=index, check the modification time "
+                      "of directories on each lookup and list them again if they "
+                      "have changed.")
+
+    parser.add_option('--resolve-cache-size', action='store', type='int',
+                      default=resolve_cache.maxsize,
+                      help="Maximum number of module lookups to remember "
+                      "(default: %default).")
+
+    parser.add_option('--target-python', action='store', metavar='X.Y',
+                      help="Resolve the modules of the standard library of the "
+                      "given version of Python from a precomputed table, "
+                      "instead of searching the library of the running "
+                      "interpreter.")
+
+    parser.add_option('--dist-index', action='store_true',
+                      help="Find the modules of the installed distributions from "
+                      "an index of their metadata, instead of searching the "
+                      "module search path.  The index is cached in the "
+                      "--cache-dir directory, or in %s." % default_cache_dir())
+
+    parser.add_option('--cluster-by-distribution', action='store_true',
+                      help="Replace the files installed by a distribution with a "
+                      "single node for the distribution, named after its "
+                      "metadata directory.")
+
+    parser.add_option('--state', action='store', metavar='FILE',
+                      help="Record the results for each processed file in the "
+                      "given state file, and on subsequent runs, only process "
+                      "the files that have changed, and the files whose imports "
+                      "may resolve differently because of added or deleted files.")
+
+    parser.add_option('-o', '--output', action='store', metavar='FILE',
+                      help="Write the dependencies to the given file instead of "
+                      "stdout.")
+
+    parser.add_option('--format', action='store', type='choice',
+                      choices=('text', 'sfb', 'jsonl'), default='text',
+                      help="Select the output format: 'text' outputs one "
+                      "dependency per line, 'sfb' is a compact binary format "
+                      "(see snakefood.sfb), and 'jsonl' outputs one JSON "
+                      "record per dependency, with the line numbers and kinds "
+                      "of the imports, as soon as each file is processed (see "
+                      "snakefood.jsonl).  All are read by the other tools.")
+
+    parser.add_option('--compress', action='store', type='choice',
+                      choices=compressions,
+                      help="Compress the output with the given method (%s)." %
+                      ', '.join(compressions))
+
+    parser.add_option('--stream', action='store_true',
+                      help="Output the dependencies of each file as soon as it "
+                      "is processed, without keeping the graph in memory.  The "
+                      "files are output in the order they are processed (see "
+                      "--sort-budget).")
+
+    parser.add_option('--sort-budget', action='store', type='float',
+                      metavar='MB',
+                      help="Stream the dependencies into an external merge "
+                      "sort that keeps about the given number of megabytes of "
+                      "them in memory (as estimated from the sizes of their "
+                      "objects), and spills sorted runs to temporary files, so "
+                      "that the output is sorted as without --stream.  Implies "
+                      "--stream.")
+
+    parser.add_option('--db', action='store', metavar='FILE',
+                      help="Write the dependencies, and the imports and errors "
+                      "of the processed files, to the given SQLite database, "
+                      "for sfood-query.  An existing database is updated, only "
+                      "the rows of the files that changed are rewritten (use "
+                      "--state as well to avoid processing them again).  The "
+                      "dependencies are not output unless -o is given.")
+
+    parser.add_option('-w', '--watch', action='store_true',
+                      help="After outputting the dependencies, keep running and "
+                      "watch the input paths for changes. On each change, only "
+                      "the touched files are processed again, and the edges "
+                      "added to and removed from the graph are output, prefixed "
+                      "with '+' and '-' respectively.")
+
+    parser.add_option('--poll', action='store', type='float', metavar='SECS',
+                      help="With --watch, poll the input paths for changes every "
+                      "given number of seconds instead of using inotify.")
+
     opts, args = parser.parse_args()
     opts.verbose -= opts.quiet
     setup_logging(opts.verbose)
@@ -89,6 +271,75 @@ def gendeps():
     if opts.internal and opts.external:
         parser.error("Using --internal and --external at the same time does not make sense.")
 
+    if opts.jobs < 1:
+        parser.error("Invalid number of jobs: %d" % opts.jobs)
+    if opts.resolve_cache_size < 1:
+        parser.error("Invalid resolve cache size: %d" % opts.resolve_cache_size)
+    if opts.poll is not None and opts.poll <= 0:
+        parser.error("Invalid polling interval: %s" % opts.poll)
+    if opts.walk_threads < 1:
+        parser.error("Invalid number of threads: %d" % opts.walk_threads)
+    if opts.watch and (opts.format != 'text' or opts.compress):
+        parser.error("--watch only outputs the text format.")
+    if opts.watch and opts.db:
+        parser.error("--db cannot be used with --watch.")
+    if opts.sort_budget is not None:
+        if opts.sort_budget <= 0:
+            parser.error("Invalid sort budget: %s" % opts.sort_budget)
+        opts.stream = True
+    if opts.stream and (opts.format != 'text' or opts.compress or opts.db or
+                        opts.watch or opts.internal >= 2 or
+                        opts.cluster_by_distribution):
+        parser.error("--stream only outputs the text format, and cannot be "
+                     "used with --compress, --db, --watch, --internal twice "
+                     "or --cluster-by-distribution.")
+    if opts.format == 'jsonl' and (opts.compress or opts.internal >= 2 or
+                                   opts.cluster_by_distribution):
+        parser.error("--format=jsonl cannot be used with --compress, "
+                     "--internal twice or --cluster-by-distribution.")
+    if opts.compress == 'zstd':
+        try:
+            import zstandard
+        except ImportError:
+            parser.error("--compress=zstd requires the zstandard module.")
+    if opts.cache_subgraphs and not opts.cache_dir:
+        parser.error("--cache-subgraphs requires --cache-dir.")
+    if opts.follow_depth is not None and opts.follow_depth < 0:
+        parser.error("Invalid follow depth: %d" % opts.follow_depth)
+    if opts.follow_depth is not None or opts.follow_roots:
+        if opts.watch:
+            parser.error("--follow-depth and --follow-roots cannot be used "
+                         "with --watch.")
+        opts.follow = True
+
+    shard = None
+    if opts.shard:
+        try:
+            shard, nshards = map(int, opts.shard.split('/'))
+            if not 1 <= shard <= nshards:
+                raise ValueError
+        except ValueError:
+            parser.error("Invalid shard: %s" % opts.shard)
+        # Note: these depend on the whole set of processed files.
+        if opts.internal >= 2 or opts.follow_depth is not None or opts.follow_roots:
+            parser.error("--shard cannot be used with --internal twice, "
+                         "--follow-depth or --follow-roots.")
+        if opts.watch:
+            parser.error("--shard cannot be used with --watch.")
+
+    rules = None
+    if (opts.excludes or opts.gitignore or opts.git_files or
+        opts.walk_threads > 1):
+        rules = IgnoreRules(opts.excludes, opts.gitignore, opts.git_files,
+                            opts.walk_threads)
+
+    table = None
+    if opts.target_python:
+        try:
+            table = load_table(opts.target_python)
+        except ValueError, e:
+            parser.error(str(e))
+
     if opts.print_roots:
         inroots = find_roots(args, opts.ignores)
         for dn in sorted(inroots):
@@ -114,13 +365,58 @@ def gendeps():
     for root in inroots:
         info('  %s' % root)
 
+    if table is not None:
+        info("")
+        info("Standard library of Python %s: %s" % (table.version, table.libpath))
+        set_target(table)
+
     info("")
     info("Using the following import path to search for modules:")
+    basepath = sys.path
     sys.path = inroots + sys.path
     for dn in sys.path:
         info("  %s" % dn)
     inroots = frozenset(inroots)
 
+    cache = None
+    if opts.cache_dir:
+        cache = ParseCache(opts.cache_dir)
+
+    if opts.resolver == 'index':
+        use_directory_index(opts.revalidate)
+    resolve_cache.resize(opts.resolve_cache_size)
+
+    distindex = None
+    if opts.dist_index or opts.cluster_by_distribution:
+        cachefn = join(opts.cache_dir or default_cache_dir(),
+                       'distributions-%d.%d' % sys.version_info[:2])
+        distindex = DistributionIndex(sys.path, cachefn)
+        info("")
+        info("Distributions: %d, in %d directories." %
+             (len(distindex.dists), len(distindex.sitedirs)))
+        if opts.dist_index:
+            use_distribution_index(distindex)
+
+    db = None
+    if opts.db:
+        try:
+            db = DependencyDB(opts.db)
+        except ValueError, e:
+            parser.error(str(e))
+
+    if opts.output:
+        outfile = open(opts.output, 'wb')
+    elif db is not None:
+        outfile = None
+    else:
+        outfile = sys.stdout
+
+    # Start watching before processing the files, so that the changes made
+    # while they are processed are not missed.
+    changes = None
+    if opts.watch:
+        changes = watch_changes(args, opts.ignores, opts.poll)
+
     # Find all the dependencies.
     info("")
     info("Processing files:")
@@ -129,75 +425,184 @@ def gendeps():
     allerrors = []
     processed_files = set()
 
-    fiter = iter_pyfiles(args, opts.ignores, False)
-    while 1:
-        newfiles = set()
-        for fn in fiter:
-            if fn in processed_files:
-                continue # Make sure we process each file only once.
+    state = None
+    if opts.state:
+        state = DependencyState(opts.state, (
+            opts.do_pragmas, opts.ignore_unused, opts.parser, tuple(sys.path),
+            opts.target_python, bool(opts.internal), opts.external))
+
+    subgraphs = None
+    if opts.cache_subgraphs and opts.follow:
+        subgraphs = SubgraphCache(opts.cache_dir, (
+            opts.do_pragmas, opts.ignore_unused, opts.parser, tuple(sys.path),
+            opts.target_python, opts.dist_index, bool(opts.internal),
+            opts.external), inroots, opts.ignores, distindex)
+
+    # Only resolve the imports that can be output.
+    scope = None
+    if opts.internal or opts.external:
+        scope = ImportScope(inroots, opts.ignores, bool(opts.internal))
+
+    procargs = (opts.verbose, opts.do_pragmas, opts.ignore_unused, cache,
+                opts.parser)
+    details = (opts.format == 'jsonl' and outfile is not None) or db is not None
+    processor = make_processor(opts.jobs, process_file,
+                               procargs + (scope, details))
+
+    # The results kept in memory for watching.
+    live = None
+    if opts.watch:
+        live = LiveDepends(args, opts.ignores, inroots, basepath, procargs,
+                           opts.internal, opts.external, opts.follow, rules)
+        if opts.cluster_by_distribution:
+            live.clusters = distindex
+
+    # Results that are reused from the state of the previous run, or from the
+    # cached subgraphs.
+    reused = deque()
+
+    def submit(fn):
+        if subgraphs is not None:
+            result = subgraphs.lookup(fn)
+            if result is not None:
+                if state is not None:
+                    state.record(fn, *result)
+                reused.append((fn, result))
+                return
+        if state is not None:
+            result = state.lookup(fn)
+            if result is not None:
+                reused.append((fn, result))
+                return
+        processor.submit(fn)
+
+    def iter_results():
+        while 1:
+            while reused:
+                yield reused.popleft()
+            for fn, result in processor.results():
+                if state is not None:
+                    state.record(fn, *result[:3])
+                if subgraphs is not None:
+                    subgraphs.record(fn, *result[:3])
+                yield fn, result
+            if not reused:
+                break
+
+    # Bound the following of the dependencies.
+    frontier = None
+    if opts.follow_depth is not None or opts.follow_roots:
+        frontier = FollowFrontier(opts.follow_depth, opts.follow_roots,
+                                  opts.ignores)
+
+    inputs = []
+    for fn in iter_pyfiles(args, opts.ignores, False, rules):
+        if fn in processed_files:
+            continue # Make sure we process each file only once.
+        if shard is not None and file_shard(fn, opts.ignores, nshards) != shard:
+            continue
+        processed_files.add(fn)
+        inputs.append(fn)
+        if frontier is not None:
+            frontier.add_input(fn)
+    if live is not None:
+        live.inputs.update(inputs)
+    if state is not None:
+        changed = state.invalidate(inputs)
+        info("Files added or deleted since the previous run: %d" % len(changed))
+    for fn in inputs:
+        submit(fn)
+
+    # Stream the records of the jsonl format as the files are processed.
+    jsonl = None
+    if opts.format == 'jsonl' and outfile is not None:
+        jsonl = JsonlWriter(outfile, opts.ignores)
+
+    # Stream the dependencies as the files are processed.
+    stream = None
+    if opts.stream:
+        budget = None
+        if opts.sort_budget is not None:
+            budget = int(opts.sort_budget * 1024 * 1024)
+        stream = StreamWriter(outfile, budget, frontier is not None)
+
+    # The metadata of the processed files, for the database.
+    dbfiles = []
 
+    try:
+        for fn, result in iter_results():
+            files, errors, names = result[:3]
             info("  %s" % fn)
-            processed_files.add(fn)
+            allerrors.extend(errors)
 
-            if is_python(fn):
-                files, errors = find_dependencies(
-                    fn, opts.verbose, opts.do_pragmas, opts.ignore_unused)
-                allerrors.extend(errors)
-            else:
-                # If the file is not a source file, we don't know how to get the
-                # dependencies of that (without importing, which we want to
-                # avoid).
-                files = []
-
-            # When packages are the source of dependencies, remove the __init__
-            # file.  This is important because the targets also do not include the
-            # __init__ (i.e. when "from <package> import <subpackage>" is seen).
-            if basename(fn) == '__init__.py':
-                fn = dirname(fn)
-
-            # Make sure all the files at least appear in the output, even if it has
-            # no dependency.
-            from_ = relfile(fn, opts.ignores)
+            from_, targets, follow = file_depends(fn, files, opts.ignores, inroots,
+                                                  opts.internal, opts.external)
+            if live is not None:
+                live.record(fn, from_, targets, follow, names)
             if from_ is None:
                 continue
-            infrom = from_[0] in inroots
-            if opts.internal and not infrom:
-                continue
-            if not opts.external:
-                allfiles[from_].add((None, None))
-
-            # Add the dependencies.
-            for dfn in files:
-                xfn = dfn
-                if basename(xfn) == '__init__.py':
-                    xfn = dirname(xfn)
-
-                to_ = relfile(xfn, opts.ignores)
-                into = to_[0] in inroots
-                if (opts.internal and not into) or (opts.external and into):
-                    continue
-                allfiles[from_].add(to_)
-                newfiles.add(dfn)
-
-        if not (opts.follow and newfiles):
-            break
-        else:
-            fiter = iter(sorted(newfiles))
+            if stream is not None:
+                stream.write_file(from_, targets)
+            elif targets:
+                allfiles[from_].update(targets)
+            # Note: the details are not available for reused results.
+            fdetails = result[3] if len(result) > 3 else None
+            if jsonl is not None:
+                jsonl.write_file(from_, targets, errors, fdetails)
+            if db is not None:
+                dbfiles.append((fn, from_, errors, fdetails))
+
+            # Follow the dependencies as soon as they are found.
+            if frontier is not None:
+                for dfn in frontier.expand(fn, follow):
+                    processed_files.add(dfn)
+                    submit(dfn)
+            elif opts.follow:
+                for dfn in follow:
+                    if dfn not in processed_files:
+                        processed_files.add(dfn)
+                        submit(dfn)
+    finally:
+        processor.close()
+
+    if state is not None:
+        state.save()
+        info("")
+        info("State: reused the results of %d files, processed %d files." %
+             (state.hits, state.misses))
+
+    if subgraphs is not None:
+        subgraphs.save()
+        info("")
+        info("Subgraphs: reused the results of %d files, processed %d files." %
+             (subgraphs.hits, subgraphs.misses))
 
     # If internal is used twice, we filter down further the dependencies to the
     # set of files that were processed only, not just to the files that live in
     # the same roots.
     if opts.internal >= 2:
-        filtfiles = type(allfiles)()
-        for from_, tolist in allfiles.iteritems():
-            filtfiles[from_] = set(x for x in tolist if x in allfiles or x == (None, None))
-        allfiles = filtfiles
+        allfiles = filter_processed(allfiles)
+    if frontier is not None:
+        truncated = frontier.truncated()
+        info("")
+        info("Files not followed because of the limits: %d" % len(truncated))
+        if stream is not None:
+            for node in truncated_nodes(truncated, stream.targets, opts.ignores):
+                stream.write_file(node, [TRUNCATED])
+        else:
+            marked = mark_truncated(allfiles, truncated, opts.ignores)
+            if jsonl is not None:
+                for node in marked:
+                    jsonl.write_file(node, [TRUNCATED], [])
+    if opts.cluster_by_distribution:
+        allfiles = cluster_by_distribution(allfiles, distindex)
 
     info("")
     info("SUMMARY")
     info("=======")
 
     # Output a list of the symbols that could not be imported as modules.
+    # Note: errors are compared by value, they may come from worker processes.
     reports = [
         ("Modules that were ignored because not used:", ERROR_UNUSED, logging.info),
         ("Modules that could not be imported:", ERROR_IMPORT, logging.warning),
@@ -207,18 +612,32 @@ def gendeps():
             ("Symbols that could not be imported as modules:", ERROR_SYMBOL, logging.debug))
 
     for msg, errtype, efun in reports:
-        names = set(name for (err, name) in allerrors if err is errtype)
+        names = set(name for (err, name) in allerrors if err == errtype)
         if names:
             efun("")
             efun(msg)
             for name in sorted(names):
                 efun("  %s" % name)
 
+    # Note: the statistics of the caches of the worker processes are not
+    # available.
+    if opts.jobs == 1:
+        info("")
+        if cache is not None:
+            info("Parse cache: %d hits, %d misses." % (cache.hits, cache.misses))
+        info("Resolution cache: %d hits, %d misses, %d entries." %
+             (resolve_cache.hits, resolve_cache.misses, len(resolve_cache)))
+        info("Filesystem cache: %d system calls instead of %d, %d saved." %
+             (fscache.syscalls, fscache.queries,
+              max(0, fscache.queries - fscache.syscalls)))
+
     # Output the list of roots found.
     info("")
     info("Found roots:")
 
     found_roots = set()
+    if stream is not None:
+        found_roots.update(stream.roots)
     for key, files in allfiles.iteritems():
         found_roots.add(key[0])
         found_roots.update(map(itemgetter(0),files))
@@ -229,7 +648,331 @@ def gendeps():
 
     # Output the dependencies.
     info("")
-    output_depends(allfiles)
+    if db is not None:
+        db.update(allfiles, dbfiles)
+        db.close()
+        info("Database: updated %d sources and files in %s." %
+             (db.changed, opts.db))
+    if stream is not None:
+        stream.close()
+    elif jsonl is None and outfile is not None:
+        output_depends(allfiles, outfile, opts.format, opts.compress)
+
+    if live is not None:
+        outfile.flush()
+        watch_depends(live, outfile, changes)
+
+
+def watch_depends(live, outfile, changes):
+    """Update the 'live' dependencies on each batch of 'changes' to their input
+    paths (see watch_changes()), and output the edges added to and removed from
+    the graph."""
+    live.commit()
+    info = logging.info
+    info("")
+    info("Watching for changes:")
+    write = outfile.write
+    for paths, dirs_changed in changes:
+        if paths is None:
+            info("  (lost track of changes, processing everything again)")
+        else:
+            for fn in sorted(paths):
+                info("  %s" % fn)
+        added, removed = live.update(paths, dirs_changed)
+        for edge in removed:
+            write('-%r\n' % (edge,))
+        for edge in added:
+            write('+%r\n' % (edge,))
+        outfile.flush()
+
+
+def file_depends(fn, files, ignores, inroots, internal=0, external=False):
+    """Given file 'fn' and the list of files that it depends on, return its
+    (root, relfn) node, the set of nodes that it depends on and the list of
+    files of these dependencies, filtered according to the --internal and
+    --external options.  The node is None if 'fn' itself is filtered out."""
+
+    # When packages are the source of dependencies, remove the __init__
+    # file.  This is important because the targets also do not include the
+    # __init__ (i.e. when "from <package> import <subpackage>" is seen).
+    if basename(fn) == '__init__.py':
+        fn = dirname(fn)
+
+    # Make sure all the files at least appear in the output, even if it has
+    # no dependency.
+    from_ = relfile(fn, ignores)
+    if from_ is None:
+        return None, set(), []
+    infrom = from_[0] in inroots
+    if internal and not infrom:
+        return None, set(), []
+    targets = set()
+    if not external:
+        targets.add((None, None))
+
+    # Add the dependencies.
+    follow = []
+    for dfn in files:
+        xfn = dfn
+        if basename(xfn) == '__init__.py':
+            xfn = dirname(xfn)
+
+        to_ = relfile(xfn, ignores)
+        into = to_[0] in inroots
+        if (internal and not into) or (external and into):
+            continue
+        targets.add(to_)
+        follow.append(dfn)
+
+    return from_, targets, follow
+
+
+def file_shard(fn, ignores, nshards):
+    """Return the shard of file 'fn', from 1 to 'nshards'.  The shard only
+    depends on the path of the file relative to its root, so that the files
+    are split in the same way on all the machines."""
+    if basename(fn) == '__init__.py':
+        fn = dirname(fn)
+    node = relfile(fn, ignores)
+    relfn = basename(fn) if node is None else node[1]
+    return int(sha1(relfn).hexdigest()[:8], 16) % nshards + 1
+
+
+def filter_processed(allfiles):
+    """Filter the dependencies down to those on the files that were processed,
+    i.e. those that appear as sources of dependencies."""
+    filtfiles = type(allfiles)()
+    for from_, tolist in allfiles.iteritems():
+        filtfiles[from_] = set(x for x in tolist if x in allfiles or x == (None, None))
+    return filtfiles
+
+
+def cluster_by_distribution(allfiles, distindex):
+    """Replace the nodes of the files installed by the distributions of
+    'distindex' with a single node for each distribution.  The dependencies
+    within a distribution are dropped."""
+    nodes = {}
+    def cluster(node):
+        try:
+            return nodes[node]
+        except KeyError:
+            dist = None
+            if node[0] is not None:
+                dist = distindex.distribution(join(*node))
+            cnode = nodes[node] = node if dist is None else dist.node()
+            return cnode
+
+    clusfiles = type(allfiles)()
+    for from_, tolist in allfiles.iteritems():
+        cfrom = cluster(from_)
+        targets = clusfiles.setdefault(cfrom, set())
+        for to_ in tolist:
+            cto = cluster(to_)
+            if cto != cfrom:
+                targets.add(cto)
+    return clusfiles
+
+
+def process_file(fn, verbose, do_pragmas, ignore_unused, cache, parser,
+                 scope=None, details=False):
+    """Return the list of files that 'fn' depends on, the list of errors and the
+    set of module names that its imports refer to.  This is equivalent to
+    find_dependencies(), with the names.  'scope' is an optional ImportScope
+    that selects the imports to resolve.  If 'details' is true, the list of
+    the details of the imports (see resolve_imports()) is returned as well."""
+    extra = ([],) if details else ()
+    if not is_python(fn):
+        # If the file is not a source file, we don't know how to get the
+        # dependencies of that (without importing, which we want to
+        # avoid).
+        return ([], [], ()) + extra
+
+    found_imports, future_imports, unused_imports = get_file_imports(
+        fn, ignore_unused, cache, parser)
+    if found_imports is None:
+        return ([], [], ()) + extra
+
+    errors = [(ERROR_UNUSED, lname)
+              for _, _, lname, _, _, _ in unused_imports]
+    files, rerrors = resolve_imports(fn, found_imports, future_imports,
+                                     verbose, do_pragmas, scope=scope,
+                                     details=extra[0] if details else None)
+    return (files, errors + rerrors, get_import_names(found_imports)) + extra
+
+
+class LiveDepends(object):
+    """The dependencies of the files under a list of input paths, kept in memory
+    and updated as files change.
+
+    The node, targets and followed files of each processed file are kept, so
+    that on a change, only the changed files, and those whose imports may
+    resolve differently because files were added or deleted, need to be
+    processed again.  'procargs' are the extra arguments to process_file(), and
+    'rules' selects the input files, see iter_pyfiles().  If 'clusters' is
+    set to a DistributionIndex, the files of distributions are clustered.
+    """
+    def __init__(self, args, ignores, inroots, basepath, procargs,
+                 internal=0, external=False, follow=False, rules=None):
+        self.args = args
+        self.ignores = ignores
+        self.inroots = frozenset(inroots)
+        self.basepath = basepath  # The search path, without the roots.
+        self.procargs = procargs
+        self.internal = internal
+        self.external = external
+        self.follow = follow
+        self.rules = rules
+        self.inputs = set()       # The files found under the input paths.
+        self.results = {}         # filename -> (from_, targets, follow, names)
+        self.edges = set()        # The edges of the last graph.
+        self.clusters = None
+        self.scope = self.make_scope()
+
+    def make_scope(self):
+        "Return the ImportScope for the current roots, or None."
+        if self.internal or self.external:
+            return ImportScope(self.inroots, self.ignores, bool(self.internal))
+
+    def record(self, fn, from_, targets, follow, names):
+        "Record the dependencies of file 'fn'."
+        self.results[fn] = (from_, targets, follow, frozenset(names))
+
+    def commit(self):
+        "Take the recorded dependencies as the current graph."
+        self.edges = self.get_edges()
+
+    def get_depends(self):
+        "Return the dictionary of (from -> set of targets) of the graph."
+        allfiles = defaultdict(set)
+        for from_, targets, _, _ in self.results.itervalues():
+            if from_ is not None and targets:
+                allfiles[from_].update(targets)
+        if self.internal >= 2:
+            allfiles = filter_processed(allfiles)
+        if self.clusters is not None:
+            allfiles = cluster_by_distribution(allfiles, self.clusters)
+        return allfiles
+
+    def get_edges(self):
+        "Return the set of (from, to) edges of the graph."
+        return set((from_, to_)
+                   for from_, targets in self.get_depends().iteritems()
+                   for to_ in targets)
+
+    def process(self, fn):
+        "Process file 'fn' and record its dependencies."
+        files, _, names = process_file(fn, *self.procargs + (self.scope,))
+        from_, targets, follow = file_depends(fn, files, self.ignores,
+                                              self.inroots, self.internal,
+                                              self.external)
+        self.record(fn, from_, targets, follow, names)
+        return follow
+
+    def update(self, paths, dirs_changed=False):
+        """Process the changes to the given files or directories, and return the
+        sorted lists of edges added to and removed from the graph.  If 'paths'
+        is None, all the files are processed again.  If 'dirs_changed' is true,
+        the package roots are searched for again."""
+        clear_caches()
+        self.scope = self.make_scope()
+
+        # Adding or deleting packages may change the roots as well.
+        if paths is not None and not dirs_changed:
+            dirs_changed = any(basename(path) == '__init__.py' and
+                               isfile(path) != (path in self.results)
+                               for path in paths)
+        if dirs_changed or paths is None:
+            inroots = frozenset(find_roots(self.args, self.ignores))
+            if inroots != self.inroots:
+                logging.info("The roots have changed, processing everything again.")
+                self.inroots = inroots
+                self.scope = self.make_scope()
+                sys.path = sorted(inroots) + self.basepath
+                paths = None
+
+        if paths is None:
+            self.inputs = set(iter_pyfiles(self.args, self.ignores, False,
+                                           self.rules))
+            self.results.clear()
+            todo = sorted(self.inputs)
+        else:
+            todo = self.invalidate(paths)
+
+        # Process the files, following their dependencies if requested.
+        queue = deque(todo)
+        seen = set(todo)
+        while queue:
+            follow = self.process(queue.popleft())
+            if self.follow:
+                for dfn in follow:
+                    if dfn not in seen and dfn not in self.results:
+                        seen.add(dfn)
+                        queue.append(dfn)
+        if self.follow:
+            self.prune()
+
+        edges = self.get_edges()
+        added = sorted(edges - self.edges)
+        removed = sorted(self.edges - edges)
+        self.edges = edges
+        return added, removed
+
+    def invalidate(self, paths):
+        """Forget the results of the deleted files among 'paths', and return the
+        list of files that need to be processed again."""
+        results, inputs = self.results, self.inputs
+        changed = set()
+        for path in paths:
+            if path in results or path in inputs:
+                changed.add(path)
+            elif isfile(path):
+                if self.selects(path):
+                    changed.add(path)
+            else:
+                # A directory that was deleted or moved away.
+                prefix = join(path, '')
+                changed.update(fn for fn in results if fn.startswith(prefix))
+
+        # Adding or deleting files may change how other imports resolve.
+        names = set()
+        todo = []
+        for fn in sorted(changed):
+            if isfile(fn):
+                if fn not in results:
+                    names.add(module_name(fn))
+                if fn in inputs or self.selects(fn):
+                    inputs.add(fn)
+                todo.append(fn)
+            else:
+                names.add(module_name(fn))
+                inputs.discard(fn)
+                results.pop(fn, None)
+        if names:
+            todo.extend(sorted(fn for fn, result in results.iteritems()
+                               if fn not in changed and
+                               not names.isdisjoint(result[3])))
+        return todo
+
+    def selects(self, fn):
+        """Return true if file 'fn' is one of the input files, according to the
+        rules that select them."""
+        # Note: without rules, the directories are walked like with rules
+        # without patterns.
+        rules = self.rules if self.rules is not None else IgnoreRules()
+        return is_python(fn) and rules.selects(fn, self.args, self.ignores)
+
+    def prune(self):
+        "Forget the results of the followed files that are no longer reachable."
+        results = self.results
+        reached = set(fn for fn in self.inputs if fn in results)
+        queue = deque(reached)
+        while queue:
+            for dfn in results[queue.popleft()][2]:
+                if dfn not in reached and dfn in results:
+                    reached.add(dfn)
+                    queue.append(dfn)
+        for fn in set(results) - reached:
+            del results[fn]
 
 
 def main():
@@ -7,7 +7,8 @@ Read snakefood dependencies and output a visual graph.
 import sys, os
 from os.path import *
 
-from snakefood.depends import read_depends, eliminate_redundant_depends
+from snakefood.depends import read_depends, InvalidDepends
+from snakefood.graphlib import DependencyGraph
 
 graph_settings = [
         ("rankdir", "LR"),
@@ -94,6 +95,10 @@ def main():
                       default=-1,
                       help="Resolution to use for graph.")
 
+    parser.add_option('--strict', action='store_true',
+                      help="Fail on the first invalid line of the dependencies "
+                      "instead of skipping it with a warning.")
+
     global opts
     opts, args = parser.parse_args()
 
@@ -104,8 +109,11 @@ def main():
             f = sys.stdin
         else:
             f = open(fn)
-        depends = read_depends(f)
-        if opts.redundant:
-            depends = eliminate_redundant_depends(depends)
-        graph(depends, sys.stdout.write,
-            opts.fontsize, opts.dpi)
+        depends = read_depends(f, opts.strict)
+        try:
+            if opts.redundant:
+                depends = DependencyGraph(depends).depends()
+            graph(depends, sys.stdout.write,
+                opts.fontsize, opts.dpi)
+        except InvalidDepends, e:
+            raise SystemExit(e)
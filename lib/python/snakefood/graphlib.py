@@ -0,0 +1,178 @@
+"""
+A compact in-memory dependency graph, shared by the tools that read the
+dependencies.
+
+The (root, relfn) nodes are interned to integer ids, in sorted order, and the
+edges are stored in the compressed sparse row (CSR) form, in both directions:
+for each node, an offset into an array of the ids of its targets (or
+sources), sorted.  The whole adjacency is thus held in a few arrays of
+integers instead of dictionaries of sets of tuples of strings, and iterating
+over the edges generates them in the sorted order of the output of sfood,
+without duplicates.
+
+The special targets, the (None, None) target of the nodes without
+dependencies and TRUNCATED, are nodes like the others; is_marker() tells them
+apart.
+"""
+# This file is part of the Snakefood open source package.
+# See http://furius.ca/snakefood/ for licensing details.
+
+import sys
+from array import array
+from bisect import bisect_left
+from itertools import izip, groupby
+from operator import itemgetter
+
+__all__ = ('DependencyGraph',)
+
+
+def _csr(nnodes, keys):
+    """Return the (offsets, ids) arrays of the CSR form of the sorted list of
+    edge 'keys', encoded as from * nnodes + to."""
+    offsets = array('l', [bisect_left(keys, i * nnodes)
+                          for i in xrange(nnodes + 1)])
+    ids = array('i', [key % nnodes for key in keys])
+    return offsets, ids
+
+
+class DependencyGraph(object):
+    """A graph of the dependencies 'depends', an iterable of ((root, fn), (root,
+    fn)) pairs, e.g. from read_depends(), built in one pass."""
+
+    def __init__(self, depends=()):
+        ids = {}
+        intern = ids.setdefault
+        src, dst = array('i'), array('i')
+        for from_, to_ in depends:
+            src.append(intern(from_, len(ids)))
+            dst.append(intern(to_, len(ids)))
+
+        # Renumber the nodes in sorted order.
+        self.nodes = sorted(ids)
+        self.ids = ids        # node -> id
+        rank = array('i', [0]) * len(ids)
+        for i, node in enumerate(self.nodes):
+            rank[ids[node]] = i
+            ids[node] = i
+
+        n = max(len(ids), 1)
+        # Note: the keys of sorted dependencies are already sorted, which the
+        # sort takes advantage of.
+        keys = [rank[s] * n + rank[d] for s, d in izip(src, dst)]
+        del src, dst
+        keys.sort()
+        keys = map(itemgetter(0), groupby(keys))
+        self.out_offsets, self.out_ids = _csr(n, keys)
+        keys = sorted([(key % n) * n + key // n for key in keys])
+        self.in_offsets, self.in_ids = _csr(n, keys)
+
+    def __len__(self):
+        return len(self.nodes)
+
+    @property
+    def nedges(self):
+        return len(self.out_ids)
+
+    def node_id(self, node):
+        "Return the id of 'node', or None if it is not in the graph."
+        return self.ids.get(node)
+
+    def is_marker(self, i):
+        "Return true if node 'i' is a special target, with no root."
+        return self.nodes[i][0] is None
+
+    def targets(self, i):
+        "Return the sorted ids of the nodes that node 'i' depends on."
+        return self.out_ids[self.out_offsets[i]:self.out_offsets[i + 1]]
+
+    def sources(self, i):
+        "Return the sorted ids of the nodes that depend on node 'i'."
+        return self.in_ids[self.in_offsets[i]:self.in_offsets[i + 1]]
+
+    def out_degree(self, i):
+        return self.out_offsets[i + 1] - self.out_offsets[i]
+
+    def in_degree(self, i):
+        return self.in_offsets[i + 1] - self.in_offsets[i]
+
+    def edges(self):
+        "Generate the (from, to) id pairs of the edges, in sorted order."
+        offsets, targets = self.out_offsets, self.out_ids
+        for i in xrange(len(self.nodes)):
+            for j in targets[offsets[i]:offsets[i + 1]]:
+                yield i, j
+
+    def depends(self):
+        "Generate the ((root, fn), (root, fn)) dependencies, in sorted order."
+        nodes = self.nodes
+        offsets, targets = self.out_offsets, self.out_ids
+        for i, from_ in enumerate(nodes):
+            for j in targets[offsets[i]:offsets[i + 1]]:
+                yield from_, nodes[j]
+
+    def flatten(self):
+        """Return the list of the nodes in the order they appear in the sorted
+        dependencies, without the special targets (see flatten_depends())."""
+        nodes = self.nodes
+        seen = bytearray(len(nodes))
+        for i, node in enumerate(nodes):
+            if node[0] is None:
+                seen[i] = 1
+        flat = []
+        offsets, targets = self.out_offsets, self.out_ids
+        for i in xrange(len(nodes)):
+            if offsets[i] == offsets[i + 1]:
+                continue
+            if not seen[i]:
+                seen[i] = 1
+                flat.append(nodes[i])
+            for j in targets[offsets[i]:offsets[i + 1]]:
+                if not seen[j]:
+                    seen[j] = 1
+                    flat.append(nodes[j])
+        return flat
+
+    def reachable(self, ids, reverse=False):
+        """Return the set of the ids of the nodes that the nodes 'ids' depend on,
+        or that depend on them if 'reverse' is true, transitively, including
+        the nodes 'ids' themselves."""
+        if reverse:
+            offsets, adjacent = self.in_offsets, self.in_ids
+        else:
+            offsets, adjacent = self.out_offsets, self.out_ids
+        reached = set(ids)
+        stack = list(reached)
+        while stack:
+            i = stack.pop()
+            for j in adjacent[offsets[i]:offsets[i + 1]]:
+                if j not in reached:
+                    reached.add(j)
+                    stack.append(j)
+        return reached
+
+    def subgraph(self, ids):
+        "Return the graph of the edges between the nodes 'ids'."
+        ids = set(ids)
+        nodes = self.nodes
+        return DependencyGraph((nodes[i], nodes[j]) for i, j in self.edges()
+                               if i in ids and j in ids)
+
+    def map_nodes(self, func):
+        """Return the graph of the dependencies with each node replaced by
+        func(node), which is called once per node.  The dependencies of a node
+        on itself that result are replaced by dependencies on (None, None)."""
+        mapped = map(func, self.nodes)
+        def iter_mapped():
+            for i, j in self.edges():
+                cfrom, cto = mapped[i], mapped[j]
+                if cfrom == cto:
+                    cto = (None, None)
+                yield cfrom, cto
+        return DependencyGraph(iter_mapped())
+
+    def write(self, outfile=None):
+        "Write the dependencies in the text format, to stdout by default."
+        write = (outfile or sys.stdout).write
+        for dep in self.depends():
+            write(repr(dep))
+            write('\n')
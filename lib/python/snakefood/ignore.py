@@ -0,0 +1,340 @@
+"""
+Selection of the source files under directories, with ignore patterns.
+
+By default, the files are found by walking the directories and skipping the
+directories whose names are ignored (see def_ignores).  The rules here can in
+addition:
+
+- skip the paths that match gitignore-style patterns (e.g. 'node_modules/',
+  '*.egg-info', '/build'), given explicitly;
+- honor the .gitignore files found in the walked directories;
+- list the files with 'git ls-files' instead of walking, when the directory is
+  within a git work tree (this lists the tracked files, and the untracked
+  files that are not ignored);
+- list independent subtrees in parallel threads, which helps when listing
+  directories is slow, e.g. on network filesystems.
+"""
+# This file is part of the Snakefood open source package.
+# See http://furius.ca/snakefood/ for licensing details.
+
+import os, re, threading, logging
+from os.path import *
+from subprocess import Popen, PIPE
+from Queue import Queue
+
+from snakefood.util import is_python, def_ignores
+from snakefood.fscache import fscache, DIR
+
+__all__ = ('IgnoreRules', 'PatternList')
+
+
+class PatternList(object):
+    """A list of gitignore-style patterns, relative to base directory 'base'.
+
+    As in gitignore files: patterns without a slash match names at any depth,
+    others are anchored at the base directory; a trailing slash matches only
+    directories; '**' matches any number of directories; and a leading '!'
+    re-includes the paths that a previous pattern excluded.
+    """
+    def __init__(self, lines, base):
+        self.base = base
+        self.rules = []  # (regexp, negate, dironly)
+        for line in lines:
+            self.add(line)
+
+    def add(self, line):
+        line = line.rstrip('\r\n').rstrip()
+        if not line or line.startswith('#'):
+            return
+        negate = line.startswith('!')
+        if negate:
+            line = line[1:]
+        elif line.startswith('\\'):
+            line = line[1:]
+        dironly = line.endswith('/')
+        line = line.rstrip('/')
+        if not line:
+            return
+        if '/' in line:
+            prefix = '^'
+            line = line.lstrip('/')
+        else:
+            prefix = '^(?:.*/)?'
+        regexp = re.compile(prefix + translate(line) + '$')
+        self.rules.append((regexp, negate, dironly))
+
+    def match(self, path, isdir):
+        """Return true if 'path' is ignored, false if it is re-included, and
+        None if no pattern matches it."""
+        rel = relpath(path, self.base)
+        result = None
+        for regexp, negate, dironly in self.rules:
+            if dironly and not isdir:
+                continue
+            if regexp.match(rel):
+                result = not negate
+        return result
+
+    def __len__(self):
+        return len(self.rules)
+
+
+def translate(pattern):
+    "Translate a gitignore glob pattern to a regular expression."
+    i, n = 0, len(pattern)
+    res = []
+    while i < n:
+        c = pattern[i]
+        if pattern.startswith('**/', i):
+            res.append('(?:.*/)?')
+            i += 3
+        elif pattern.startswith('**', i):
+            res.append('.*')
+            i += 2
+        elif c == '*':
+            res.append('[^/]*')
+            i += 1
+        elif c == '?':
+            res.append('[^/]')
+            i += 1
+        elif c == '[':
+            j = pattern.find(']', i+2)
+            if j == -1:
+                res.append(re.escape(c))
+                i += 1
+            else:
+                chars = pattern[i+1:j].replace('\\', '\\\\')
+                if chars[0] == '!':
+                    chars = '^' + chars[1:]
+                res.append('[%s]' % chars)
+                i = j+1
+        elif c == '\\' and i+1 < n:
+            res.append(re.escape(pattern[i+1]))
+            i += 2
+        else:
+            res.append(re.escape(c))
+            i += 1
+    return ''.join(res)
+
+
+def is_ignored(path, isdir, patterns):
+    "Return true if 'path' is ignored by the given list of PatternList's."
+    result = None
+    for plist in patterns:
+        match = plist.match(path, isdir)
+        if match is not None:
+            result = match
+    return bool(result)
+
+
+class IgnoreRules(object):
+    """The rules to select the source files under directories.
+
+    'patterns' is a list of gitignore-style patterns, relative to each of the
+    directories searched.  If 'gitignore' is true, the .gitignore files are
+    honored.  If 'git' is true, the files are listed with git when possible.
+    'threads' is the number of threads used to walk the directories.
+    """
+    def __init__(self, patterns=(), gitignore=False, git=False, threads=1):
+        self.patterns = list(patterns)
+        self.gitignore = gitignore
+        self.git = git
+        self.threads = threads
+        self.ignorefiles = {}  # dn -> PatternList of its .gitignore file
+
+    def iter_pyfiles(self, dirsorfns, ignores, abspaths=False):
+        "Yield the Python files under the given directories, or the given files."
+        for dn in dirsorfns:
+            if not abspaths:
+                dn = fscache.realpath(dn)
+
+            if not fscache.exists(dn):
+                logging.warning("File '%s' does not exist." % dn)
+                continue
+
+            if not fscache.isdir(dn):
+                if is_python(dn):
+                    yield dn
+                continue
+
+            top = []
+            if self.patterns:
+                top.append(PatternList(self.patterns, dn))
+            files = None
+            if self.git:
+                files = self.git_files(dn, ignores, top)
+            if files is None:
+                files = self.walk_files(dn, ignores, top)
+            for fn in files:
+                yield fn
+
+    def selects(self, fn, dirsorfns, ignores, abspaths=False):
+        """Return true if Python file 'fn' is one of the files that
+        iter_pyfiles() yields for the given directories or files, without
+        listing them, e.g. for a file that has just been created."""
+        ignores = ignores or def_ignores
+        for dn in dirsorfns:
+            if not abspaths:
+                dn = fscache.realpath(dn)
+            if fn == dn:
+                return True
+            if not fn.startswith(join(dn, '')):
+                continue
+
+            comps = fn[len(dn)+1:].split(os.sep)
+            top = []
+            if self.patterns:
+                top.append(PatternList(self.patterns, dn))
+            files = None
+            if self.git:
+                files = self.git_files(dn, ignores, top, ['/'.join(comps)])
+            if files is not None:
+                if fn in files:
+                    return True
+                continue
+
+            # Check the path like the walk does, one directory at a time.
+            path, patterns = dn, top
+            for i, comp in enumerate(comps):
+                if self.gitignore:
+                    plist = self.ignorefile(path)
+                    if plist:
+                        patterns = patterns + [plist]
+                path = join(path, comp)
+                isdir = i < len(comps)-1
+                if isdir and comp in ignores:
+                    break
+                if is_ignored(path, isdir, patterns):
+                    break
+            else:
+                return True
+        return False
+
+    def git_files(self, dn, ignores, patterns, paths=()):
+        """Return the list of the Python files under 'dn' that git knows about,
+        or None if 'dn' is not within a git work tree.  If 'paths' is given,
+        only the files among these paths relative to 'dn' are listed."""
+        # Note: the tracked files are listed separately, because the exclude
+        # patterns would apply to them otherwise.
+        listed = set()
+        for args in (['--cached'], ['--others', '--exclude-standard']):
+            if paths:
+                args = args + ['--'] + list(paths)
+            try:
+                p = Popen(['git', 'ls-files', '-z'] + args, cwd=dn,
+                          stdout=PIPE, stderr=PIPE)
+                out, _ = p.communicate()
+            except OSError:
+                return None
+            if p.returncode != 0:
+                return None
+            listed.update(out.split('\0'))
+
+        files = []
+        ignores = frozenset(ignores)
+        for rel in sorted(listed):
+            if not rel:
+                continue
+            comps = rel.split('/')
+            if not ignores.isdisjoint(comps[:-1]):
+                continue
+            fn = join(dn, *comps)
+            if patterns and self.ignored_path(dn, comps, patterns):
+                continue
+            # Note: files deleted from the work tree are still listed.
+            if fscache.isfile(fn) and is_python(fn):
+                files.append(fn)
+        return files
+
+    def ignored_path(self, dn, comps, patterns):
+        "Return true if the path made of 'comps' under 'dn' is ignored."
+        path = dn
+        for i, comp in enumerate(comps):
+            path = join(path, comp)
+            if is_ignored(path, i < len(comps)-1, patterns):
+                return True
+        return False
+
+    def walk_files(self, top, ignores, patterns):
+        "Generate the Python files under directory 'top'."
+        if self.threads > 1:
+            self.prefetch(top, ignores, patterns)
+        stack = [(top, patterns)]
+        while stack:
+            dn, patterns = stack.pop()
+            dirs, files, patterns = self.visit(dn, ignores, patterns)
+            for fn in files:
+                yield fn
+            stack.extend((join(dn, x), patterns) for x in reversed(dirs))
+
+    def visit(self, dn, ignores, patterns):
+        """List directory 'dn' and return the names of the subdirectories to
+        walk, the Python files in it, and the patterns for its subdirectories."""
+        listing = fscache.listing(dn)
+        if listing is None:
+            return [], [], patterns
+        names, kinds = listing
+
+        if self.gitignore and '.gitignore' in kinds:
+            plist = self.ignorefile(dn)
+            if plist:
+                patterns = patterns + [plist]
+
+        dirs, files = [], []
+        for name in names:
+            fn = join(dn, name)
+            kind = kinds.get(name)
+            if kind == DIR:
+                if name in ignores or is_ignored(fn, True, patterns):
+                    continue
+                dirs.append(name)
+            elif fscache.isdir(fn):
+                continue # Links to directories are not followed.
+            elif not is_ignored(fn, False, patterns) and is_python(fn):
+                files.append(fn)
+        return dirs, files, patterns
+
+    def ignorefile(self, dn):
+        "Return the PatternList of the .gitignore file of directory 'dn'."
+        try:
+            return self.ignorefiles[dn]
+        except KeyError:
+            try:
+                f = open(join(dn, '.gitignore'))
+                try:
+                    plist = PatternList(f, dn)
+                finally:
+                    f.close()
+            except IOError:
+                plist = PatternList((), dn)
+            self.ignorefiles[dn] = plist
+            return plist
+
+    def prefetch(self, top, ignores, patterns):
+        """Walk the directory tree under 'top' with threads, to fill the caches
+        of directory listings and of the detection of Python files."""
+        queue = Queue()
+
+        def worker():
+            while 1:
+                item = queue.get()
+                if item is None:
+                    break
+                dn, patterns = item
+                try:
+                    dirs, _, patterns = self.visit(dn, ignores, patterns)
+                    for x in dirs:
+                        queue.put((join(dn, x), patterns))
+                except Exception, e:
+                    logging.warning("Error listing '%s': %s" % (dn, e))
+                finally:
+                    queue.task_done()
+
+        threads = [threading.Thread(target=worker) for _ in xrange(self.threads)]
+        for thread in threads:
+            thread.daemon = True
+            thread.start()
+        queue.put((top, patterns))
+        queue.join()
+        for thread in threads:
+            queue.put(None)
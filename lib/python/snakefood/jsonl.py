@@ -0,0 +1,117 @@
+"""
+The JSON Lines format for the dependencies, 'jsonl'.
+
+Each line is a JSON object, a record, with the "from" and "to" nodes of a
+dependency, as [root, filename] lists.  A null "to" stands for the (None,
+None) target of the files without dependencies, and the marker edges of the
+truncated files have a [null, "..."] target.  The records of the dependencies
+found when processing a file can also carry:
+
+  "imports"     the list of the imports of the dependency, with their "line",
+                their "kind" ('import', 'from' or 'relative') and the name of
+                their "module";
+  "unresolved"  the name of a module that could not be imported, in the
+                records of the imports that could not be resolved (their "to"
+                is null); these are skipped when reading the dependencies.
+
+The records are written as the files are processed, so they are not sorted.
+"""
+# This file is part of the Snakefood open source package.
+# See http://furius.ca/snakefood/ for licensing details.
+
+import json
+from os.path import *
+
+from snakefood.find import ERROR_IMPORT
+from snakefood.roots import relfile
+
+__all__ = ('JsonlWriter', 'parse_record', 'is_jsonl')
+
+
+
+def is_jsonl(head):
+    "Return true if 'head', the first line of a file, is a jsonl record."
+    return head.lstrip().startswith('{')
+
+
+def _node(value):
+    "Return the (root, fn) node of the JSON list 'value'."
+    if value is None:
+        return None, None
+    root, fn = value
+    if isinstance(root, unicode):
+        root = root.encode('utf8')
+    if isinstance(fn, unicode):
+        fn = fn.encode('utf8')
+    return root, fn
+
+
+def parse_record(line, roots=None):
+    """Parse a jsonl record.  Return its ((root, fn), (root, fn)) dependency, or
+    None if it is not a dependency.  Raise a ValueError if it is not valid.  If
+    a dictionary 'roots' is given, the root strings are interned in it."""
+    if roots is None:
+        roots = {}
+    try:
+        record = json.loads(line)
+        if 'unresolved' in record:
+            return None
+        (froot, ffn), (troot, tfn) = _node(record['from']), _node(record['to'])
+    except (TypeError, KeyError, ValueError, AttributeError):
+        raise ValueError("Invalid record")
+    if not isinstance(froot, str) or not isinstance(ffn, str):
+        raise ValueError("Invalid record")
+    return ((roots.setdefault(froot, froot), ffn),
+            (roots.setdefault(troot, troot), tfn))
+
+
+class JsonlWriter(object):
+    """Write the dependencies of the files to file object 'outfile' as they are
+    processed.  Filenames are mapped to nodes like file_depends() does."""
+
+    def __init__(self, outfile, ignores):
+        self.outfile = outfile
+        self.ignores = ignores
+        self.dumps = json.JSONEncoder(separators=(', ', ': '),
+                                      sort_keys=True).encode
+
+    def write(self, record):
+        self.outfile.write(self.dumps(record))
+        self.outfile.write('\n')
+
+    def node(self, fn):
+        "Return the node of file 'fn'."
+        if basename(fn) == '__init__.py':
+            fn = dirname(fn)
+        return relfile(fn, self.ignores)
+
+    def write_file(self, from_, targets, errors, details=None):
+        """Write the records of the dependencies of node 'from_' on 'targets',
+        with the metadata of the (lineno, kind, modname, filename, unresolved)
+        'details' of its imports if available, and the names of its
+        unresolved imports from 'errors'."""
+        imports = {}
+        unresolved = []
+        if details is not None:
+            for lineno, kind, modname, fn, name in details:
+                if name is not None:
+                    unresolved.append({'line': lineno, 'kind': kind,
+                                       'unresolved': name})
+                if fn is None:
+                    continue
+                info = {'line': lineno, 'kind': kind, 'module': modname}
+                imports.setdefault(self.node(fn), []).append(info)
+        else:
+            unresolved = [{'unresolved': name}
+                          for err, name in errors if err == ERROR_IMPORT]
+
+        for to_ in sorted(targets):
+            record = {'from': from_, 'to': None if to_ == (None, None) else to_}
+            if to_ in imports:
+                record['imports'] = imports[to_]
+            self.write(record)
+        for record in unresolved:
+            record['from'] = from_
+            record['to'] = None
+            self.write(record)
+        self.outfile.flush()
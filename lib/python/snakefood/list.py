@@ -8,13 +8,14 @@ AST to obtain the list of imports.)
 # This file is part of the Snakefood open source package.
 # See http://furius.ca/snakefood/ for licensing details.
 
-import logging
+import os, logging
 from os.path import *
 
 from six import print_
 
 from snakefood.util import iter_pyfiles, setup_logging, def_ignores
 from snakefood.find import find_imports
+from snakefood.cache import ParseCache
 
 
 
@@ -35,9 +36,24 @@ def list_imports():
     parser.add_option('-v', '--verbose', action='count', default=0,
                       help="Output input lines as well.")
 
+    parser.add_option('--cache-dir', action='store',
+                      default=os.environ.get('SFOOD_CACHE_DIR'),
+                      help="Cache the imports parsed from each file in the given "
+                      "directory. (Default: $SFOOD_CACHE_DIR.)")
+
+    parser.add_option('--parser', action='store', type='choice',
+                      choices=('ast', 'fast'), default='ast',
+                      help="Select how imports are extracted from source files: "
+                      "'ast' uses the compiler AST, 'fast' only uses the tokenizer "
+                      "and is much faster, but does not report all syntax errors.")
+
     opts, args = parser.parse_args()
     setup_logging(opts.verbose)
 
+    cache = None
+    if opts.cache_dir:
+        cache = ParseCache(opts.cache_dir)
+
     if not args:
         logging.warning("Searching for files from root directory.")
         args = ['.']
@@ -48,7 +64,8 @@ def list_imports():
         all_symnames = set()
         for fn in iter_pyfiles(args, opts.ignores):
             all_symnames.update(x[0] for x in
-                                find_imports(fn, opts.verbose, opts.ignores))
+                                find_imports(fn, opts.verbose, opts.ignores,
+                                             cache, opts.parser))
         for symname in sorted(all_symnames):
             print_(symname)
     else:
@@ -57,7 +74,9 @@ def list_imports():
                 lines = list(open(fn, 'rU'))
             for symname, lineno, islocal in find_imports(fn,
                                                          opts.verbose,
-                                                         opts.ignores):
+                                                         opts.ignores,
+                                                         cache,
+                                                         opts.parser):
                 print_('%s:%d: %s' % (fn, lineno, symname))
                 if opts.verbose:
                     for no in xrange(lineno-1, len(lines)):
@@ -8,17 +8,40 @@ things.
 
 # stdlib imports
 import compiler
+from compiler.ast import Discard, Const, AssName, List, Tuple
+from compiler.consts import OP_ASSIGN
 
-__all__ = ('get_names_from_ast', 'filter_unused_imports',
-           'NamesVisitor', 'AssignVisitor', 'AllVisitor')
+__all__ = ('get_names_from_ast', 'filter_unused_imports', 'get_assigned_names',
+           'scan_ast', 'ImportVisitor', 'NamesVisitor', 'AssignVisitor',
+           'AllVisitor', 'SourceVisitor')
+
+
+# The last AST scanned and its SourceVisitor, see scan_ast().
+_last_scan = (None, None)
+
+def scan_ast(ast):
+    """Run the SourceVisitor over the AST and return it.  The result for the
+    last AST is remembered, so that the functions below can be called in
+    sequence on the same tree with a single traversal."""
+    global _last_scan
+    last_ast, vis = _last_scan
+    if ast is not last_ast:
+        vis = SourceVisitor()
+        vis.walk(ast)
+        vis.finalize()
+        _last_scan = (ast, vis)
+    return vis
 
 
 def get_names_from_ast(ast):
     "Find all the names being referenced/used."
-    vis = NamesVisitor()
-    compiler.walk(ast, vis)
-    dotted_names, simple_names = vis.finalize()
-    return (dotted_names, simple_names)
+    vis = scan_ast(ast)
+    return (vis.dotted, vis.simple)
+
+
+def get_assigned_names(ast):
+    "Find all the potential names being assigned to (see AssignVisitor)."
+    return scan_ast(ast).assnames
 
 
 def filter_unused_imports(ast, found_imports):
@@ -29,13 +52,10 @@ def filter_unused_imports(ast, found_imports):
     """
     used_imports, unused_imports = [], []
 
-    # Find all the names being referenced/used.
-    dotted_names, simple_names = get_names_from_ast(ast)
-
-    # Find all the names being exported via __all__.
-    vis = AllVisitor()
-    compiler.walk(ast, vis)
-    exported = vis.finalize()
+    # Find all the names being referenced/used, and the names being exported
+    # via __all__.
+    vis = scan_ast(ast)
+    dotted_names, exported = vis.dotted, vis.all
 
     # Check that all imports have been referenced at least once.
     usednames = set(x[0] for x in dotted_names)
@@ -51,6 +71,89 @@ def filter_unused_imports(ast, found_imports):
     return used_imports, unused_imports
 
 
+class ImportVisitor(object):
+    """AST visitor for grabbing the import statements.
+
+    This visitor produces a list of
+
+       (module-name, remote-name, local-name, line-no, pragma)
+
+    * remote-name is the name off the symbol in the imported module.
+    * local-name is the name of the object given in the importing module.
+    """
+    def __init__(self):
+        self.modules = []
+        self.recent = []
+        self.future = set()
+
+    def visitImport(self, node):
+        self.accept_imports()
+        self.recent.extend((x[0], None, x[1] or x[0], node.lineno, 0)
+                           for x in node.names)
+
+    def visitFrom(self, node):
+        self.accept_imports()
+        modname = node.modname
+        if modname == '__future__':
+            for name, as_ in node.names:
+                self.future.add(name)
+            return
+        for name, as_ in node.names:
+            if name == '*':
+                # We really don't know...
+                mod = (modname, None, None, node.lineno, node.level)
+            else:
+                mod = (modname, name, as_ or name, node.lineno, node.level)
+            self.recent.append(mod)
+
+    # For package initialization files, try to fetch the __all__ list, which
+    # implies an implicit import if the package is being imported via
+    # from-import; from the documentation:
+    #
+    #  The import statement uses the following convention: if a package's
+    #  __init__.py code defines a list named __all__, it is taken to be the list
+    #  of module names that should be imported when from package import * is
+    #  encountered. It is up to the package author to keep this list up-to-date
+    #  when a new version of the package is released. Package authors may also
+    #  decide not to support it, if they don't see a use for importing * from
+    #  their package.
+    def visitAssign(self, node):
+        lhs = node.nodes
+        if (len(lhs) == 1 and
+            isinstance(lhs[0], AssName) and
+            lhs[0].name == '__all__' and
+            lhs[0].flags == OP_ASSIGN):
+
+            rhs = node.expr
+            if isinstance(rhs, (List, Tuple)):
+                for namenode in rhs:
+                    # Note: maybe we should handle the case of non-consts.
+                    if isinstance(namenode, Const):
+                        modname = namenode.value
+                        mod = (modname, None, modname, node.lineno, 0)#node.level
+                        self.recent.append(mod)
+
+    def default(self, node):
+        pragma = None
+        if self.recent:
+            if isinstance(node, Discard):
+                children = node.getChildren()
+                if len(children) == 1 and isinstance(children[0], Const):
+                    const_node = children[0]
+                    pragma = const_node.value
+
+        self.accept_imports(pragma)
+
+    def accept_imports(self, pragma=None):
+        self.modules.extend((m, r, l, n, lvl, pragma)
+                            for (m, r, l, n, lvl) in self.recent)
+        self.recent = []
+
+    def finalize(self):
+        self.accept_imports()
+        return self.modules, self.future
+
+
 class Visitor(object):
     "Base class for our visitors."
     def continue_(self, node):
@@ -140,3 +243,94 @@ class AllVisitor(Visitor):
 
     def finalize(self):
         return self.all
+
+
+class SourceVisitor(object):
+    """AST visitor that collects the results of the ImportVisitor, NamesVisitor,
+    AllVisitor and AssignVisitor in a single traversal of the tree.
+
+    The results are available as attributes after finalize(): 'found_imports'
+    and 'future_imports' (ImportVisitor), 'dotted' and 'simple' (NamesVisitor),
+    'all' (AllVisitor) and 'assnames' (AssignVisitor).
+    """
+    def __init__(self):
+        self.imports = ImportVisitor()
+
+        # NamesVisitor state.
+        self.dotted = []
+        self.simple = []
+        self.attributes = []
+
+        # AllVisitor state.
+        self.all = []
+        self.in_assign = False
+        self.in_all = False
+
+        # AssignVisitor state.
+        self.assnames = []
+        self.in_class = False
+
+    def walk(self, node):
+        name = node.__class__.__name__
+
+        # Note: the ImportVisitor does not descend into assignments, and
+        # handles all the nodes it does not have a method for with default().
+        imports = self.imports
+        if name == 'Import':
+            imports.visitImport(node)
+        elif name == 'From':
+            imports.visitFrom(node)
+        elif not self.in_assign:
+            if name == 'Assign':
+                imports.visitAssign(node)
+            else:
+                imports.default(node)
+
+        if name == 'Name':
+            self.attributes.append(node.name)
+            self.attributes.reverse()
+            attribs = self.attributes
+            for i in xrange(1, len(attribs)+1):
+                self.dotted.append(('.'.join(attribs[0:i]), node.lineno))
+            self.simple.append((attribs[0], node.lineno))
+            self.attributes = []
+
+        elif name == 'Getattr':
+            self.attributes.append(node.attrname)
+
+        elif name == 'AssName':
+            self.assnames.append((node.name, node.lineno))
+            if self.in_assign and node.name == '__all__':
+                self.in_all = True
+
+        elif name == 'Const':
+            if self.in_assign and self.in_all:
+                self.all.append((node.value, node.lineno))
+
+        elif name == 'Assign':
+            prev, self.in_assign = self.in_assign, True
+            self.walk_children(node)
+            self.in_assign = prev
+            return
+
+        elif name == 'Class':
+            self.assnames.append((node.name, node.lineno))
+            prev, self.in_class = self.in_class, True
+            self.walk_children(node)
+            self.in_class = prev
+            return
+
+        elif name == 'Function':
+            # Avoid method definitions.
+            if not self.in_class:
+                self.assnames.append((node.name, node.lineno))
+
+        self.walk_children(node)
+
+    def walk_children(self, node):
+        for child in node.getChildNodes():
+            self.walk(child)
+
+    def finalize(self):
+        self.found_imports, self.future_imports = self.imports.finalize()
+        return self
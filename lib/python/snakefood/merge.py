@@ -0,0 +1,88 @@
+"""
+Merge the sorted dependency files output by sfood, e.g. for each --shard.
+
+The inputs are read in parallel and merged in order, so that only one line of
+each input is kept in memory, and the lines that appear in more than one
+input are output once.  As sfood sorts its output, the merge of the outputs
+of the shards of a run is identical to the output of the whole run.
+"""
+# This file is part of the Snakefood open source package.
+# See http://furius.ca/snakefood/ for licensing details.
+
+import sys, heapq, logging
+
+from snakefood.util import setup_logging
+from snakefood.depends import read_depends
+
+__all__ = ('merge_depends', 'sorted_depends')
+
+
+
+def sorted_depends(f, name='<stdin>', strict=False):
+    """Generator for the dependencies read from file object 'f', which must be
+    sorted.  Raise a ValueError if they are not.  See read_depends() for
+    'strict'."""
+    last = None
+    for dep in read_depends(f, strict, name):
+        if last is not None and dep < last:
+            raise ValueError("Dependencies of '%s' are not sorted: %r" %
+                             (name, dep))
+        last = dep
+        yield dep
+
+
+def merge_depends(iterables):
+    """Generate the dependencies of the sorted 'iterables', in order, without
+    duplicates."""
+    last = None
+    for dep in heapq.merge(*iterables):
+        if dep != last:
+            yield dep
+            last = dep
+
+
+def main():
+    import optparse
+    parser = optparse.OptionParser(__doc__.strip())
+
+    parser.add_option('-o', '--output', action='store', metavar='FILE',
+                      help="Write the dependencies to the given file instead of "
+                      "stdout.")
+
+    parser.add_option('--strict', action='store_true',
+                      help="Fail on the first invalid line of the dependencies "
+                      "instead of skipping it with a warning.")
+
+    parser.add_option('-v', '--verbose', action='count', default=0,
+                      help="Output more debugging information")
+    parser.add_option('-q', '--quiet', action='count', default=0,
+                      help="Output less debugging information")
+
+    opts, args = parser.parse_args()
+    opts.verbose -= opts.quiet
+    setup_logging(opts.verbose)
+
+    if not args:
+        args = ['-']
+    files = []
+    try:
+        for fn in args:
+            if fn == '-':
+                files.append((sys.stdin, '<stdin>'))
+            else:
+                files.append((open(fn), fn))
+    except IOError, e:
+        parser.error(str(e))
+
+    if opts.output:
+        outfile = open(opts.output, 'w')
+    else:
+        outfile = sys.stdout
+    write = outfile.write
+    try:
+        for dep in merge_depends([sorted_depends(f, fn, opts.strict) for f, fn in files]):
+            write(repr(dep))
+            write('\n')
+    except ValueError, e:
+        logging.error(str(e))
+        sys.exit(1)
@@ -0,0 +1,102 @@
+"""
+Processing of files, either serially or in parallel with a pool of processes.
+
+Files are submitted to a processor and the results are iterated over in the
+order that the files were submitted.  More files may be submitted while
+iterating over the results, e.g. to follow dependencies as they are found.
+"""
+# This file is part of the Snakefood open source package.
+# See http://furius.ca/snakefood/ for licensing details.
+
+import sys
+from collections import deque
+
+__all__ = ('SerialProcessor', 'PoolProcessor', 'make_processor')
+
+
+
+class SerialProcessor(object):
+    "Apply a function to each submitted file in the current process."
+
+    def __init__(self, func, args=()):
+        self.func = func
+        self.args = args
+        self.queue = deque()
+
+    def submit(self, fn):
+        "Add file 'fn' to the queue of files to be processed."
+        self.queue.append(fn)
+
+    def results(self):
+        "Generate (filename, result) pairs, in the order of submission."
+        func, args = self.func, self.args
+        while self.queue:
+            fn = self.queue.popleft()
+            yield fn, func(fn, *args)
+
+    def close(self):
+        pass
+
+
+# State of the worker processes, see _init_worker().
+_worker = None
+
+def _init_worker(path, func, args):
+    global _worker
+    sys.path[:] = path
+    _worker = func, args
+
+def _process_chunk(chunk):
+    func, args = _worker
+    return [(fn, func(fn, *args)) for fn in chunk]
+
+
+class PoolProcessor(SerialProcessor):
+    """Apply a function to each submitted file in a pool of worker processes.
+
+    Files are sent to the workers in chunks of 'chunksize' files, and at most
+    two chunks per worker are in flight at any time, so that the results come
+    back in bounded batches.  The function and its extra arguments must be
+    picklable.  sys.path is copied to the workers; other global state must be
+    set up before the processor is created (the workers are forked).
+    """
+    def __init__(self, jobs, func, args=(), chunksize=16):
+        import multiprocessing
+        SerialProcessor.__init__(self, func, args)
+        self.pool = multiprocessing.Pool(jobs, _init_worker,
+                                         (sys.path, func, args))
+        self.chunksize = chunksize
+        self.maxinflight = 2 * jobs
+        self.inflight = deque()
+
+    def _dispatch(self):
+        "Send chunks of queued files to the workers."
+        queue = self.queue
+        while queue and len(self.inflight) < self.maxinflight:
+            chunk = [queue.popleft()
+                     for _ in xrange(min(self.chunksize, len(queue)))]
+            self.inflight.append(self.pool.apply_async(_process_chunk, (chunk,)))
+
+    def results(self):
+        self._dispatch()
+        while self.inflight:
+            # Note: a very large timeout allows KeyboardInterrupt to be
+            # delivered while waiting.
+            chunk = self.inflight.popleft().get(1e100)
+            # Refill the pipeline before handing the results out.
+            self._dispatch()
+            for result in chunk:
+                yield result
+                self._dispatch()
+
+    def close(self):
+        self.pool.terminate()
+        self.pool.join()
+
+
+def make_processor(jobs, func, args=()):
+    "Create a processor for the given number of jobs."
+    if jobs > 1:
+        return PoolProcessor(jobs, func, args)
+    else:
+        return SerialProcessor(func, args)
@@ -0,0 +1,97 @@
+"""
+Query a database of dependencies written by sfood --db.
+
+Usage: sfood-query [options] DB COMMAND [ARGS...]
+
+The commands are:
+
+  deps FILE...       Output the files that the given files depend on.
+  rdeps FILE...      Output the files that depend on the given files.
+  path FROM TO       Output a shortest chain of dependencies from file FROM to
+                     file TO, one file per line, or fail if there is none.
+  fan                Output the fan-in and fan-out of each package, the numbers
+                     of other packages that depend on it and that it depends on.
+  dump               Output all the dependencies, in the format of sfood.
+
+Each query only reads the rows that it needs, from the indexes of the database.
+"""
+# This file is part of the Snakefood open source package.
+# See http://furius.ca/snakefood/ for licensing details.
+
+import sys, logging
+from os.path import *
+
+from six import print_
+
+from snakefood.util import setup_logging
+from snakefood.db import DependencyDB
+
+__all__ = ()
+
+
+commands = ('deps', 'rdeps', 'path', 'fan', 'dump')
+
+
+def main():
+    import optparse
+    parser = optparse.OptionParser(__doc__.strip())
+
+    parser.add_option('-t', '--transitive', action='store_true',
+                      help="With deps and rdeps, output the dependencies "
+                      "transitively instead of only the direct ones.")
+
+    parser.add_option('-v', '--verbose', action='count', default=0,
+                      help="Output more debugging information")
+    parser.add_option('-q', '--quiet', action='count', default=0,
+                      help="Output less debugging information")
+
+    opts, args = parser.parse_args()
+    opts.verbose -= opts.quiet
+    setup_logging(opts.verbose)
+
+    if len(args) < 2:
+        parser.error("You must specify a database and a command.")
+    dbfn, command, args = args[0], args[1], args[2:]
+    if command not in commands:
+        parser.error("Invalid command '%s' (use one of: %s)." %
+                     (command, ', '.join(commands)))
+    if not exists(dbfn):
+        parser.error("Database '%s' does not exist." % dbfn)
+    try:
+        db = DependencyDB(dbfn)
+    except ValueError, e:
+        parser.error(str(e))
+
+    if command in ('deps', 'rdeps'):
+        if not args:
+            parser.error("You must specify files.")
+        for fn in db.depends(db.find_files(args), command == 'rdeps',
+                             opts.transitive):
+            print_(fn)
+
+    elif command == 'path':
+        if len(args) != 2:
+            parser.error("You must specify two files.")
+        ids = [db.find_files([fn]) for fn in args]
+        path = db.find_path(ids[0][0], ids[1][0]) if all(ids) else None
+        if path is None:
+            logging.error("No path from '%s' to '%s'." % tuple(args))
+            sys.exit(1)
+        for fn in path:
+            print_(fn)
+
+    elif command == 'fan':
+        if args:
+            parser.error("The fan command takes no arguments.")
+        for package, fanin, fanout in db.fan():
+            print_('%d\t%d\t%s' % (fanin, fanout, package))
+
+    elif command == 'dump':
+        if args:
+            parser.error("The dump command takes no arguments.")
+        write = sys.stdout.write
+        for dep in db.iter_depends():
+            write(repr(dep))
+            write('\n')
+
+    db.close()
@@ -6,11 +6,13 @@ Code that deals with search and classifying root directories.
 
 import os, logging
 from os.path import *
-from dircache import listdir
 
 from snakefood.util import is_python, filter_separate
+from snakefood.fscache import fscache
+from snakefood import stdlib
 
-__all__ = ('find_roots', 'find_package_root', 'relfile',)
+__all__ = ('find_roots', 'find_package_root', 'relfile', 'RootIndex',
+           'clear_root_indexes')
 
 
 
@@ -42,6 +44,14 @@ def find_roots(list_dirofn, ignores):
 
 def find_package_root(fn, ignores):
     "Search up the directory tree for a package root."
+    if isabs(fn):
+        return get_root_index(ignores).find_package_root(fn)
+    else:
+        return search_package_root(fn, ignores)
+
+def search_package_root(fn, ignores):
+    """Search up the directory tree for a package root, looking at the
+    filesystem."""
     if not isdir(fn):
         fn = dirname(fn)
     while is_package_dir(fn):
@@ -56,7 +66,7 @@ def search_for_roots(dn, ignores):
     if not isdir(dn):
         dn = dirname(dn)
     roots = []
-    for root, dirs, files in os.walk(dn):
+    for root, dirs, files in fscache.walk(dn):
         for d in list(dirs):
             if d in ignores:
                 dirs.remove(d)
@@ -67,19 +77,19 @@ def search_for_roots(dn, ignores):
 
 def is_package_dir(dn):
     """Return true if this is a directory within a package."""
-    return exists(join(dn, '__init__.py'))
+    return fscache.exists(join(dn, '__init__.py'))
 
 
 def is_package_root(dn, ignores):
     """Return true if this is a package root.  A package root is a directory
     that could be used as a PYTHONPATH entry."""
 
-    if not exists(dn) or exists(join(dn, '__init__.py')):
+    if not fscache.exists(dn) or fscache.exists(join(dn, '__init__.py')):
         return False
 
     else:
-        dirfiles = (join(dn, x) for x in listdir(dn))
-        subdirs, files = filter_separate(isdir, dirfiles)
+        dirfiles = (join(dn, x) for x in fscache.listdir(dn))
+        subdirs, files = filter_separate(fscache.isdir, dirfiles)
 
         # Check if the directory contains Python files.
         pyfiles = []
@@ -105,14 +115,101 @@ def is_package_root(dn, ignores):
             # subdirectories that have dots in them.
             if '.' in bsub or bsub in ignores:
                 continue
-            if exists(join(sub, '__init__.py')):
+            if fscache.exists(join(sub, '__init__.py')):
                 return True
 
     return False
 
+class RootNode(object):
+    "A node of the trie of the RootIndex, for a single path."
+
+    __slots__ = ('path', 'parent', 'children', 'isdir', 'ispkg', 'root')
+
+    def __init__(self, path, parent):
+        self.path = path
+        self.parent = parent
+        self.children = {}
+        self.isdir = None   # Whether the path is a directory.
+        self.ispkg = None   # Whether the path is a package directory.
+        self.root = self    # The package root, or self if not known yet.
+
+
+class RootIndex(object):
+    """An index of the package roots of paths, filled in lazily.
+
+    The paths are kept in a trie of path components, whose nodes record whether
+    the path is a directory, whether it is a package directory, and its package
+    root, as they get found.  Looking up the root of a path therefore takes time
+    proportional to the depth of the path, and the filesystem is looked at only
+    once for each path.  The paths must be absolute and normalized.
+    """
+    def __init__(self, ignores):
+        self.ignores = ignores
+        self.top = RootNode(os.sep, None)
+
+    def lookup(self, fn):
+        "Return the node for path 'fn'."
+        node = self.top
+        for comp in fn.split(os.sep):
+            if not comp:
+                continue
+            try:
+                node = node.children[comp]
+            except KeyError:
+                child = node.children[comp] = RootNode(join(node.path, comp), node)
+                node = child
+        return node
+
+    def find_package_root(self, fn):
+        "Search up the directory tree for a package root."
+        node = self.lookup(fn)
+        if node.isdir is None:
+            node.isdir = fscache.isdir(node.path)
+        if not node.isdir and node.parent is not None:
+            node = node.parent
+
+        # Go up through the package directories, up to a node whose root is
+        # known or a directory that is not a package.
+        pending = []
+        while node.root is node:
+            pending.append(node)
+            if node.ispkg is None:
+                node.ispkg = is_package_dir(node.path)
+            if not node.ispkg or node.parent is None:
+                node.root = (node.path if is_package_root(node.path, self.ignores)
+                             else None)
+                break
+            node = node.parent
+        root = node.root
+        for node in pending:
+            node.root = root
+        return root
+
+
+# Root indexes, by list of ignored directories.
+_root_indexes = {}
+
+def get_root_index(ignores):
+    "Return the root index for the given list of ignored directories."
+    key = tuple(ignores)
+    try:
+        return _root_indexes[key]
+    except KeyError:
+        index = _root_indexes[key] = RootIndex(key)
+        return index
+
+def clear_root_indexes():
+    "Forget the package roots, e.g. after files have been added or deleted."
+    _root_indexes.clear()
+
+
 def relfile(fn, ignores):
     "Return pairs of (package root, relative filename)."
-    root = find_package_root(realpath(fn), ignores)
+    if stdlib.target is not None:
+        pair = stdlib.target.relfile(fn)
+        if pair is not None:
+            return pair
+    root = find_package_root(fscache.realpath(fn), ignores)
     if root is None:
         root = dirname(fn)
         rlen = basename(fn)
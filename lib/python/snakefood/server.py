@@ -0,0 +1,353 @@
+"""
+A resident server that answers queries about dependencies over a Unix socket.
+
+The server keeps the parse and resolution caches warm, and the dependency graph
+of the given files or directories in memory, so that editors and hooks do not
+pay for the startup, the search for the roots and cold caches on every
+invocation.  With --watch, the graph is kept up to date as files change.
+
+The protocol is line-based: each request is a JSON object with a 'command' and
+a 'path', and each response is a JSON object with either a 'result' or an
+'error'.  The commands are:
+
+  deps      The files that the given file depends on, and the errors, as
+            ('import', 'symbol' or 'unused', name) pairs.
+  rdeps     The files of the graph that depend on the given file.
+  unused    The imports of the given file that are not used.
+  root      The package root of the given path, and the path relative to it.
+  ping      Check that the server is running.
+  shutdown  Stop the server.
+
+Use --client to send queries from the command line.
+"""
+# This file is part of the Snakefood open source package.
+# See http://furius.ca/snakefood/ for licensing details.
+
+import sys, os, errno, socket, asyncore, asynchat, threading, tempfile, logging
+from os.path import *
+import json
+
+from six import print_
+
+from snakefood.util import def_ignores, setup_logging
+from snakefood.find import get_file_imports, use_directory_index
+from snakefood.find import ERROR_IMPORT, ERROR_SYMBOL, ERROR_UNUSED
+from snakefood.cache import ParseCache
+from snakefood.gendeps import LiveDepends, process_file, watch_changes
+from snakefood.roots import *
+
+__all__ = ('DependencyServer', 'query', 'default_socket')
+
+
+def default_socket():
+    "Return the default filename of the socket."
+    return os.environ.get('SFOOD_SOCKET') or join(
+        tempfile.gettempdir(), 'sfood-%d.sock' % os.getuid())
+
+
+# Names of the kinds of errors, in the responses.
+error_kinds = {ERROR_IMPORT: 'import',
+               ERROR_SYMBOL: 'symbol',
+               ERROR_UNUSED: 'unused'}
+
+
+class QueryError(Exception):
+    "An error to report to the client."
+
+
+class DependencyServer(object):
+    """The state held by the server, and the implementation of the commands.
+
+    The commands and the updates from watching the files are serialized with a
+    lock, because the caches are not thread-safe.
+    """
+    def __init__(self, live, cache=None):
+        self.live = live
+        self.cache = cache
+        self.lock = threading.Lock()
+        self.rindex = None   # Reverse dependencies: filename -> set of files.
+        self.running = True
+
+    def handle(self, request):
+        "Process a request and return the response."
+        try:
+            command = request['command']
+            method = getattr(self, 'do_%s' % command, None)
+            if method is None:
+                raise QueryError("Invalid command '%s'." % command)
+            path = request.get('path')
+            if path is not None:
+                if isinstance(path, unicode):
+                    path = path.encode(sys.getfilesystemencoding() or 'utf-8')
+                path = realpath(path)
+            self.lock.acquire()
+            try:
+                return {'result': method(path)}
+            finally:
+                self.lock.release()
+        except (KeyError, TypeError, AttributeError):
+            return {'error': "Invalid request."}
+        except QueryError, e:
+            return {'error': str(e)}
+
+    def update(self, paths, dirs_changed):
+        "Process changes to the files of the graph."
+        self.lock.acquire()
+        try:
+            self.live.update(paths, dirs_changed)
+            self.rindex = None
+        finally:
+            self.lock.release()
+
+    def check_file(self, fn):
+        if fn is None or not isfile(fn):
+            raise QueryError("File '%s' does not exist." % fn)
+
+    def do_deps(self, fn):
+        self.check_file(fn)
+        files, errors, _ = process_file(fn, *self.live.procargs)
+        return {'files': sorted(files),
+                'errors': sorted([error_kinds[err], name]
+                                 for err, name in errors)}
+
+    def do_rdeps(self, fn):
+        if fn is not None and isdir(fn):
+            fn = join(fn, '__init__.py')
+        if self.rindex is None:
+            self.rindex = {}
+            for sfn, (_, _, follow, _) in self.live.results.iteritems():
+                for dfn in follow:
+                    self.rindex.setdefault(dfn, set()).add(sfn)
+        return sorted(self.rindex.get(fn, ()))
+
+    def do_unused(self, fn):
+        self.check_file(fn)
+        _, _, unused_imports = get_file_imports(fn, True, self.cache)
+        if unused_imports is None:
+            raise QueryError("Could not parse file '%s'." % fn)
+        do_pragmas = self.live.procargs[1]
+        return [{'name': lname, 'lineno': lineno}
+                for _, _, lname, lineno, _, pragma in unused_imports
+                if not (do_pragmas and pragma)]
+
+    def do_root(self, path):
+        if path is None or not exists(path):
+            raise QueryError("Path '%s' does not exist." % path)
+        return relfile(path, self.live.ignores)
+
+    def do_ping(self, path):
+        return True
+
+    def do_shutdown(self, path):
+        self.running = False
+
+
+class QueryChannel(asynchat.async_chat):
+    "A connection from a client."
+
+    def __init__(self, sock, server, map):
+        asynchat.async_chat.__init__(self, sock, map)
+        self.server = server
+        self.buffer = []
+        self.set_terminator('\n')
+
+    def collect_incoming_data(self, data):
+        self.buffer.append(data)
+
+    def found_terminator(self):
+        line = ''.join(self.buffer)
+        self.buffer = []
+        try:
+            request = json.loads(line)
+        except ValueError:
+            response = {'error': "Invalid request."}
+        else:
+            response = self.server.handle(request)
+        self.push(json.dumps(response) + '\n')
+
+
+class QueryListener(asyncore.dispatcher):
+    "The listening socket of the server."
+
+    def __init__(self, sockfn, server, map):
+        asyncore.dispatcher.__init__(self, map=map)
+        self.server = server
+        self.create_socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.bind(sockfn)
+        self.listen(16)
+
+    def handle_accept(self):
+        pair = self.accept()
+        if pair is not None:
+            QueryChannel(pair[0], self.server, self._map)
+
+
+def serve(server, sockfn):
+    "Accept and answer the queries of clients until a shutdown is requested."
+    # Remove the socket of a server that is not running anymore.
+    if exists(sockfn):
+        try:
+            list(query(sockfn, [('ping', None)]))
+        except socket.error:
+            os.remove(sockfn)
+        else:
+            raise SystemExit("A server is already running on '%s'." % sockfn)
+
+    map = {}
+    listener = QueryListener(sockfn, server, map)
+    try:
+        while server.running:
+            asyncore.loop(timeout=1.0, map=map, count=1)
+    finally:
+        listener.close()
+        os.remove(sockfn)
+
+
+def query(sockfn, requests):
+    """Send the given (command, path) requests to the server and generate the
+    responses."""
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(sockfn)
+        f = sock.makefile('r')
+        for command, path in requests:
+            sock.sendall(json.dumps({'command': command, 'path': path}) + '\n')
+            line = f.readline()
+            if not line:
+                raise socket.error(errno.ECONNRESET, "Connection closed by server.")
+            yield json.loads(line)
+    finally:
+        sock.close()
+
+
+def output_result(command, path, result):
+    "Print the result of a query for the user."
+    if command == 'deps':
+        for fn in result['files']:
+            print_(fn)
+        for kind, name in result['errors']:
+            if kind == 'import':
+                logging.warning("Could not import module '%s'" % name)
+    elif command == 'rdeps':
+        for fn in result:
+            print_(fn)
+    elif command == 'unused':
+        for x in result:
+            print_("%s:%d:  Unused import '%s'" % (path, x['lineno'], x['name']))
+    elif command == 'root':
+        print_('%s %s' % tuple(result))
+
+
+def main():
+    import optparse
+    parser = optparse.OptionParser(__doc__.strip())
+
+    parser.add_option('-s', '--socket', action='store', default=default_socket(),
+                      help="Filename of the Unix socket (default: $SFOOD_SOCKET "
+                      "or %default).")
+
+    parser.add_option('-c', '--client', action='store', metavar='COMMAND',
+                      help="Instead of running the server, send the given command "
+                      "for each of the paths on the command-line to the running "
+                      "server, and print the results.")
+
+    parser.add_option('-I', '--ignore', dest='ignores', action='append',
+                      default=def_ignores,
+                      help="Add the given directory name to the list to be ignored.")
+
+    parser.add_option('-v', '--verbose', action='count', default=0,
+                      help="Output more debugging information")
+    parser.add_option('-q', '--quiet', action='count', default=0,
+                      help="Output less debugging information")
+
+    parser.add_option('-f', '--follow', '-r', '--recursive', action='store_true',
+                      help="Follow the modules depended upon and include them "
+                      "in the graph.")
+
+    parser.add_option('-d', '--disable-pragmas', action='store_false',
+                      dest='do_pragmas', default=True,
+                      help="Disable processing of pragma directives as strings after imports.")
+
+    parser.add_option('--cache-dir', action='store',
+                      default=os.environ.get('SFOOD_CACHE_DIR'),
+                      help="Also cache the imports parsed from each file in the "
+                      "given directory. (Default: $SFOOD_CACHE_DIR.)")
+
+    parser.add_option('--parser', action='store', type='choice',
+                      choices=('ast', 'fast'), default='ast',
+                      help="Select how imports are extracted from source files "
+                      "(see sfood).")
+
+    parser.add_option('--resolver', action='store', type='choice',
+                      choices=('imp', 'index'), default='imp',
+                      help="Select how modules are found (see sfood).")
+
+    parser.add_option('-w', '--watch', action='store_true',
+                      help="Watch the files of the graph for changes and keep it "
+                      "up to date.")
+
+    parser.add_option('--poll', action='store', type='float', metavar='SECS',
+                      help="With --watch, poll for changes every given number of "
+                      "seconds instead of using inotify.")
+
+    opts, args = parser.parse_args()
+    opts.verbose -= opts.quiet
+    setup_logging(opts.verbose)
+
+    if opts.client:
+        if not args:
+            parser.error("You must specify paths to query.")
+        args = map(realpath, args)
+        try:
+            responses = query(opts.socket, [(opts.client, x) for x in args])
+            for path, response in zip(args, responses):
+                if 'error' in response:
+                    logging.error(response['error'])
+                else:
+                    output_result(opts.client, path, response['result'])
+        except socket.error, e:
+            raise SystemExit("Could not query server on '%s': %s" % (opts.socket, e))
+        return
+
+    if not args:
+        logging.warning("Serving the files from current directory.")
+        args = ['.']
+
+    info = logging.info
+    inroots = find_roots(args, opts.ignores)
+    basepath = sys.path
+    sys.path = inroots + sys.path
+
+    cache = None
+    if opts.cache_dir:
+        cache = ParseCache(opts.cache_dir)
+    if opts.resolver == 'index':
+        use_directory_index(opts.watch)
+
+    procargs = (opts.verbose, opts.do_pragmas, False, cache, opts.parser)
+    live = LiveDepends(args, opts.ignores, inroots, basepath, procargs,
+                       follow=opts.follow)
+
+    # Start watching before processing the files, so that no change is missed.
+    changes = None
+    if opts.watch:
+        changes = watch_changes(args, opts.ignores, opts.poll)
+
+    info("Processing files...")
+    live.update(None)
+    info("Graph of %d files." % len(live.results))
+
+    server = DependencyServer(live, cache)
+    if opts.watch:
+        def watch():
+            for paths, dirs_changed in changes:
+                server.update(paths, dirs_changed)
+        thread = threading.Thread(target=watch)
+        thread.daemon = True
+        thread.start()
+
+    info("Listening on '%s'." % opts.socket)
+    try:
+        serve(server, opts.socket)
+    except KeyboardInterrupt:
+        raise SystemExit("Interrupted.")
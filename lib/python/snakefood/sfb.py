@@ -0,0 +1,185 @@
+"""
+A compact binary format for the dependencies, 'sfb'.
+
+The text format output by sfood repeats the root and the filename of both
+nodes on every line.  The sfb format stores each root and each filename once,
+in string tables, and the edges as pairs of integer node ids: the nodes are
+sorted, and the edges are sorted and grouped by source node, with the number
+of targets of each node and the differences between the ids of consecutive
+targets, which are small numbers that compress well.  All the integers are
+unsigned 32-bit little-endian numbers.  The layout of a file is:
+
+  'SFB1'                             magic number
+  nroots, nnodes, nedges, flags      counts (flags are reserved, 0)
+  size, roots                        '\\0'-separated roots
+  size, paths                        '\\0'-separated filenames of the nodes
+  noderoots[nnodes]                  the index of the root of each node
+  counts[nnodes]                     the number of targets of each node
+  deltas[nedges]                     the target ids, delta-encoded per node
+
+Root index 0 stands for None, and the empty filename of a node without a
+root also stands for None, e.g. for the (None, None) targets of the nodes
+without dependencies.  Unicode strings are stored in UTF-8.
+
+Either format can be compressed with gzip or zstd (which needs the zstandard
+module); read_depends() detects the format and the compression.
+"""
+# This file is part of the Snakefood open source package.
+# See http://furius.ca/snakefood/ for licensing details.
+
+import sys, struct, zlib
+from array import array
+from operator import itemgetter
+
+__all__ = ('SFB_MAGIC', 'write_sfb', 'iter_sfb', 'compress', 'decompress',
+           'is_binary', 'compressions')
+
+
+SFB_MAGIC = 'SFB1'
+GZIP_MAGIC = '\x1f\x8b'
+ZSTD_MAGIC = '\x28\xb5\x2f\xfd'
+
+compressions = ('gzip', 'zstd')
+
+_header = struct.Struct('<IIII')
+_size = struct.Struct('<I')
+
+# An array typecode for unsigned 32-bit integers.
+_uint32 = [code for code in 'IL' if array(code).itemsize == 4][0]
+
+
+def is_binary(head):
+    "Return true if 'head', the start of a file, is sfb or compressed data."
+    return head.startswith((SFB_MAGIC, GZIP_MAGIC, ZSTD_MAGIC))
+
+
+def _encode(s):
+    if s is None:
+        return ''
+    if isinstance(s, unicode):
+        return s.encode('utf8')
+    return s
+
+
+def _tobytes(ints):
+    a = array(_uint32, ints)
+    if sys.byteorder == 'big':
+        a.byteswap()
+    return a.tostring()
+
+
+def _fromstring(data, pos, count):
+    a = array(_uint32)
+    a.fromstring(data[pos:pos + 4 * count])
+    if sys.byteorder == 'big':
+        a.byteswap()
+    return a, pos + 4 * count
+
+
+def write_sfb(depdict, outfile):
+    """Write the dictionary of (from -> list of targets) 'depdict' to file
+    object 'outfile' in the sfb format."""
+    nodes = set(depdict)
+    for targets in depdict.itervalues():
+        nodes.update(targets)
+    nodes = sorted(nodes)
+    ids = dict((node, i) for i, node in enumerate(nodes))
+
+    roots = [None] + sorted(set(root for root, _ in nodes if root is not None))
+    rootids = dict((root, i) for i, root in enumerate(roots))
+
+    counts = [0] * len(nodes)
+    deltas = []
+    for from_, targets in sorted(depdict.iteritems(), key=itemgetter(0)):
+        tids = sorted(ids[to_] for to_ in set(targets))
+        counts[ids[from_]] = len(tids)
+        last = 0
+        for tid in tids:
+            deltas.append(tid - last)
+            last = tid
+
+    rootdata = '\0'.join(map(_encode, roots[1:]))
+    pathdata = '\0'.join(_encode(fn) for _, fn in nodes)
+    write = outfile.write
+    write(SFB_MAGIC)
+    write(_header.pack(len(roots), len(nodes), len(deltas), 0))
+    write(_size.pack(len(rootdata)))
+    write(rootdata)
+    write(_size.pack(len(pathdata)))
+    write(pathdata)
+    write(_tobytes(rootids[root] for root, _ in nodes))
+    write(_tobytes(counts))
+    write(_tobytes(deltas))
+
+
+def iter_sfb(data):
+    """Generate the ((root, fn), (root, fn)) dependencies of the sfb string
+    'data', in sorted order.  Raise a ValueError if it is not valid."""
+    if not data.startswith(SFB_MAGIC):
+        raise ValueError("Not an sfb file.")
+    try:
+        pos = len(SFB_MAGIC)
+        nroots, nnodes, nedges, _ = _header.unpack_from(data, pos)
+        pos += _header.size
+        size, = _size.unpack_from(data, pos)
+        pos += _size.size
+        roots = [None] + (data[pos:pos + size].split('\0') if nroots > 1 else [])
+        pos += size
+        size, = _size.unpack_from(data, pos)
+        pos += _size.size
+        paths = data[pos:pos + size].split('\0') if nnodes else []
+        pos += size
+        noderoots, pos = _fromstring(data, pos, nnodes)
+        counts, pos = _fromstring(data, pos, nnodes)
+        deltas, pos = _fromstring(data, pos, nedges)
+    except struct.error, e:
+        raise ValueError("Invalid sfb file: %s" % e)
+    if (len(roots) != nroots or len(paths) != nnodes or len(deltas) != nedges
+        or pos != len(data) or sum(counts) != nedges):
+        raise ValueError("Invalid sfb file.")
+
+    try:
+        nodes = [(roots[r], fn if (r or fn) else None)
+                 for r, fn in zip(noderoots, paths)]
+        i = 0
+        for from_, count in zip(nodes, counts):
+            tid = 0
+            for delta in deltas[i:i + count]:
+                tid += delta
+                yield from_, nodes[tid]
+            i += count
+    except IndexError:
+        raise ValueError("Invalid sfb file: node id out of range.")
+
+
+def compress(data, method):
+    "Compress string 'data' with 'method', one of 'compressions'."
+    if method == 'gzip':
+        import gzip
+        from cStringIO import StringIO
+        buf = StringIO()
+        f = gzip.GzipFile(fileobj=buf, mode='wb', mtime=0)
+        f.write(data)
+        f.close()
+        return buf.getvalue()
+    elif method == 'zstd':
+        return _zstandard().ZstdCompressor().compress(data)
+    raise ValueError("Invalid compression: %s" % method)
+
+
+def decompress(data):
+    "Decompress string 'data' if it is compressed, or return it unchanged."
+    if data.startswith(GZIP_MAGIC):
+        return zlib.decompress(data, 16 + zlib.MAX_WBITS)
+    elif data.startswith(ZSTD_MAGIC):
+        return _zstandard().ZstdDecompressor().decompress(
+            data, max_output_size=1 << 31)
+    return data
+
+
+def _zstandard():
+    try:
+        import zstandard
+    except ImportError:
+        raise ValueError("zstd compression requires the zstandard module.")
+    return zstandard
@@ -0,0 +1,175 @@
+"""
+State saved between runs of sfood, for incremental processing.
+
+The state file records, for each processed file, its modification time, size
+and content hash, along with the files it depends on, the errors found and the
+module names its imports refer to.  On the next run, the results of the files
+that have not changed are reused instead of being computed again.
+
+Adding or deleting a file may change how the imports of other files resolve,
+e.g. a new module may shadow another one.  Files whose imports refer to a
+module name that has been added or deleted since the last run are therefore
+processed again as well.
+"""
+# This file is part of the Snakefood open source package.
+# See http://furius.ca/snakefood/ for licensing details.
+
+import os, sys, marshal, tempfile, logging
+from os.path import *
+
+try:
+    from hashlib import sha1
+except ImportError:
+    from sha import new as sha1
+
+from snakefood.find import ERROR_IMPORT, ERROR_SYMBOL, ERROR_UNUSED
+
+__all__ = ('DependencyState', 'STATE_VERSION')
+
+
+# Version of the format of the state file.
+STATE_VERSION = 1
+
+# Error constants, which are compared by identity by some of the code.
+_errors = dict((x, x) for x in (ERROR_IMPORT, ERROR_SYMBOL, ERROR_UNUSED))
+
+
+class DependencyState(object):
+    """The per-file results of a previous run, and those of the current run.
+
+    'signature' is a tuple of the options that affect the results of
+    processing a file; the previous state is ignored if it does not match.
+    """
+    def __init__(self, filename, signature):
+        self.filename = filename
+        self.signature = (STATE_VERSION,) + tuple(signature)
+        self.entries = {}   # Previous run: filename -> entry tuple.
+        self.current = {}   # Current run: filename -> entry tuple.
+        self.stamps = {}    # Files being processed: filename -> stamp.
+        self.invalid = set()
+        self.hits = 0
+        self.misses = 0
+        self.load()
+
+    def load(self):
+        try:
+            f = open(self.filename, 'rb')
+            try:
+                signature, entries = marshal.load(f)
+            finally:
+                f.close()
+        except (IOError, OSError):
+            return
+        except (EOFError, ValueError, TypeError):
+            logging.warning("Ignoring invalid state file '%s'." % self.filename)
+            return
+        if signature != self.signature:
+            logging.info("Options have changed, ignoring state file '%s'." %
+                         self.filename)
+            return
+        self.entries = entries
+
+    def save(self):
+        "Write the results of the current run to the state file."
+        dn = dirname(abspath(self.filename))
+        # Files created by mkstemp() are private; give the state file the
+        # permissions of a regular file, according to the umask.
+        umask = os.umask(0)
+        os.umask(umask)
+        fd, tmpfn = tempfile.mkstemp(dir=dn, prefix='.tmp')
+        try:
+            f = os.fdopen(fd, 'wb')
+            try:
+                marshal.dump((self.signature, self.current), f)
+            finally:
+                f.close()
+            os.chmod(tmpfn, 0666 & ~umask)
+            os.rename(tmpfn, self.filename)
+        except:
+            os.remove(tmpfn)
+            raise
+
+    def invalidate(self, inputs):
+        """Given the list of input files of the current run, invalidate the
+        results of the files that may resolve differently because files have
+        been added or deleted since the previous run."""
+        entries = self.entries
+        changed = [fn for fn in inputs if fn not in entries]
+        changed.extend(fn for fn in entries if not exists(fn))
+        names = set(module_name(fn) for fn in changed)
+        for fn, entry in entries.iteritems():
+            if not names.isdisjoint(entry[5]):
+                self.invalid.add(fn)
+        return changed
+
+    def lookup(self, fn):
+        """Return the (files, errors, names) recorded for file 'fn' if it has
+        not changed since the previous run, or None if it must be processed."""
+        stamp = file_stamp(fn)
+        entry = self.entries.get(fn)
+        if (entry is not None and stamp is not None and
+            fn not in self.invalid and stamp[1] == entry[1]):
+            if stamp[0] != entry[0]:
+                # Touched but maybe not modified, check the contents.
+                stamp = stamp + (file_hash(fn),)
+                if stamp[2] == entry[2]:
+                    entry = stamp + entry[3:]
+                else:
+                    entry = None
+            if entry is not None:
+                self.hits += 1
+                self.current[fn] = entry
+                files, errors, names = entry[3:6]
+                return files, [(_errors.get(err, err), name)
+                               for err, name in errors], names
+
+        self.misses += 1
+        if stamp is not None and len(stamp) == 2:
+            stamp = stamp + (file_hash(fn),)
+        self.stamps[fn] = stamp
+        return None
+
+    def record(self, fn, files, errors, names):
+        """Record the results of processing file 'fn' in the current run, or
+        those reused from elsewhere without looking it up, e.g. from the cached
+        subgraphs."""
+        try:
+            stamp = self.stamps.pop(fn)
+        except KeyError:
+            stamp = file_stamp(fn)
+            if stamp is not None:
+                entry = self.entries.get(fn)
+                if entry is not None and entry[:2] == stamp:
+                    stamp = entry[:3]
+                else:
+                    stamp = stamp + (file_hash(fn),)
+        if stamp is None or stamp[2] is None:
+            return
+        self.current[fn] = stamp + (list(files), list(errors), set(names))
+
+
+def file_stamp(fn):
+    "Return the (mtime, size) of file 'fn', or None if it does not exist."
+    try:
+        st = os.stat(fn)
+    except OSError:
+        return None
+    return (st.st_mtime, st.st_size)
+
+def file_hash(fn):
+    "Return the hash of the contents of file 'fn', or None if unreadable."
+    try:
+        f = open(fn, 'rb')
+        try:
+            return sha1(f.read()).hexdigest()
+        finally:
+            f.close()
+    except (IOError, OSError):
+        return None
+
+def module_name(fn):
+    "Return the name of the module that file 'fn' would be imported as."
+    base = basename(fn)
+    if base.startswith('__init__.'):
+        return basename(dirname(fn))
+    return splitext(base)[0]
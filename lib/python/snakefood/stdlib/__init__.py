@@ -0,0 +1,158 @@
+"""
+Tables of the modules of the standard library, for each target version of Python.
+
+When a target version is selected (with --target-python), the imports of the
+modules of its standard library are resolved from its table, with a dictionary
+lookup, instead of searching the directories of the running interpreter.  This
+is faster, and correct when the code is analyzed for another version than the
+one running snakefood.
+
+The tables are generated by running generate.py with the interpreter of each
+version.  They list the names of the builtin modules, and the names of the
+modules found under the library directory, with their filenames relative to it.
+Note that the filenames of extension modules depend on the platform on which
+the tables were generated.
+"""
+# This file is part of the Snakefood open source package.
+# See http://furius.ca/snakefood/ for licensing details.
+
+import sys, os, logging
+from os.path import *
+from subprocess import Popen, PIPE
+
+__all__ = ('StdlibTable', 'versions', 'load_table', 'target_libpath',
+           'strip_library_dirs', 'split_library_dirs', 'set_target')
+
+
+# The versions of Python for which a table is available.
+versions = ('2.7', '3.6', '3.7', '3.8', '3.9', '3.10', '3.11', '3.12', '3.13')
+
+# Modules that are treated like builtins, because they are created at runtime.
+exceptions = ('os.path',)
+
+
+class StdlibTable(object):
+    """The modules of the standard library of a version of Python, installed in
+    directory 'libpath'.
+
+    The builtin modules are mapped to a filename made of their name in the
+    library directory, as when they are found by searching the running
+    interpreter.
+    """
+    def __init__(self, version, libpath, paths, builtins, modules):
+        self.version = version
+        self.libpath = libpath
+        self.roots = sorted((join(libpath, x) if x else libpath for x in paths),
+                            key=len, reverse=True)
+        self.builtins = frozenset(builtins + exceptions)
+        self.modules = modules
+        self.toplevel = frozenset(x.split('.')[0] for x in modules)
+        self.files = frozenset(modules.itervalues())
+
+    def __contains__(self, modname):
+        "Return true if 'modname' is a module or package of the library."
+        return modname.split('.')[0] in self.toplevel
+
+    def find_builtin(self, modname):
+        "Return the filename for builtin module 'modname', or None."
+        if modname in self.builtins:
+            return join(self.libpath, modname)
+
+    def find_module(self, modname):
+        "Return the filename of module 'modname', or None if it does not exist."
+        relfn = self.modules.get(modname)
+        if relfn is not None:
+            return join(self.libpath, relfn)
+
+    def package_name(self, dn):
+        """Return the name of the package of the library in directory 'dn', the
+        empty string for the library directory itself, or None if 'dn' is not
+        in the library."""
+        if dn == self.libpath:
+            return ''
+        if dn.startswith(self.libpath) and dn[len(self.libpath)] == os.sep:
+            package = dn[len(self.libpath)+1:].replace(os.sep, '.')
+            if package in self.modules:
+                return package
+
+    def relfile(self, fn):
+        """Return the (root, relative filename) pair for file or package
+        directory 'fn' of the library, or None if 'fn' is not in the table."""
+        if not (fn.startswith(self.libpath) and fn[len(self.libpath):][:1] == os.sep):
+            return None
+        rel = fn[len(self.libpath)+1:]
+        if not (rel in self.files or rel in self.builtins or
+                join(rel, '__init__.py') in self.files):
+            return None
+        for root in self.roots:
+            if fn.startswith(root + os.sep):
+                return root, fn[len(root)+1:]
+
+
+def load_table(version, libpath=None):
+    """Load the table for Python 'version' (a 'X.Y' string).  'libpath' is the
+    library directory of the target interpreter; by default, it is found with
+    target_libpath()."""
+    if version not in versions:
+        raise ValueError("No table of the standard library for Python %s "
+                         "(available: %s)." % (version, ', '.join(versions)))
+    modname = 'py%s' % version.replace('.', '')
+    mod = __import__('snakefood.stdlib.%s' % modname, {}, {}, [modname])
+    if libpath is None:
+        libpath = target_libpath(version)
+    return StdlibTable(mod.version, libpath, mod.paths, mod.builtins, mod.modules)
+
+
+def target_libpath(version):
+    """Return the library directory of Python 'version'.  It is queried from the
+    interpreter of that version if it is found on the path, and otherwise
+    assumed to be installed with the same prefix as the running interpreter."""
+    if version == '%d.%d' % sys.version_info[:2]:
+        return realpath(join(sys.prefix, 'lib', 'python%s' % version))
+    try:
+        p = Popen(['python%s' % version, '-E', '-S', '-c',
+                   'import sysconfig; print(sysconfig.get_paths()["stdlib"])'],
+                  stdout=PIPE, stderr=PIPE)
+        out, _ = p.communicate()
+        if p.returncode == 0 and out.strip():
+            return realpath(out.strip())
+    except OSError:
+        pass
+    libpath = join(sys.prefix, 'lib', 'python%s' % version)
+    logging.info("Could not find Python %s, assuming its library is in '%s'." %
+                 (version, libpath))
+    return libpath
+
+
+def strip_library_dirs(path, libpath):
+    """Return the module search path 'path' without the directories of library
+    directory 'libpath' (the site-packages directories are kept)."""
+    before, after = split_library_dirs(path, libpath)
+    return before + after
+
+
+def split_library_dirs(path, libpath):
+    """Return the directories of the module search path 'path' that come before
+    the first directory of library directory 'libpath', and those that come
+    after it, without the directories of the library (see
+    strip_library_dirs())."""
+    before, after = [], []
+    newpath = before
+    for dn in path:
+        rdn = realpath(dn or os.curdir)
+        if rdn == libpath or (rdn.startswith(libpath + os.sep) and
+                              not rdn.endswith(('site-packages', 'dist-packages'))):
+            newpath = after
+            continue
+        newpath.append(dn)
+    return before, after
+
+
+# The table of the target version, or None to search the modules of the
+# standard library like the others.
+target = None
+
+def set_target(table):
+    "Resolve the modules of the standard library from table 'table'."
+    global target
+    target = table
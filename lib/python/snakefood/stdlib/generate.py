@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+"""
+Generate the table of the standard library of the running interpreter.
+
+The table is output as a Python module, to be saved in this directory under
+the name of the version, e.g.:
+
+  python3.11 lib/python/snakefood/stdlib/generate.py > lib/python/snakefood/stdlib/py311.py
+
+This script runs standalone, under any version of Python that snakefood has a
+table for, so it must not import anything from snakefood.
+"""
+# This file is part of the Snakefood open source package.
+# See http://furius.ca/snakefood/ for licensing details.
+
+import sys, os, re, sysconfig
+from os.path import *
+
+try:
+    from importlib.machinery import EXTENSION_SUFFIXES
+except ImportError:
+    import imp
+    EXTENSION_SUFFIXES = [suffix for suffix, _, kind in imp.get_suffixes()
+                          if kind == imp.C_EXTENSION]
+
+# Directories of third-party packages, which may be within the library.
+skipped_packages = ('site-packages', 'dist-packages')
+
+identifier_re = re.compile('[A-Za-z_][A-Za-z0-9_]*$')
+
+
+def library_dirs():
+    """Return the standard library directory and the list of the directories of
+    the module search path that are within it, relative to it."""
+    paths = sysconfig.get_paths()
+    stdlib = realpath(paths['stdlib'])
+    sitedirs = set(realpath(paths[x]) for x in ('purelib', 'platlib'))
+    dirs = []
+    for dn in sys.path:
+        dn = realpath(dn or os.curdir)
+        if dn in sitedirs or not isdir(dn):
+            continue
+        if dn == stdlib:
+            dirs.append('')
+        elif dn.startswith(stdlib + os.sep):
+            dirs.append(dn[len(stdlib)+1:])
+    return stdlib, dirs
+
+
+def module_name(fn):
+    "Return the name of the module in file 'fn', or None if it is not a module."
+    for suffix in ['.py'] + EXTENSION_SUFFIXES:
+        if fn.endswith(suffix):
+            name = fn[:-len(suffix)]
+            if identifier_re.match(name):
+                return name
+
+
+def find_modules(stdlib, reldir, package, modules):
+    """Add the modules found in directory 'reldir' to 'modules', as names of
+    package 'package'.  The first module found for a name is kept, as with the
+    module search path."""
+    dn = join(stdlib, reldir)
+    names = sorted(os.listdir(dn))
+    prefix = package and package + '.' or ''
+
+    # Note: packages take precedence over modules, as for the import machinery.
+    for name in names:
+        init = join(reldir, name, '__init__.py')
+        if (identifier_re.match(name) and name not in skipped_packages and
+            isfile(join(stdlib, init))):
+            modname = prefix + name
+            if modname not in modules:
+                modules[modname] = init
+                find_modules(stdlib, join(reldir, name), modname, modules)
+
+    for name in names:
+        modname = module_name(name)
+        if modname is None or modname == '__init__':
+            continue
+        modname = prefix + modname
+        if modname not in modules:
+            modules[modname] = join(reldir, name)
+
+
+def main():
+    stdlib, dirs = library_dirs()
+    modules = {}
+    for reldir in dirs:
+        find_modules(stdlib, reldir, '', modules)
+
+    write = sys.stdout.write
+    write('# Generated by generate.py from Python %s on %s; do not edit.\n' %
+          (sys.version.split()[0], sys.platform))
+    write('\n')
+    write('version = %r\n' % ('%d.%d' % sys.version_info[:2]))
+    write('\n')
+    write('# Directories of the module search path, relative to the library.\n')
+    write('paths = (\n')
+    for reldir in dirs:
+        write('    %r,\n' % str(reldir))
+    write(')\n')
+    write('\n')
+    write('builtins = (\n')
+    for name in sorted(sys.builtin_module_names):
+        write('    %r,\n' % str(name))
+    write(')\n')
+    write('\n')
+    write('# Module name -> filename, relative to the library.\n')
+    write('modules = {\n')
+    for modname in sorted(modules):
+        write('    %r: %r,\n' % (str(modname), str(modules[modname])))
+    write('}\n')
+
+
+if __name__ == '__main__':
+    main()
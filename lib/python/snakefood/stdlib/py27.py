@@ -0,0 +1,1437 @@
+# Generated by generate.py from Python 2.7.18 on linux2; do not edit.
+
+version = '2.7'
+
+# Directories of the module search path, relative to the library.
+paths = (
+    '',
+    'plat-linux2',
+    'lib-tk',
+    'lib-dynload',
+)
+
+builtins = (
+    '__builtin__',
+    '__main__',
+    '_ast',
+    '_codecs',
+    '_sre',
+    '_symtable',
+    '_warnings',
+    '_weakref',
+    'errno',
+    'exceptions',
+    'gc',
+    'imp',
+    'marshal',
+    'posix',
+    'pwd',
+    'signal',
+    'sys',
+    'thread',
+    'xxsubtype',
+    'zipimport',
+)
+
+# Module name -> filename, relative to the library.
+modules = {
+    'BaseHTTPServer': 'BaseHTTPServer.py',
+    'Bastion': 'Bastion.py',
+    'CDROM': 'plat-linux2/CDROM.py',
+    'CGIHTTPServer': 'CGIHTTPServer.py',
+    'Canvas': 'lib-tk/Canvas.py',
+    'ConfigParser': 'ConfigParser.py',
+    'Cookie': 'Cookie.py',
+    'DLFCN': 'plat-linux2/DLFCN.py',
+    'Dialog': 'lib-tk/Dialog.py',
+    'DocXMLRPCServer': 'DocXMLRPCServer.py',
+    'FileDialog': 'lib-tk/FileDialog.py',
+    'FixTk': 'lib-tk/FixTk.py',
+    'HTMLParser': 'HTMLParser.py',
+    'IN': 'plat-linux2/IN.py',
+    'MimeWriter': 'MimeWriter.py',
+    'Queue': 'Queue.py',
+    'ScrolledText': 'lib-tk/ScrolledText.py',
+    'SimpleDialog': 'lib-tk/SimpleDialog.py',
+    'SimpleHTTPServer': 'SimpleHTTPServer.py',
+    'SimpleXMLRPCServer': 'SimpleXMLRPCServer.py',
+    'SocketServer': 'SocketServer.py',
+    'StringIO': 'StringIO.py',
+    'TYPES': 'plat-linux2/TYPES.py',
+    'Tix': 'lib-tk/Tix.py',
+    'Tkconstants': 'lib-tk/Tkconstants.py',
+    'Tkdnd': 'lib-tk/Tkdnd.py',
+    'Tkinter': 'lib-tk/Tkinter.py',
+    'UserDict': 'UserDict.py',
+    'UserList': 'UserList.py',
+    'UserString': 'UserString.py',
+    '_LWPCookieJar': '_LWPCookieJar.py',
+    '_MozillaCookieJar': '_MozillaCookieJar.py',
+    '__future__': '__future__.py',
+    '_abcoll': '_abcoll.py',
+    '_bisect': 'lib-dynload/_bisect.so',
+    '_codecs_cn': 'lib-dynload/_codecs_cn.so',
+    '_codecs_hk': 'lib-dynload/_codecs_hk.so',
+    '_codecs_iso2022': 'lib-dynload/_codecs_iso2022.so',
+    '_codecs_jp': 'lib-dynload/_codecs_jp.so',
+    '_codecs_kr': 'lib-dynload/_codecs_kr.so',
+    '_codecs_tw': 'lib-dynload/_codecs_tw.so',
+    '_collections': 'lib-dynload/_collections.so',
+    '_csv': 'lib-dynload/_csv.so',
+    '_ctypes': 'lib-dynload/_ctypes.so',
+    '_ctypes_test': 'lib-dynload/_ctypes_test.so',
+    '_curses': 'lib-dynload/_curses.so',
+    '_curses_panel': 'lib-dynload/_curses_panel.so',
+    '_elementtree': 'lib-dynload/_elementtree.so',
+    '_functools': 'lib-dynload/_functools.so',
+    '_heapq': 'lib-dynload/_heapq.so',
+    '_hotshot': 'lib-dynload/_hotshot.so',
+    '_io': 'lib-dynload/_io.so',
+    '_json': 'lib-dynload/_json.so',
+    '_locale': 'lib-dynload/_locale.so',
+    '_lsprof': 'lib-dynload/_lsprof.so',
+    '_md5': 'lib-dynload/_md5.so',
+    '_multibytecodec': 'lib-dynload/_multibytecodec.so',
+    '_multiprocessing': 'lib-dynload/_multiprocessing.so',
+    '_osx_support': '_osx_support.py',
+    '_pyio': '_pyio.py',
+    '_random': 'lib-dynload/_random.so',
+    '_sha': 'lib-dynload/_sha.so',
+    '_sha256': 'lib-dynload/_sha256.so',
+    '_sha512': 'lib-dynload/_sha512.so',
+    '_socket': 'lib-dynload/_socket.so',
+    '_sqlite3': 'lib-dynload/_sqlite3.so',
+    '_ssl': 'lib-dynload/_ssl.so',
+    '_strptime': '_strptime.py',
+    '_struct': 'lib-dynload/_struct.so',
+    '_sysconfigdata': '_sysconfigdata.py',
+    '_testcapi': 'lib-dynload/_testcapi.so',
+    '_threading_local': '_threading_local.py',
+    '_tkinter': 'lib-dynload/_tkinter.so',
+    '_weakrefset': '_weakrefset.py',
+    'abc': 'abc.py',
+    'aifc': 'aifc.py',
+    'antigravity': 'antigravity.py',
+    'anydbm': 'anydbm.py',
+    'argparse': 'argparse.py',
+    'array': 'lib-dynload/array.so',
+    'ast': 'ast.py',
+    'asynchat': 'asynchat.py',
+    'asyncore': 'asyncore.py',
+    'atexit': 'atexit.py',
+    'audiodev': 'audiodev.py',
+    'audioop': 'lib-dynload/audioop.so',
+    'base64': 'base64.py',
+    'bdb': 'bdb.py',
+    'binascii': 'lib-dynload/binascii.so',
+    'binhex': 'binhex.py',
+    'bisect': 'bisect.py',
+    'bsddb': 'bsddb/__init__.py',
+    'bsddb.db': 'bsddb/db.py',
+    'bsddb.dbobj': 'bsddb/dbobj.py',
+    'bsddb.dbrecio': 'bsddb/dbrecio.py',
+    'bsddb.dbshelve': 'bsddb/dbshelve.py',
+    'bsddb.dbtables': 'bsddb/dbtables.py',
+    'bsddb.dbutils': 'bsddb/dbutils.py',
+    'bsddb.test': 'bsddb/test/__init__.py',
+    'bsddb.test.test_all': 'bsddb/test/test_all.py',
+    'bsddb.test.test_associate': 'bsddb/test/test_associate.py',
+    'bsddb.test.test_basics': 'bsddb/test/test_basics.py',
+    'bsddb.test.test_compare': 'bsddb/test/test_compare.py',
+    'bsddb.test.test_compat': 'bsddb/test/test_compat.py',
+    'bsddb.test.test_cursor_pget_bug': 'bsddb/test/test_cursor_pget_bug.py',
+    'bsddb.test.test_db': 'bsddb/test/test_db.py',
+    'bsddb.test.test_dbenv': 'bsddb/test/test_dbenv.py',
+    'bsddb.test.test_dbobj': 'bsddb/test/test_dbobj.py',
+    'bsddb.test.test_dbshelve': 'bsddb/test/test_dbshelve.py',
+    'bsddb.test.test_dbtables': 'bsddb/test/test_dbtables.py',
+    'bsddb.test.test_distributed_transactions': 'bsddb/test/test_distributed_transactions.py',
+    'bsddb.test.test_early_close': 'bsddb/test/test_early_close.py',
+    'bsddb.test.test_fileid': 'bsddb/test/test_fileid.py',
+    'bsddb.test.test_get_none': 'bsddb/test/test_get_none.py',
+    'bsddb.test.test_join': 'bsddb/test/test_join.py',
+    'bsddb.test.test_lock': 'bsddb/test/test_lock.py',
+    'bsddb.test.test_misc': 'bsddb/test/test_misc.py',
+    'bsddb.test.test_pickle': 'bsddb/test/test_pickle.py',
+    'bsddb.test.test_queue': 'bsddb/test/test_queue.py',
+    'bsddb.test.test_recno': 'bsddb/test/test_recno.py',
+    'bsddb.test.test_replication': 'bsddb/test/test_replication.py',
+    'bsddb.test.test_sequence': 'bsddb/test/test_sequence.py',
+    'bsddb.test.test_thread': 'bsddb/test/test_thread.py',
+    'bz2': 'lib-dynload/bz2.so',
+    'cPickle': 'lib-dynload/cPickle.so',
+    'cProfile': 'cProfile.py',
+    'cStringIO': 'lib-dynload/cStringIO.so',
+    'calendar': 'calendar.py',
+    'cgi': 'cgi.py',
+    'cgitb': 'cgitb.py',
+    'chunk': 'chunk.py',
+    'cmath': 'lib-dynload/cmath.so',
+    'cmd': 'cmd.py',
+    'code': 'code.py',
+    'codecs': 'codecs.py',
+    'codeop': 'codeop.py',
+    'collections': 'collections.py',
+    'colorsys': 'colorsys.py',
+    'commands': 'commands.py',
+    'compileall': 'compileall.py',
+    'compiler': 'compiler/__init__.py',
+    'compiler.ast': 'compiler/ast.py',
+    'compiler.consts': 'compiler/consts.py',
+    'compiler.future': 'compiler/future.py',
+    'compiler.misc': 'compiler/misc.py',
+    'compiler.pyassem': 'compiler/pyassem.py',
+    'compiler.pycodegen': 'compiler/pycodegen.py',
+    'compiler.symbols': 'compiler/symbols.py',
+    'compiler.syntax': 'compiler/syntax.py',
+    'compiler.transformer': 'compiler/transformer.py',
+    'compiler.visitor': 'compiler/visitor.py',
+    'contextlib': 'contextlib.py',
+    'cookielib': 'cookielib.py',
+    'copy': 'copy.py',
+    'copy_reg': 'copy_reg.py',
+    'crypt': 'lib-dynload/crypt.so',
+    'csv': 'csv.py',
+    'ctypes': 'ctypes/__init__.py',
+    'ctypes._endian': 'ctypes/_endian.py',
+    'ctypes.macholib': 'ctypes/macholib/__init__.py',
+    'ctypes.macholib.dyld': 'ctypes/macholib/dyld.py',
+    'ctypes.macholib.dylib': 'ctypes/macholib/dylib.py',
+    'ctypes.macholib.framework': 'ctypes/macholib/framework.py',
+    'ctypes.test': 'ctypes/test/__init__.py',
+    'ctypes.test.runtests': 'ctypes/test/runtests.py',
+    'ctypes.test.test_anon': 'ctypes/test/test_anon.py',
+    'ctypes.test.test_array_in_pointer': 'ctypes/test/test_array_in_pointer.py',
+    'ctypes.test.test_arrays': 'ctypes/test/test_arrays.py',
+    'ctypes.test.test_as_parameter': 'ctypes/test/test_as_parameter.py',
+    'ctypes.test.test_bitfields': 'ctypes/test/test_bitfields.py',
+    'ctypes.test.test_buffers': 'ctypes/test/test_buffers.py',
+    'ctypes.test.test_byteswap': 'ctypes/test/test_byteswap.py',
+    'ctypes.test.test_callbacks': 'ctypes/test/test_callbacks.py',
+    'ctypes.test.test_cast': 'ctypes/test/test_cast.py',
+    'ctypes.test.test_cfuncs': 'ctypes/test/test_cfuncs.py',
+    'ctypes.test.test_checkretval': 'ctypes/test/test_checkretval.py',
+    'ctypes.test.test_delattr': 'ctypes/test/test_delattr.py',
+    'ctypes.test.test_errno': 'ctypes/test/test_errno.py',
+    'ctypes.test.test_find': 'ctypes/test/test_find.py',
+    'ctypes.test.test_frombuffer': 'ctypes/test/test_frombuffer.py',
+    'ctypes.test.test_funcptr': 'ctypes/test/test_funcptr.py',
+    'ctypes.test.test_functions': 'ctypes/test/test_functions.py',
+    'ctypes.test.test_incomplete': 'ctypes/test/test_incomplete.py',
+    'ctypes.test.test_init': 'ctypes/test/test_init.py',
+    'ctypes.test.test_internals': 'ctypes/test/test_internals.py',
+    'ctypes.test.test_keeprefs': 'ctypes/test/test_keeprefs.py',
+    'ctypes.test.test_libc': 'ctypes/test/test_libc.py',
+    'ctypes.test.test_loading': 'ctypes/test/test_loading.py',
+    'ctypes.test.test_macholib': 'ctypes/test/test_macholib.py',
+    'ctypes.test.test_memfunctions': 'ctypes/test/test_memfunctions.py',
+    'ctypes.test.test_numbers': 'ctypes/test/test_numbers.py',
+    'ctypes.test.test_objects': 'ctypes/test/test_objects.py',
+    'ctypes.test.test_parameters': 'ctypes/test/test_parameters.py',
+    'ctypes.test.test_pep3118': 'ctypes/test/test_pep3118.py',
+    'ctypes.test.test_pickling': 'ctypes/test/test_pickling.py',
+    'ctypes.test.test_pointers': 'ctypes/test/test_pointers.py',
+    'ctypes.test.test_prototypes': 'ctypes/test/test_prototypes.py',
+    'ctypes.test.test_python_api': 'ctypes/test/test_python_api.py',
+    'ctypes.test.test_random_things': 'ctypes/test/test_random_things.py',
+    'ctypes.test.test_refcounts': 'ctypes/test/test_refcounts.py',
+    'ctypes.test.test_repr': 'ctypes/test/test_repr.py',
+    'ctypes.test.test_returnfuncptrs': 'ctypes/test/test_returnfuncptrs.py',
+    'ctypes.test.test_simplesubclasses': 'ctypes/test/test_simplesubclasses.py',
+    'ctypes.test.test_sizes': 'ctypes/test/test_sizes.py',
+    'ctypes.test.test_slicing': 'ctypes/test/test_slicing.py',
+    'ctypes.test.test_stringptr': 'ctypes/test/test_stringptr.py',
+    'ctypes.test.test_strings': 'ctypes/test/test_strings.py',
+    'ctypes.test.test_struct_fields': 'ctypes/test/test_struct_fields.py',
+    'ctypes.test.test_structures': 'ctypes/test/test_structures.py',
+    'ctypes.test.test_unaligned_structures': 'ctypes/test/test_unaligned_structures.py',
+    'ctypes.test.test_unicode': 'ctypes/test/test_unicode.py',
+    'ctypes.test.test_values': 'ctypes/test/test_values.py',
+    'ctypes.test.test_varsize_struct': 'ctypes/test/test_varsize_struct.py',
+    'ctypes.test.test_win32': 'ctypes/test/test_win32.py',
+    'ctypes.test.test_wintypes': 'ctypes/test/test_wintypes.py',
+    'ctypes.util': 'ctypes/util.py',
+    'ctypes.wintypes': 'ctypes/wintypes.py',
+    'curses': 'curses/__init__.py',
+    'curses.ascii': 'curses/ascii.py',
+    'curses.has_key': 'curses/has_key.py',
+    'curses.panel': 'curses/panel.py',
+    'curses.textpad': 'curses/textpad.py',
+    'curses.wrapper': 'curses/wrapper.py',
+    'datetime': 'lib-dynload/datetime.so',
+    'dbhash': 'dbhash.py',
+    'decimal': 'decimal.py',
+    'difflib': 'difflib.py',
+    'dircache': 'dircache.py',
+    'dis': 'dis.py',
+    'distutils': 'distutils/__init__.py',
+    'distutils.archive_util': 'distutils/archive_util.py',
+    'distutils.bcppcompiler': 'distutils/bcppcompiler.py',
+    'distutils.ccompiler': 'distutils/ccompiler.py',
+    'distutils.cmd': 'distutils/cmd.py',
+    'distutils.command': 'distutils/command/__init__.py',
+    'distutils.command.bdist': 'distutils/command/bdist.py',
+    'distutils.command.bdist_dumb': 'distutils/command/bdist_dumb.py',
+    'distutils.command.bdist_msi': 'distutils/command/bdist_msi.py',
+    'distutils.command.bdist_rpm': 'distutils/command/bdist_rpm.py',
+    'distutils.command.bdist_wininst': 'distutils/command/bdist_wininst.py',
+    'distutils.command.build': 'distutils/command/build.py',
+    'distutils.command.build_clib': 'distutils/command/build_clib.py',
+    'distutils.command.build_ext': 'distutils/command/build_ext.py',
+    'distutils.command.build_py': 'distutils/command/build_py.py',
+    'distutils.command.build_scripts': 'distutils/command/build_scripts.py',
+    'distutils.command.check': 'distutils/command/check.py',
+    'distutils.command.clean': 'distutils/command/clean.py',
+    'distutils.command.config': 'distutils/command/config.py',
+    'distutils.command.install': 'distutils/command/install.py',
+    'distutils.command.install_data': 'distutils/command/install_data.py',
+    'distutils.command.install_egg_info': 'distutils/command/install_egg_info.py',
+    'distutils.command.install_headers': 'distutils/command/install_headers.py',
+    'distutils.command.install_lib': 'distutils/command/install_lib.py',
+    'distutils.command.install_scripts': 'distutils/command/install_scripts.py',
+    'distutils.command.register': 'distutils/command/register.py',
+    'distutils.command.sdist': 'distutils/command/sdist.py',
+    'distutils.command.upload': 'distutils/command/upload.py',
+    'distutils.config': 'distutils/config.py',
+    'distutils.core': 'distutils/core.py',
+    'distutils.cygwinccompiler': 'distutils/cygwinccompiler.py',
+    'distutils.debug': 'distutils/debug.py',
+    'distutils.dep_util': 'distutils/dep_util.py',
+    'distutils.dir_util': 'distutils/dir_util.py',
+    'distutils.dist': 'distutils/dist.py',
+    'distutils.emxccompiler': 'distutils/emxccompiler.py',
+    'distutils.errors': 'distutils/errors.py',
+    'distutils.extension': 'distutils/extension.py',
+    'distutils.fancy_getopt': 'distutils/fancy_getopt.py',
+    'distutils.file_util': 'distutils/file_util.py',
+    'distutils.filelist': 'distutils/filelist.py',
+    'distutils.log': 'distutils/log.py',
+    'distutils.msvc9compiler': 'distutils/msvc9compiler.py',
+    'distutils.msvccompiler': 'distutils/msvccompiler.py',
+    'distutils.spawn': 'distutils/spawn.py',
+    'distutils.sysconfig': 'distutils/sysconfig.py',
+    'distutils.tests': 'distutils/tests/__init__.py',
+    'distutils.tests.setuptools_build_ext': 'distutils/tests/setuptools_build_ext.py',
+    'distutils.tests.setuptools_extension': 'distutils/tests/setuptools_extension.py',
+    'distutils.tests.support': 'distutils/tests/support.py',
+    'distutils.tests.test_archive_util': 'distutils/tests/test_archive_util.py',
+    'distutils.tests.test_bdist': 'distutils/tests/test_bdist.py',
+    'distutils.tests.test_bdist_dumb': 'distutils/tests/test_bdist_dumb.py',
+    'distutils.tests.test_bdist_msi': 'distutils/tests/test_bdist_msi.py',
+    'distutils.tests.test_bdist_rpm': 'distutils/tests/test_bdist_rpm.py',
+    'distutils.tests.test_bdist_wininst': 'distutils/tests/test_bdist_wininst.py',
+    'distutils.tests.test_build': 'distutils/tests/test_build.py',
+    'distutils.tests.test_build_clib': 'distutils/tests/test_build_clib.py',
+    'distutils.tests.test_build_ext': 'distutils/tests/test_build_ext.py',
+    'distutils.tests.test_build_py': 'distutils/tests/test_build_py.py',
+    'distutils.tests.test_build_scripts': 'distutils/tests/test_build_scripts.py',
+    'distutils.tests.test_ccompiler': 'distutils/tests/test_ccompiler.py',
+    'distutils.tests.test_check': 'distutils/tests/test_check.py',
+    'distutils.tests.test_clean': 'distutils/tests/test_clean.py',
+    'distutils.tests.test_cmd': 'distutils/tests/test_cmd.py',
+    'distutils.tests.test_config': 'distutils/tests/test_config.py',
+    'distutils.tests.test_config_cmd': 'distutils/tests/test_config_cmd.py',
+    'distutils.tests.test_core': 'distutils/tests/test_core.py',
+    'distutils.tests.test_dep_util': 'distutils/tests/test_dep_util.py',
+    'distutils.tests.test_dir_util': 'distutils/tests/test_dir_util.py',
+    'distutils.tests.test_dist': 'distutils/tests/test_dist.py',
+    'distutils.tests.test_file_util': 'distutils/tests/test_file_util.py',
+    'distutils.tests.test_filelist': 'distutils/tests/test_filelist.py',
+    'distutils.tests.test_install': 'distutils/tests/test_install.py',
+    'distutils.tests.test_install_data': 'distutils/tests/test_install_data.py',
+    'distutils.tests.test_install_headers': 'distutils/tests/test_install_headers.py',
+    'distutils.tests.test_install_lib': 'distutils/tests/test_install_lib.py',
+    'distutils.tests.test_install_scripts': 'distutils/tests/test_install_scripts.py',
+    'distutils.tests.test_msvc9compiler': 'distutils/tests/test_msvc9compiler.py',
+    'distutils.tests.test_register': 'distutils/tests/test_register.py',
+    'distutils.tests.test_sdist': 'distutils/tests/test_sdist.py',
+    'distutils.tests.test_spawn': 'distutils/tests/test_spawn.py',
+    'distutils.tests.test_sysconfig': 'distutils/tests/test_sysconfig.py',
+    'distutils.tests.test_text_file': 'distutils/tests/test_text_file.py',
+    'distutils.tests.test_unixccompiler': 'distutils/tests/test_unixccompiler.py',
+    'distutils.tests.test_upload': 'distutils/tests/test_upload.py',
+    'distutils.tests.test_util': 'distutils/tests/test_util.py',
+    'distutils.tests.test_version': 'distutils/tests/test_version.py',
+    'distutils.tests.test_versionpredicate': 'distutils/tests/test_versionpredicate.py',
+    'distutils.text_file': 'distutils/text_file.py',
+    'distutils.unixccompiler': 'distutils/unixccompiler.py',
+    'distutils.util': 'distutils/util.py',
+    'distutils.version': 'distutils/version.py',
+    'distutils.versionpredicate': 'distutils/versionpredicate.py',
+    'doctest': 'doctest.py',
+    'dumbdbm': 'dumbdbm.py',
+    'dummy_thread': 'dummy_thread.py',
+    'dummy_threading': 'dummy_threading.py',
+    'email': 'email/__init__.py',
+    'email._parseaddr': 'email/_parseaddr.py',
+    'email.base64mime': 'email/base64mime.py',
+    'email.charset': 'email/charset.py',
+    'email.encoders': 'email/encoders.py',
+    'email.errors': 'email/errors.py',
+    'email.feedparser': 'email/feedparser.py',
+    'email.generator': 'email/generator.py',
+    'email.header': 'email/header.py',
+    'email.iterators': 'email/iterators.py',
+    'email.message': 'email/message.py',
+    'email.mime': 'email/mime/__init__.py',
+    'email.mime.application': 'email/mime/application.py',
+    'email.mime.audio': 'email/mime/audio.py',
+    'email.mime.base': 'email/mime/base.py',
+    'email.mime.image': 'email/mime/image.py',
+    'email.mime.message': 'email/mime/message.py',
+    'email.mime.multipart': 'email/mime/multipart.py',
+    'email.mime.nonmultipart': 'email/mime/nonmultipart.py',
+    'email.mime.text': 'email/mime/text.py',
+    'email.parser': 'email/parser.py',
+    'email.quoprimime': 'email/quoprimime.py',
+    'email.test': 'email/test/__init__.py',
+    'email.test.test_email': 'email/test/test_email.py',
+    'email.test.test_email_codecs': 'email/test/test_email_codecs.py',
+    'email.test.test_email_codecs_renamed': 'email/test/test_email_codecs_renamed.py',
+    'email.test.test_email_renamed': 'email/test/test_email_renamed.py',
+    'email.test.test_email_torture': 'email/test/test_email_torture.py',
+    'email.utils': 'email/utils.py',
+    'encodings': 'encodings/__init__.py',
+    'encodings.aliases': 'encodings/aliases.py',
+    'encodings.ascii': 'encodings/ascii.py',
+    'encodings.base64_codec': 'encodings/base64_codec.py',
+    'encodings.big5': 'encodings/big5.py',
+    'encodings.big5hkscs': 'encodings/big5hkscs.py',
+    'encodings.bz2_codec': 'encodings/bz2_codec.py',
+    'encodings.charmap': 'encodings/charmap.py',
+    'encodings.cp037': 'encodings/cp037.py',
+    'encodings.cp1006': 'encodings/cp1006.py',
+    'encodings.cp1026': 'encodings/cp1026.py',
+    'encodings.cp1140': 'encodings/cp1140.py',
+    'encodings.cp1250': 'encodings/cp1250.py',
+    'encodings.cp1251': 'encodings/cp1251.py',
+    'encodings.cp1252': 'encodings/cp1252.py',
+    'encodings.cp1253': 'encodings/cp1253.py',
+    'encodings.cp1254': 'encodings/cp1254.py',
+    'encodings.cp1255': 'encodings/cp1255.py',
+    'encodings.cp1256': 'encodings/cp1256.py',
+    'encodings.cp1257': 'encodings/cp1257.py',
+    'encodings.cp1258': 'encodings/cp1258.py',
+    'encodings.cp424': 'encodings/cp424.py',
+    'encodings.cp437': 'encodings/cp437.py',
+    'encodings.cp500': 'encodings/cp500.py',
+    'encodings.cp720': 'encodings/cp720.py',
+    'encodings.cp737': 'encodings/cp737.py',
+    'encodings.cp775': 'encodings/cp775.py',
+    'encodings.cp850': 'encodings/cp850.py',
+    'encodings.cp852': 'encodings/cp852.py',
+    'encodings.cp855': 'encodings/cp855.py',
+    'encodings.cp856': 'encodings/cp856.py',
+    'encodings.cp857': 'encodings/cp857.py',
+    'encodings.cp858': 'encodings/cp858.py',
+    'encodings.cp860': 'encodings/cp860.py',
+    'encodings.cp861': 'encodings/cp861.py',
+    'encodings.cp862': 'encodings/cp862.py',
+    'encodings.cp863': 'encodings/cp863.py',
+    'encodings.cp864': 'encodings/cp864.py',
+    'encodings.cp865': 'encodings/cp865.py',
+    'encodings.cp866': 'encodings/cp866.py',
+    'encodings.cp869': 'encodings/cp869.py',
+    'encodings.cp874': 'encodings/cp874.py',
+    'encodings.cp875': 'encodings/cp875.py',
+    'encodings.cp932': 'encodings/cp932.py',
+    'encodings.cp949': 'encodings/cp949.py',
+    'encodings.cp950': 'encodings/cp950.py',
+    'encodings.euc_jis_2004': 'encodings/euc_jis_2004.py',
+    'encodings.euc_jisx0213': 'encodings/euc_jisx0213.py',
+    'encodings.euc_jp': 'encodings/euc_jp.py',
+    'encodings.euc_kr': 'encodings/euc_kr.py',
+    'encodings.gb18030': 'encodings/gb18030.py',
+    'encodings.gb2312': 'encodings/gb2312.py',
+    'encodings.gbk': 'encodings/gbk.py',
+    'encodings.hex_codec': 'encodings/hex_codec.py',
+    'encodings.hp_roman8': 'encodings/hp_roman8.py',
+    'encodings.hz': 'encodings/hz.py',
+    'encodings.idna': 'encodings/idna.py',
+    'encodings.iso2022_jp': 'encodings/iso2022_jp.py',
+    'encodings.iso2022_jp_1': 'encodings/iso2022_jp_1.py',
+    'encodings.iso2022_jp_2': 'encodings/iso2022_jp_2.py',
+    'encodings.iso2022_jp_2004': 'encodings/iso2022_jp_2004.py',
+    'encodings.iso2022_jp_3': 'encodings/iso2022_jp_3.py',
+    'encodings.iso2022_jp_ext': 'encodings/iso2022_jp_ext.py',
+    'encodings.iso2022_kr': 'encodings/iso2022_kr.py',
+    'encodings.iso8859_1': 'encodings/iso8859_1.py',
+    'encodings.iso8859_10': 'encodings/iso8859_10.py',
+    'encodings.iso8859_11': 'encodings/iso8859_11.py',
+    'encodings.iso8859_13': 'encodings/iso8859_13.py',
+    'encodings.iso8859_14': 'encodings/iso8859_14.py',
+    'encodings.iso8859_15': 'encodings/iso8859_15.py',
+    'encodings.iso8859_16': 'encodings/iso8859_16.py',
+    'encodings.iso8859_2': 'encodings/iso8859_2.py',
+    'encodings.iso8859_3': 'encodings/iso8859_3.py',
+    'encodings.iso8859_4': 'encodings/iso8859_4.py',
+    'encodings.iso8859_5': 'encodings/iso8859_5.py',
+    'encodings.iso8859_6': 'encodings/iso8859_6.py',
+    'encodings.iso8859_7': 'encodings/iso8859_7.py',
+    'encodings.iso8859_8': 'encodings/iso8859_8.py',
+    'encodings.iso8859_9': 'encodings/iso8859_9.py',
+    'encodings.johab': 'encodings/johab.py',
+    'encodings.koi8_r': 'encodings/koi8_r.py',
+    'encodings.koi8_u': 'encodings/koi8_u.py',
+    'encodings.latin_1': 'encodings/latin_1.py',
+    'encodings.mac_arabic': 'encodings/mac_arabic.py',
+    'encodings.mac_centeuro': 'encodings/mac_centeuro.py',
+    'encodings.mac_croatian': 'encodings/mac_croatian.py',
+    'encodings.mac_cyrillic': 'encodings/mac_cyrillic.py',
+    'encodings.mac_farsi': 'encodings/mac_farsi.py',
+    'encodings.mac_greek': 'encodings/mac_greek.py',
+    'encodings.mac_iceland': 'encodings/mac_iceland.py',
+    'encodings.mac_latin2': 'encodings/mac_latin2.py',
+    'encodings.mac_roman': 'encodings/mac_roman.py',
+    'encodings.mac_romanian': 'encodings/mac_romanian.py',
+    'encodings.mac_turkish': 'encodings/mac_turkish.py',
+    'encodings.mbcs': 'encodings/mbcs.py',
+    'encodings.palmos': 'encodings/palmos.py',
+    'encodings.ptcp154': 'encodings/ptcp154.py',
+    'encodings.punycode': 'encodings/punycode.py',
+    'encodings.quopri_codec': 'encodings/quopri_codec.py',
+    'encodings.raw_unicode_escape': 'encodings/raw_unicode_escape.py',
+    'encodings.rot_13': 'encodings/rot_13.py',
+    'encodings.shift_jis': 'encodings/shift_jis.py',
+    'encodings.shift_jis_2004': 'encodings/shift_jis_2004.py',
+    'encodings.shift_jisx0213': 'encodings/shift_jisx0213.py',
+    'encodings.string_escape': 'encodings/string_escape.py',
+    'encodings.tis_620': 'encodings/tis_620.py',
+    'encodings.undefined': 'encodings/undefined.py',
+    'encodings.unicode_escape': 'encodings/unicode_escape.py',
+    'encodings.unicode_internal': 'encodings/unicode_internal.py',
+    'encodings.utf_16': 'encodings/utf_16.py',
+    'encodings.utf_16_be': 'encodings/utf_16_be.py',
+    'encodings.utf_16_le': 'encodings/utf_16_le.py',
+    'encodings.utf_32': 'encodings/utf_32.py',
+    'encodings.utf_32_be': 'encodings/utf_32_be.py',
+    'encodings.utf_32_le': 'encodings/utf_32_le.py',
+    'encodings.utf_7': 'encodings/utf_7.py',
+    'encodings.utf_8': 'encodings/utf_8.py',
+    'encodings.utf_8_sig': 'encodings/utf_8_sig.py',
+    'encodings.uu_codec': 'encodings/uu_codec.py',
+    'encodings.zlib_codec': 'encodings/zlib_codec.py',
+    'ensurepip': 'ensurepip/__init__.py',
+    'ensurepip.__main__': 'ensurepip/__main__.py',
+    'ensurepip._uninstall': 'ensurepip/_uninstall.py',
+    'fcntl': 'lib-dynload/fcntl.so',
+    'filecmp': 'filecmp.py',
+    'fileinput': 'fileinput.py',
+    'fnmatch': 'fnmatch.py',
+    'formatter': 'formatter.py',
+    'fpformat': 'fpformat.py',
+    'fractions': 'fractions.py',
+    'ftplib': 'ftplib.py',
+    'functools': 'functools.py',
+    'future_builtins': 'lib-dynload/future_builtins.so',
+    'genericpath': 'genericpath.py',
+    'getopt': 'getopt.py',
+    'getpass': 'getpass.py',
+    'gettext': 'gettext.py',
+    'glob': 'glob.py',
+    'grp': 'lib-dynload/grp.so',
+    'gzip': 'gzip.py',
+    'hashlib': 'hashlib.py',
+    'heapq': 'heapq.py',
+    'hmac': 'hmac.py',
+    'hotshot': 'hotshot/__init__.py',
+    'hotshot.log': 'hotshot/log.py',
+    'hotshot.stats': 'hotshot/stats.py',
+    'hotshot.stones': 'hotshot/stones.py',
+    'htmlentitydefs': 'htmlentitydefs.py',
+    'htmllib': 'htmllib.py',
+    'httplib': 'httplib.py',
+    'idlelib': 'idlelib/__init__.py',
+    'idlelib.AutoComplete': 'idlelib/AutoComplete.py',
+    'idlelib.AutoCompleteWindow': 'idlelib/AutoCompleteWindow.py',
+    'idlelib.AutoExpand': 'idlelib/AutoExpand.py',
+    'idlelib.Bindings': 'idlelib/Bindings.py',
+    'idlelib.CallTipWindow': 'idlelib/CallTipWindow.py',
+    'idlelib.CallTips': 'idlelib/CallTips.py',
+    'idlelib.ClassBrowser': 'idlelib/ClassBrowser.py',
+    'idlelib.CodeContext': 'idlelib/CodeContext.py',
+    'idlelib.ColorDelegator': 'idlelib/ColorDelegator.py',
+    'idlelib.Debugger': 'idlelib/Debugger.py',
+    'idlelib.Delegator': 'idlelib/Delegator.py',
+    'idlelib.EditorWindow': 'idlelib/EditorWindow.py',
+    'idlelib.FileList': 'idlelib/FileList.py',
+    'idlelib.FormatParagraph': 'idlelib/FormatParagraph.py',
+    'idlelib.GrepDialog': 'idlelib/GrepDialog.py',
+    'idlelib.HyperParser': 'idlelib/HyperParser.py',
+    'idlelib.IOBinding': 'idlelib/IOBinding.py',
+    'idlelib.IdleHistory': 'idlelib/IdleHistory.py',
+    'idlelib.MultiCall': 'idlelib/MultiCall.py',
+    'idlelib.MultiStatusBar': 'idlelib/MultiStatusBar.py',
+    'idlelib.ObjectBrowser': 'idlelib/ObjectBrowser.py',
+    'idlelib.OutputWindow': 'idlelib/OutputWindow.py',
+    'idlelib.ParenMatch': 'idlelib/ParenMatch.py',
+    'idlelib.PathBrowser': 'idlelib/PathBrowser.py',
+    'idlelib.Percolator': 'idlelib/Percolator.py',
+    'idlelib.PyParse': 'idlelib/PyParse.py',
+    'idlelib.PyShell': 'idlelib/PyShell.py',
+    'idlelib.RemoteDebugger': 'idlelib/RemoteDebugger.py',
+    'idlelib.RemoteObjectBrowser': 'idlelib/RemoteObjectBrowser.py',
+    'idlelib.ReplaceDialog': 'idlelib/ReplaceDialog.py',
+    'idlelib.RstripExtension': 'idlelib/RstripExtension.py',
+    'idlelib.ScriptBinding': 'idlelib/ScriptBinding.py',
+    'idlelib.ScrolledList': 'idlelib/ScrolledList.py',
+    'idlelib.SearchDialog': 'idlelib/SearchDialog.py',
+    'idlelib.SearchDialogBase': 'idlelib/SearchDialogBase.py',
+    'idlelib.SearchEngine': 'idlelib/SearchEngine.py',
+    'idlelib.StackViewer': 'idlelib/StackViewer.py',
+    'idlelib.ToolTip': 'idlelib/ToolTip.py',
+    'idlelib.TreeWidget': 'idlelib/TreeWidget.py',
+    'idlelib.UndoDelegator': 'idlelib/UndoDelegator.py',
+    'idlelib.WidgetRedirector': 'idlelib/WidgetRedirector.py',
+    'idlelib.WindowList': 'idlelib/WindowList.py',
+    'idlelib.ZoomHeight': 'idlelib/ZoomHeight.py',
+    'idlelib.aboutDialog': 'idlelib/aboutDialog.py',
+    'idlelib.configDialog': 'idlelib/configDialog.py',
+    'idlelib.configHandler': 'idlelib/configHandler.py',
+    'idlelib.configHelpSourceEdit': 'idlelib/configHelpSourceEdit.py',
+    'idlelib.configSectionNameDialog': 'idlelib/configSectionNameDialog.py',
+    'idlelib.dynOptionMenuWidget': 'idlelib/dynOptionMenuWidget.py',
+    'idlelib.help': 'idlelib/help.py',
+    'idlelib.idle': 'idlelib/idle.py',
+    'idlelib.idle_test': 'idlelib/idle_test/__init__.py',
+    'idlelib.idle_test.htest': 'idlelib/idle_test/htest.py',
+    'idlelib.idle_test.mock_idle': 'idlelib/idle_test/mock_idle.py',
+    'idlelib.idle_test.mock_tk': 'idlelib/idle_test/mock_tk.py',
+    'idlelib.idle_test.test_autocomplete': 'idlelib/idle_test/test_autocomplete.py',
+    'idlelib.idle_test.test_autoexpand': 'idlelib/idle_test/test_autoexpand.py',
+    'idlelib.idle_test.test_calltips': 'idlelib/idle_test/test_calltips.py',
+    'idlelib.idle_test.test_config_name': 'idlelib/idle_test/test_config_name.py',
+    'idlelib.idle_test.test_configdialog': 'idlelib/idle_test/test_configdialog.py',
+    'idlelib.idle_test.test_delegator': 'idlelib/idle_test/test_delegator.py',
+    'idlelib.idle_test.test_editmenu': 'idlelib/idle_test/test_editmenu.py',
+    'idlelib.idle_test.test_formatparagraph': 'idlelib/idle_test/test_formatparagraph.py',
+    'idlelib.idle_test.test_grep': 'idlelib/idle_test/test_grep.py',
+    'idlelib.idle_test.test_helpabout': 'idlelib/idle_test/test_helpabout.py',
+    'idlelib.idle_test.test_hyperparser': 'idlelib/idle_test/test_hyperparser.py',
+    'idlelib.idle_test.test_idlehistory': 'idlelib/idle_test/test_idlehistory.py',
+    'idlelib.idle_test.test_io': 'idlelib/idle_test/test_io.py',
+    'idlelib.idle_test.test_parenmatch': 'idlelib/idle_test/test_parenmatch.py',
+    'idlelib.idle_test.test_pathbrowser': 'idlelib/idle_test/test_pathbrowser.py',
+    'idlelib.idle_test.test_rstrip': 'idlelib/idle_test/test_rstrip.py',
+    'idlelib.idle_test.test_searchdialogbase': 'idlelib/idle_test/test_searchdialogbase.py',
+    'idlelib.idle_test.test_searchengine': 'idlelib/idle_test/test_searchengine.py',
+    'idlelib.idle_test.test_text': 'idlelib/idle_test/test_text.py',
+    'idlelib.idle_test.test_textview': 'idlelib/idle_test/test_textview.py',
+    'idlelib.idle_test.test_warning': 'idlelib/idle_test/test_warning.py',
+    'idlelib.idle_test.test_widgetredir': 'idlelib/idle_test/test_widgetredir.py',
+    'idlelib.idlever': 'idlelib/idlever.py',
+    'idlelib.keybindingDialog': 'idlelib/keybindingDialog.py',
+    'idlelib.macosxSupport': 'idlelib/macosxSupport.py',
+    'idlelib.rpc': 'idlelib/rpc.py',
+    'idlelib.run': 'idlelib/run.py',
+    'idlelib.tabbedpages': 'idlelib/tabbedpages.py',
+    'idlelib.textView': 'idlelib/textView.py',
+    'ihooks': 'ihooks.py',
+    'imaplib': 'imaplib.py',
+    'imghdr': 'imghdr.py',
+    'importlib': 'importlib/__init__.py',
+    'imputil': 'imputil.py',
+    'inspect': 'inspect.py',
+    'io': 'io.py',
+    'itertools': 'lib-dynload/itertools.so',
+    'json': 'json/__init__.py',
+    'json.decoder': 'json/decoder.py',
+    'json.encoder': 'json/encoder.py',
+    'json.scanner': 'json/scanner.py',
+    'json.tests': 'json/tests/__init__.py',
+    'json.tests.test_check_circular': 'json/tests/test_check_circular.py',
+    'json.tests.test_decode': 'json/tests/test_decode.py',
+    'json.tests.test_default': 'json/tests/test_default.py',
+    'json.tests.test_dump': 'json/tests/test_dump.py',
+    'json.tests.test_encode_basestring_ascii': 'json/tests/test_encode_basestring_ascii.py',
+    'json.tests.test_fail': 'json/tests/test_fail.py',
+    'json.tests.test_float': 'json/tests/test_float.py',
+    'json.tests.test_indent': 'json/tests/test_indent.py',
+    'json.tests.test_pass1': 'json/tests/test_pass1.py',
+    'json.tests.test_pass2': 'json/tests/test_pass2.py',
+    'json.tests.test_pass3': 'json/tests/test_pass3.py',
+    'json.tests.test_recursion': 'json/tests/test_recursion.py',
+    'json.tests.test_scanstring': 'json/tests/test_scanstring.py',
+    'json.tests.test_separators': 'json/tests/test_separators.py',
+    'json.tests.test_speedups': 'json/tests/test_speedups.py',
+    'json.tests.test_tool': 'json/tests/test_tool.py',
+    'json.tests.test_unicode': 'json/tests/test_unicode.py',
+    'json.tool': 'json/tool.py',
+    'keyword': 'keyword.py',
+    'lib2to3': 'lib2to3/__init__.py',
+    'lib2to3.__main__': 'lib2to3/__main__.py',
+    'lib2to3.btm_matcher': 'lib2to3/btm_matcher.py',
+    'lib2to3.btm_utils': 'lib2to3/btm_utils.py',
+    'lib2to3.fixer_base': 'lib2to3/fixer_base.py',
+    'lib2to3.fixer_util': 'lib2to3/fixer_util.py',
+    'lib2to3.fixes': 'lib2to3/fixes/__init__.py',
+    'lib2to3.fixes.fix_apply': 'lib2to3/fixes/fix_apply.py',
+    'lib2to3.fixes.fix_asserts': 'lib2to3/fixes/fix_asserts.py',
+    'lib2to3.fixes.fix_basestring': 'lib2to3/fixes/fix_basestring.py',
+    'lib2to3.fixes.fix_buffer': 'lib2to3/fixes/fix_buffer.py',
+    'lib2to3.fixes.fix_dict': 'lib2to3/fixes/fix_dict.py',
+    'lib2to3.fixes.fix_except': 'lib2to3/fixes/fix_except.py',
+    'lib2to3.fixes.fix_exec': 'lib2to3/fixes/fix_exec.py',
+    'lib2to3.fixes.fix_execfile': 'lib2to3/fixes/fix_execfile.py',
+    'lib2to3.fixes.fix_exitfunc': 'lib2to3/fixes/fix_exitfunc.py',
+    'lib2to3.fixes.fix_filter': 'lib2to3/fixes/fix_filter.py',
+    'lib2to3.fixes.fix_funcattrs': 'lib2to3/fixes/fix_funcattrs.py',
+    'lib2to3.fixes.fix_future': 'lib2to3/fixes/fix_future.py',
+    'lib2to3.fixes.fix_getcwdu': 'lib2to3/fixes/fix_getcwdu.py',
+    'lib2to3.fixes.fix_has_key': 'lib2to3/fixes/fix_has_key.py',
+    'lib2to3.fixes.fix_idioms': 'lib2to3/fixes/fix_idioms.py',
+    'lib2to3.fixes.fix_import': 'lib2to3/fixes/fix_import.py',
+    'lib2to3.fixes.fix_imports': 'lib2to3/fixes/fix_imports.py',
+    'lib2to3.fixes.fix_imports2': 'lib2to3/fixes/fix_imports2.py',
+    'lib2to3.fixes.fix_input': 'lib2to3/fixes/fix_input.py',
+    'lib2to3.fixes.fix_intern': 'lib2to3/fixes/fix_intern.py',
+    'lib2to3.fixes.fix_isinstance': 'lib2to3/fixes/fix_isinstance.py',
+    'lib2to3.fixes.fix_itertools': 'lib2to3/fixes/fix_itertools.py',
+    'lib2to3.fixes.fix_itertools_imports': 'lib2to3/fixes/fix_itertools_imports.py',
+    'lib2to3.fixes.fix_long': 'lib2to3/fixes/fix_long.py',
+    'lib2to3.fixes.fix_map': 'lib2to3/fixes/fix_map.py',
+    'lib2to3.fixes.fix_metaclass': 'lib2to3/fixes/fix_metaclass.py',
+    'lib2to3.fixes.fix_methodattrs': 'lib2to3/fixes/fix_methodattrs.py',
+    'lib2to3.fixes.fix_ne': 'lib2to3/fixes/fix_ne.py',
+    'lib2to3.fixes.fix_next': 'lib2to3/fixes/fix_next.py',
+    'lib2to3.fixes.fix_nonzero': 'lib2to3/fixes/fix_nonzero.py',
+    'lib2to3.fixes.fix_numliterals': 'lib2to3/fixes/fix_numliterals.py',
+    'lib2to3.fixes.fix_operator': 'lib2to3/fixes/fix_operator.py',
+    'lib2to3.fixes.fix_paren': 'lib2to3/fixes/fix_paren.py',
+    'lib2to3.fixes.fix_print': 'lib2to3/fixes/fix_print.py',
+    'lib2to3.fixes.fix_raise': 'lib2to3/fixes/fix_raise.py',
+    'lib2to3.fixes.fix_raw_input': 'lib2to3/fixes/fix_raw_input.py',
+    'lib2to3.fixes.fix_reduce': 'lib2to3/fixes/fix_reduce.py',
+    'lib2to3.fixes.fix_renames': 'lib2to3/fixes/fix_renames.py',
+    'lib2to3.fixes.fix_repr': 'lib2to3/fixes/fix_repr.py',
+    'lib2to3.fixes.fix_set_literal': 'lib2to3/fixes/fix_set_literal.py',
+    'lib2to3.fixes.fix_standarderror': 'lib2to3/fixes/fix_standarderror.py',
+    'lib2to3.fixes.fix_sys_exc': 'lib2to3/fixes/fix_sys_exc.py',
+    'lib2to3.fixes.fix_throw': 'lib2to3/fixes/fix_throw.py',
+    'lib2to3.fixes.fix_tuple_params': 'lib2to3/fixes/fix_tuple_params.py',
+    'lib2to3.fixes.fix_types': 'lib2to3/fixes/fix_types.py',
+    'lib2to3.fixes.fix_unicode': 'lib2to3/fixes/fix_unicode.py',
+    'lib2to3.fixes.fix_urllib': 'lib2to3/fixes/fix_urllib.py',
+    'lib2to3.fixes.fix_ws_comma': 'lib2to3/fixes/fix_ws_comma.py',
+    'lib2to3.fixes.fix_xrange': 'lib2to3/fixes/fix_xrange.py',
+    'lib2to3.fixes.fix_xreadlines': 'lib2to3/fixes/fix_xreadlines.py',
+    'lib2to3.fixes.fix_zip': 'lib2to3/fixes/fix_zip.py',
+    'lib2to3.main': 'lib2to3/main.py',
+    'lib2to3.patcomp': 'lib2to3/patcomp.py',
+    'lib2to3.pgen2': 'lib2to3/pgen2/__init__.py',
+    'lib2to3.pgen2.conv': 'lib2to3/pgen2/conv.py',
+    'lib2to3.pgen2.driver': 'lib2to3/pgen2/driver.py',
+    'lib2to3.pgen2.grammar': 'lib2to3/pgen2/grammar.py',
+    'lib2to3.pgen2.literals': 'lib2to3/pgen2/literals.py',
+    'lib2to3.pgen2.parse': 'lib2to3/pgen2/parse.py',
+    'lib2to3.pgen2.pgen': 'lib2to3/pgen2/pgen.py',
+    'lib2to3.pgen2.token': 'lib2to3/pgen2/token.py',
+    'lib2to3.pgen2.tokenize': 'lib2to3/pgen2/tokenize.py',
+    'lib2to3.pygram': 'lib2to3/pygram.py',
+    'lib2to3.pytree': 'lib2to3/pytree.py',
+    'lib2to3.refactor': 'lib2to3/refactor.py',
+    'lib2to3.tests': 'lib2to3/tests/__init__.py',
+    'lib2to3.tests.pytree_idempotency': 'lib2to3/tests/pytree_idempotency.py',
+    'lib2to3.tests.support': 'lib2to3/tests/support.py',
+    'lib2to3.tests.test_all_fixers': 'lib2to3/tests/test_all_fixers.py',
+    'lib2to3.tests.test_fixers': 'lib2to3/tests/test_fixers.py',
+    'lib2to3.tests.test_main': 'lib2to3/tests/test_main.py',
+    'lib2to3.tests.test_parser': 'lib2to3/tests/test_parser.py',
+    'lib2to3.tests.test_pytree': 'lib2to3/tests/test_pytree.py',
+    'lib2to3.tests.test_refactor': 'lib2to3/tests/test_refactor.py',
+    'lib2to3.tests.test_util': 'lib2to3/tests/test_util.py',
+    'linecache': 'linecache.py',
+    'linuxaudiodev': 'lib-dynload/linuxaudiodev.so',
+    'locale': 'locale.py',
+    'logging': 'logging/__init__.py',
+    'logging.config': 'logging/config.py',
+    'logging.handlers': 'logging/handlers.py',
+    'macpath': 'macpath.py',
+    'macurl2path': 'macurl2path.py',
+    'mailbox': 'mailbox.py',
+    'mailcap': 'mailcap.py',
+    'markupbase': 'markupbase.py',
+    'math': 'lib-dynload/math.so',
+    'md5': 'md5.py',
+    'mhlib': 'mhlib.py',
+    'mimetools': 'mimetools.py',
+    'mimetypes': 'mimetypes.py',
+    'mimify': 'mimify.py',
+    'mmap': 'lib-dynload/mmap.so',
+    'modulefinder': 'modulefinder.py',
+    'multifile': 'multifile.py',
+    'multiprocessing': 'multiprocessing/__init__.py',
+    'multiprocessing.connection': 'multiprocessing/connection.py',
+    'multiprocessing.dummy': 'multiprocessing/dummy/__init__.py',
+    'multiprocessing.dummy.connection': 'multiprocessing/dummy/connection.py',
+    'multiprocessing.forking': 'multiprocessing/forking.py',
+    'multiprocessing.heap': 'multiprocessing/heap.py',
+    'multiprocessing.managers': 'multiprocessing/managers.py',
+    'multiprocessing.pool': 'multiprocessing/pool.py',
+    'multiprocessing.process': 'multiprocessing/process.py',
+    'multiprocessing.queues': 'multiprocessing/queues.py',
+    'multiprocessing.reduction': 'multiprocessing/reduction.py',
+    'multiprocessing.sharedctypes': 'multiprocessing/sharedctypes.py',
+    'multiprocessing.synchronize': 'multiprocessing/synchronize.py',
+    'multiprocessing.util': 'multiprocessing/util.py',
+    'mutex': 'mutex.py',
+    'netrc': 'netrc.py',
+    'new': 'new.py',
+    'nis': 'lib-dynload/nis.so',
+    'nntplib': 'nntplib.py',
+    'ntpath': 'ntpath.py',
+    'nturl2path': 'nturl2path.py',
+    'numbers': 'numbers.py',
+    'opcode': 'opcode.py',
+    'operator': 'lib-dynload/operator.so',
+    'optparse': 'optparse.py',
+    'os': 'os.py',
+    'os2emxpath': 'os2emxpath.py',
+    'ossaudiodev': 'lib-dynload/ossaudiodev.so',
+    'parser': 'lib-dynload/parser.so',
+    'pdb': 'pdb.py',
+    'pickle': 'pickle.py',
+    'pickletools': 'pickletools.py',
+    'pipes': 'pipes.py',
+    'pkgutil': 'pkgutil.py',
+    'platform': 'platform.py',
+    'plistlib': 'plistlib.py',
+    'popen2': 'popen2.py',
+    'poplib': 'poplib.py',
+    'posixfile': 'posixfile.py',
+    'posixpath': 'posixpath.py',
+    'pprint': 'pprint.py',
+    'profile': 'profile.py',
+    'pstats': 'pstats.py',
+    'pty': 'pty.py',
+    'py_compile': 'py_compile.py',
+    'pyclbr': 'pyclbr.py',
+    'pydoc': 'pydoc.py',
+    'pydoc_data': 'pydoc_data/__init__.py',
+    'pydoc_data.topics': 'pydoc_data/topics.py',
+    'pyexpat': 'lib-dynload/pyexpat.so',
+    'quopri': 'quopri.py',
+    'random': 'random.py',
+    're': 're.py',
+    'readline': 'lib-dynload/readline.so',
+    'repr': 'repr.py',
+    'resource': 'lib-dynload/resource.so',
+    'rexec': 'rexec.py',
+    'rfc822': 'rfc822.py',
+    'rlcompleter': 'rlcompleter.py',
+    'robotparser': 'robotparser.py',
+    'runpy': 'runpy.py',
+    'sched': 'sched.py',
+    'select': 'lib-dynload/select.so',
+    'sets': 'sets.py',
+    'sgmllib': 'sgmllib.py',
+    'sha': 'sha.py',
+    'shelve': 'shelve.py',
+    'shlex': 'shlex.py',
+    'shutil': 'shutil.py',
+    'site': 'site.py',
+    'smtpd': 'smtpd.py',
+    'smtplib': 'smtplib.py',
+    'sndhdr': 'sndhdr.py',
+    'socket': 'socket.py',
+    'spwd': 'lib-dynload/spwd.so',
+    'sqlite3': 'sqlite3/__init__.py',
+    'sqlite3.dbapi2': 'sqlite3/dbapi2.py',
+    'sqlite3.dump': 'sqlite3/dump.py',
+    'sqlite3.test': 'sqlite3/test/__init__.py',
+    'sqlite3.test.dbapi': 'sqlite3/test/dbapi.py',
+    'sqlite3.test.dump': 'sqlite3/test/dump.py',
+    'sqlite3.test.factory': 'sqlite3/test/factory.py',
+    'sqlite3.test.hooks': 'sqlite3/test/hooks.py',
+    'sqlite3.test.py25tests': 'sqlite3/test/py25tests.py',
+    'sqlite3.test.regression': 'sqlite3/test/regression.py',
+    'sqlite3.test.transactions': 'sqlite3/test/transactions.py',
+    'sqlite3.test.types': 'sqlite3/test/types.py',
+    'sqlite3.test.userfunctions': 'sqlite3/test/userfunctions.py',
+    'sre': 'sre.py',
+    'sre_compile': 'sre_compile.py',
+    'sre_constants': 'sre_constants.py',
+    'sre_parse': 'sre_parse.py',
+    'ssl': 'ssl.py',
+    'stat': 'stat.py',
+    'statvfs': 'statvfs.py',
+    'string': 'string.py',
+    'stringold': 'stringold.py',
+    'stringprep': 'stringprep.py',
+    'strop': 'lib-dynload/strop.so',
+    'struct': 'struct.py',
+    'subprocess': 'subprocess.py',
+    'sunau': 'sunau.py',
+    'sunaudio': 'sunaudio.py',
+    'symbol': 'symbol.py',
+    'symtable': 'symtable.py',
+    'sysconfig': 'sysconfig.py',
+    'syslog': 'lib-dynload/syslog.so',
+    'tabnanny': 'tabnanny.py',
+    'tarfile': 'tarfile.py',
+    'telnetlib': 'telnetlib.py',
+    'tempfile': 'tempfile.py',
+    'termios': 'lib-dynload/termios.so',
+    'test': 'test/__init__.py',
+    'test.__main__': 'test/__main__.py',
+    'test._mock_backport': 'test/_mock_backport.py',
+    'test.audiotests': 'test/audiotests.py',
+    'test.autotest': 'test/autotest.py',
+    'test.bad_coding': 'test/bad_coding.py',
+    'test.bad_coding2': 'test/bad_coding2.py',
+    'test.bad_coding3': 'test/bad_coding3.py',
+    'test.badsyntax_future3': 'test/badsyntax_future3.py',
+    'test.badsyntax_future4': 'test/badsyntax_future4.py',
+    'test.badsyntax_future5': 'test/badsyntax_future5.py',
+    'test.badsyntax_future6': 'test/badsyntax_future6.py',
+    'test.badsyntax_future7': 'test/badsyntax_future7.py',
+    'test.badsyntax_future8': 'test/badsyntax_future8.py',
+    'test.badsyntax_future9': 'test/badsyntax_future9.py',
+    'test.badsyntax_nocaret': 'test/badsyntax_nocaret.py',
+    'test.bisect_cmd': 'test/bisect_cmd.py',
+    'test.curses_tests': 'test/curses_tests.py',
+    'test.doctest_aliases': 'test/doctest_aliases.py',
+    'test.double_const': 'test/double_const.py',
+    'test.fork_wait': 'test/fork_wait.py',
+    'test.gdb_sample': 'test/gdb_sample.py',
+    'test.infinite_reload': 'test/infinite_reload.py',
+    'test.inspect_fodder': 'test/inspect_fodder.py',
+    'test.inspect_fodder2': 'test/inspect_fodder2.py',
+    'test.list_tests': 'test/list_tests.py',
+    'test.lock_tests': 'test/lock_tests.py',
+    'test.make_ssl_certs': 'test/make_ssl_certs.py',
+    'test.mapping_tests': 'test/mapping_tests.py',
+    'test.mp_fork_bomb': 'test/mp_fork_bomb.py',
+    'test.multibytecodec_support': 'test/multibytecodec_support.py',
+    'test.outstanding_bugs': 'test/outstanding_bugs.py',
+    'test.pickletester': 'test/pickletester.py',
+    'test.profilee': 'test/profilee.py',
+    'test.pyclbr_input': 'test/pyclbr_input.py',
+    'test.pydoc_mod': 'test/pydoc_mod.py',
+    'test.pydocfodder': 'test/pydocfodder.py',
+    'test.pystone': 'test/pystone.py',
+    'test.pythoninfo': 'test/pythoninfo.py',
+    'test.re_tests': 'test/re_tests.py',
+    'test.regrtest': 'test/regrtest.py',
+    'test.relimport': 'test/relimport.py',
+    'test.reperf': 'test/reperf.py',
+    'test.sample_doctest': 'test/sample_doctest.py',
+    'test.sample_doctest_no_docstrings': 'test/sample_doctest_no_docstrings.py',
+    'test.sample_doctest_no_doctests': 'test/sample_doctest_no_doctests.py',
+    'test.script_helper': 'test/script_helper.py',
+    'test.seq_tests': 'test/seq_tests.py',
+    'test.sortperf': 'test/sortperf.py',
+    'test.ssl_servers': 'test/ssl_servers.py',
+    'test.ssltests': 'test/ssltests.py',
+    'test.string_tests': 'test/string_tests.py',
+    'test.support': 'test/support/__init__.py',
+    'test.support.script_helper': 'test/support/script_helper.py',
+    'test.symlink_support': 'test/symlink_support.py',
+    'test.test_MimeWriter': 'test/test_MimeWriter.py',
+    'test.test_SimpleHTTPServer': 'test/test_SimpleHTTPServer.py',
+    'test.test_StringIO': 'test/test_StringIO.py',
+    'test.test___all__': 'test/test___all__.py',
+    'test.test___future__': 'test/test___future__.py',
+    'test.test__locale': 'test/test__locale.py',
+    'test.test__osx_support': 'test/test__osx_support.py',
+    'test.test_abc': 'test/test_abc.py',
+    'test.test_abstract_numbers': 'test/test_abstract_numbers.py',
+    'test.test_aepack': 'test/test_aepack.py',
+    'test.test_aifc': 'test/test_aifc.py',
+    'test.test_al': 'test/test_al.py',
+    'test.test_anydbm': 'test/test_anydbm.py',
+    'test.test_applesingle': 'test/test_applesingle.py',
+    'test.test_argparse': 'test/test_argparse.py',
+    'test.test_array': 'test/test_array.py',
+    'test.test_ascii_formatd': 'test/test_ascii_formatd.py',
+    'test.test_ast': 'test/test_ast.py',
+    'test.test_asynchat': 'test/test_asynchat.py',
+    'test.test_asyncore': 'test/test_asyncore.py',
+    'test.test_atexit': 'test/test_atexit.py',
+    'test.test_audioop': 'test/test_audioop.py',
+    'test.test_augassign': 'test/test_augassign.py',
+    'test.test_base64': 'test/test_base64.py',
+    'test.test_bastion': 'test/test_bastion.py',
+    'test.test_bdb': 'test/test_bdb.py',
+    'test.test_bigaddrspace': 'test/test_bigaddrspace.py',
+    'test.test_bigmem': 'test/test_bigmem.py',
+    'test.test_binascii': 'test/test_binascii.py',
+    'test.test_binhex': 'test/test_binhex.py',
+    'test.test_binop': 'test/test_binop.py',
+    'test.test_bisect': 'test/test_bisect.py',
+    'test.test_bool': 'test/test_bool.py',
+    'test.test_bsddb': 'test/test_bsddb.py',
+    'test.test_bsddb185': 'test/test_bsddb185.py',
+    'test.test_bsddb3': 'test/test_bsddb3.py',
+    'test.test_buffer': 'test/test_buffer.py',
+    'test.test_bufio': 'test/test_bufio.py',
+    'test.test_builtin': 'test/test_builtin.py',
+    'test.test_bytes': 'test/test_bytes.py',
+    'test.test_bz2': 'test/test_bz2.py',
+    'test.test_calendar': 'test/test_calendar.py',
+    'test.test_call': 'test/test_call.py',
+    'test.test_capi': 'test/test_capi.py',
+    'test.test_cd': 'test/test_cd.py',
+    'test.test_cfgparser': 'test/test_cfgparser.py',
+    'test.test_cgi': 'test/test_cgi.py',
+    'test.test_charmapcodec': 'test/test_charmapcodec.py',
+    'test.test_cl': 'test/test_cl.py',
+    'test.test_class': 'test/test_class.py',
+    'test.test_cmath': 'test/test_cmath.py',
+    'test.test_cmd': 'test/test_cmd.py',
+    'test.test_cmd_line': 'test/test_cmd_line.py',
+    'test.test_cmd_line_script': 'test/test_cmd_line_script.py',
+    'test.test_code': 'test/test_code.py',
+    'test.test_codeccallbacks': 'test/test_codeccallbacks.py',
+    'test.test_codecencodings_cn': 'test/test_codecencodings_cn.py',
+    'test.test_codecencodings_hk': 'test/test_codecencodings_hk.py',
+    'test.test_codecencodings_iso2022': 'test/test_codecencodings_iso2022.py',
+    'test.test_codecencodings_jp': 'test/test_codecencodings_jp.py',
+    'test.test_codecencodings_kr': 'test/test_codecencodings_kr.py',
+    'test.test_codecencodings_tw': 'test/test_codecencodings_tw.py',
+    'test.test_codecmaps_cn': 'test/test_codecmaps_cn.py',
+    'test.test_codecmaps_hk': 'test/test_codecmaps_hk.py',
+    'test.test_codecmaps_jp': 'test/test_codecmaps_jp.py',
+    'test.test_codecmaps_kr': 'test/test_codecmaps_kr.py',
+    'test.test_codecmaps_tw': 'test/test_codecmaps_tw.py',
+    'test.test_codecs': 'test/test_codecs.py',
+    'test.test_codeop': 'test/test_codeop.py',
+    'test.test_coercion': 'test/test_coercion.py',
+    'test.test_collections': 'test/test_collections.py',
+    'test.test_colorsys': 'test/test_colorsys.py',
+    'test.test_commands': 'test/test_commands.py',
+    'test.test_compare': 'test/test_compare.py',
+    'test.test_compile': 'test/test_compile.py',
+    'test.test_compileall': 'test/test_compileall.py',
+    'test.test_compiler': 'test/test_compiler.py',
+    'test.test_complex': 'test/test_complex.py',
+    'test.test_complex_args': 'test/test_complex_args.py',
+    'test.test_contains': 'test/test_contains.py',
+    'test.test_contextlib': 'test/test_contextlib.py',
+    'test.test_cookie': 'test/test_cookie.py',
+    'test.test_cookielib': 'test/test_cookielib.py',
+    'test.test_copy': 'test/test_copy.py',
+    'test.test_copy_reg': 'test/test_copy_reg.py',
+    'test.test_cpickle': 'test/test_cpickle.py',
+    'test.test_cprofile': 'test/test_cprofile.py',
+    'test.test_crypt': 'test/test_crypt.py',
+    'test.test_csv': 'test/test_csv.py',
+    'test.test_ctypes': 'test/test_ctypes.py',
+    'test.test_curses': 'test/test_curses.py',
+    'test.test_datetime': 'test/test_datetime.py',
+    'test.test_dbm': 'test/test_dbm.py',
+    'test.test_decimal': 'test/test_decimal.py',
+    'test.test_decorators': 'test/test_decorators.py',
+    'test.test_defaultdict': 'test/test_defaultdict.py',
+    'test.test_deque': 'test/test_deque.py',
+    'test.test_descr': 'test/test_descr.py',
+    'test.test_descrtut': 'test/test_descrtut.py',
+    'test.test_dict': 'test/test_dict.py',
+    'test.test_dictcomps': 'test/test_dictcomps.py',
+    'test.test_dictviews': 'test/test_dictviews.py',
+    'test.test_difflib': 'test/test_difflib.py',
+    'test.test_dircache': 'test/test_dircache.py',
+    'test.test_dis': 'test/test_dis.py',
+    'test.test_distutils': 'test/test_distutils.py',
+    'test.test_dl': 'test/test_dl.py',
+    'test.test_doctest': 'test/test_doctest.py',
+    'test.test_doctest2': 'test/test_doctest2.py',
+    'test.test_docxmlrpc': 'test/test_docxmlrpc.py',
+    'test.test_dumbdbm': 'test/test_dumbdbm.py',
+    'test.test_dummy_thread': 'test/test_dummy_thread.py',
+    'test.test_dummy_threading': 'test/test_dummy_threading.py',
+    'test.test_email': 'test/test_email.py',
+    'test.test_email_codecs': 'test/test_email_codecs.py',
+    'test.test_email_renamed': 'test/test_email_renamed.py',
+    'test.test_ensurepip': 'test/test_ensurepip.py',
+    'test.test_enumerate': 'test/test_enumerate.py',
+    'test.test_eof': 'test/test_eof.py',
+    'test.test_epoll': 'test/test_epoll.py',
+    'test.test_errno': 'test/test_errno.py',
+    'test.test_exception_variations': 'test/test_exception_variations.py',
+    'test.test_exceptions': 'test/test_exceptions.py',
+    'test.test_extcall': 'test/test_extcall.py',
+    'test.test_fcntl': 'test/test_fcntl.py',
+    'test.test_file': 'test/test_file.py',
+    'test.test_file2k': 'test/test_file2k.py',
+    'test.test_file_eintr': 'test/test_file_eintr.py',
+    'test.test_filecmp': 'test/test_filecmp.py',
+    'test.test_fileinput': 'test/test_fileinput.py',
+    'test.test_fileio': 'test/test_fileio.py',
+    'test.test_float': 'test/test_float.py',
+    'test.test_fnmatch': 'test/test_fnmatch.py',
+    'test.test_fork1': 'test/test_fork1.py',
+    'test.test_format': 'test/test_format.py',
+    'test.test_fpformat': 'test/test_fpformat.py',
+    'test.test_fractions': 'test/test_fractions.py',
+    'test.test_frozen': 'test/test_frozen.py',
+    'test.test_ftplib': 'test/test_ftplib.py',
+    'test.test_funcattrs': 'test/test_funcattrs.py',
+    'test.test_functools': 'test/test_functools.py',
+    'test.test_future': 'test/test_future.py',
+    'test.test_future1': 'test/test_future1.py',
+    'test.test_future2': 'test/test_future2.py',
+    'test.test_future3': 'test/test_future3.py',
+    'test.test_future4': 'test/test_future4.py',
+    'test.test_future5': 'test/test_future5.py',
+    'test.test_future_builtins': 'test/test_future_builtins.py',
+    'test.test_gc': 'test/test_gc.py',
+    'test.test_gdb': 'test/test_gdb.py',
+    'test.test_gdbm': 'test/test_gdbm.py',
+    'test.test_generators': 'test/test_generators.py',
+    'test.test_genericpath': 'test/test_genericpath.py',
+    'test.test_genexps': 'test/test_genexps.py',
+    'test.test_getargs': 'test/test_getargs.py',
+    'test.test_getargs2': 'test/test_getargs2.py',
+    'test.test_getopt': 'test/test_getopt.py',
+    'test.test_gettext': 'test/test_gettext.py',
+    'test.test_gl': 'test/test_gl.py',
+    'test.test_glob': 'test/test_glob.py',
+    'test.test_global': 'test/test_global.py',
+    'test.test_grammar': 'test/test_grammar.py',
+    'test.test_grp': 'test/test_grp.py',
+    'test.test_gzip': 'test/test_gzip.py',
+    'test.test_hash': 'test/test_hash.py',
+    'test.test_hashlib': 'test/test_hashlib.py',
+    'test.test_heapq': 'test/test_heapq.py',
+    'test.test_hmac': 'test/test_hmac.py',
+    'test.test_hotshot': 'test/test_hotshot.py',
+    'test.test_htmllib': 'test/test_htmllib.py',
+    'test.test_htmlparser': 'test/test_htmlparser.py',
+    'test.test_httplib': 'test/test_httplib.py',
+    'test.test_httpservers': 'test/test_httpservers.py',
+    'test.test_idle': 'test/test_idle.py',
+    'test.test_imageop': 'test/test_imageop.py',
+    'test.test_imaplib': 'test/test_imaplib.py',
+    'test.test_imgfile': 'test/test_imgfile.py',
+    'test.test_imghdr': 'test/test_imghdr.py',
+    'test.test_imp': 'test/test_imp.py',
+    'test.test_import': 'test/test_import.py',
+    'test.test_import_magic': 'test/test_import_magic.py',
+    'test.test_importhooks': 'test/test_importhooks.py',
+    'test.test_importlib': 'test/test_importlib.py',
+    'test.test_index': 'test/test_index.py',
+    'test.test_inspect': 'test/test_inspect.py',
+    'test.test_int': 'test/test_int.py',
+    'test.test_int_literal': 'test/test_int_literal.py',
+    'test.test_io': 'test/test_io.py',
+    'test.test_ioctl': 'test/test_ioctl.py',
+    'test.test_isinstance': 'test/test_isinstance.py',
+    'test.test_iter': 'test/test_iter.py',
+    'test.test_iterlen': 'test/test_iterlen.py',
+    'test.test_itertools': 'test/test_itertools.py',
+    'test.test_json': 'test/test_json.py',
+    'test.test_kqueue': 'test/test_kqueue.py',
+    'test.test_largefile': 'test/test_largefile.py',
+    'test.test_lib2to3': 'test/test_lib2to3.py',
+    'test.test_linecache': 'test/test_linecache.py',
+    'test.test_linuxaudiodev': 'test/test_linuxaudiodev.py',
+    'test.test_list': 'test/test_list.py',
+    'test.test_locale': 'test/test_locale.py',
+    'test.test_logging': 'test/test_logging.py',
+    'test.test_long': 'test/test_long.py',
+    'test.test_long_future': 'test/test_long_future.py',
+    'test.test_longexp': 'test/test_longexp.py',
+    'test.test_macos': 'test/test_macos.py',
+    'test.test_macostools': 'test/test_macostools.py',
+    'test.test_macpath': 'test/test_macpath.py',
+    'test.test_macurl2path': 'test/test_macurl2path.py',
+    'test.test_mailbox': 'test/test_mailbox.py',
+    'test.test_marshal': 'test/test_marshal.py',
+    'test.test_math': 'test/test_math.py',
+    'test.test_md5': 'test/test_md5.py',
+    'test.test_memoryio': 'test/test_memoryio.py',
+    'test.test_memoryview': 'test/test_memoryview.py',
+    'test.test_mhlib': 'test/test_mhlib.py',
+    'test.test_mimetools': 'test/test_mimetools.py',
+    'test.test_mimetypes': 'test/test_mimetypes.py',
+    'test.test_minidom': 'test/test_minidom.py',
+    'test.test_mmap': 'test/test_mmap.py',
+    'test.test_module': 'test/test_module.py',
+    'test.test_modulefinder': 'test/test_modulefinder.py',
+    'test.test_msilib': 'test/test_msilib.py',
+    'test.test_multibytecodec': 'test/test_multibytecodec.py',
+    'test.test_multifile': 'test/test_multifile.py',
+    'test.test_multiprocessing': 'test/test_multiprocessing.py',
+    'test.test_mutants': 'test/test_mutants.py',
+    'test.test_mutex': 'test/test_mutex.py',
+    'test.test_netrc': 'test/test_netrc.py',
+    'test.test_new': 'test/test_new.py',
+    'test.test_nis': 'test/test_nis.py',
+    'test.test_nntplib': 'test/test_nntplib.py',
+    'test.test_normalization': 'test/test_normalization.py',
+    'test.test_ntpath': 'test/test_ntpath.py',
+    'test.test_old_mailbox': 'test/test_old_mailbox.py',
+    'test.test_opcodes': 'test/test_opcodes.py',
+    'test.test_openpty': 'test/test_openpty.py',
+    'test.test_operator': 'test/test_operator.py',
+    'test.test_optparse': 'test/test_optparse.py',
+    'test.test_ordered_dict': 'test/test_ordered_dict.py',
+    'test.test_os': 'test/test_os.py',
+    'test.test_ossaudiodev': 'test/test_ossaudiodev.py',
+    'test.test_parser': 'test/test_parser.py',
+    'test.test_pdb': 'test/test_pdb.py',
+    'test.test_peepholer': 'test/test_peepholer.py',
+    'test.test_pep247': 'test/test_pep247.py',
+    'test.test_pep277': 'test/test_pep277.py',
+    'test.test_pep352': 'test/test_pep352.py',
+    'test.test_pickle': 'test/test_pickle.py',
+    'test.test_pickletools': 'test/test_pickletools.py',
+    'test.test_pipes': 'test/test_pipes.py',
+    'test.test_pkg': 'test/test_pkg.py',
+    'test.test_pkgimport': 'test/test_pkgimport.py',
+    'test.test_pkgutil': 'test/test_pkgutil.py',
+    'test.test_platform': 'test/test_platform.py',
+    'test.test_plistlib': 'test/test_plistlib.py',
+    'test.test_poll': 'test/test_poll.py',
+    'test.test_popen': 'test/test_popen.py',
+    'test.test_popen2': 'test/test_popen2.py',
+    'test.test_poplib': 'test/test_poplib.py',
+    'test.test_posix': 'test/test_posix.py',
+    'test.test_posixpath': 'test/test_posixpath.py',
+    'test.test_pow': 'test/test_pow.py',
+    'test.test_pprint': 'test/test_pprint.py',
+    'test.test_print': 'test/test_print.py',
+    'test.test_profile': 'test/test_profile.py',
+    'test.test_property': 'test/test_property.py',
+    'test.test_pstats': 'test/test_pstats.py',
+    'test.test_pty': 'test/test_pty.py',
+    'test.test_pwd': 'test/test_pwd.py',
+    'test.test_py3kwarn': 'test/test_py3kwarn.py',
+    'test.test_py_compile': 'test/test_py_compile.py',
+    'test.test_pyclbr': 'test/test_pyclbr.py',
+    'test.test_pydoc': 'test/test_pydoc.py',
+    'test.test_pyexpat': 'test/test_pyexpat.py',
+    'test.test_queue': 'test/test_queue.py',
+    'test.test_quopri': 'test/test_quopri.py',
+    'test.test_random': 'test/test_random.py',
+    'test.test_re': 'test/test_re.py',
+    'test.test_readline': 'test/test_readline.py',
+    'test.test_regrtest': 'test/test_regrtest.py',
+    'test.test_repr': 'test/test_repr.py',
+    'test.test_resource': 'test/test_resource.py',
+    'test.test_rfc822': 'test/test_rfc822.py',
+    'test.test_richcmp': 'test/test_richcmp.py',
+    'test.test_rlcompleter': 'test/test_rlcompleter.py',
+    'test.test_robotparser': 'test/test_robotparser.py',
+    'test.test_runpy': 'test/test_runpy.py',
+    'test.test_sax': 'test/test_sax.py',
+    'test.test_scope': 'test/test_scope.py',
+    'test.test_scriptpackages': 'test/test_scriptpackages.py',
+    'test.test_select': 'test/test_select.py',
+    'test.test_set': 'test/test_set.py',
+    'test.test_setcomps': 'test/test_setcomps.py',
+    'test.test_sets': 'test/test_sets.py',
+    'test.test_sgmllib': 'test/test_sgmllib.py',
+    'test.test_sha': 'test/test_sha.py',
+    'test.test_shelve': 'test/test_shelve.py',
+    'test.test_shlex': 'test/test_shlex.py',
+    'test.test_shutil': 'test/test_shutil.py',
+    'test.test_signal': 'test/test_signal.py',
+    'test.test_site': 'test/test_site.py',
+    'test.test_slice': 'test/test_slice.py',
+    'test.test_smtplib': 'test/test_smtplib.py',
+    'test.test_smtpnet': 'test/test_smtpnet.py',
+    'test.test_socket': 'test/test_socket.py',
+    'test.test_socketserver': 'test/test_socketserver.py',
+    'test.test_softspace': 'test/test_softspace.py',
+    'test.test_sort': 'test/test_sort.py',
+    'test.test_source_encoding': 'test/test_source_encoding.py',
+    'test.test_spwd': 'test/test_spwd.py',
+    'test.test_sqlite': 'test/test_sqlite.py',
+    'test.test_ssl': 'test/test_ssl.py',
+    'test.test_startfile': 'test/test_startfile.py',
+    'test.test_stat': 'test/test_stat.py',
+    'test.test_str': 'test/test_str.py',
+    'test.test_strftime': 'test/test_strftime.py',
+    'test.test_string': 'test/test_string.py',
+    'test.test_stringprep': 'test/test_stringprep.py',
+    'test.test_strop': 'test/test_strop.py',
+    'test.test_strptime': 'test/test_strptime.py',
+    'test.test_strtod': 'test/test_strtod.py',
+    'test.test_struct': 'test/test_struct.py',
+    'test.test_structmembers': 'test/test_structmembers.py',
+    'test.test_structseq': 'test/test_structseq.py',
+    'test.test_subprocess': 'test/test_subprocess.py',
+    'test.test_sunau': 'test/test_sunau.py',
+    'test.test_sunaudiodev': 'test/test_sunaudiodev.py',
+    'test.test_sundry': 'test/test_sundry.py',
+    'test.test_support': 'test/test_support.py',
+    'test.test_symtable': 'test/test_symtable.py',
+    'test.test_syntax': 'test/test_syntax.py',
+    'test.test_sys': 'test/test_sys.py',
+    'test.test_sys_setprofile': 'test/test_sys_setprofile.py',
+    'test.test_sys_settrace': 'test/test_sys_settrace.py',
+    'test.test_sysconfig': 'test/test_sysconfig.py',
+    'test.test_tarfile': 'test/test_tarfile.py',
+    'test.test_tcl': 'test/test_tcl.py',
+    'test.test_telnetlib': 'test/test_telnetlib.py',
+    'test.test_tempfile': 'test/test_tempfile.py',
+    'test.test_test_support': 'test/test_test_support.py',
+    'test.test_textwrap': 'test/test_textwrap.py',
+    'test.test_thread': 'test/test_thread.py',
+    'test.test_threaded_import': 'test/test_threaded_import.py',
+    'test.test_threadedtempfile': 'test/test_threadedtempfile.py',
+    'test.test_threading': 'test/test_threading.py',
+    'test.test_threading_local': 'test/test_threading_local.py',
+    'test.test_threadsignals': 'test/test_threadsignals.py',
+    'test.test_time': 'test/test_time.py',
+    'test.test_timeit': 'test/test_timeit.py',
+    'test.test_timeout': 'test/test_timeout.py',
+    'test.test_tk': 'test/test_tk.py',
+    'test.test_tokenize': 'test/test_tokenize.py',
+    'test.test_tools': 'test/test_tools.py',
+    'test.test_trace': 'test/test_trace.py',
+    'test.test_traceback': 'test/test_traceback.py',
+    'test.test_transformer': 'test/test_transformer.py',
+    'test.test_ttk_guionly': 'test/test_ttk_guionly.py',
+    'test.test_ttk_textonly': 'test/test_ttk_textonly.py',
+    'test.test_tuple': 'test/test_tuple.py',
+    'test.test_turtle': 'test/test_turtle.py',
+    'test.test_typechecks': 'test/test_typechecks.py',
+    'test.test_types': 'test/test_types.py',
+    'test.test_ucn': 'test/test_ucn.py',
+    'test.test_unary': 'test/test_unary.py',
+    'test.test_undocumented_details': 'test/test_undocumented_details.py',
+    'test.test_unicode': 'test/test_unicode.py',
+    'test.test_unicode_file': 'test/test_unicode_file.py',
+    'test.test_unicodedata': 'test/test_unicodedata.py',
+    'test.test_unittest': 'test/test_unittest.py',
+    'test.test_univnewlines': 'test/test_univnewlines.py',
+    'test.test_univnewlines2k': 'test/test_univnewlines2k.py',
+    'test.test_unpack': 'test/test_unpack.py',
+    'test.test_urllib': 'test/test_urllib.py',
+    'test.test_urllib2': 'test/test_urllib2.py',
+    'test.test_urllib2_localnet': 'test/test_urllib2_localnet.py',
+    'test.test_urllib2net': 'test/test_urllib2net.py',
+    'test.test_urllibnet': 'test/test_urllibnet.py',
+    'test.test_urlparse': 'test/test_urlparse.py',
+    'test.test_userdict': 'test/test_userdict.py',
+    'test.test_userlist': 'test/test_userlist.py',
+    'test.test_userstring': 'test/test_userstring.py',
+    'test.test_uu': 'test/test_uu.py',
+    'test.test_uuid': 'test/test_uuid.py',
+    'test.test_wait3': 'test/test_wait3.py',
+    'test.test_wait4': 'test/test_wait4.py',
+    'test.test_warnings': 'test/test_warnings.py',
+    'test.test_wave': 'test/test_wave.py',
+    'test.test_weakref': 'test/test_weakref.py',
+    'test.test_weakset': 'test/test_weakset.py',
+    'test.test_whichdb': 'test/test_whichdb.py',
+    'test.test_winreg': 'test/test_winreg.py',
+    'test.test_winsound': 'test/test_winsound.py',
+    'test.test_with': 'test/test_with.py',
+    'test.test_wsgiref': 'test/test_wsgiref.py',
+    'test.test_xdrlib': 'test/test_xdrlib.py',
+    'test.test_xml_etree': 'test/test_xml_etree.py',
+    'test.test_xml_etree_c': 'test/test_xml_etree_c.py',
+    'test.test_xmllib': 'test/test_xmllib.py',
+    'test.test_xmlrpc': 'test/test_xmlrpc.py',
+    'test.test_xpickle': 'test/test_xpickle.py',
+    'test.test_xrange': 'test/test_xrange.py',
+    'test.test_zipfile': 'test/test_zipfile.py',
+    'test.test_zipfile64': 'test/test_zipfile64.py',
+    'test.test_zipimport': 'test/test_zipimport.py',
+    'test.test_zipimport_support': 'test/test_zipimport_support.py',
+    'test.test_zlib': 'test/test_zlib.py',
+    'test.testall': 'test/testall.py',
+    'test.testcodec': 'test/testcodec.py',
+    'test.tf_inherit_check': 'test/tf_inherit_check.py',
+    'test.threaded_import_hangers': 'test/threaded_import_hangers.py',
+    'test.time_hashlib': 'test/time_hashlib.py',
+    'test.tracedmodules': 'test/tracedmodules/__init__.py',
+    'test.tracedmodules.testmod': 'test/tracedmodules/testmod.py',
+    'test.warning_tests': 'test/warning_tests.py',
+    'test.win_console_handler': 'test/win_console_handler.py',
+    'test.xmltests': 'test/xmltests.py',
+    'textwrap': 'textwrap.py',
+    'this': 'this.py',
+    'threading': 'threading.py',
+    'time': 'lib-dynload/time.so',
+    'timeit': 'timeit.py',
+    'tkColorChooser': 'lib-tk/tkColorChooser.py',
+    'tkCommonDialog': 'lib-tk/tkCommonDialog.py',
+    'tkFileDialog': 'lib-tk/tkFileDialog.py',
+    'tkFont': 'lib-tk/tkFont.py',
+    'tkMessageBox': 'lib-tk/tkMessageBox.py',
+    'tkSimpleDialog': 'lib-tk/tkSimpleDialog.py',
+    'toaiff': 'toaiff.py',
+    'token': 'token.py',
+    'tokenize': 'tokenize.py',
+    'trace': 'trace.py',
+    'traceback': 'traceback.py',
+    'ttk': 'lib-tk/ttk.py',
+    'tty': 'tty.py',
+    'turtle': 'lib-tk/turtle.py',
+    'types': 'types.py',
+    'unicodedata': 'lib-dynload/unicodedata.so',
+    'unittest': 'unittest/__init__.py',
+    'unittest.__main__': 'unittest/__main__.py',
+    'unittest.case': 'unittest/case.py',
+    'unittest.loader': 'unittest/loader.py',
+    'unittest.main': 'unittest/main.py',
+    'unittest.result': 'unittest/result.py',
+    'unittest.runner': 'unittest/runner.py',
+    'unittest.signals': 'unittest/signals.py',
+    'unittest.suite': 'unittest/suite.py',
+    'unittest.test': 'unittest/test/__init__.py',
+    'unittest.test.dummy': 'unittest/test/dummy.py',
+    'unittest.test.support': 'unittest/test/support.py',
+    'unittest.test.test_assertions': 'unittest/test/test_assertions.py',
+    'unittest.test.test_break': 'unittest/test/test_break.py',
+    'unittest.test.test_case': 'unittest/test/test_case.py',
+    'unittest.test.test_discovery': 'unittest/test/test_discovery.py',
+    'unittest.test.test_functiontestcase': 'unittest/test/test_functiontestcase.py',
+    'unittest.test.test_loader': 'unittest/test/test_loader.py',
+    'unittest.test.test_program': 'unittest/test/test_program.py',
+    'unittest.test.test_result': 'unittest/test/test_result.py',
+    'unittest.test.test_runner': 'unittest/test/test_runner.py',
+    'unittest.test.test_setups': 'unittest/test/test_setups.py',
+    'unittest.test.test_skipping': 'unittest/test/test_skipping.py',
+    'unittest.test.test_suite': 'unittest/test/test_suite.py',
+    'unittest.util': 'unittest/util.py',
+    'urllib': 'urllib.py',
+    'urllib2': 'urllib2.py',
+    'urlparse': 'urlparse.py',
+    'user': 'user.py',
+    'uu': 'uu.py',
+    'uuid': 'uuid.py',
+    'warnings': 'warnings.py',
+    'wave': 'wave.py',
+    'weakref': 'weakref.py',
+    'webbrowser': 'webbrowser.py',
+    'whichdb': 'whichdb.py',
+    'wsgiref': 'wsgiref/__init__.py',
+    'wsgiref.handlers': 'wsgiref/handlers.py',
+    'wsgiref.headers': 'wsgiref/headers.py',
+    'wsgiref.simple_server': 'wsgiref/simple_server.py',
+    'wsgiref.util': 'wsgiref/util.py',
+    'wsgiref.validate': 'wsgiref/validate.py',
+    'xdrlib': 'xdrlib.py',
+    'xml': 'xml/__init__.py',
+    'xml.dom': 'xml/dom/__init__.py',
+    'xml.dom.NodeFilter': 'xml/dom/NodeFilter.py',
+    'xml.dom.domreg': 'xml/dom/domreg.py',
+    'xml.dom.expatbuilder': 'xml/dom/expatbuilder.py',
+    'xml.dom.minicompat': 'xml/dom/minicompat.py',
+    'xml.dom.minidom': 'xml/dom/minidom.py',
+    'xml.dom.pulldom': 'xml/dom/pulldom.py',
+    'xml.dom.xmlbuilder': 'xml/dom/xmlbuilder.py',
+    'xml.etree': 'xml/etree/__init__.py',
+    'xml.etree.ElementInclude': 'xml/etree/ElementInclude.py',
+    'xml.etree.ElementPath': 'xml/etree/ElementPath.py',
+    'xml.etree.ElementTree': 'xml/etree/ElementTree.py',
+    'xml.etree.cElementTree': 'xml/etree/cElementTree.py',
+    'xml.parsers': 'xml/parsers/__init__.py',
+    'xml.parsers.expat': 'xml/parsers/expat.py',
+    'xml.sax': 'xml/sax/__init__.py',
+    'xml.sax._exceptions': 'xml/sax/_exceptions.py',
+    'xml.sax.expatreader': 'xml/sax/expatreader.py',
+    'xml.sax.handler': 'xml/sax/handler.py',
+    'xml.sax.saxutils': 'xml/sax/saxutils.py',
+    'xml.sax.xmlreader': 'xml/sax/xmlreader.py',
+    'xmllib': 'xmllib.py',
+    'xmlrpclib': 'xmlrpclib.py',
+    'zipfile': 'zipfile.py',
+    'zlib': 'lib-dynload/zlib.so',
+}
@@ -0,0 +1,1765 @@
+# Generated by generate.py from Python 3.10.13 on linux; do not edit.
+
+version = '3.10'
+
+# Directories of the module search path, relative to the library.
+paths = (
+    '',
+    'lib-dynload',
+)
+
+builtins = (
+    '_abc',
+    '_ast',
+    '_codecs',
+    '_collections',
+    '_functools',
+    '_imp',
+    '_io',
+    '_locale',
+    '_operator',
+    '_signal',
+    '_sre',
+    '_stat',
+    '_string',
+    '_symtable',
+    '_thread',
+    '_tracemalloc',
+    '_warnings',
+    '_weakref',
+    'atexit',
+    'builtins',
+    'errno',
+    'faulthandler',
+    'gc',
+    'itertools',
+    'marshal',
+    'posix',
+    'pwd',
+    'sys',
+    'time',
+    'xxsubtype',
+)
+
+# Module name -> filename, relative to the library.
+modules = {
+    '__future__': '__future__.py',
+    '_aix_support': '_aix_support.py',
+    '_asyncio': 'lib-dynload/_asyncio.cpython-310-x86_64-linux-gnu.so',
+    '_bisect': 'lib-dynload/_bisect.cpython-310-x86_64-linux-gnu.so',
+    '_blake2': 'lib-dynload/_blake2.cpython-310-x86_64-linux-gnu.so',
+    '_bootsubprocess': '_bootsubprocess.py',
+    '_bz2': 'lib-dynload/_bz2.cpython-310-x86_64-linux-gnu.so',
+    '_codecs_cn': 'lib-dynload/_codecs_cn.cpython-310-x86_64-linux-gnu.so',
+    '_codecs_hk': 'lib-dynload/_codecs_hk.cpython-310-x86_64-linux-gnu.so',
+    '_codecs_iso2022': 'lib-dynload/_codecs_iso2022.cpython-310-x86_64-linux-gnu.so',
+    '_codecs_jp': 'lib-dynload/_codecs_jp.cpython-310-x86_64-linux-gnu.so',
+    '_codecs_kr': 'lib-dynload/_codecs_kr.cpython-310-x86_64-linux-gnu.so',
+    '_codecs_tw': 'lib-dynload/_codecs_tw.cpython-310-x86_64-linux-gnu.so',
+    '_collections_abc': '_collections_abc.py',
+    '_compat_pickle': '_compat_pickle.py',
+    '_compression': '_compression.py',
+    '_contextvars': 'lib-dynload/_contextvars.cpython-310-x86_64-linux-gnu.so',
+    '_crypt': 'lib-dynload/_crypt.cpython-310-x86_64-linux-gnu.so',
+    '_csv': 'lib-dynload/_csv.cpython-310-x86_64-linux-gnu.so',
+    '_ctypes': 'lib-dynload/_ctypes.cpython-310-x86_64-linux-gnu.so',
+    '_ctypes_test': 'lib-dynload/_ctypes_test.cpython-310-x86_64-linux-gnu.so',
+    '_curses': 'lib-dynload/_curses.cpython-310-x86_64-linux-gnu.so',
+    '_curses_panel': 'lib-dynload/_curses_panel.cpython-310-x86_64-linux-gnu.so',
+    '_datetime': 'lib-dynload/_datetime.cpython-310-x86_64-linux-gnu.so',
+    '_decimal': 'lib-dynload/_decimal.cpython-310-x86_64-linux-gnu.so',
+    '_elementtree': 'lib-dynload/_elementtree.cpython-310-x86_64-linux-gnu.so',
+    '_hashlib': 'lib-dynload/_hashlib.cpython-310-x86_64-linux-gnu.so',
+    '_heapq': 'lib-dynload/_heapq.cpython-310-x86_64-linux-gnu.so',
+    '_json': 'lib-dynload/_json.cpython-310-x86_64-linux-gnu.so',
+    '_lsprof': 'lib-dynload/_lsprof.cpython-310-x86_64-linux-gnu.so',
+    '_lzma': 'lib-dynload/_lzma.cpython-310-x86_64-linux-gnu.so',
+    '_markupbase': '_markupbase.py',
+    '_md5': 'lib-dynload/_md5.cpython-310-x86_64-linux-gnu.so',
+    '_multibytecodec': 'lib-dynload/_multibytecodec.cpython-310-x86_64-linux-gnu.so',
+    '_multiprocessing': 'lib-dynload/_multiprocessing.cpython-310-x86_64-linux-gnu.so',
+    '_opcode': 'lib-dynload/_opcode.cpython-310-x86_64-linux-gnu.so',
+    '_osx_support': '_osx_support.py',
+    '_pickle': 'lib-dynload/_pickle.cpython-310-x86_64-linux-gnu.so',
+    '_posixshmem': 'lib-dynload/_posixshmem.cpython-310-x86_64-linux-gnu.so',
+    '_posixsubprocess': 'lib-dynload/_posixsubprocess.cpython-310-x86_64-linux-gnu.so',
+    '_py_abc': '_py_abc.py',
+    '_pydecimal': '_pydecimal.py',
+    '_pyio': '_pyio.py',
+    '_queue': 'lib-dynload/_queue.cpython-310-x86_64-linux-gnu.so',
+    '_random': 'lib-dynload/_random.cpython-310-x86_64-linux-gnu.so',
+    '_sha1': 'lib-dynload/_sha1.cpython-310-x86_64-linux-gnu.so',
+    '_sha256': 'lib-dynload/_sha256.cpython-310-x86_64-linux-gnu.so',
+    '_sha3': 'lib-dynload/_sha3.cpython-310-x86_64-linux-gnu.so',
+    '_sha512': 'lib-dynload/_sha512.cpython-310-x86_64-linux-gnu.so',
+    '_sitebuiltins': '_sitebuiltins.py',
+    '_socket': 'lib-dynload/_socket.cpython-310-x86_64-linux-gnu.so',
+    '_sqlite3': 'lib-dynload/_sqlite3.cpython-310-x86_64-linux-gnu.so',
+    '_ssl': 'lib-dynload/_ssl.cpython-310-x86_64-linux-gnu.so',
+    '_statistics': 'lib-dynload/_statistics.cpython-310-x86_64-linux-gnu.so',
+    '_strptime': '_strptime.py',
+    '_struct': 'lib-dynload/_struct.cpython-310-x86_64-linux-gnu.so',
+    '_testbuffer': 'lib-dynload/_testbuffer.cpython-310-x86_64-linux-gnu.so',
+    '_testcapi': 'lib-dynload/_testcapi.cpython-310-x86_64-linux-gnu.so',
+    '_testclinic': 'lib-dynload/_testclinic.cpython-310-x86_64-linux-gnu.so',
+    '_testimportmultiple': 'lib-dynload/_testimportmultiple.cpython-310-x86_64-linux-gnu.so',
+    '_testinternalcapi': 'lib-dynload/_testinternalcapi.cpython-310-x86_64-linux-gnu.so',
+    '_testmultiphase': 'lib-dynload/_testmultiphase.cpython-310-x86_64-linux-gnu.so',
+    '_threading_local': '_threading_local.py',
+    '_tkinter': 'lib-dynload/_tkinter.cpython-310-x86_64-linux-gnu.so',
+    '_uuid': 'lib-dynload/_uuid.cpython-310-x86_64-linux-gnu.so',
+    '_weakrefset': '_weakrefset.py',
+    '_xxsubinterpreters': 'lib-dynload/_xxsubinterpreters.cpython-310-x86_64-linux-gnu.so',
+    '_xxtestfuzz': 'lib-dynload/_xxtestfuzz.cpython-310-x86_64-linux-gnu.so',
+    '_zoneinfo': 'lib-dynload/_zoneinfo.cpython-310-x86_64-linux-gnu.so',
+    'abc': 'abc.py',
+    'aifc': 'aifc.py',
+    'antigravity': 'antigravity.py',
+    'argparse': 'argparse.py',
+    'array': 'lib-dynload/array.cpython-310-x86_64-linux-gnu.so',
+    'ast': 'ast.py',
+    'asynchat': 'asynchat.py',
+    'asyncio': 'asyncio/__init__.py',
+    'asyncio.__main__': 'asyncio/__main__.py',
+    'asyncio.base_events': 'asyncio/base_events.py',
+    'asyncio.base_futures': 'asyncio/base_futures.py',
+    'asyncio.base_subprocess': 'asyncio/base_subprocess.py',
+    'asyncio.base_tasks': 'asyncio/base_tasks.py',
+    'asyncio.constants': 'asyncio/constants.py',
+    'asyncio.coroutines': 'asyncio/coroutines.py',
+    'asyncio.events': 'asyncio/events.py',
+    'asyncio.exceptions': 'asyncio/exceptions.py',
+    'asyncio.format_helpers': 'asyncio/format_helpers.py',
+    'asyncio.futures': 'asyncio/futures.py',
+    'asyncio.locks': 'asyncio/locks.py',
+    'asyncio.log': 'asyncio/log.py',
+    'asyncio.mixins': 'asyncio/mixins.py',
+    'asyncio.proactor_events': 'asyncio/proactor_events.py',
+    'asyncio.protocols': 'asyncio/protocols.py',
+    'asyncio.queues': 'asyncio/queues.py',
+    'asyncio.runners': 'asyncio/runners.py',
+    'asyncio.selector_events': 'asyncio/selector_events.py',
+    'asyncio.sslproto': 'asyncio/sslproto.py',
+    'asyncio.staggered': 'asyncio/staggered.py',
+    'asyncio.streams': 'asyncio/streams.py',
+    'asyncio.subprocess': 'asyncio/subprocess.py',
+    'asyncio.tasks': 'asyncio/tasks.py',
+    'asyncio.threads': 'asyncio/threads.py',
+    'asyncio.transports': 'asyncio/transports.py',
+    'asyncio.trsock': 'asyncio/trsock.py',
+    'asyncio.unix_events': 'asyncio/unix_events.py',
+    'asyncio.windows_events': 'asyncio/windows_events.py',
+    'asyncio.windows_utils': 'asyncio/windows_utils.py',
+    'asyncore': 'asyncore.py',
+    'audioop': 'lib-dynload/audioop.cpython-310-x86_64-linux-gnu.so',
+    'base64': 'base64.py',
+    'bdb': 'bdb.py',
+    'binascii': 'lib-dynload/binascii.cpython-310-x86_64-linux-gnu.so',
+    'binhex': 'binhex.py',
+    'bisect': 'bisect.py',
+    'bz2': 'bz2.py',
+    'cProfile': 'cProfile.py',
+    'calendar': 'calendar.py',
+    'cgi': 'cgi.py',
+    'cgitb': 'cgitb.py',
+    'chunk': 'chunk.py',
+    'cmath': 'lib-dynload/cmath.cpython-310-x86_64-linux-gnu.so',
+    'cmd': 'cmd.py',
+    'code': 'code.py',
+    'codecs': 'codecs.py',
+    'codeop': 'codeop.py',
+    'collections': 'collections/__init__.py',
+    'collections.abc': 'collections/abc.py',
+    'colorsys': 'colorsys.py',
+    'compileall': 'compileall.py',
+    'concurrent': 'concurrent/__init__.py',
+    'concurrent.futures': 'concurrent/futures/__init__.py',
+    'concurrent.futures._base': 'concurrent/futures/_base.py',
+    'concurrent.futures.process': 'concurrent/futures/process.py',
+    'concurrent.futures.thread': 'concurrent/futures/thread.py',
+    'configparser': 'configparser.py',
+    'contextlib': 'contextlib.py',
+    'contextvars': 'contextvars.py',
+    'copy': 'copy.py',
+    'copyreg': 'copyreg.py',
+    'crypt': 'crypt.py',
+    'csv': 'csv.py',
+    'ctypes': 'ctypes/__init__.py',
+    'ctypes._aix': 'ctypes/_aix.py',
+    'ctypes._endian': 'ctypes/_endian.py',
+    'ctypes.macholib': 'ctypes/macholib/__init__.py',
+    'ctypes.macholib.dyld': 'ctypes/macholib/dyld.py',
+    'ctypes.macholib.dylib': 'ctypes/macholib/dylib.py',
+    'ctypes.macholib.framework': 'ctypes/macholib/framework.py',
+    'ctypes.test': 'ctypes/test/__init__.py',
+    'ctypes.test.__main__': 'ctypes/test/__main__.py',
+    'ctypes.test.test_anon': 'ctypes/test/test_anon.py',
+    'ctypes.test.test_array_in_pointer': 'ctypes/test/test_array_in_pointer.py',
+    'ctypes.test.test_arrays': 'ctypes/test/test_arrays.py',
+    'ctypes.test.test_as_parameter': 'ctypes/test/test_as_parameter.py',
+    'ctypes.test.test_bitfields': 'ctypes/test/test_bitfields.py',
+    'ctypes.test.test_buffers': 'ctypes/test/test_buffers.py',
+    'ctypes.test.test_bytes': 'ctypes/test/test_bytes.py',
+    'ctypes.test.test_byteswap': 'ctypes/test/test_byteswap.py',
+    'ctypes.test.test_callbacks': 'ctypes/test/test_callbacks.py',
+    'ctypes.test.test_cast': 'ctypes/test/test_cast.py',
+    'ctypes.test.test_cfuncs': 'ctypes/test/test_cfuncs.py',
+    'ctypes.test.test_checkretval': 'ctypes/test/test_checkretval.py',
+    'ctypes.test.test_delattr': 'ctypes/test/test_delattr.py',
+    'ctypes.test.test_errno': 'ctypes/test/test_errno.py',
+    'ctypes.test.test_find': 'ctypes/test/test_find.py',
+    'ctypes.test.test_frombuffer': 'ctypes/test/test_frombuffer.py',
+    'ctypes.test.test_funcptr': 'ctypes/test/test_funcptr.py',
+    'ctypes.test.test_functions': 'ctypes/test/test_functions.py',
+    'ctypes.test.test_incomplete': 'ctypes/test/test_incomplete.py',
+    'ctypes.test.test_init': 'ctypes/test/test_init.py',
+    'ctypes.test.test_internals': 'ctypes/test/test_internals.py',
+    'ctypes.test.test_keeprefs': 'ctypes/test/test_keeprefs.py',
+    'ctypes.test.test_libc': 'ctypes/test/test_libc.py',
+    'ctypes.test.test_loading': 'ctypes/test/test_loading.py',
+    'ctypes.test.test_macholib': 'ctypes/test/test_macholib.py',
+    'ctypes.test.test_memfunctions': 'ctypes/test/test_memfunctions.py',
+    'ctypes.test.test_numbers': 'ctypes/test/test_numbers.py',
+    'ctypes.test.test_objects': 'ctypes/test/test_objects.py',
+    'ctypes.test.test_parameters': 'ctypes/test/test_parameters.py',
+    'ctypes.test.test_pep3118': 'ctypes/test/test_pep3118.py',
+    'ctypes.test.test_pickling': 'ctypes/test/test_pickling.py',
+    'ctypes.test.test_pointers': 'ctypes/test/test_pointers.py',
+    'ctypes.test.test_prototypes': 'ctypes/test/test_prototypes.py',
+    'ctypes.test.test_python_api': 'ctypes/test/test_python_api.py',
+    'ctypes.test.test_random_things': 'ctypes/test/test_random_things.py',
+    'ctypes.test.test_refcounts': 'ctypes/test/test_refcounts.py',
+    'ctypes.test.test_repr': 'ctypes/test/test_repr.py',
+    'ctypes.test.test_returnfuncptrs': 'ctypes/test/test_returnfuncptrs.py',
+    'ctypes.test.test_simplesubclasses': 'ctypes/test/test_simplesubclasses.py',
+    'ctypes.test.test_sizes': 'ctypes/test/test_sizes.py',
+    'ctypes.test.test_slicing': 'ctypes/test/test_slicing.py',
+    'ctypes.test.test_stringptr': 'ctypes/test/test_stringptr.py',
+    'ctypes.test.test_strings': 'ctypes/test/test_strings.py',
+    'ctypes.test.test_struct_fields': 'ctypes/test/test_struct_fields.py',
+    'ctypes.test.test_structures': 'ctypes/test/test_structures.py',
+    'ctypes.test.test_unaligned_structures': 'ctypes/test/test_unaligned_structures.py',
+    'ctypes.test.test_unicode': 'ctypes/test/test_unicode.py',
+    'ctypes.test.test_values': 'ctypes/test/test_values.py',
+    'ctypes.test.test_varsize_struct': 'ctypes/test/test_varsize_struct.py',
+    'ctypes.test.test_win32': 'ctypes/test/test_win32.py',
+    'ctypes.test.test_wintypes': 'ctypes/test/test_wintypes.py',
+    'ctypes.util': 'ctypes/util.py',
+    'ctypes.wintypes': 'ctypes/wintypes.py',
+    'curses': 'curses/__init__.py',
+    'curses.ascii': 'curses/ascii.py',
+    'curses.has_key': 'curses/has_key.py',
+    'curses.panel': 'curses/panel.py',
+    'curses.textpad': 'curses/textpad.py',
+    'dataclasses': 'dataclasses.py',
+    'datetime': 'datetime.py',
+    'dbm': 'dbm/__init__.py',
+    'dbm.dumb': 'dbm/dumb.py',
+    'dbm.gnu': 'dbm/gnu.py',
+    'dbm.ndbm': 'dbm/ndbm.py',
+    'decimal': 'decimal.py',
+    'difflib': 'difflib.py',
+    'dis': 'dis.py',
+    'distutils': 'distutils/__init__.py',
+    'distutils._msvccompiler': 'distutils/_msvccompiler.py',
+    'distutils.archive_util': 'distutils/archive_util.py',
+    'distutils.bcppcompiler': 'distutils/bcppcompiler.py',
+    'distutils.ccompiler': 'distutils/ccompiler.py',
+    'distutils.cmd': 'distutils/cmd.py',
+    'distutils.command': 'distutils/command/__init__.py',
+    'distutils.command.bdist': 'distutils/command/bdist.py',
+    'distutils.command.bdist_dumb': 'distutils/command/bdist_dumb.py',
+    'distutils.command.bdist_msi': 'distutils/command/bdist_msi.py',
+    'distutils.command.bdist_rpm': 'distutils/command/bdist_rpm.py',
+    'distutils.command.build': 'distutils/command/build.py',
+    'distutils.command.build_clib': 'distutils/command/build_clib.py',
+    'distutils.command.build_ext': 'distutils/command/build_ext.py',
+    'distutils.command.build_py': 'distutils/command/build_py.py',
+    'distutils.command.build_scripts': 'distutils/command/build_scripts.py',
+    'distutils.command.check': 'distutils/command/check.py',
+    'distutils.command.clean': 'distutils/command/clean.py',
+    'distutils.command.config': 'distutils/command/config.py',
+    'distutils.command.install': 'distutils/command/install.py',
+    'distutils.command.install_data': 'distutils/command/install_data.py',
+    'distutils.command.install_egg_info': 'distutils/command/install_egg_info.py',
+    'distutils.command.install_headers': 'distutils/command/install_headers.py',
+    'distutils.command.install_lib': 'distutils/command/install_lib.py',
+    'distutils.command.install_scripts': 'distutils/command/install_scripts.py',
+    'distutils.command.register': 'distutils/command/register.py',
+    'distutils.command.sdist': 'distutils/command/sdist.py',
+    'distutils.command.upload': 'distutils/command/upload.py',
+    'distutils.config': 'distutils/config.py',
+    'distutils.core': 'distutils/core.py',
+    'distutils.cygwinccompiler': 'distutils/cygwinccompiler.py',
+    'distutils.debug': 'distutils/debug.py',
+    'distutils.dep_util': 'distutils/dep_util.py',
+    'distutils.dir_util': 'distutils/dir_util.py',
+    'distutils.dist': 'distutils/dist.py',
+    'distutils.errors': 'distutils/errors.py',
+    'distutils.extension': 'distutils/extension.py',
+    'distutils.fancy_getopt': 'distutils/fancy_getopt.py',
+    'distutils.file_util': 'distutils/file_util.py',
+    'distutils.filelist': 'distutils/filelist.py',
+    'distutils.log': 'distutils/log.py',
+    'distutils.msvc9compiler': 'distutils/msvc9compiler.py',
+    'distutils.msvccompiler': 'distutils/msvccompiler.py',
+    'distutils.spawn': 'distutils/spawn.py',
+    'distutils.sysconfig': 'distutils/sysconfig.py',
+    'distutils.tests': 'distutils/tests/__init__.py',
+    'distutils.tests.support': 'distutils/tests/support.py',
+    'distutils.tests.test_archive_util': 'distutils/tests/test_archive_util.py',
+    'distutils.tests.test_bdist': 'distutils/tests/test_bdist.py',
+    'distutils.tests.test_bdist_dumb': 'distutils/tests/test_bdist_dumb.py',
+    'distutils.tests.test_bdist_msi': 'distutils/tests/test_bdist_msi.py',
+    'distutils.tests.test_bdist_rpm': 'distutils/tests/test_bdist_rpm.py',
+    'distutils.tests.test_build': 'distutils/tests/test_build.py',
+    'distutils.tests.test_build_clib': 'distutils/tests/test_build_clib.py',
+    'distutils.tests.test_build_ext': 'distutils/tests/test_build_ext.py',
+    'distutils.tests.test_build_py': 'distutils/tests/test_build_py.py',
+    'distutils.tests.test_build_scripts': 'distutils/tests/test_build_scripts.py',
+    'distutils.tests.test_check': 'distutils/tests/test_check.py',
+    'distutils.tests.test_clean': 'distutils/tests/test_clean.py',
+    'distutils.tests.test_cmd': 'distutils/tests/test_cmd.py',
+    'distutils.tests.test_config': 'distutils/tests/test_config.py',
+    'distutils.tests.test_config_cmd': 'distutils/tests/test_config_cmd.py',
+    'distutils.tests.test_core': 'distutils/tests/test_core.py',
+    'distutils.tests.test_cygwinccompiler': 'distutils/tests/test_cygwinccompiler.py',
+    'distutils.tests.test_dep_util': 'distutils/tests/test_dep_util.py',
+    'distutils.tests.test_dir_util': 'distutils/tests/test_dir_util.py',
+    'distutils.tests.test_dist': 'distutils/tests/test_dist.py',
+    'distutils.tests.test_extension': 'distutils/tests/test_extension.py',
+    'distutils.tests.test_file_util': 'distutils/tests/test_file_util.py',
+    'distutils.tests.test_filelist': 'distutils/tests/test_filelist.py',
+    'distutils.tests.test_install': 'distutils/tests/test_install.py',
+    'distutils.tests.test_install_data': 'distutils/tests/test_install_data.py',
+    'distutils.tests.test_install_headers': 'distutils/tests/test_install_headers.py',
+    'distutils.tests.test_install_lib': 'distutils/tests/test_install_lib.py',
+    'distutils.tests.test_install_scripts': 'distutils/tests/test_install_scripts.py',
+    'distutils.tests.test_log': 'distutils/tests/test_log.py',
+    'distutils.tests.test_msvc9compiler': 'distutils/tests/test_msvc9compiler.py',
+    'distutils.tests.test_msvccompiler': 'distutils/tests/test_msvccompiler.py',
+    'distutils.tests.test_register': 'distutils/tests/test_register.py',
+    'distutils.tests.test_sdist': 'distutils/tests/test_sdist.py',
+    'distutils.tests.test_spawn': 'distutils/tests/test_spawn.py',
+    'distutils.tests.test_sysconfig': 'distutils/tests/test_sysconfig.py',
+    'distutils.tests.test_text_file': 'distutils/tests/test_text_file.py',
+    'distutils.tests.test_unixccompiler': 'distutils/tests/test_unixccompiler.py',
+    'distutils.tests.test_upload': 'distutils/tests/test_upload.py',
+    'distutils.tests.test_util': 'distutils/tests/test_util.py',
+    'distutils.tests.test_version': 'distutils/tests/test_version.py',
+    'distutils.tests.test_versionpredicate': 'distutils/tests/test_versionpredicate.py',
+    'distutils.text_file': 'distutils/text_file.py',
+    'distutils.unixccompiler': 'distutils/unixccompiler.py',
+    'distutils.util': 'distutils/util.py',
+    'distutils.version': 'distutils/version.py',
+    'distutils.versionpredicate': 'distutils/versionpredicate.py',
+    'doctest': 'doctest.py',
+    'email': 'email/__init__.py',
+    'email._encoded_words': 'email/_encoded_words.py',
+    'email._header_value_parser': 'email/_header_value_parser.py',
+    'email._parseaddr': 'email/_parseaddr.py',
+    'email._policybase': 'email/_policybase.py',
+    'email.base64mime': 'email/base64mime.py',
+    'email.charset': 'email/charset.py',
+    'email.contentmanager': 'email/contentmanager.py',
+    'email.encoders': 'email/encoders.py',
+    'email.errors': 'email/errors.py',
+    'email.feedparser': 'email/feedparser.py',
+    'email.generator': 'email/generator.py',
+    'email.header': 'email/header.py',
+    'email.headerregistry': 'email/headerregistry.py',
+    'email.iterators': 'email/iterators.py',
+    'email.message': 'email/message.py',
+    'email.mime': 'email/mime/__init__.py',
+    'email.mime.application': 'email/mime/application.py',
+    'email.mime.audio': 'email/mime/audio.py',
+    'email.mime.base': 'email/mime/base.py',
+    'email.mime.image': 'email/mime/image.py',
+    'email.mime.message': 'email/mime/message.py',
+    'email.mime.multipart': 'email/mime/multipart.py',
+    'email.mime.nonmultipart': 'email/mime/nonmultipart.py',
+    'email.mime.text': 'email/mime/text.py',
+    'email.parser': 'email/parser.py',
+    'email.policy': 'email/policy.py',
+    'email.quoprimime': 'email/quoprimime.py',
+    'email.utils': 'email/utils.py',
+    'encodings': 'encodings/__init__.py',
+    'encodings.aliases': 'encodings/aliases.py',
+    'encodings.ascii': 'encodings/ascii.py',
+    'encodings.base64_codec': 'encodings/base64_codec.py',
+    'encodings.big5': 'encodings/big5.py',
+    'encodings.big5hkscs': 'encodings/big5hkscs.py',
+    'encodings.bz2_codec': 'encodings/bz2_codec.py',
+    'encodings.charmap': 'encodings/charmap.py',
+    'encodings.cp037': 'encodings/cp037.py',
+    'encodings.cp1006': 'encodings/cp1006.py',
+    'encodings.cp1026': 'encodings/cp1026.py',
+    'encodings.cp1125': 'encodings/cp1125.py',
+    'encodings.cp1140': 'encodings/cp1140.py',
+    'encodings.cp1250': 'encodings/cp1250.py',
+    'encodings.cp1251': 'encodings/cp1251.py',
+    'encodings.cp1252': 'encodings/cp1252.py',
+    'encodings.cp1253': 'encodings/cp1253.py',
+    'encodings.cp1254': 'encodings/cp1254.py',
+    'encodings.cp1255': 'encodings/cp1255.py',
+    'encodings.cp1256': 'encodings/cp1256.py',
+    'encodings.cp1257': 'encodings/cp1257.py',
+    'encodings.cp1258': 'encodings/cp1258.py',
+    'encodings.cp273': 'encodings/cp273.py',
+    'encodings.cp424': 'encodings/cp424.py',
+    'encodings.cp437': 'encodings/cp437.py',
+    'encodings.cp500': 'encodings/cp500.py',
+    'encodings.cp720': 'encodings/cp720.py',
+    'encodings.cp737': 'encodings/cp737.py',
+    'encodings.cp775': 'encodings/cp775.py',
+    'encodings.cp850': 'encodings/cp850.py',
+    'encodings.cp852': 'encodings/cp852.py',
+    'encodings.cp855': 'encodings/cp855.py',
+    'encodings.cp856': 'encodings/cp856.py',
+    'encodings.cp857': 'encodings/cp857.py',
+    'encodings.cp858': 'encodings/cp858.py',
+    'encodings.cp860': 'encodings/cp860.py',
+    'encodings.cp861': 'encodings/cp861.py',
+    'encodings.cp862': 'encodings/cp862.py',
+    'encodings.cp863': 'encodings/cp863.py',
+    'encodings.cp864': 'encodings/cp864.py',
+    'encodings.cp865': 'encodings/cp865.py',
+    'encodings.cp866': 'encodings/cp866.py',
+    'encodings.cp869': 'encodings/cp869.py',
+    'encodings.cp874': 'encodings/cp874.py',
+    'encodings.cp875': 'encodings/cp875.py',
+    'encodings.cp932': 'encodings/cp932.py',
+    'encodings.cp949': 'encodings/cp949.py',
+    'encodings.cp950': 'encodings/cp950.py',
+    'encodings.euc_jis_2004': 'encodings/euc_jis_2004.py',
+    'encodings.euc_jisx0213': 'encodings/euc_jisx0213.py',
+    'encodings.euc_jp': 'encodings/euc_jp.py',
+    'encodings.euc_kr': 'encodings/euc_kr.py',
+    'encodings.gb18030': 'encodings/gb18030.py',
+    'encodings.gb2312': 'encodings/gb2312.py',
+    'encodings.gbk': 'encodings/gbk.py',
+    'encodings.hex_codec': 'encodings/hex_codec.py',
+    'encodings.hp_roman8': 'encodings/hp_roman8.py',
+    'encodings.hz': 'encodings/hz.py',
+    'encodings.idna': 'encodings/idna.py',
+    'encodings.iso2022_jp': 'encodings/iso2022_jp.py',
+    'encodings.iso2022_jp_1': 'encodings/iso2022_jp_1.py',
+    'encodings.iso2022_jp_2': 'encodings/iso2022_jp_2.py',
+    'encodings.iso2022_jp_2004': 'encodings/iso2022_jp_2004.py',
+    'encodings.iso2022_jp_3': 'encodings/iso2022_jp_3.py',
+    'encodings.iso2022_jp_ext': 'encodings/iso2022_jp_ext.py',
+    'encodings.iso2022_kr': 'encodings/iso2022_kr.py',
+    'encodings.iso8859_1': 'encodings/iso8859_1.py',
+    'encodings.iso8859_10': 'encodings/iso8859_10.py',
+    'encodings.iso8859_11': 'encodings/iso8859_11.py',
+    'encodings.iso8859_13': 'encodings/iso8859_13.py',
+    'encodings.iso8859_14': 'encodings/iso8859_14.py',
+    'encodings.iso8859_15': 'encodings/iso8859_15.py',
+    'encodings.iso8859_16': 'encodings/iso8859_16.py',
+    'encodings.iso8859_2': 'encodings/iso8859_2.py',
+    'encodings.iso8859_3': 'encodings/iso8859_3.py',
+    'encodings.iso8859_4': 'encodings/iso8859_4.py',
+    'encodings.iso8859_5': 'encodings/iso8859_5.py',
+    'encodings.iso8859_6': 'encodings/iso8859_6.py',
+    'encodings.iso8859_7': 'encodings/iso8859_7.py',
+    'encodings.iso8859_8': 'encodings/iso8859_8.py',
+    'encodings.iso8859_9': 'encodings/iso8859_9.py',
+    'encodings.johab': 'encodings/johab.py',
+    'encodings.koi8_r': 'encodings/koi8_r.py',
+    'encodings.koi8_t': 'encodings/koi8_t.py',
+    'encodings.koi8_u': 'encodings/koi8_u.py',
+    'encodings.kz1048': 'encodings/kz1048.py',
+    'encodings.latin_1': 'encodings/latin_1.py',
+    'encodings.mac_arabic': 'encodings/mac_arabic.py',
+    'encodings.mac_croatian': 'encodings/mac_croatian.py',
+    'encodings.mac_cyrillic': 'encodings/mac_cyrillic.py',
+    'encodings.mac_farsi': 'encodings/mac_farsi.py',
+    'encodings.mac_greek': 'encodings/mac_greek.py',
+    'encodings.mac_iceland': 'encodings/mac_iceland.py',
+    'encodings.mac_latin2': 'encodings/mac_latin2.py',
+    'encodings.mac_roman': 'encodings/mac_roman.py',
+    'encodings.mac_romanian': 'encodings/mac_romanian.py',
+    'encodings.mac_turkish': 'encodings/mac_turkish.py',
+    'encodings.mbcs': 'encodings/mbcs.py',
+    'encodings.oem': 'encodings/oem.py',
+    'encodings.palmos': 'encodings/palmos.py',
+    'encodings.ptcp154': 'encodings/ptcp154.py',
+    'encodings.punycode': 'encodings/punycode.py',
+    'encodings.quopri_codec': 'encodings/quopri_codec.py',
+    'encodings.raw_unicode_escape': 'encodings/raw_unicode_escape.py',
+    'encodings.rot_13': 'encodings/rot_13.py',
+    'encodings.shift_jis': 'encodings/shift_jis.py',
+    'encodings.shift_jis_2004': 'encodings/shift_jis_2004.py',
+    'encodings.shift_jisx0213': 'encodings/shift_jisx0213.py',
+    'encodings.tis_620': 'encodings/tis_620.py',
+    'encodings.undefined': 'encodings/undefined.py',
+    'encodings.unicode_escape': 'encodings/unicode_escape.py',
+    'encodings.utf_16': 'encodings/utf_16.py',
+    'encodings.utf_16_be': 'encodings/utf_16_be.py',
+    'encodings.utf_16_le': 'encodings/utf_16_le.py',
+    'encodings.utf_32': 'encodings/utf_32.py',
+    'encodings.utf_32_be': 'encodings/utf_32_be.py',
+    'encodings.utf_32_le': 'encodings/utf_32_le.py',
+    'encodings.utf_7': 'encodings/utf_7.py',
+    'encodings.utf_8': 'encodings/utf_8.py',
+    'encodings.utf_8_sig': 'encodings/utf_8_sig.py',
+    'encodings.uu_codec': 'encodings/uu_codec.py',
+    'encodings.zlib_codec': 'encodings/zlib_codec.py',
+    'ensurepip': 'ensurepip/__init__.py',
+    'ensurepip.__main__': 'ensurepip/__main__.py',
+    'ensurepip._bundled': 'ensurepip/_bundled/__init__.py',
+    'ensurepip._uninstall': 'ensurepip/_uninstall.py',
+    'enum': 'enum.py',
+    'fcntl': 'lib-dynload/fcntl.cpython-310-x86_64-linux-gnu.so',
+    'filecmp': 'filecmp.py',
+    'fileinput': 'fileinput.py',
+    'fnmatch': 'fnmatch.py',
+    'fractions': 'fractions.py',
+    'ftplib': 'ftplib.py',
+    'functools': 'functools.py',
+    'genericpath': 'genericpath.py',
+    'getopt': 'getopt.py',
+    'getpass': 'getpass.py',
+    'gettext': 'gettext.py',
+    'glob': 'glob.py',
+    'graphlib': 'graphlib.py',
+    'grp': 'lib-dynload/grp.cpython-310-x86_64-linux-gnu.so',
+    'gzip': 'gzip.py',
+    'hashlib': 'hashlib.py',
+    'heapq': 'heapq.py',
+    'hmac': 'hmac.py',
+    'html': 'html/__init__.py',
+    'html.entities': 'html/entities.py',
+    'html.parser': 'html/parser.py',
+    'http': 'http/__init__.py',
+    'http.client': 'http/client.py',
+    'http.cookiejar': 'http/cookiejar.py',
+    'http.cookies': 'http/cookies.py',
+    'http.server': 'http/server.py',
+    'idlelib': 'idlelib/__init__.py',
+    'idlelib.__main__': 'idlelib/__main__.py',
+    'idlelib.autocomplete': 'idlelib/autocomplete.py',
+    'idlelib.autocomplete_w': 'idlelib/autocomplete_w.py',
+    'idlelib.autoexpand': 'idlelib/autoexpand.py',
+    'idlelib.browser': 'idlelib/browser.py',
+    'idlelib.calltip': 'idlelib/calltip.py',
+    'idlelib.calltip_w': 'idlelib/calltip_w.py',
+    'idlelib.codecontext': 'idlelib/codecontext.py',
+    'idlelib.colorizer': 'idlelib/colorizer.py',
+    'idlelib.config': 'idlelib/config.py',
+    'idlelib.config_key': 'idlelib/config_key.py',
+    'idlelib.configdialog': 'idlelib/configdialog.py',
+    'idlelib.debugger': 'idlelib/debugger.py',
+    'idlelib.debugger_r': 'idlelib/debugger_r.py',
+    'idlelib.debugobj': 'idlelib/debugobj.py',
+    'idlelib.debugobj_r': 'idlelib/debugobj_r.py',
+    'idlelib.delegator': 'idlelib/delegator.py',
+    'idlelib.dynoption': 'idlelib/dynoption.py',
+    'idlelib.editor': 'idlelib/editor.py',
+    'idlelib.filelist': 'idlelib/filelist.py',
+    'idlelib.format': 'idlelib/format.py',
+    'idlelib.grep': 'idlelib/grep.py',
+    'idlelib.help': 'idlelib/help.py',
+    'idlelib.help_about': 'idlelib/help_about.py',
+    'idlelib.history': 'idlelib/history.py',
+    'idlelib.hyperparser': 'idlelib/hyperparser.py',
+    'idlelib.idle': 'idlelib/idle.py',
+    'idlelib.idle_test': 'idlelib/idle_test/__init__.py',
+    'idlelib.idle_test.htest': 'idlelib/idle_test/htest.py',
+    'idlelib.idle_test.mock_idle': 'idlelib/idle_test/mock_idle.py',
+    'idlelib.idle_test.mock_tk': 'idlelib/idle_test/mock_tk.py',
+    'idlelib.idle_test.template': 'idlelib/idle_test/template.py',
+    'idlelib.idle_test.test_autocomplete': 'idlelib/idle_test/test_autocomplete.py',
+    'idlelib.idle_test.test_autocomplete_w': 'idlelib/idle_test/test_autocomplete_w.py',
+    'idlelib.idle_test.test_autoexpand': 'idlelib/idle_test/test_autoexpand.py',
+    'idlelib.idle_test.test_browser': 'idlelib/idle_test/test_browser.py',
+    'idlelib.idle_test.test_calltip': 'idlelib/idle_test/test_calltip.py',
+    'idlelib.idle_test.test_calltip_w': 'idlelib/idle_test/test_calltip_w.py',
+    'idlelib.idle_test.test_codecontext': 'idlelib/idle_test/test_codecontext.py',
+    'idlelib.idle_test.test_colorizer': 'idlelib/idle_test/test_colorizer.py',
+    'idlelib.idle_test.test_config': 'idlelib/idle_test/test_config.py',
+    'idlelib.idle_test.test_config_key': 'idlelib/idle_test/test_config_key.py',
+    'idlelib.idle_test.test_configdialog': 'idlelib/idle_test/test_configdialog.py',
+    'idlelib.idle_test.test_debugger': 'idlelib/idle_test/test_debugger.py',
+    'idlelib.idle_test.test_debugger_r': 'idlelib/idle_test/test_debugger_r.py',
+    'idlelib.idle_test.test_debugobj': 'idlelib/idle_test/test_debugobj.py',
+    'idlelib.idle_test.test_debugobj_r': 'idlelib/idle_test/test_debugobj_r.py',
+    'idlelib.idle_test.test_delegator': 'idlelib/idle_test/test_delegator.py',
+    'idlelib.idle_test.test_editmenu': 'idlelib/idle_test/test_editmenu.py',
+    'idlelib.idle_test.test_editor': 'idlelib/idle_test/test_editor.py',
+    'idlelib.idle_test.test_filelist': 'idlelib/idle_test/test_filelist.py',
+    'idlelib.idle_test.test_format': 'idlelib/idle_test/test_format.py',
+    'idlelib.idle_test.test_grep': 'idlelib/idle_test/test_grep.py',
+    'idlelib.idle_test.test_help': 'idlelib/idle_test/test_help.py',
+    'idlelib.idle_test.test_help_about': 'idlelib/idle_test/test_help_about.py',
+    'idlelib.idle_test.test_history': 'idlelib/idle_test/test_history.py',
+    'idlelib.idle_test.test_hyperparser': 'idlelib/idle_test/test_hyperparser.py',
+    'idlelib.idle_test.test_iomenu': 'idlelib/idle_test/test_iomenu.py',
+    'idlelib.idle_test.test_macosx': 'idlelib/idle_test/test_macosx.py',
+    'idlelib.idle_test.test_mainmenu': 'idlelib/idle_test/test_mainmenu.py',
+    'idlelib.idle_test.test_multicall': 'idlelib/idle_test/test_multicall.py',
+    'idlelib.idle_test.test_outwin': 'idlelib/idle_test/test_outwin.py',
+    'idlelib.idle_test.test_parenmatch': 'idlelib/idle_test/test_parenmatch.py',
+    'idlelib.idle_test.test_pathbrowser': 'idlelib/idle_test/test_pathbrowser.py',
+    'idlelib.idle_test.test_percolator': 'idlelib/idle_test/test_percolator.py',
+    'idlelib.idle_test.test_pyparse': 'idlelib/idle_test/test_pyparse.py',
+    'idlelib.idle_test.test_pyshell': 'idlelib/idle_test/test_pyshell.py',
+    'idlelib.idle_test.test_query': 'idlelib/idle_test/test_query.py',
+    'idlelib.idle_test.test_redirector': 'idlelib/idle_test/test_redirector.py',
+    'idlelib.idle_test.test_replace': 'idlelib/idle_test/test_replace.py',
+    'idlelib.idle_test.test_rpc': 'idlelib/idle_test/test_rpc.py',
+    'idlelib.idle_test.test_run': 'idlelib/idle_test/test_run.py',
+    'idlelib.idle_test.test_runscript': 'idlelib/idle_test/test_runscript.py',
+    'idlelib.idle_test.test_scrolledlist': 'idlelib/idle_test/test_scrolledlist.py',
+    'idlelib.idle_test.test_search': 'idlelib/idle_test/test_search.py',
+    'idlelib.idle_test.test_searchbase': 'idlelib/idle_test/test_searchbase.py',
+    'idlelib.idle_test.test_searchengine': 'idlelib/idle_test/test_searchengine.py',
+    'idlelib.idle_test.test_sidebar': 'idlelib/idle_test/test_sidebar.py',
+    'idlelib.idle_test.test_squeezer': 'idlelib/idle_test/test_squeezer.py',
+    'idlelib.idle_test.test_stackviewer': 'idlelib/idle_test/test_stackviewer.py',
+    'idlelib.idle_test.test_statusbar': 'idlelib/idle_test/test_statusbar.py',
+    'idlelib.idle_test.test_text': 'idlelib/idle_test/test_text.py',
+    'idlelib.idle_test.test_textview': 'idlelib/idle_test/test_textview.py',
+    'idlelib.idle_test.test_tooltip': 'idlelib/idle_test/test_tooltip.py',
+    'idlelib.idle_test.test_tree': 'idlelib/idle_test/test_tree.py',
+    'idlelib.idle_test.test_undo': 'idlelib/idle_test/test_undo.py',
+    'idlelib.idle_test.test_util': 'idlelib/idle_test/test_util.py',
+    'idlelib.idle_test.test_warning': 'idlelib/idle_test/test_warning.py',
+    'idlelib.idle_test.test_window': 'idlelib/idle_test/test_window.py',
+    'idlelib.idle_test.test_zoomheight': 'idlelib/idle_test/test_zoomheight.py',
+    'idlelib.idle_test.test_zzdummy': 'idlelib/idle_test/test_zzdummy.py',
+    'idlelib.idle_test.tkinter_testing_utils': 'idlelib/idle_test/tkinter_testing_utils.py',
+    'idlelib.iomenu': 'idlelib/iomenu.py',
+    'idlelib.macosx': 'idlelib/macosx.py',
+    'idlelib.mainmenu': 'idlelib/mainmenu.py',
+    'idlelib.multicall': 'idlelib/multicall.py',
+    'idlelib.outwin': 'idlelib/outwin.py',
+    'idlelib.parenmatch': 'idlelib/parenmatch.py',
+    'idlelib.pathbrowser': 'idlelib/pathbrowser.py',
+    'idlelib.percolator': 'idlelib/percolator.py',
+    'idlelib.pyparse': 'idlelib/pyparse.py',
+    'idlelib.pyshell': 'idlelib/pyshell.py',
+    'idlelib.query': 'idlelib/query.py',
+    'idlelib.redirector': 'idlelib/redirector.py',
+    'idlelib.replace': 'idlelib/replace.py',
+    'idlelib.rpc': 'idlelib/rpc.py',
+    'idlelib.run': 'idlelib/run.py',
+    'idlelib.runscript': 'idlelib/runscript.py',
+    'idlelib.scrolledlist': 'idlelib/scrolledlist.py',
+    'idlelib.search': 'idlelib/search.py',
+    'idlelib.searchbase': 'idlelib/searchbase.py',
+    'idlelib.searchengine': 'idlelib/searchengine.py',
+    'idlelib.sidebar': 'idlelib/sidebar.py',
+    'idlelib.squeezer': 'idlelib/squeezer.py',
+    'idlelib.stackviewer': 'idlelib/stackviewer.py',
+    'idlelib.statusbar': 'idlelib/statusbar.py',
+    'idlelib.textview': 'idlelib/textview.py',
+    'idlelib.tooltip': 'idlelib/tooltip.py',
+    'idlelib.tree': 'idlelib/tree.py',
+    'idlelib.undo': 'idlelib/undo.py',
+    'idlelib.util': 'idlelib/util.py',
+    'idlelib.window': 'idlelib/window.py',
+    'idlelib.zoomheight': 'idlelib/zoomheight.py',
+    'idlelib.zzdummy': 'idlelib/zzdummy.py',
+    'imaplib': 'imaplib.py',
+    'imghdr': 'imghdr.py',
+    'imp': 'imp.py',
+    'importlib': 'importlib/__init__.py',
+    'importlib._abc': 'importlib/_abc.py',
+    'importlib._adapters': 'importlib/_adapters.py',
+    'importlib._bootstrap': 'importlib/_bootstrap.py',
+    'importlib._bootstrap_external': 'importlib/_bootstrap_external.py',
+    'importlib._common': 'importlib/_common.py',
+    'importlib.abc': 'importlib/abc.py',
+    'importlib.machinery': 'importlib/machinery.py',
+    'importlib.metadata': 'importlib/metadata/__init__.py',
+    'importlib.metadata._adapters': 'importlib/metadata/_adapters.py',
+    'importlib.metadata._collections': 'importlib/metadata/_collections.py',
+    'importlib.metadata._functools': 'importlib/metadata/_functools.py',
+    'importlib.metadata._itertools': 'importlib/metadata/_itertools.py',
+    'importlib.metadata._meta': 'importlib/metadata/_meta.py',
+    'importlib.metadata._text': 'importlib/metadata/_text.py',
+    'importlib.readers': 'importlib/readers.py',
+    'importlib.resources': 'importlib/resources.py',
+    'importlib.util': 'importlib/util.py',
+    'inspect': 'inspect.py',
+    'io': 'io.py',
+    'ipaddress': 'ipaddress.py',
+    'json': 'json/__init__.py',
+    'json.decoder': 'json/decoder.py',
+    'json.encoder': 'json/encoder.py',
+    'json.scanner': 'json/scanner.py',
+    'json.tool': 'json/tool.py',
+    'keyword': 'keyword.py',
+    'lib2to3': 'lib2to3/__init__.py',
+    'lib2to3.__main__': 'lib2to3/__main__.py',
+    'lib2to3.btm_matcher': 'lib2to3/btm_matcher.py',
+    'lib2to3.btm_utils': 'lib2to3/btm_utils.py',
+    'lib2to3.fixer_base': 'lib2to3/fixer_base.py',
+    'lib2to3.fixer_util': 'lib2to3/fixer_util.py',
+    'lib2to3.fixes': 'lib2to3/fixes/__init__.py',
+    'lib2to3.fixes.fix_apply': 'lib2to3/fixes/fix_apply.py',
+    'lib2to3.fixes.fix_asserts': 'lib2to3/fixes/fix_asserts.py',
+    'lib2to3.fixes.fix_basestring': 'lib2to3/fixes/fix_basestring.py',
+    'lib2to3.fixes.fix_buffer': 'lib2to3/fixes/fix_buffer.py',
+    'lib2to3.fixes.fix_dict': 'lib2to3/fixes/fix_dict.py',
+    'lib2to3.fixes.fix_except': 'lib2to3/fixes/fix_except.py',
+    'lib2to3.fixes.fix_exec': 'lib2to3/fixes/fix_exec.py',
+    'lib2to3.fixes.fix_execfile': 'lib2to3/fixes/fix_execfile.py',
+    'lib2to3.fixes.fix_exitfunc': 'lib2to3/fixes/fix_exitfunc.py',
+    'lib2to3.fixes.fix_filter': 'lib2to3/fixes/fix_filter.py',
+    'lib2to3.fixes.fix_funcattrs': 'lib2to3/fixes/fix_funcattrs.py',
+    'lib2to3.fixes.fix_future': 'lib2to3/fixes/fix_future.py',
+    'lib2to3.fixes.fix_getcwdu': 'lib2to3/fixes/fix_getcwdu.py',
+    'lib2to3.fixes.fix_has_key': 'lib2to3/fixes/fix_has_key.py',
+    'lib2to3.fixes.fix_idioms': 'lib2to3/fixes/fix_idioms.py',
+    'lib2to3.fixes.fix_import': 'lib2to3/fixes/fix_import.py',
+    'lib2to3.fixes.fix_imports': 'lib2to3/fixes/fix_imports.py',
+    'lib2to3.fixes.fix_imports2': 'lib2to3/fixes/fix_imports2.py',
+    'lib2to3.fixes.fix_input': 'lib2to3/fixes/fix_input.py',
+    'lib2to3.fixes.fix_intern': 'lib2to3/fixes/fix_intern.py',
+    'lib2to3.fixes.fix_isinstance': 'lib2to3/fixes/fix_isinstance.py',
+    'lib2to3.fixes.fix_itertools': 'lib2to3/fixes/fix_itertools.py',
+    'lib2to3.fixes.fix_itertools_imports': 'lib2to3/fixes/fix_itertools_imports.py',
+    'lib2to3.fixes.fix_long': 'lib2to3/fixes/fix_long.py',
+    'lib2to3.fixes.fix_map': 'lib2to3/fixes/fix_map.py',
+    'lib2to3.fixes.fix_metaclass': 'lib2to3/fixes/fix_metaclass.py',
+    'lib2to3.fixes.fix_methodattrs': 'lib2to3/fixes/fix_methodattrs.py',
+    'lib2to3.fixes.fix_ne': 'lib2to3/fixes/fix_ne.py',
+    'lib2to3.fixes.fix_next': 'lib2to3/fixes/fix_next.py',
+    'lib2to3.fixes.fix_nonzero': 'lib2to3/fixes/fix_nonzero.py',
+    'lib2to3.fixes.fix_numliterals': 'lib2to3/fixes/fix_numliterals.py',
+    'lib2to3.fixes.fix_operator': 'lib2to3/fixes/fix_operator.py',
+    'lib2to3.fixes.fix_paren': 'lib2to3/fixes/fix_paren.py',
+    'lib2to3.fixes.fix_print': 'lib2to3/fixes/fix_print.py',
+    'lib2to3.fixes.fix_raise': 'lib2to3/fixes/fix_raise.py',
+    'lib2to3.fixes.fix_raw_input': 'lib2to3/fixes/fix_raw_input.py',
+    'lib2to3.fixes.fix_reduce': 'lib2to3/fixes/fix_reduce.py',
+    'lib2to3.fixes.fix_reload': 'lib2to3/fixes/fix_reload.py',
+    'lib2to3.fixes.fix_renames': 'lib2to3/fixes/fix_renames.py',
+    'lib2to3.fixes.fix_repr': 'lib2to3/fixes/fix_repr.py',
+    'lib2to3.fixes.fix_set_literal': 'lib2to3/fixes/fix_set_literal.py',
+    'lib2to3.fixes.fix_standarderror': 'lib2to3/fixes/fix_standarderror.py',
+    'lib2to3.fixes.fix_sys_exc': 'lib2to3/fixes/fix_sys_exc.py',
+    'lib2to3.fixes.fix_throw': 'lib2to3/fixes/fix_throw.py',
+    'lib2to3.fixes.fix_tuple_params': 'lib2to3/fixes/fix_tuple_params.py',
+    'lib2to3.fixes.fix_types': 'lib2to3/fixes/fix_types.py',
+    'lib2to3.fixes.fix_unicode': 'lib2to3/fixes/fix_unicode.py',
+    'lib2to3.fixes.fix_urllib': 'lib2to3/fixes/fix_urllib.py',
+    'lib2to3.fixes.fix_ws_comma': 'lib2to3/fixes/fix_ws_comma.py',
+    'lib2to3.fixes.fix_xrange': 'lib2to3/fixes/fix_xrange.py',
+    'lib2to3.fixes.fix_xreadlines': 'lib2to3/fixes/fix_xreadlines.py',
+    'lib2to3.fixes.fix_zip': 'lib2to3/fixes/fix_zip.py',
+    'lib2to3.main': 'lib2to3/main.py',
+    'lib2to3.patcomp': 'lib2to3/patcomp.py',
+    'lib2to3.pgen2': 'lib2to3/pgen2/__init__.py',
+    'lib2to3.pgen2.conv': 'lib2to3/pgen2/conv.py',
+    'lib2to3.pgen2.driver': 'lib2to3/pgen2/driver.py',
+    'lib2to3.pgen2.grammar': 'lib2to3/pgen2/grammar.py',
+    'lib2to3.pgen2.literals': 'lib2to3/pgen2/literals.py',
+    'lib2to3.pgen2.parse': 'lib2to3/pgen2/parse.py',
+    'lib2to3.pgen2.pgen': 'lib2to3/pgen2/pgen.py',
+    'lib2to3.pgen2.token': 'lib2to3/pgen2/token.py',
+    'lib2to3.pgen2.tokenize': 'lib2to3/pgen2/tokenize.py',
+    'lib2to3.pygram': 'lib2to3/pygram.py',
+    'lib2to3.pytree': 'lib2to3/pytree.py',
+    'lib2to3.refactor': 'lib2to3/refactor.py',
+    'lib2to3.tests': 'lib2to3/tests/__init__.py',
+    'lib2to3.tests.__main__': 'lib2to3/tests/__main__.py',
+    'lib2to3.tests.pytree_idempotency': 'lib2to3/tests/pytree_idempotency.py',
+    'lib2to3.tests.support': 'lib2to3/tests/support.py',
+    'lib2to3.tests.test_all_fixers': 'lib2to3/tests/test_all_fixers.py',
+    'lib2to3.tests.test_fixers': 'lib2to3/tests/test_fixers.py',
+    'lib2to3.tests.test_main': 'lib2to3/tests/test_main.py',
+    'lib2to3.tests.test_parser': 'lib2to3/tests/test_parser.py',
+    'lib2to3.tests.test_pytree': 'lib2to3/tests/test_pytree.py',
+    'lib2to3.tests.test_refactor': 'lib2to3/tests/test_refactor.py',
+    'lib2to3.tests.test_util': 'lib2to3/tests/test_util.py',
+    'linecache': 'linecache.py',
+    'locale': 'locale.py',
+    'logging': 'logging/__init__.py',
+    'logging.config': 'logging/config.py',
+    'logging.handlers': 'logging/handlers.py',
+    'lzma': 'lzma.py',
+    'mailbox': 'mailbox.py',
+    'mailcap': 'mailcap.py',
+    'math': 'lib-dynload/math.cpython-310-x86_64-linux-gnu.so',
+    'mimetypes': 'mimetypes.py',
+    'mmap': 'lib-dynload/mmap.cpython-310-x86_64-linux-gnu.so',
+    'modulefinder': 'modulefinder.py',
+    'multiprocessing': 'multiprocessing/__init__.py',
+    'multiprocessing.connection': 'multiprocessing/connection.py',
+    'multiprocessing.context': 'multiprocessing/context.py',
+    'multiprocessing.dummy': 'multiprocessing/dummy/__init__.py',
+    'multiprocessing.dummy.connection': 'multiprocessing/dummy/connection.py',
+    'multiprocessing.forkserver': 'multiprocessing/forkserver.py',
+    'multiprocessing.heap': 'multiprocessing/heap.py',
+    'multiprocessing.managers': 'multiprocessing/managers.py',
+    'multiprocessing.pool': 'multiprocessing/pool.py',
+    'multiprocessing.popen_fork': 'multiprocessing/popen_fork.py',
+    'multiprocessing.popen_forkserver': 'multiprocessing/popen_forkserver.py',
+    'multiprocessing.popen_spawn_posix': 'multiprocessing/popen_spawn_posix.py',
+    'multiprocessing.popen_spawn_win32': 'multiprocessing/popen_spawn_win32.py',
+    'multiprocessing.process': 'multiprocessing/process.py',
+    'multiprocessing.queues': 'multiprocessing/queues.py',
+    'multiprocessing.reduction': 'multiprocessing/reduction.py',
+    'multiprocessing.resource_sharer': 'multiprocessing/resource_sharer.py',
+    'multiprocessing.resource_tracker': 'multiprocessing/resource_tracker.py',
+    'multiprocessing.shared_memory': 'multiprocessing/shared_memory.py',
+    'multiprocessing.sharedctypes': 'multiprocessing/sharedctypes.py',
+    'multiprocessing.spawn': 'multiprocessing/spawn.py',
+    'multiprocessing.synchronize': 'multiprocessing/synchronize.py',
+    'multiprocessing.util': 'multiprocessing/util.py',
+    'netrc': 'netrc.py',
+    'nis': 'lib-dynload/nis.cpython-310-x86_64-linux-gnu.so',
+    'nntplib': 'nntplib.py',
+    'ntpath': 'ntpath.py',
+    'nturl2path': 'nturl2path.py',
+    'numbers': 'numbers.py',
+    'opcode': 'opcode.py',
+    'operator': 'operator.py',
+    'optparse': 'optparse.py',
+    'os': 'os.py',
+    'ossaudiodev': 'lib-dynload/ossaudiodev.cpython-310-x86_64-linux-gnu.so',
+    'pathlib': 'pathlib.py',
+    'pdb': 'pdb.py',
+    'pickle': 'pickle.py',
+    'pickletools': 'pickletools.py',
+    'pipes': 'pipes.py',
+    'pkgutil': 'pkgutil.py',
+    'platform': 'platform.py',
+    'plistlib': 'plistlib.py',
+    'poplib': 'poplib.py',
+    'posixpath': 'posixpath.py',
+    'pprint': 'pprint.py',
+    'profile': 'profile.py',
+    'pstats': 'pstats.py',
+    'pty': 'pty.py',
+    'py_compile': 'py_compile.py',
+    'pyclbr': 'pyclbr.py',
+    'pydoc': 'pydoc.py',
+    'pydoc_data': 'pydoc_data/__init__.py',
+    'pydoc_data.topics': 'pydoc_data/topics.py',
+    'pyexpat': 'lib-dynload/pyexpat.cpython-310-x86_64-linux-gnu.so',
+    'queue': 'queue.py',
+    'quopri': 'quopri.py',
+    'random': 'random.py',
+    're': 're.py',
+    'readline': 'lib-dynload/readline.cpython-310-x86_64-linux-gnu.so',
+    'reprlib': 'reprlib.py',
+    'resource': 'lib-dynload/resource.cpython-310-x86_64-linux-gnu.so',
+    'rlcompleter': 'rlcompleter.py',
+    'runpy': 'runpy.py',
+    'sched': 'sched.py',
+    'secrets': 'secrets.py',
+    'select': 'lib-dynload/select.cpython-310-x86_64-linux-gnu.so',
+    'selectors': 'selectors.py',
+    'shelve': 'shelve.py',
+    'shlex': 'shlex.py',
+    'shutil': 'shutil.py',
+    'signal': 'signal.py',
+    'site': 'site.py',
+    'smtpd': 'smtpd.py',
+    'smtplib': 'smtplib.py',
+    'sndhdr': 'sndhdr.py',
+    'socket': 'socket.py',
+    'socketserver': 'socketserver.py',
+    'spwd': 'lib-dynload/spwd.cpython-310-x86_64-linux-gnu.so',
+    'sqlite3': 'sqlite3/__init__.py',
+    'sqlite3.dbapi2': 'sqlite3/dbapi2.py',
+    'sqlite3.dump': 'sqlite3/dump.py',
+    'sqlite3.test': 'sqlite3/test/__init__.py',
+    'sqlite3.test.backup': 'sqlite3/test/backup.py',
+    'sqlite3.test.dbapi': 'sqlite3/test/dbapi.py',
+    'sqlite3.test.dump': 'sqlite3/test/dump.py',
+    'sqlite3.test.factory': 'sqlite3/test/factory.py',
+    'sqlite3.test.hooks': 'sqlite3/test/hooks.py',
+    'sqlite3.test.regression': 'sqlite3/test/regression.py',
+    'sqlite3.test.transactions': 'sqlite3/test/transactions.py',
+    'sqlite3.test.types': 'sqlite3/test/types.py',
+    'sqlite3.test.userfunctions': 'sqlite3/test/userfunctions.py',
+    'sre_compile': 'sre_compile.py',
+    'sre_constants': 'sre_constants.py',
+    'sre_parse': 'sre_parse.py',
+    'ssl': 'ssl.py',
+    'stat': 'stat.py',
+    'statistics': 'statistics.py',
+    'string': 'string.py',
+    'stringprep': 'stringprep.py',
+    'struct': 'struct.py',
+    'subprocess': 'subprocess.py',
+    'sunau': 'sunau.py',
+    'symtable': 'symtable.py',
+    'sysconfig': 'sysconfig.py',
+    'syslog': 'lib-dynload/syslog.cpython-310-x86_64-linux-gnu.so',
+    'tabnanny': 'tabnanny.py',
+    'tarfile': 'tarfile.py',
+    'telnetlib': 'telnetlib.py',
+    'tempfile': 'tempfile.py',
+    'termios': 'lib-dynload/termios.cpython-310-x86_64-linux-gnu.so',
+    'test': 'test/__init__.py',
+    'test.__main__': 'test/__main__.py',
+    'test._test_atexit': 'test/_test_atexit.py',
+    'test._test_eintr': 'test/_test_eintr.py',
+    'test._test_embed_set_config': 'test/_test_embed_set_config.py',
+    'test._test_multiprocessing': 'test/_test_multiprocessing.py',
+    'test._typed_dict_helper': 'test/_typed_dict_helper.py',
+    'test.ann_module': 'test/ann_module.py',
+    'test.ann_module2': 'test/ann_module2.py',
+    'test.ann_module3': 'test/ann_module3.py',
+    'test.ann_module4': 'test/ann_module4.py',
+    'test.ann_module5': 'test/ann_module5.py',
+    'test.ann_module6': 'test/ann_module6.py',
+    'test.ann_module7': 'test/ann_module7.py',
+    'test.audiotests': 'test/audiotests.py',
+    'test.autotest': 'test/autotest.py',
+    'test.bad_coding': 'test/bad_coding.py',
+    'test.bad_coding2': 'test/bad_coding2.py',
+    'test.bad_getattr': 'test/bad_getattr.py',
+    'test.bad_getattr2': 'test/bad_getattr2.py',
+    'test.bad_getattr3': 'test/bad_getattr3.py',
+    'test.badsyntax_3131': 'test/badsyntax_3131.py',
+    'test.badsyntax_future10': 'test/badsyntax_future10.py',
+    'test.badsyntax_future3': 'test/badsyntax_future3.py',
+    'test.badsyntax_future4': 'test/badsyntax_future4.py',
+    'test.badsyntax_future5': 'test/badsyntax_future5.py',
+    'test.badsyntax_future6': 'test/badsyntax_future6.py',
+    'test.badsyntax_future7': 'test/badsyntax_future7.py',
+    'test.badsyntax_future8': 'test/badsyntax_future8.py',
+    'test.badsyntax_future9': 'test/badsyntax_future9.py',
+    'test.badsyntax_pep3120': 'test/badsyntax_pep3120.py',
+    'test.bisect_cmd': 'test/bisect_cmd.py',
+    'test.coding20731': 'test/coding20731.py',
+    'test.curses_tests': 'test/curses_tests.py',
+    'test.dataclass_module_1': 'test/dataclass_module_1.py',
+    'test.dataclass_module_1_str': 'test/dataclass_module_1_str.py',
+    'test.dataclass_module_2': 'test/dataclass_module_2.py',
+    'test.dataclass_module_2_str': 'test/dataclass_module_2_str.py',
+    'test.dataclass_textanno': 'test/dataclass_textanno.py',
+    'test.datetimetester': 'test/datetimetester.py',
+    'test.dis_module': 'test/dis_module.py',
+    'test.doctest_aliases': 'test/doctest_aliases.py',
+    'test.doctest_lineno': 'test/doctest_lineno.py',
+    'test.double_const': 'test/double_const.py',
+    'test.encoded_modules': 'test/encoded_modules/__init__.py',
+    'test.encoded_modules.module_iso_8859_1': 'test/encoded_modules/module_iso_8859_1.py',
+    'test.encoded_modules.module_koi8_r': 'test/encoded_modules/module_koi8_r.py',
+    'test.final_a': 'test/final_a.py',
+    'test.final_b': 'test/final_b.py',
+    'test.fork_wait': 'test/fork_wait.py',
+    'test.future_test1': 'test/future_test1.py',
+    'test.future_test2': 'test/future_test2.py',
+    'test.gdb_sample': 'test/gdb_sample.py',
+    'test.good_getattr': 'test/good_getattr.py',
+    'test.imp_dummy': 'test/imp_dummy.py',
+    'test.inspect_fodder': 'test/inspect_fodder.py',
+    'test.inspect_fodder2': 'test/inspect_fodder2.py',
+    'test.inspect_stock_annotations': 'test/inspect_stock_annotations.py',
+    'test.inspect_stringized_annotations': 'test/inspect_stringized_annotations.py',
+    'test.inspect_stringized_annotations_2': 'test/inspect_stringized_annotations_2.py',
+    'test.libregrtest': 'test/libregrtest/__init__.py',
+    'test.libregrtest.cmdline': 'test/libregrtest/cmdline.py',
+    'test.libregrtest.main': 'test/libregrtest/main.py',
+    'test.libregrtest.pgo': 'test/libregrtest/pgo.py',
+    'test.libregrtest.refleak': 'test/libregrtest/refleak.py',
+    'test.libregrtest.runtest': 'test/libregrtest/runtest.py',
+    'test.libregrtest.runtest_mp': 'test/libregrtest/runtest_mp.py',
+    'test.libregrtest.save_env': 'test/libregrtest/save_env.py',
+    'test.libregrtest.setup': 'test/libregrtest/setup.py',
+    'test.libregrtest.utils': 'test/libregrtest/utils.py',
+    'test.libregrtest.win_utils': 'test/libregrtest/win_utils.py',
+    'test.list_tests': 'test/list_tests.py',
+    'test.lock_tests': 'test/lock_tests.py',
+    'test.make_ssl_certs': 'test/make_ssl_certs.py',
+    'test.mapping_tests': 'test/mapping_tests.py',
+    'test.memory_watchdog': 'test/memory_watchdog.py',
+    'test.mock_socket': 'test/mock_socket.py',
+    'test.mod_generics_cache': 'test/mod_generics_cache.py',
+    'test.mp_fork_bomb': 'test/mp_fork_bomb.py',
+    'test.mp_preload': 'test/mp_preload.py',
+    'test.multibytecodec_support': 'test/multibytecodec_support.py',
+    'test.pickletester': 'test/pickletester.py',
+    'test.profilee': 'test/profilee.py',
+    'test.pyclbr_input': 'test/pyclbr_input.py',
+    'test.pydoc_mod': 'test/pydoc_mod.py',
+    'test.pydocfodder': 'test/pydocfodder.py',
+    'test.pythoninfo': 'test/pythoninfo.py',
+    'test.re_tests': 'test/re_tests.py',
+    'test.regrtest': 'test/regrtest.py',
+    'test.relimport': 'test/relimport.py',
+    'test.reperf': 'test/reperf.py',
+    'test.sample_doctest': 'test/sample_doctest.py',
+    'test.sample_doctest_no_docstrings': 'test/sample_doctest_no_docstrings.py',
+    'test.sample_doctest_no_doctests': 'test/sample_doctest_no_doctests.py',
+    'test.seq_tests': 'test/seq_tests.py',
+    'test.signalinterproctester': 'test/signalinterproctester.py',
+    'test.sortperf': 'test/sortperf.py',
+    'test.ssl_servers': 'test/ssl_servers.py',
+    'test.ssltests': 'test/ssltests.py',
+    'test.string_tests': 'test/string_tests.py',
+    'test.support': 'test/support/__init__.py',
+    'test.support.bytecode_helper': 'test/support/bytecode_helper.py',
+    'test.support.hashlib_helper': 'test/support/hashlib_helper.py',
+    'test.support.import_helper': 'test/support/import_helper.py',
+    'test.support.interpreters': 'test/support/interpreters.py',
+    'test.support.logging_helper': 'test/support/logging_helper.py',
+    'test.support.os_helper': 'test/support/os_helper.py',
+    'test.support.script_helper': 'test/support/script_helper.py',
+    'test.support.socket_helper': 'test/support/socket_helper.py',
+    'test.support.testresult': 'test/support/testresult.py',
+    'test.support.threading_helper': 'test/support/threading_helper.py',
+    'test.support.warnings_helper': 'test/support/warnings_helper.py',
+    'test.test___all__': 'test/test___all__.py',
+    'test.test___future__': 'test/test___future__.py',
+    'test.test__locale': 'test/test__locale.py',
+    'test.test__opcode': 'test/test__opcode.py',
+    'test.test__osx_support': 'test/test__osx_support.py',
+    'test.test__xxsubinterpreters': 'test/test__xxsubinterpreters.py',
+    'test.test_abc': 'test/test_abc.py',
+    'test.test_abstract_numbers': 'test/test_abstract_numbers.py',
+    'test.test_aifc': 'test/test_aifc.py',
+    'test.test_argparse': 'test/test_argparse.py',
+    'test.test_array': 'test/test_array.py',
+    'test.test_asdl_parser': 'test/test_asdl_parser.py',
+    'test.test_ast': 'test/test_ast.py',
+    'test.test_asyncgen': 'test/test_asyncgen.py',
+    'test.test_asynchat': 'test/test_asynchat.py',
+    'test.test_asyncio': 'test/test_asyncio/__init__.py',
+    'test.test_asyncio.__main__': 'test/test_asyncio/__main__.py',
+    'test.test_asyncio.echo': 'test/test_asyncio/echo.py',
+    'test.test_asyncio.echo2': 'test/test_asyncio/echo2.py',
+    'test.test_asyncio.echo3': 'test/test_asyncio/echo3.py',
+    'test.test_asyncio.functional': 'test/test_asyncio/functional.py',
+    'test.test_asyncio.test_base_events': 'test/test_asyncio/test_base_events.py',
+    'test.test_asyncio.test_buffered_proto': 'test/test_asyncio/test_buffered_proto.py',
+    'test.test_asyncio.test_context': 'test/test_asyncio/test_context.py',
+    'test.test_asyncio.test_events': 'test/test_asyncio/test_events.py',
+    'test.test_asyncio.test_futures': 'test/test_asyncio/test_futures.py',
+    'test.test_asyncio.test_futures2': 'test/test_asyncio/test_futures2.py',
+    'test.test_asyncio.test_locks': 'test/test_asyncio/test_locks.py',
+    'test.test_asyncio.test_pep492': 'test/test_asyncio/test_pep492.py',
+    'test.test_asyncio.test_proactor_events': 'test/test_asyncio/test_proactor_events.py',
+    'test.test_asyncio.test_protocols': 'test/test_asyncio/test_protocols.py',
+    'test.test_asyncio.test_queues': 'test/test_asyncio/test_queues.py',
+    'test.test_asyncio.test_runners': 'test/test_asyncio/test_runners.py',
+    'test.test_asyncio.test_selector_events': 'test/test_asyncio/test_selector_events.py',
+    'test.test_asyncio.test_sendfile': 'test/test_asyncio/test_sendfile.py',
+    'test.test_asyncio.test_server': 'test/test_asyncio/test_server.py',
+    'test.test_asyncio.test_sock_lowlevel': 'test/test_asyncio/test_sock_lowlevel.py',
+    'test.test_asyncio.test_sslproto': 'test/test_asyncio/test_sslproto.py',
+    'test.test_asyncio.test_streams': 'test/test_asyncio/test_streams.py',
+    'test.test_asyncio.test_subprocess': 'test/test_asyncio/test_subprocess.py',
+    'test.test_asyncio.test_tasks': 'test/test_asyncio/test_tasks.py',
+    'test.test_asyncio.test_threads': 'test/test_asyncio/test_threads.py',
+    'test.test_asyncio.test_transports': 'test/test_asyncio/test_transports.py',
+    'test.test_asyncio.test_unix_events': 'test/test_asyncio/test_unix_events.py',
+    'test.test_asyncio.test_waitfor': 'test/test_asyncio/test_waitfor.py',
+    'test.test_asyncio.test_windows_events': 'test/test_asyncio/test_windows_events.py',
+    'test.test_asyncio.test_windows_utils': 'test/test_asyncio/test_windows_utils.py',
+    'test.test_asyncio.utils': 'test/test_asyncio/utils.py',
+    'test.test_asyncore': 'test/test_asyncore.py',
+    'test.test_atexit': 'test/test_atexit.py',
+    'test.test_audioop': 'test/test_audioop.py',
+    'test.test_audit': 'test/test_audit.py',
+    'test.test_augassign': 'test/test_augassign.py',
+    'test.test_base64': 'test/test_base64.py',
+    'test.test_baseexception': 'test/test_baseexception.py',
+    'test.test_bdb': 'test/test_bdb.py',
+    'test.test_bigaddrspace': 'test/test_bigaddrspace.py',
+    'test.test_bigmem': 'test/test_bigmem.py',
+    'test.test_binascii': 'test/test_binascii.py',
+    'test.test_binhex': 'test/test_binhex.py',
+    'test.test_binop': 'test/test_binop.py',
+    'test.test_bisect': 'test/test_bisect.py',
+    'test.test_bool': 'test/test_bool.py',
+    'test.test_buffer': 'test/test_buffer.py',
+    'test.test_bufio': 'test/test_bufio.py',
+    'test.test_builtin': 'test/test_builtin.py',
+    'test.test_bytes': 'test/test_bytes.py',
+    'test.test_bz2': 'test/test_bz2.py',
+    'test.test_c_locale_coercion': 'test/test_c_locale_coercion.py',
+    'test.test_calendar': 'test/test_calendar.py',
+    'test.test_call': 'test/test_call.py',
+    'test.test_cgi': 'test/test_cgi.py',
+    'test.test_cgitb': 'test/test_cgitb.py',
+    'test.test_charmapcodec': 'test/test_charmapcodec.py',
+    'test.test_check_c_globals': 'test/test_check_c_globals.py',
+    'test.test_class': 'test/test_class.py',
+    'test.test_clinic': 'test/test_clinic.py',
+    'test.test_cmath': 'test/test_cmath.py',
+    'test.test_cmd': 'test/test_cmd.py',
+    'test.test_cmd_line': 'test/test_cmd_line.py',
+    'test.test_cmd_line_script': 'test/test_cmd_line_script.py',
+    'test.test_code': 'test/test_code.py',
+    'test.test_code_module': 'test/test_code_module.py',
+    'test.test_codeccallbacks': 'test/test_codeccallbacks.py',
+    'test.test_codecencodings_cn': 'test/test_codecencodings_cn.py',
+    'test.test_codecencodings_hk': 'test/test_codecencodings_hk.py',
+    'test.test_codecencodings_iso2022': 'test/test_codecencodings_iso2022.py',
+    'test.test_codecencodings_jp': 'test/test_codecencodings_jp.py',
+    'test.test_codecencodings_kr': 'test/test_codecencodings_kr.py',
+    'test.test_codecencodings_tw': 'test/test_codecencodings_tw.py',
+    'test.test_codecmaps_cn': 'test/test_codecmaps_cn.py',
+    'test.test_codecmaps_hk': 'test/test_codecmaps_hk.py',
+    'test.test_codecmaps_jp': 'test/test_codecmaps_jp.py',
+    'test.test_codecmaps_kr': 'test/test_codecmaps_kr.py',
+    'test.test_codecmaps_tw': 'test/test_codecmaps_tw.py',
+    'test.test_codecs': 'test/test_codecs.py',
+    'test.test_codeop': 'test/test_codeop.py',
+    'test.test_collections': 'test/test_collections.py',
+    'test.test_colorsys': 'test/test_colorsys.py',
+    'test.test_compare': 'test/test_compare.py',
+    'test.test_compile': 'test/test_compile.py',
+    'test.test_compileall': 'test/test_compileall.py',
+    'test.test_complex': 'test/test_complex.py',
+    'test.test_concurrent_futures': 'test/test_concurrent_futures.py',
+    'test.test_configparser': 'test/test_configparser.py',
+    'test.test_contains': 'test/test_contains.py',
+    'test.test_context': 'test/test_context.py',
+    'test.test_contextlib': 'test/test_contextlib.py',
+    'test.test_contextlib_async': 'test/test_contextlib_async.py',
+    'test.test_copy': 'test/test_copy.py',
+    'test.test_copyreg': 'test/test_copyreg.py',
+    'test.test_coroutines': 'test/test_coroutines.py',
+    'test.test_cprofile': 'test/test_cprofile.py',
+    'test.test_crashers': 'test/test_crashers.py',
+    'test.test_crypt': 'test/test_crypt.py',
+    'test.test_csv': 'test/test_csv.py',
+    'test.test_ctypes': 'test/test_ctypes.py',
+    'test.test_curses': 'test/test_curses.py',
+    'test.test_dataclasses': 'test/test_dataclasses.py',
+    'test.test_datetime': 'test/test_datetime.py',
+    'test.test_dbm': 'test/test_dbm.py',
+    'test.test_dbm_dumb': 'test/test_dbm_dumb.py',
+    'test.test_dbm_gnu': 'test/test_dbm_gnu.py',
+    'test.test_dbm_ndbm': 'test/test_dbm_ndbm.py',
+    'test.test_decimal': 'test/test_decimal.py',
+    'test.test_decorators': 'test/test_decorators.py',
+    'test.test_defaultdict': 'test/test_defaultdict.py',
+    'test.test_deque': 'test/test_deque.py',
+    'test.test_descr': 'test/test_descr.py',
+    'test.test_descrtut': 'test/test_descrtut.py',
+    'test.test_devpoll': 'test/test_devpoll.py',
+    'test.test_dict': 'test/test_dict.py',
+    'test.test_dict_version': 'test/test_dict_version.py',
+    'test.test_dictcomps': 'test/test_dictcomps.py',
+    'test.test_dictviews': 'test/test_dictviews.py',
+    'test.test_difflib': 'test/test_difflib.py',
+    'test.test_dis': 'test/test_dis.py',
+    'test.test_distutils': 'test/test_distutils.py',
+    'test.test_doctest': 'test/test_doctest.py',
+    'test.test_doctest2': 'test/test_doctest2.py',
+    'test.test_docxmlrpc': 'test/test_docxmlrpc.py',
+    'test.test_dtrace': 'test/test_dtrace.py',
+    'test.test_dynamic': 'test/test_dynamic.py',
+    'test.test_dynamicclassattribute': 'test/test_dynamicclassattribute.py',
+    'test.test_eintr': 'test/test_eintr.py',
+    'test.test_email': 'test/test_email/__init__.py',
+    'test.test_email.__main__': 'test/test_email/__main__.py',
+    'test.test_email.test__encoded_words': 'test/test_email/test__encoded_words.py',
+    'test.test_email.test__header_value_parser': 'test/test_email/test__header_value_parser.py',
+    'test.test_email.test_asian_codecs': 'test/test_email/test_asian_codecs.py',
+    'test.test_email.test_contentmanager': 'test/test_email/test_contentmanager.py',
+    'test.test_email.test_defect_handling': 'test/test_email/test_defect_handling.py',
+    'test.test_email.test_email': 'test/test_email/test_email.py',
+    'test.test_email.test_generator': 'test/test_email/test_generator.py',
+    'test.test_email.test_headerregistry': 'test/test_email/test_headerregistry.py',
+    'test.test_email.test_inversion': 'test/test_email/test_inversion.py',
+    'test.test_email.test_message': 'test/test_email/test_message.py',
+    'test.test_email.test_parser': 'test/test_email/test_parser.py',
+    'test.test_email.test_pickleable': 'test/test_email/test_pickleable.py',
+    'test.test_email.test_policy': 'test/test_email/test_policy.py',
+    'test.test_email.test_utils': 'test/test_email/test_utils.py',
+    'test.test_email.torture_test': 'test/test_email/torture_test.py',
+    'test.test_embed': 'test/test_embed.py',
+    'test.test_ensurepip': 'test/test_ensurepip.py',
+    'test.test_enum': 'test/test_enum.py',
+    'test.test_enumerate': 'test/test_enumerate.py',
+    'test.test_eof': 'test/test_eof.py',
+    'test.test_epoll': 'test/test_epoll.py',
+    'test.test_errno': 'test/test_errno.py',
+    'test.test_exception_hierarchy': 'test/test_exception_hierarchy.py',
+    'test.test_exception_variations': 'test/test_exception_variations.py',
+    'test.test_exceptions': 'test/test_exceptions.py',
+    'test.test_extcall': 'test/test_extcall.py',
+    'test.test_faulthandler': 'test/test_faulthandler.py',
+    'test.test_fcntl': 'test/test_fcntl.py',
+    'test.test_file': 'test/test_file.py',
+    'test.test_file_eintr': 'test/test_file_eintr.py',
+    'test.test_filecmp': 'test/test_filecmp.py',
+    'test.test_fileinput': 'test/test_fileinput.py',
+    'test.test_fileio': 'test/test_fileio.py',
+    'test.test_finalization': 'test/test_finalization.py',
+    'test.test_float': 'test/test_float.py',
+    'test.test_flufl': 'test/test_flufl.py',
+    'test.test_fnmatch': 'test/test_fnmatch.py',
+    'test.test_fork1': 'test/test_fork1.py',
+    'test.test_format': 'test/test_format.py',
+    'test.test_fractions': 'test/test_fractions.py',
+    'test.test_frame': 'test/test_frame.py',
+    'test.test_frozen': 'test/test_frozen.py',
+    'test.test_fstring': 'test/test_fstring.py',
+    'test.test_ftplib': 'test/test_ftplib.py',
+    'test.test_funcattrs': 'test/test_funcattrs.py',
+    'test.test_functools': 'test/test_functools.py',
+    'test.test_future': 'test/test_future.py',
+    'test.test_future3': 'test/test_future3.py',
+    'test.test_future4': 'test/test_future4.py',
+    'test.test_future5': 'test/test_future5.py',
+    'test.test_gc': 'test/test_gc.py',
+    'test.test_gdb': 'test/test_gdb.py',
+    'test.test_generator_stop': 'test/test_generator_stop.py',
+    'test.test_generators': 'test/test_generators.py',
+    'test.test_genericalias': 'test/test_genericalias.py',
+    'test.test_genericclass': 'test/test_genericclass.py',
+    'test.test_genericpath': 'test/test_genericpath.py',
+    'test.test_genexps': 'test/test_genexps.py',
+    'test.test_getopt': 'test/test_getopt.py',
+    'test.test_getpass': 'test/test_getpass.py',
+    'test.test_gettext': 'test/test_gettext.py',
+    'test.test_glob': 'test/test_glob.py',
+    'test.test_global': 'test/test_global.py',
+    'test.test_grammar': 'test/test_grammar.py',
+    'test.test_graphlib': 'test/test_graphlib.py',
+    'test.test_grp': 'test/test_grp.py',
+    'test.test_gzip': 'test/test_gzip.py',
+    'test.test_hash': 'test/test_hash.py',
+    'test.test_hashlib': 'test/test_hashlib.py',
+    'test.test_heapq': 'test/test_heapq.py',
+    'test.test_hmac': 'test/test_hmac.py',
+    'test.test_html': 'test/test_html.py',
+    'test.test_htmlparser': 'test/test_htmlparser.py',
+    'test.test_http_cookiejar': 'test/test_http_cookiejar.py',
+    'test.test_http_cookies': 'test/test_http_cookies.py',
+    'test.test_httplib': 'test/test_httplib.py',
+    'test.test_httpservers': 'test/test_httpservers.py',
+    'test.test_idle': 'test/test_idle.py',
+    'test.test_imaplib': 'test/test_imaplib.py',
+    'test.test_imghdr': 'test/test_imghdr.py',
+    'test.test_imp': 'test/test_imp.py',
+    'test.test_import': 'test/test_import/__init__.py',
+    'test.test_import.__main__': 'test/test_import/__main__.py',
+    'test.test_importlib': 'test/test_importlib/__init__.py',
+    'test.test_importlib.__main__': 'test/test_importlib/__main__.py',
+    'test.test_importlib.abc': 'test/test_importlib/abc.py',
+    'test.test_importlib.builtin': 'test/test_importlib/builtin/__init__.py',
+    'test.test_importlib.builtin.__main__': 'test/test_importlib/builtin/__main__.py',
+    'test.test_importlib.builtin.test_finder': 'test/test_importlib/builtin/test_finder.py',
+    'test.test_importlib.builtin.test_loader': 'test/test_importlib/builtin/test_loader.py',
+    'test.test_importlib.data': 'test/test_importlib/data/__init__.py',
+    'test.test_importlib.data01': 'test/test_importlib/data01/__init__.py',
+    'test.test_importlib.data01.subdirectory': 'test/test_importlib/data01/subdirectory/__init__.py',
+    'test.test_importlib.data02': 'test/test_importlib/data02/__init__.py',
+    'test.test_importlib.data02.one': 'test/test_importlib/data02/one/__init__.py',
+    'test.test_importlib.data02.two': 'test/test_importlib/data02/two/__init__.py',
+    'test.test_importlib.data03': 'test/test_importlib/data03/__init__.py',
+    'test.test_importlib.extension': 'test/test_importlib/extension/__init__.py',
+    'test.test_importlib.extension.__main__': 'test/test_importlib/extension/__main__.py',
+    'test.test_importlib.extension.test_case_sensitivity': 'test/test_importlib/extension/test_case_sensitivity.py',
+    'test.test_importlib.extension.test_finder': 'test/test_importlib/extension/test_finder.py',
+    'test.test_importlib.extension.test_loader': 'test/test_importlib/extension/test_loader.py',
+    'test.test_importlib.extension.test_path_hook': 'test/test_importlib/extension/test_path_hook.py',
+    'test.test_importlib.fixtures': 'test/test_importlib/fixtures.py',
+    'test.test_importlib.frozen': 'test/test_importlib/frozen/__init__.py',
+    'test.test_importlib.frozen.__main__': 'test/test_importlib/frozen/__main__.py',
+    'test.test_importlib.frozen.test_finder': 'test/test_importlib/frozen/test_finder.py',
+    'test.test_importlib.frozen.test_loader': 'test/test_importlib/frozen/test_loader.py',
+    'test.test_importlib.import_': 'test/test_importlib/import_/__init__.py',
+    'test.test_importlib.import_.__main__': 'test/test_importlib/import_/__main__.py',
+    'test.test_importlib.import_.test___loader__': 'test/test_importlib/import_/test___loader__.py',
+    'test.test_importlib.import_.test___package__': 'test/test_importlib/import_/test___package__.py',
+    'test.test_importlib.import_.test_api': 'test/test_importlib/import_/test_api.py',
+    'test.test_importlib.import_.test_caching': 'test/test_importlib/import_/test_caching.py',
+    'test.test_importlib.import_.test_fromlist': 'test/test_importlib/import_/test_fromlist.py',
+    'test.test_importlib.import_.test_meta_path': 'test/test_importlib/import_/test_meta_path.py',
+    'test.test_importlib.import_.test_packages': 'test/test_importlib/import_/test_packages.py',
+    'test.test_importlib.import_.test_path': 'test/test_importlib/import_/test_path.py',
+    'test.test_importlib.import_.test_relative_imports': 'test/test_importlib/import_/test_relative_imports.py',
+    'test.test_importlib.source': 'test/test_importlib/source/__init__.py',
+    'test.test_importlib.source.__main__': 'test/test_importlib/source/__main__.py',
+    'test.test_importlib.source.test_case_sensitivity': 'test/test_importlib/source/test_case_sensitivity.py',
+    'test.test_importlib.source.test_file_loader': 'test/test_importlib/source/test_file_loader.py',
+    'test.test_importlib.source.test_finder': 'test/test_importlib/source/test_finder.py',
+    'test.test_importlib.source.test_path_hook': 'test/test_importlib/source/test_path_hook.py',
+    'test.test_importlib.source.test_source_encoding': 'test/test_importlib/source/test_source_encoding.py',
+    'test.test_importlib.stubs': 'test/test_importlib/stubs.py',
+    'test.test_importlib.test_abc': 'test/test_importlib/test_abc.py',
+    'test.test_importlib.test_api': 'test/test_importlib/test_api.py',
+    'test.test_importlib.test_files': 'test/test_importlib/test_files.py',
+    'test.test_importlib.test_lazy': 'test/test_importlib/test_lazy.py',
+    'test.test_importlib.test_locks': 'test/test_importlib/test_locks.py',
+    'test.test_importlib.test_main': 'test/test_importlib/test_main.py',
+    'test.test_importlib.test_metadata_api': 'test/test_importlib/test_metadata_api.py',
+    'test.test_importlib.test_namespace_pkgs': 'test/test_importlib/test_namespace_pkgs.py',
+    'test.test_importlib.test_open': 'test/test_importlib/test_open.py',
+    'test.test_importlib.test_path': 'test/test_importlib/test_path.py',
+    'test.test_importlib.test_pkg_import': 'test/test_importlib/test_pkg_import.py',
+    'test.test_importlib.test_read': 'test/test_importlib/test_read.py',
+    'test.test_importlib.test_reader': 'test/test_importlib/test_reader.py',
+    'test.test_importlib.test_resource': 'test/test_importlib/test_resource.py',
+    'test.test_importlib.test_spec': 'test/test_importlib/test_spec.py',
+    'test.test_importlib.test_threaded_import': 'test/test_importlib/test_threaded_import.py',
+    'test.test_importlib.test_util': 'test/test_importlib/test_util.py',
+    'test.test_importlib.test_windows': 'test/test_importlib/test_windows.py',
+    'test.test_importlib.test_zip': 'test/test_importlib/test_zip.py',
+    'test.test_importlib.threaded_import_hangers': 'test/test_importlib/threaded_import_hangers.py',
+    'test.test_importlib.util': 'test/test_importlib/util.py',
+    'test.test_importlib.zipdata01': 'test/test_importlib/zipdata01/__init__.py',
+    'test.test_importlib.zipdata02': 'test/test_importlib/zipdata02/__init__.py',
+    'test.test_index': 'test/test_index.py',
+    'test.test_inspect': 'test/test_inspect.py',
+    'test.test_int': 'test/test_int.py',
+    'test.test_int_literal': 'test/test_int_literal.py',
+    'test.test_interpreters': 'test/test_interpreters.py',
+    'test.test_io': 'test/test_io.py',
+    'test.test_ioctl': 'test/test_ioctl.py',
+    'test.test_ipaddress': 'test/test_ipaddress.py',
+    'test.test_isinstance': 'test/test_isinstance.py',
+    'test.test_iter': 'test/test_iter.py',
+    'test.test_iterlen': 'test/test_iterlen.py',
+    'test.test_itertools': 'test/test_itertools.py',
+    'test.test_json': 'test/test_json/__init__.py',
+    'test.test_json.__main__': 'test/test_json/__main__.py',
+    'test.test_json.test_decode': 'test/test_json/test_decode.py',
+    'test.test_json.test_default': 'test/test_json/test_default.py',
+    'test.test_json.test_dump': 'test/test_json/test_dump.py',
+    'test.test_json.test_encode_basestring_ascii': 'test/test_json/test_encode_basestring_ascii.py',
+    'test.test_json.test_enum': 'test/test_json/test_enum.py',
+    'test.test_json.test_fail': 'test/test_json/test_fail.py',
+    'test.test_json.test_float': 'test/test_json/test_float.py',
+    'test.test_json.test_indent': 'test/test_json/test_indent.py',
+    'test.test_json.test_pass1': 'test/test_json/test_pass1.py',
+    'test.test_json.test_pass2': 'test/test_json/test_pass2.py',
+    'test.test_json.test_pass3': 'test/test_json/test_pass3.py',
+    'test.test_json.test_recursion': 'test/test_json/test_recursion.py',
+    'test.test_json.test_scanstring': 'test/test_json/test_scanstring.py',
+    'test.test_json.test_separators': 'test/test_json/test_separators.py',
+    'test.test_json.test_speedups': 'test/test_json/test_speedups.py',
+    'test.test_json.test_tool': 'test/test_json/test_tool.py',
+    'test.test_json.test_unicode': 'test/test_json/test_unicode.py',
+    'test.test_keyword': 'test/test_keyword.py',
+    'test.test_keywordonlyarg': 'test/test_keywordonlyarg.py',
+    'test.test_kqueue': 'test/test_kqueue.py',
+    'test.test_largefile': 'test/test_largefile.py',
+    'test.test_lib2to3': 'test/test_lib2to3.py',
+    'test.test_linecache': 'test/test_linecache.py',
+    'test.test_list': 'test/test_list.py',
+    'test.test_listcomps': 'test/test_listcomps.py',
+    'test.test_lltrace': 'test/test_lltrace.py',
+    'test.test_locale': 'test/test_locale.py',
+    'test.test_logging': 'test/test_logging.py',
+    'test.test_long': 'test/test_long.py',
+    'test.test_longexp': 'test/test_longexp.py',
+    'test.test_lzma': 'test/test_lzma.py',
+    'test.test_mailbox': 'test/test_mailbox.py',
+    'test.test_mailcap': 'test/test_mailcap.py',
+    'test.test_marshal': 'test/test_marshal.py',
+    'test.test_math': 'test/test_math.py',
+    'test.test_memoryio': 'test/test_memoryio.py',
+    'test.test_memoryview': 'test/test_memoryview.py',
+    'test.test_metaclass': 'test/test_metaclass.py',
+    'test.test_mimetypes': 'test/test_mimetypes.py',
+    'test.test_minidom': 'test/test_minidom.py',
+    'test.test_mmap': 'test/test_mmap.py',
+    'test.test_module': 'test/test_module.py',
+    'test.test_modulefinder': 'test/test_modulefinder.py',
+    'test.test_msilib': 'test/test_msilib.py',
+    'test.test_multibytecodec': 'test/test_multibytecodec.py',
+    'test.test_multiprocessing_fork': 'test/test_multiprocessing_fork.py',
+    'test.test_multiprocessing_forkserver': 'test/test_multiprocessing_forkserver.py',
+    'test.test_multiprocessing_main_handling': 'test/test_multiprocessing_main_handling.py',
+    'test.test_multiprocessing_spawn': 'test/test_multiprocessing_spawn.py',
+    'test.test_named_expressions': 'test/test_named_expressions.py',
+    'test.test_netrc': 'test/test_netrc.py',
+    'test.test_nis': 'test/test_nis.py',
+    'test.test_nntplib': 'test/test_nntplib.py',
+    'test.test_ntpath': 'test/test_ntpath.py',
+    'test.test_numeric_tower': 'test/test_numeric_tower.py',
+    'test.test_opcache': 'test/test_opcache.py',
+    'test.test_opcodes': 'test/test_opcodes.py',
+    'test.test_openpty': 'test/test_openpty.py',
+    'test.test_operator': 'test/test_operator.py',
+    'test.test_optparse': 'test/test_optparse.py',
+    'test.test_ordered_dict': 'test/test_ordered_dict.py',
+    'test.test_os': 'test/test_os.py',
+    'test.test_ossaudiodev': 'test/test_ossaudiodev.py',
+    'test.test_osx_env': 'test/test_osx_env.py',
+    'test.test_pathlib': 'test/test_pathlib.py',
+    'test.test_patma': 'test/test_patma.py',
+    'test.test_pdb': 'test/test_pdb.py',
+    'test.test_peepholer': 'test/test_peepholer.py',
+    'test.test_peg_generator': 'test/test_peg_generator/__init__.py',
+    'test.test_peg_generator.__main__': 'test/test_peg_generator/__main__.py',
+    'test.test_peg_generator.test_c_parser': 'test/test_peg_generator/test_c_parser.py',
+    'test.test_peg_generator.test_first_sets': 'test/test_peg_generator/test_first_sets.py',
+    'test.test_peg_generator.test_grammar_validator': 'test/test_peg_generator/test_grammar_validator.py',
+    'test.test_peg_generator.test_pegen': 'test/test_peg_generator/test_pegen.py',
+    'test.test_pickle': 'test/test_pickle.py',
+    'test.test_picklebuffer': 'test/test_picklebuffer.py',
+    'test.test_pickletools': 'test/test_pickletools.py',
+    'test.test_pipes': 'test/test_pipes.py',
+    'test.test_pkg': 'test/test_pkg.py',
+    'test.test_pkgutil': 'test/test_pkgutil.py',
+    'test.test_platform': 'test/test_platform.py',
+    'test.test_plistlib': 'test/test_plistlib.py',
+    'test.test_poll': 'test/test_poll.py',
+    'test.test_popen': 'test/test_popen.py',
+    'test.test_poplib': 'test/test_poplib.py',
+    'test.test_positional_only_arg': 'test/test_positional_only_arg.py',
+    'test.test_posix': 'test/test_posix.py',
+    'test.test_posixpath': 'test/test_posixpath.py',
+    'test.test_pow': 'test/test_pow.py',
+    'test.test_pprint': 'test/test_pprint.py',
+    'test.test_print': 'test/test_print.py',
+    'test.test_profile': 'test/test_profile.py',
+    'test.test_property': 'test/test_property.py',
+    'test.test_pstats': 'test/test_pstats.py',
+    'test.test_pty': 'test/test_pty.py',
+    'test.test_pulldom': 'test/test_pulldom.py',
+    'test.test_pwd': 'test/test_pwd.py',
+    'test.test_py_compile': 'test/test_py_compile.py',
+    'test.test_pyclbr': 'test/test_pyclbr.py',
+    'test.test_pydoc': 'test/test_pydoc.py',
+    'test.test_pyexpat': 'test/test_pyexpat.py',
+    'test.test_queue': 'test/test_queue.py',
+    'test.test_quopri': 'test/test_quopri.py',
+    'test.test_raise': 'test/test_raise.py',
+    'test.test_random': 'test/test_random.py',
+    'test.test_range': 'test/test_range.py',
+    'test.test_re': 'test/test_re.py',
+    'test.test_readline': 'test/test_readline.py',
+    'test.test_regrtest': 'test/test_regrtest.py',
+    'test.test_repl': 'test/test_repl.py',
+    'test.test_reprlib': 'test/test_reprlib.py',
+    'test.test_resource': 'test/test_resource.py',
+    'test.test_richcmp': 'test/test_richcmp.py',
+    'test.test_rlcompleter': 'test/test_rlcompleter.py',
+    'test.test_robotparser': 'test/test_robotparser.py',
+    'test.test_runpy': 'test/test_runpy.py',
+    'test.test_sax': 'test/test_sax.py',
+    'test.test_sched': 'test/test_sched.py',
+    'test.test_scope': 'test/test_scope.py',
+    'test.test_script_helper': 'test/test_script_helper.py',
+    'test.test_secrets': 'test/test_secrets.py',
+    'test.test_select': 'test/test_select.py',
+    'test.test_selectors': 'test/test_selectors.py',
+    'test.test_set': 'test/test_set.py',
+    'test.test_setcomps': 'test/test_setcomps.py',
+    'test.test_shelve': 'test/test_shelve.py',
+    'test.test_shlex': 'test/test_shlex.py',
+    'test.test_shutil': 'test/test_shutil.py',
+    'test.test_signal': 'test/test_signal.py',
+    'test.test_site': 'test/test_site.py',
+    'test.test_slice': 'test/test_slice.py',
+    'test.test_smtpd': 'test/test_smtpd.py',
+    'test.test_smtplib': 'test/test_smtplib.py',
+    'test.test_smtpnet': 'test/test_smtpnet.py',
+    'test.test_sndhdr': 'test/test_sndhdr.py',
+    'test.test_socket': 'test/test_socket.py',
+    'test.test_socketserver': 'test/test_socketserver.py',
+    'test.test_sort': 'test/test_sort.py',
+    'test.test_source_encoding': 'test/test_source_encoding.py',
+    'test.test_spwd': 'test/test_spwd.py',
+    'test.test_sqlite': 'test/test_sqlite.py',
+    'test.test_ssl': 'test/test_ssl.py',
+    'test.test_startfile': 'test/test_startfile.py',
+    'test.test_stat': 'test/test_stat.py',
+    'test.test_statistics': 'test/test_statistics.py',
+    'test.test_strftime': 'test/test_strftime.py',
+    'test.test_string': 'test/test_string.py',
+    'test.test_string_literals': 'test/test_string_literals.py',
+    'test.test_stringprep': 'test/test_stringprep.py',
+    'test.test_strptime': 'test/test_strptime.py',
+    'test.test_strtod': 'test/test_strtod.py',
+    'test.test_struct': 'test/test_struct.py',
+    'test.test_structseq': 'test/test_structseq.py',
+    'test.test_subclassinit': 'test/test_subclassinit.py',
+    'test.test_subprocess': 'test/test_subprocess.py',
+    'test.test_sunau': 'test/test_sunau.py',
+    'test.test_sundry': 'test/test_sundry.py',
+    'test.test_super': 'test/test_super.py',
+    'test.test_support': 'test/test_support.py',
+    'test.test_symtable': 'test/test_symtable.py',
+    'test.test_syntax': 'test/test_syntax.py',
+    'test.test_sys': 'test/test_sys.py',
+    'test.test_sys_setprofile': 'test/test_sys_setprofile.py',
+    'test.test_sys_settrace': 'test/test_sys_settrace.py',
+    'test.test_sysconfig': 'test/test_sysconfig.py',
+    'test.test_syslog': 'test/test_syslog.py',
+    'test.test_tabnanny': 'test/test_tabnanny.py',
+    'test.test_tarfile': 'test/test_tarfile.py',
+    'test.test_tcl': 'test/test_tcl.py',
+    'test.test_telnetlib': 'test/test_telnetlib.py',
+    'test.test_tempfile': 'test/test_tempfile.py',
+    'test.test_textwrap': 'test/test_textwrap.py',
+    'test.test_thread': 'test/test_thread.py',
+    'test.test_threadedtempfile': 'test/test_threadedtempfile.py',
+    'test.test_threading': 'test/test_threading.py',
+    'test.test_threading_local': 'test/test_threading_local.py',
+    'test.test_threadsignals': 'test/test_threadsignals.py',
+    'test.test_time': 'test/test_time.py',
+    'test.test_timeit': 'test/test_timeit.py',
+    'test.test_timeout': 'test/test_timeout.py',
+    'test.test_tix': 'test/test_tix.py',
+    'test.test_tk': 'test/test_tk.py',
+    'test.test_tokenize': 'test/test_tokenize.py',
+    'test.test_tools': 'test/test_tools/__init__.py',
+    'test.test_tools.__main__': 'test/test_tools/__main__.py',
+    'test.test_tools.test_fixcid': 'test/test_tools/test_fixcid.py',
+    'test.test_tools.test_gprof2html': 'test/test_tools/test_gprof2html.py',
+    'test.test_tools.test_i18n': 'test/test_tools/test_i18n.py',
+    'test.test_tools.test_lll': 'test/test_tools/test_lll.py',
+    'test.test_tools.test_md5sum': 'test/test_tools/test_md5sum.py',
+    'test.test_tools.test_pathfix': 'test/test_tools/test_pathfix.py',
+    'test.test_tools.test_pdeps': 'test/test_tools/test_pdeps.py',
+    'test.test_tools.test_pindent': 'test/test_tools/test_pindent.py',
+    'test.test_tools.test_reindent': 'test/test_tools/test_reindent.py',
+    'test.test_tools.test_sundry': 'test/test_tools/test_sundry.py',
+    'test.test_trace': 'test/test_trace.py',
+    'test.test_traceback': 'test/test_traceback.py',
+    'test.test_tracemalloc': 'test/test_tracemalloc.py',
+    'test.test_ttk_guionly': 'test/test_ttk_guionly.py',
+    'test.test_ttk_textonly': 'test/test_ttk_textonly.py',
+    'test.test_tuple': 'test/test_tuple.py',
+    'test.test_turtle': 'test/test_turtle.py',
+    'test.test_type_annotations': 'test/test_type_annotations.py',
+    'test.test_type_comments': 'test/test_type_comments.py',
+    'test.test_typechecks': 'test/test_typechecks.py',
+    'test.test_types': 'test/test_types.py',
+    'test.test_typing': 'test/test_typing.py',
+    'test.test_ucn': 'test/test_ucn.py',
+    'test.test_unary': 'test/test_unary.py',
+    'test.test_unicode': 'test/test_unicode.py',
+    'test.test_unicode_file': 'test/test_unicode_file.py',
+    'test.test_unicode_file_functions': 'test/test_unicode_file_functions.py',
+    'test.test_unicode_identifiers': 'test/test_unicode_identifiers.py',
+    'test.test_unicodedata': 'test/test_unicodedata.py',
+    'test.test_unittest': 'test/test_unittest.py',
+    'test.test_univnewlines': 'test/test_univnewlines.py',
+    'test.test_unpack': 'test/test_unpack.py',
+    'test.test_unpack_ex': 'test/test_unpack_ex.py',
+    'test.test_unparse': 'test/test_unparse.py',
+    'test.test_urllib': 'test/test_urllib.py',
+    'test.test_urllib2': 'test/test_urllib2.py',
+    'test.test_urllib2_localnet': 'test/test_urllib2_localnet.py',
+    'test.test_urllib2net': 'test/test_urllib2net.py',
+    'test.test_urllib_response': 'test/test_urllib_response.py',
+    'test.test_urllibnet': 'test/test_urllibnet.py',
+    'test.test_urlparse': 'test/test_urlparse.py',
+    'test.test_userdict': 'test/test_userdict.py',
+    'test.test_userlist': 'test/test_userlist.py',
+    'test.test_userstring': 'test/test_userstring.py',
+    'test.test_utf8_mode': 'test/test_utf8_mode.py',
+    'test.test_utf8source': 'test/test_utf8source.py',
+    'test.test_uu': 'test/test_uu.py',
+    'test.test_uuid': 'test/test_uuid.py',
+    'test.test_venv': 'test/test_venv.py',
+    'test.test_wait3': 'test/test_wait3.py',
+    'test.test_wait4': 'test/test_wait4.py',
+    'test.test_warnings': 'test/test_warnings/__init__.py',
+    'test.test_warnings.__main__': 'test/test_warnings/__main__.py',
+    'test.test_wave': 'test/test_wave.py',
+    'test.test_weakref': 'test/test_weakref.py',
+    'test.test_weakset': 'test/test_weakset.py',
+    'test.test_webbrowser': 'test/test_webbrowser.py',
+    'test.test_winconsoleio': 'test/test_winconsoleio.py',
+    'test.test_winreg': 'test/test_winreg.py',
+    'test.test_winsound': 'test/test_winsound.py',
+    'test.test_with': 'test/test_with.py',
+    'test.test_wsgiref': 'test/test_wsgiref.py',
+    'test.test_xdrlib': 'test/test_xdrlib.py',
+    'test.test_xml_dom_minicompat': 'test/test_xml_dom_minicompat.py',
+    'test.test_xml_etree': 'test/test_xml_etree.py',
+    'test.test_xml_etree_c': 'test/test_xml_etree_c.py',
+    'test.test_xmlrpc': 'test/test_xmlrpc.py',
+    'test.test_xmlrpc_net': 'test/test_xmlrpc_net.py',
+    'test.test_xxlimited': 'test/test_xxlimited.py',
+    'test.test_xxtestfuzz': 'test/test_xxtestfuzz.py',
+    'test.test_yield_from': 'test/test_yield_from.py',
+    'test.test_zipapp': 'test/test_zipapp.py',
+    'test.test_zipfile': 'test/test_zipfile.py',
+    'test.test_zipfile64': 'test/test_zipfile64.py',
+    'test.test_zipimport': 'test/test_zipimport.py',
+    'test.test_zipimport_support': 'test/test_zipimport_support.py',
+    'test.test_zlib': 'test/test_zlib.py',
+    'test.test_zoneinfo': 'test/test_zoneinfo/__init__.py',
+    'test.test_zoneinfo.__main__': 'test/test_zoneinfo/__main__.py',
+    'test.test_zoneinfo._support': 'test/test_zoneinfo/_support.py',
+    'test.test_zoneinfo.test_zoneinfo': 'test/test_zoneinfo/test_zoneinfo.py',
+    'test.testcodec': 'test/testcodec.py',
+    'test.tf_inherit_check': 'test/tf_inherit_check.py',
+    'test.time_hashlib': 'test/time_hashlib.py',
+    'test.tracedmodules': 'test/tracedmodules/__init__.py',
+    'test.tracedmodules.testmod': 'test/tracedmodules/testmod.py',
+    'test.typinganndata': 'test/typinganndata/__init__.py',
+    'test.typinganndata.ann_module9': 'test/typinganndata/ann_module9.py',
+    'test.win_console_handler': 'test/win_console_handler.py',
+    'test.xmltests': 'test/xmltests.py',
+    'textwrap': 'textwrap.py',
+    'this': 'this.py',
+    'threading': 'threading.py',
+    'timeit': 'timeit.py',
+    'tkinter': 'tkinter/__init__.py',
+    'tkinter.__main__': 'tkinter/__main__.py',
+    'tkinter.colorchooser': 'tkinter/colorchooser.py',
+    'tkinter.commondialog': 'tkinter/commondialog.py',
+    'tkinter.constants': 'tkinter/constants.py',
+    'tkinter.dialog': 'tkinter/dialog.py',
+    'tkinter.dnd': 'tkinter/dnd.py',
+    'tkinter.filedialog': 'tkinter/filedialog.py',
+    'tkinter.font': 'tkinter/font.py',
+    'tkinter.messagebox': 'tkinter/messagebox.py',
+    'tkinter.scrolledtext': 'tkinter/scrolledtext.py',
+    'tkinter.simpledialog': 'tkinter/simpledialog.py',
+    'tkinter.test': 'tkinter/test/__init__.py',
+    'tkinter.test.support': 'tkinter/test/support.py',
+    'tkinter.test.test_tkinter': 'tkinter/test/test_tkinter/__init__.py',
+    'tkinter.test.test_tkinter.test_colorchooser': 'tkinter/test/test_tkinter/test_colorchooser.py',
+    'tkinter.test.test_tkinter.test_font': 'tkinter/test/test_tkinter/test_font.py',
+    'tkinter.test.test_tkinter.test_geometry_managers': 'tkinter/test/test_tkinter/test_geometry_managers.py',
+    'tkinter.test.test_tkinter.test_images': 'tkinter/test/test_tkinter/test_images.py',
+    'tkinter.test.test_tkinter.test_loadtk': 'tkinter/test/test_tkinter/test_loadtk.py',
+    'tkinter.test.test_tkinter.test_messagebox': 'tkinter/test/test_tkinter/test_messagebox.py',
+    'tkinter.test.test_tkinter.test_misc': 'tkinter/test/test_tkinter/test_misc.py',
+    'tkinter.test.test_tkinter.test_simpledialog': 'tkinter/test/test_tkinter/test_simpledialog.py',
+    'tkinter.test.test_tkinter.test_text': 'tkinter/test/test_tkinter/test_text.py',
+    'tkinter.test.test_tkinter.test_variables': 'tkinter/test/test_tkinter/test_variables.py',
+    'tkinter.test.test_tkinter.test_widgets': 'tkinter/test/test_tkinter/test_widgets.py',
+    'tkinter.test.test_ttk': 'tkinter/test/test_ttk/__init__.py',
+    'tkinter.test.test_ttk.test_extensions': 'tkinter/test/test_ttk/test_extensions.py',
+    'tkinter.test.test_ttk.test_style': 'tkinter/test/test_ttk/test_style.py',
+    'tkinter.test.test_ttk.test_widgets': 'tkinter/test/test_ttk/test_widgets.py',
+    'tkinter.test.widget_tests': 'tkinter/test/widget_tests.py',
+    'tkinter.tix': 'tkinter/tix.py',
+    'tkinter.ttk': 'tkinter/ttk.py',
+    'token': 'token.py',
+    'tokenize': 'tokenize.py',
+    'trace': 'trace.py',
+    'traceback': 'traceback.py',
+    'tracemalloc': 'tracemalloc.py',
+    'tty': 'tty.py',
+    'turtle': 'turtle.py',
+    'turtledemo': 'turtledemo/__init__.py',
+    'turtledemo.__main__': 'turtledemo/__main__.py',
+    'turtledemo.bytedesign': 'turtledemo/bytedesign.py',
+    'turtledemo.chaos': 'turtledemo/chaos.py',
+    'turtledemo.clock': 'turtledemo/clock.py',
+    'turtledemo.colormixer': 'turtledemo/colormixer.py',
+    'turtledemo.forest': 'turtledemo/forest.py',
+    'turtledemo.fractalcurves': 'turtledemo/fractalcurves.py',
+    'turtledemo.lindenmayer': 'turtledemo/lindenmayer.py',
+    'turtledemo.minimal_hanoi': 'turtledemo/minimal_hanoi.py',
+    'turtledemo.nim': 'turtledemo/nim.py',
+    'turtledemo.paint': 'turtledemo/paint.py',
+    'turtledemo.peace': 'turtledemo/peace.py',
+    'turtledemo.penrose': 'turtledemo/penrose.py',
+    'turtledemo.planet_and_moon': 'turtledemo/planet_and_moon.py',
+    'turtledemo.rosette': 'turtledemo/rosette.py',
+    'turtledemo.round_dance': 'turtledemo/round_dance.py',
+    'turtledemo.sorting_animate': 'turtledemo/sorting_animate.py',
+    'turtledemo.tree': 'turtledemo/tree.py',
+    'turtledemo.two_canvases': 'turtledemo/two_canvases.py',
+    'turtledemo.yinyang': 'turtledemo/yinyang.py',
+    'types': 'types.py',
+    'typing': 'typing.py',
+    'unicodedata': 'lib-dynload/unicodedata.cpython-310-x86_64-linux-gnu.so',
+    'unittest': 'unittest/__init__.py',
+    'unittest.__main__': 'unittest/__main__.py',
+    'unittest._log': 'unittest/_log.py',
+    'unittest.async_case': 'unittest/async_case.py',
+    'unittest.case': 'unittest/case.py',
+    'unittest.loader': 'unittest/loader.py',
+    'unittest.main': 'unittest/main.py',
+    'unittest.mock': 'unittest/mock.py',
+    'unittest.result': 'unittest/result.py',
+    'unittest.runner': 'unittest/runner.py',
+    'unittest.signals': 'unittest/signals.py',
+    'unittest.suite': 'unittest/suite.py',
+    'unittest.test': 'unittest/test/__init__.py',
+    'unittest.test.__main__': 'unittest/test/__main__.py',
+    'unittest.test._test_warnings': 'unittest/test/_test_warnings.py',
+    'unittest.test.dummy': 'unittest/test/dummy.py',
+    'unittest.test.support': 'unittest/test/support.py',
+    'unittest.test.test_assertions': 'unittest/test/test_assertions.py',
+    'unittest.test.test_async_case': 'unittest/test/test_async_case.py',
+    'unittest.test.test_break': 'unittest/test/test_break.py',
+    'unittest.test.test_case': 'unittest/test/test_case.py',
+    'unittest.test.test_discovery': 'unittest/test/test_discovery.py',
+    'unittest.test.test_functiontestcase': 'unittest/test/test_functiontestcase.py',
+    'unittest.test.test_loader': 'unittest/test/test_loader.py',
+    'unittest.test.test_program': 'unittest/test/test_program.py',
+    'unittest.test.test_result': 'unittest/test/test_result.py',
+    'unittest.test.test_runner': 'unittest/test/test_runner.py',
+    'unittest.test.test_setups': 'unittest/test/test_setups.py',
+    'unittest.test.test_skipping': 'unittest/test/test_skipping.py',
+    'unittest.test.test_suite': 'unittest/test/test_suite.py',
+    'unittest.test.testmock': 'unittest/test/testmock/__init__.py',
+    'unittest.test.testmock.__main__': 'unittest/test/testmock/__main__.py',
+    'unittest.test.testmock.support': 'unittest/test/testmock/support.py',
+    'unittest.test.testmock.testasync': 'unittest/test/testmock/testasync.py',
+    'unittest.test.testmock.testcallable': 'unittest/test/testmock/testcallable.py',
+    'unittest.test.testmock.testhelpers': 'unittest/test/testmock/testhelpers.py',
+    'unittest.test.testmock.testmagicmethods': 'unittest/test/testmock/testmagicmethods.py',
+    'unittest.test.testmock.testmock': 'unittest/test/testmock/testmock.py',
+    'unittest.test.testmock.testpatch': 'unittest/test/testmock/testpatch.py',
+    'unittest.test.testmock.testsealable': 'unittest/test/testmock/testsealable.py',
+    'unittest.test.testmock.testsentinel': 'unittest/test/testmock/testsentinel.py',
+    'unittest.test.testmock.testwith': 'unittest/test/testmock/testwith.py',
+    'unittest.util': 'unittest/util.py',
+    'urllib': 'urllib/__init__.py',
+    'urllib.error': 'urllib/error.py',
+    'urllib.parse': 'urllib/parse.py',
+    'urllib.request': 'urllib/request.py',
+    'urllib.response': 'urllib/response.py',
+    'urllib.robotparser': 'urllib/robotparser.py',
+    'uu': 'uu.py',
+    'uuid': 'uuid.py',
+    'venv': 'venv/__init__.py',
+    'venv.__main__': 'venv/__main__.py',
+    'warnings': 'warnings.py',
+    'wave': 'wave.py',
+    'weakref': 'weakref.py',
+    'webbrowser': 'webbrowser.py',
+    'wsgiref': 'wsgiref/__init__.py',
+    'wsgiref.handlers': 'wsgiref/handlers.py',
+    'wsgiref.headers': 'wsgiref/headers.py',
+    'wsgiref.simple_server': 'wsgiref/simple_server.py',
+    'wsgiref.util': 'wsgiref/util.py',
+    'wsgiref.validate': 'wsgiref/validate.py',
+    'xdrlib': 'xdrlib.py',
+    'xml': 'xml/__init__.py',
+    'xml.dom': 'xml/dom/__init__.py',
+    'xml.dom.NodeFilter': 'xml/dom/NodeFilter.py',
+    'xml.dom.domreg': 'xml/dom/domreg.py',
+    'xml.dom.expatbuilder': 'xml/dom/expatbuilder.py',
+    'xml.dom.minicompat': 'xml/dom/minicompat.py',
+    'xml.dom.minidom': 'xml/dom/minidom.py',
+    'xml.dom.pulldom': 'xml/dom/pulldom.py',
+    'xml.dom.xmlbuilder': 'xml/dom/xmlbuilder.py',
+    'xml.etree': 'xml/etree/__init__.py',
+    'xml.etree.ElementInclude': 'xml/etree/ElementInclude.py',
+    'xml.etree.ElementPath': 'xml/etree/ElementPath.py',
+    'xml.etree.ElementTree': 'xml/etree/ElementTree.py',
+    'xml.etree.cElementTree': 'xml/etree/cElementTree.py',
+    'xml.parsers': 'xml/parsers/__init__.py',
+    'xml.parsers.expat': 'xml/parsers/expat.py',
+    'xml.sax': 'xml/sax/__init__.py',
+    'xml.sax._exceptions': 'xml/sax/_exceptions.py',
+    'xml.sax.expatreader': 'xml/sax/expatreader.py',
+    'xml.sax.handler': 'xml/sax/handler.py',
+    'xml.sax.saxutils': 'xml/sax/saxutils.py',
+    'xml.sax.xmlreader': 'xml/sax/xmlreader.py',
+    'xmlrpc': 'xmlrpc/__init__.py',
+    'xmlrpc.client': 'xmlrpc/client.py',
+    'xmlrpc.server': 'xmlrpc/server.py',
+    'xxlimited': 'lib-dynload/xxlimited.cpython-310-x86_64-linux-gnu.so',
+    'xxlimited_35': 'lib-dynload/xxlimited_35.cpython-310-x86_64-linux-gnu.so',
+    'zipapp': 'zipapp.py',
+    'zipfile': 'zipfile.py',
+    'zipimport': 'zipimport.py',
+    'zlib': 'lib-dynload/zlib.cpython-310-x86_64-linux-gnu.so',
+    'zoneinfo': 'zoneinfo/__init__.py',
+    'zoneinfo._common': 'zoneinfo/_common.py',
+    'zoneinfo._tzpath': 'zoneinfo/_tzpath.py',
+    'zoneinfo._zoneinfo': 'zoneinfo/_zoneinfo.py',
+}
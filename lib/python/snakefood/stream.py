@@ -0,0 +1,137 @@
+"""
+Output the dependencies as the files are processed, for sfood --stream.
+
+The dependencies of each file are written as soon as the file is processed,
+so that the graph is not kept in memory and the output starts right away.  The
+lines of each file are sorted, but the files come in the order they are
+processed.  If sorted output is needed, the dependencies go through an
+external merge sort instead: they are buffered up to a memory budget, and
+each time the budget is exceeded, the buffer is sorted and spilled as a run
+to a temporary file; at the end the runs are merged, which outputs exactly the
+same lines as sfood without --stream.
+"""
+# This file is part of the Snakefood open source package.
+# See http://furius.ca/snakefood/ for licensing details.
+
+import sys, struct, tempfile, logging
+
+from snakefood.depends import read_depends
+from snakefood.merge import merge_depends
+
+__all__ = ('ExternalSort', 'StreamWriter')
+
+
+# The maximum number of runs that are merged at once.
+MAX_RUNS = 64
+
+# The memory taken by a buffered dependency, in addition to the characters of
+# its strings: the three tuples, the headers of the four strings and the slot
+# of the list.  Strings shared with other dependencies are counted for each.
+EDGE_OVERHEAD = (3 * sys.getsizeof((None, None)) + 4 * sys.getsizeof('') +
+                 struct.calcsize('P'))
+
+
+class ExternalSort(object):
+    """Sort dependencies, keeping at most about 'budget' bytes of them in
+    memory, as estimated from the sizes of their objects.  Iterating over the
+    sorter generates the dependencies that were added, in sorted order, without
+    duplicates."""
+
+    def __init__(self, budget, tmpdir=None):
+        self.budget = budget
+        self.tmpdir = tmpdir
+        self.buffer = []
+        self.size = 0
+        self.runs = []        # temporary files of the sorted runs
+
+    def add(self, dep):
+        "Add dependency 'dep'."
+        self.buffer.append(dep)
+        (froot, ffn), (troot, tfn) = dep
+        self.size += EDGE_OVERHEAD + sum(len(s) for s in (froot, ffn, troot, tfn)
+                                         if s is not None)
+        if self.size > self.budget:
+            self.spill()
+
+    def spill(self):
+        "Write the buffered dependencies as a sorted run."
+        if not self.buffer:
+            return
+        self.buffer.sort()
+        self.runs.append(self.write_run(merge_depends([self.buffer])))
+        self.buffer = []
+        self.size = 0
+        if len(self.runs) >= MAX_RUNS:
+            # Merge the runs into one, to bound the number of open files.
+            runs, self.runs = self.runs, []
+            self.runs.append(self.write_run(self.merge_runs(runs)))
+            for f in runs:
+                f.close()
+
+    def write_run(self, depends):
+        "Write 'depends' to a new temporary file and return it."
+        f = tempfile.TemporaryFile(prefix='sfood-sort-', dir=self.tmpdir)
+        write = f.write
+        for dep in depends:
+            write(repr(dep))
+            write('\n')
+        f.seek(0)
+        logging.debug("Spilled a run of the dependencies to a temporary file.")
+        return f
+
+    def merge_runs(self, runs):
+        return merge_depends([read_depends(f, True) for f in runs])
+
+    def __iter__(self):
+        self.buffer.sort()
+        try:
+            for dep in merge_depends([self.merge_runs(self.runs), self.buffer]):
+                yield dep
+        finally:
+            for f in self.runs:
+                f.close()
+            self.runs = []
+            self.buffer = []
+
+
+class StreamWriter(object):
+    """Write the dependencies of each file to 'outfile' as it is processed, or
+    if 'budget' is given, sort all of them within that memory budget and write
+    them at close().  Only the roots of the nodes are kept, and if
+    'keep_targets' is true, the set of the targets."""
+
+    def __init__(self, outfile, budget=None, keep_targets=False):
+        self.outfile = outfile
+        self.sorter = ExternalSort(budget) if budget is not None else None
+        self.roots = set()
+        self.targets = set() if keep_targets else None
+
+    def write_file(self, from_, targets):
+        "Write the dependencies of node 'from_' on 'targets'."
+        self.roots.add(from_[0])
+        self.roots.update(root for root, _ in targets)
+        if self.targets is not None:
+            self.targets.update(targets)
+        write = self.outfile.write
+        sorter = self.sorter
+        for to_ in sorted(targets):
+            dep = (from_, to_)
+            if sorter is not None:
+                sorter.add(dep)
+            else:
+                write(repr(dep))
+                write('\n')
+        if sorter is None:
+            self.outfile.flush()
+
+    def close(self):
+        "Write the sorted dependencies, if sorting."
+        if self.sorter is None:
+            return
+        if self.sorter.runs:
+            logging.info("Merging %d sorted runs of the dependencies." %
+                         len(self.sorter.runs))
+        write = self.outfile.write
+        for dep in self.sorter:
+            write(repr(dep))
+            write('\n')
@@ -0,0 +1,258 @@
+"""
+A persistent cache of the dependencies of the external code reached with --follow.
+
+Following the dependencies of a project goes through the same third-party and
+standard library files on every run, and these rarely change.  This cache
+stores the results of processing the files outside of the input roots, grouped
+in units: the files installed by each distribution (when an index of the
+distributions is available), or else the files of each package root.  A unit
+is keyed by the name, version and modification time of the record of the
+distribution, or by the path and modification time of the root, and by the
+options and the module search path, which affect how imports resolve.  When
+--follow reaches a file of a unit that was expanded before, its results are
+reused instead of parsing the file, and so on through the unit.
+
+Within a unit, the results of each file are reused only if nothing that its
+imports were resolved from has changed since, so that only the files reached
+are checked, instead of every file of the unit: the file itself, the
+directories of the packages that its lookups searched (its own, those of the
+modules it imports and of the parents of the modules that could not be found),
+whose modification times change when modules are added or removed, and the
+directory of the search path that provides each name it refers to.
+
+The units are stored in the 'subgraphs' subdirectory of the cache directory,
+apart from the parsed files.
+"""
+# This file is part of the Snakefood open source package.
+# See http://furius.ca/snakefood/ for licensing details.
+
+import sys, os, logging
+from os.path import *
+
+from snakefood.cache import ParseCache
+from snakefood.find import ERROR_IMPORT, ERROR_SYMBOL, ERROR_UNUSED
+from snakefood.find import resolve_module
+from snakefood.fscache import fscache
+from snakefood.dists import EXTENSION_SUFFIXES
+from snakefood.roots import relfile
+
+__all__ = ('SubgraphCache', 'dist_fingerprint', 'root_fingerprint')
+
+
+# Version of the format of the cached units.
+SUBGRAPH_VERSION = 3
+
+# Error constants, which are compared by identity by some of the code.
+_errors = dict((x, x) for x in (ERROR_IMPORT, ERROR_SYMBOL, ERROR_UNUSED))
+
+
+class Unit(object):
+    "The cached results of the files of a unit."
+
+    def __init__(self, name, key, results):
+        self.name = name
+        self.key = key
+        self.results = results    # filename -> (stamp, files, errors, names)
+        self.dirty = False
+
+
+class SubgraphCache(object):
+    """The results of the files outside of the input roots, by unit.
+
+    'cachedir' is the cache directory, 'signature' a tuple of the options that
+    affect the results, 'inroots' the input roots, whose files are not cached,
+    and 'distindex' an optional DistributionIndex, to group the files by
+    distribution.
+    """
+    def __init__(self, cachedir, signature, inroots, ignores, distindex=None):
+        self.cache = ParseCache(join(cachedir, 'subgraphs'))
+        self.signature = repr((SUBGRAPH_VERSION,) + tuple(signature))
+        self.inroots = frozenset(inroots)
+        self.ignores = ignores
+        self.distindex = distindex
+        self.units = {}     # root or distribution -> Unit, or None
+        self.dirtimes = {}  # directory -> modification time
+        self.providers = None  # name -> index of the first path entry with it
+        self.hits = 0
+        self.misses = 0
+
+    def unit(self, fn):
+        "Return the Unit of file 'fn', or None if it is not cached."
+        dist = None
+        if self.distindex is not None:
+            xfn = dirname(fn) if basename(fn) == '__init__.py' else fn
+            dist = self.distindex.distribution(xfn)
+        if dist is not None:
+            ukey = dist
+        else:
+            ukey = relfile(fn, self.ignores)[0]
+            if ukey in self.inroots:
+                return None
+        try:
+            return self.units[ukey]
+        except KeyError:
+            pass
+
+        if dist is not None:
+            name = '%s %s' % (dist.name, dist.version)
+            fingerprint = dist_fingerprint(dist)
+        else:
+            name = ukey
+            fingerprint = root_fingerprint(ukey)
+        unit = None
+        if fingerprint is not None:
+            key = self.cache.key(fingerprint, 'subgraph', self.signature)
+            results = self.cache.get(key)
+            if results is not None:
+                logging.debug("Reusing the dependencies of '%s'." % name)
+            unit = Unit(name, key, results or {})
+        self.units[ukey] = unit
+        return unit
+
+    def lookup(self, fn):
+        """Return the (files, errors, names) of file 'fn' from the cache, or None
+        if it must be processed."""
+        unit = self.unit(fn)
+        if unit is None:
+            return None
+        result = unit.results.get(fn)
+        if result is None or not self.unchanged(fn, result[0]):
+            self.misses += 1
+            return None
+        self.hits += 1
+        _, files, errors, names = result
+        return files, [(_errors.get(err, err), name) for err, name in errors], names
+
+    def record(self, fn, files, errors, names):
+        "Record the results of processing file 'fn'."
+        unit = self.unit(fn)
+        if unit is None:
+            return
+        stamp = self.stamp(fn, files, errors, names)
+        if stamp is not None:
+            unit.results[fn] = (stamp, list(files), list(errors), set(names))
+            unit.dirty = True
+
+    def stamp(self, fn, files, errors, names):
+        """Return the stamp of file 'fn' and of what the lookups of its imports
+        searched, given its results, or None if it does not exist.  The stamp
+        is a tuple of the (mtime, size) of the file, of the pairs of the
+        package directories searched and their modification times, and of the
+        pairs of the names referred to and the index of the entry of the search
+        path that provides them."""
+        try:
+            st = os.stat(fn)
+        except OSError:
+            return None
+        pkgdirs = package_dirs(dirname(fn))
+        dirs = set(pkgdirs)
+        for dfn in files:
+            if not fscache.isdir(dfn):
+                dfn = dirname(dfn)
+            dirs.update(package_dirs(dfn))
+
+        # Modules that are not found may be added to the packages of the
+        # leading parts of their names, from the search path or relative to
+        # the packages of the file.
+        for _, name in errors:
+            comps = name.lstrip('.').split('.')
+            for i in xrange(1, len(comps)):
+                prefix = '.'.join(comps[:i])
+                found = [resolve_module(prefix, None, 0, True)]
+                found.extend(resolve_module(prefix, dn, 1, True)
+                             for dn in pkgdirs)
+                for dfn in filter(None, found):
+                    if basename(dfn) == '__init__.py':
+                        dfn = dirname(dfn)
+                    if fscache.isdir(dfn):
+                        dirs.update(package_dirs(dfn))
+
+        dirtimes = tuple(sorted((dn, self.dirtime(dn)) for dn in dirs))
+        providers = tuple(sorted((name, self.provider(name)) for name in names))
+        return (st.st_mtime, st.st_size, dirtimes, providers)
+
+    def unchanged(self, fn, stamp):
+        "Return true if file 'fn' and what its lookups searched match 'stamp'."
+        mtime, size, dirtimes, providers = stamp
+        try:
+            st = os.stat(fn)
+        except OSError:
+            return False
+        return ((st.st_mtime, st.st_size) == (mtime, size) and
+                all(self.dirtime(dn) == dirtime for dn, dirtime in dirtimes) and
+                all(self.provider(name) == i for name, i in providers))
+
+    def dirtime(self, dn):
+        "Return the modification time of directory 'dn', or None."
+        try:
+            return self.dirtimes[dn]
+        except KeyError:
+            pass
+        try:
+            dirtime = os.stat(dn).st_mtime
+        except OSError:
+            dirtime = None
+        self.dirtimes[dn] = dirtime
+        return dirtime
+
+    def provider(self, name):
+        """Return the index of the first entry of the module search path that
+        has a module, package or other entry named 'name', or None."""
+        if self.providers is None:
+            self.providers = {}
+            for i, dn in enumerate(sys.path):
+                listing = fscache.listing(dn)
+                if listing is None:
+                    continue
+                for x in listing[0]:
+                    if x.endswith(module_suffixes):
+                        x = x.split('.', 1)[0]
+                    self.providers.setdefault(x, i)
+        return self.providers.get(name)
+
+    def save(self):
+        "Store the units that have new results."
+        for unit in self.units.itervalues():
+            if unit is not None and unit.dirty:
+                self.cache.put(unit.key, unit.results)
+                unit.dirty = False
+
+
+# The suffixes of the files of modules.
+module_suffixes = tuple(['.py'] + EXTENSION_SUFFIXES)
+
+def package_dirs(dn):
+    """Return directory 'dn' and the directories of its parent packages, up to
+    the directory that contains the top-level package."""
+    dirs = [dn]
+    while fscache.exists(join(dn, '__init__.py')) and dirname(dn) != dn:
+        dn = dirname(dn)
+        dirs.append(dn)
+    return dirs
+
+
+def dist_fingerprint(dist):
+    """Return a fingerprint of Distribution 'dist': its location, name and
+    version, and the modification time of the list of its files, which is
+    written again when it is reinstalled."""
+    mdn = join(dist.sitedir, dist.metadir)
+    for fn in join(mdn, 'RECORD'), join(mdn, 'installed-files.txt'), mdn:
+        try:
+            mtime = os.stat(fn).st_mtime
+            break
+        except OSError:
+            pass
+    else:
+        return None
+    return repr((dist.sitedir, dist.name, dist.version, mtime))
+
+
+def root_fingerprint(root):
+    """Return a fingerprint of package root 'root': its path and its
+    modification time, which changes when modules are added or removed at its
+    top level.  Return None if it does not exist."""
+    try:
+        mtime = os.stat(root).st_mtime
+    except OSError:
+        return None
+    return repr((root, mtime))
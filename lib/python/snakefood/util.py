@@ -6,51 +6,64 @@ Various utilities, to iterate among files, global stuff, etc.
 
 import os, logging, re
 from os.path import *
+from collections import OrderedDict
+
+from snakefood.fscache import fscache
 
 __all__ = ('is_python', 'def_ignores', 'iter_pyfiles', 'setup_logging',
-           'filter_separate')
+           'filter_separate', 'LRUCache')
+
 
 
+# Extensions of files that are never Python scripts, which do not need to be
+# opened to check for a '#!...python' line.
+binary_extensions = frozenset("""
+.so .pyd .pyc .pyo .o .a .dll .dylib .exe .class .jar .zip .gz .bz2 .xz .tar
+.tgz .whl .egg .png .jpg .jpeg .gif .ico .bmp .pdf .ttf .woff .woff2 .mo .db
+.sqlite .pickle .pkl .npy .npz
+""".split())
 
 def is_python(fn):
     "Return true if the file is a Python file."
     if fn.endswith('.py'):
         return True
+    elif splitext(fn)[1].lower() in binary_extensions:
+        return False
     else:
-        try:
-            file_head = open(fn).read(64)
-            if re.match("#!.*\\bpython", file_head):
-                return True
-        except IOError:
-            return False
+        return fscache.is_python(fn)
 
 
 def_ignores = ['.svn', 'CVS', 'build', '.hg', '.git']
 # Note: 'build' is for those packages which have been installed with setup.py.
 # It is pretty common to forget these around.
 
-def iter_pyfiles(dirsorfns, ignores, abspaths=False):
+def iter_pyfiles(dirsorfns, ignores, abspaths=False, rules=None):
     """Yield all the files ending with .py recursively.  'dirsorfns' is a list
     of filenames or directories.  If 'abspaths' is true, we assumethe paths are
-    absolute paths."""
+    absolute paths.  'rules' is an optional IgnoreRules object that selects
+    the files to yield (see snakefood.ignore)."""
     assert isinstance(dirsorfns, (list, tuple))
     assert isinstance(ignores, (type(None), list))
 
     ignores = ignores or def_ignores
+    if rules is not None:
+        for fn in rules.iter_pyfiles(dirsorfns, ignores, abspaths):
+            yield fn
+        return
     for dn in dirsorfns:
         if not abspaths:
-            dn = realpath(dn)
+            dn = fscache.realpath(dn)
 
-        if not exists(dn):
+        if not fscache.exists(dn):
             logging.warning("File '%s' does not exist." % dn)
             continue
 
-        if not isdir(dn):
+        if not fscache.isdir(dn):
             if is_python(dn):
                 yield dn
 
         else:
-            for root, dirs, files in os.walk(dn):
+            for root, dirs, files in fscache.walk(dn):
                 for r in ignores:
                     try:
                         dirs.remove(r)
@@ -91,4 +104,44 @@ def filter_separate(pred, seq):
     return inlist, outlist
 
 
+class LRUCache(object):
+    """A mapping of bounded size, which evicts the least recently used entries
+    when it is full.  The number of successful and failed lookups is counted."""
 
+    def __init__(self, maxsize):
+        assert maxsize > 0
+        self.maxsize = maxsize
+        self.data = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.data)
+
+    def __getitem__(self, key):
+        data = self.data
+        try:
+            value = data.pop(key)
+        except KeyError:
+            self.misses += 1
+            raise
+        data[key] = value
+        self.hits += 1
+        return value
+
+    def __setitem__(self, key, value):
+        data = self.data
+        data.pop(key, None)
+        data[key] = value
+        while len(data) > self.maxsize:
+            data.popitem(last=False)
+
+    def resize(self, maxsize):
+        "Change the maximum size, evicting entries if necessary."
+        assert maxsize > 0
+        self.maxsize = maxsize
+        while len(self.data) > maxsize:
+            self.data.popitem(last=False)
+
+    def clear(self):
+        self.data.clear()
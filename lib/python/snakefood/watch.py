@@ -0,0 +1,243 @@
+"""
+Detection of the changes to the files under a list of paths, for --watch.
+
+On Linux, the changes are reported by the kernel through inotify, which is
+accessed with ctypes.  Elsewhere, or if inotify cannot be used, the paths are
+polled for changes to the modification times and sizes of their files.
+
+Changes are reported in batches, as a set of changed paths and a flag telling
+whether directories were added or deleted.  The set of paths includes the
+files found in added directories, and deleted directories themselves.
+"""
+# This file is part of the Snakefood open source package.
+# See http://furius.ca/snakefood/ for licensing details.
+
+import os, time, struct, select, errno, logging
+from os.path import *
+
+__all__ = ('InotifyWatcher', 'PollingWatcher', 'watch_changes')
+
+
+# Inotify event masks, see <sys/inotify.h>.
+IN_MODIFY       = 0x00000002
+IN_CLOSE_WRITE  = 0x00000008
+IN_MOVED_FROM   = 0x00000040
+IN_MOVED_TO     = 0x00000080
+IN_CREATE       = 0x00000100
+IN_DELETE       = 0x00000200
+IN_DELETE_SELF  = 0x00000400
+IN_MOVE_SELF    = 0x00000800
+IN_Q_OVERFLOW   = 0x00004000
+IN_IGNORED      = 0x00008000
+IN_ONLYDIR      = 0x01000000
+IN_ISDIR        = 0x40000000
+
+watch_mask = (IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO |
+              IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF |
+              IN_ONLYDIR)
+
+# Header of an inotify event: wd, mask, cookie and length of the name.
+event_struct = struct.Struct('iIII')
+
+
+def load_inotify():
+    "Return the C library, if it provides inotify."
+    import ctypes, ctypes.util
+    libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+    libc.inotify_init
+    libc.inotify_add_watch
+    return libc
+
+
+class InotifyWatcher(object):
+    """Watch for changes with inotify.
+
+    Directories are watched recursively, except for the ignored ones.  For
+    input paths that are files, their directory is watched, but only the
+    changes to the files themselves are reported.  'delay' is the time to wait
+    for more events after a change, so that related changes are reported
+    together.
+    """
+    def __init__(self, paths, ignores, delay=0.1):
+        import ctypes
+        self.ctypes = ctypes
+        self.libc = load_inotify()
+        self.fd = self.libc.inotify_init()
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init() failed")
+        self.ignores = ignores
+        self.delay = delay
+        self.dirs = {}    # wd -> directory name
+        self.files = {}   # directory name -> names of the watched files
+        try:
+            for path in map(realpath, paths):
+                if isdir(path):
+                    self.add_tree(path)
+                else:
+                    dn = dirname(path)
+                    if dn not in self.files and dn in self.dirs.values():
+                        continue # Already watched as a whole.
+                    self.files.setdefault(dn, set()).add(basename(path))
+                    self.add_watch(dn)
+        except:
+            self.close()
+            raise
+
+    def close(self):
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+    def add_watch(self, dn):
+        "Watch directory 'dn'."
+        wd = self.libc.inotify_add_watch(self.fd, dn, watch_mask)
+        if wd < 0:
+            err = self.ctypes.get_errno()
+            if err == errno.ENOSPC:
+                raise OSError(err, "Too many directories to watch, "
+                              "see /proc/sys/fs/inotify/max_user_watches")
+            # The directory may have gone away already.
+            logging.debug("Could not watch directory '%s': %s" %
+                          (dn, os.strerror(err)))
+            return
+        self.dirs[wd] = dn
+
+    def add_tree(self, dn):
+        """Watch directory 'dn' and all its subdirectories, and return the list
+        of the files found in them."""
+        self.files.pop(dn, None)
+        found = []
+        for root, dirs, files in os.walk(dn):
+            for r in self.ignores:
+                try:
+                    dirs.remove(r)
+                except ValueError:
+                    pass
+            self.add_watch(root)
+            found.extend(join(root, x) for x in files)
+        return found
+
+    def read_events(self, paths):
+        """Read the pending events and add the changed paths to 'paths'.  Return
+        a pair of flags, telling whether directories were added or deleted, and
+        whether events were lost."""
+        dirs_changed = overflow = False
+        buf = os.read(self.fd, 65536)
+        pos = 0
+        while pos < len(buf):
+            wd, mask, _, length = event_struct.unpack_from(buf, pos)
+            pos += event_struct.size
+            name = buf[pos:pos+length].rstrip('\0')
+            pos += length
+
+            if mask & IN_Q_OVERFLOW:
+                overflow = True
+                continue
+            if mask & IN_IGNORED:
+                self.dirs.pop(wd, None)
+                continue
+            dn = self.dirs.get(wd)
+            if dn is None:
+                continue
+            names = self.files.get(dn)
+            if names is not None and name not in names:
+                continue
+
+            path = join(dn, name) if name else dn
+            if mask & (IN_DELETE_SELF | IN_MOVE_SELF):
+                dirs_changed = True
+            elif mask & IN_ISDIR:
+                if name in self.ignores:
+                    continue
+                dirs_changed = True
+                if mask & (IN_CREATE | IN_MOVED_TO):
+                    paths.update(self.add_tree(path))
+            paths.add(path)
+
+        return dirs_changed, overflow
+
+    def changes(self):
+        """Generate (paths, dirs_changed) pairs for each batch of changes.  The
+        paths are None if events were lost."""
+        fd = self.fd
+        try:
+            while 1:
+                select.select([fd], [], [])
+                paths = set()
+                dirs_changed = overflow = False
+                while 1:
+                    dchg, ovf = self.read_events(paths)
+                    dirs_changed |= dchg
+                    overflow |= ovf
+                    if not select.select([fd], [], [], self.delay)[0]:
+                        break
+                if overflow:
+                    yield None, True
+                elif paths:
+                    yield paths, dirs_changed
+        finally:
+            self.close()
+
+
+class PollingWatcher(object):
+    "Watch for changes by looking at the paths every 'interval' seconds."
+
+    def __init__(self, paths, ignores, interval=1.0):
+        self.paths = map(realpath, paths)
+        self.ignores = ignores
+        self.interval = interval
+        self.stamps, self.dirs = self.snapshot()
+
+    def snapshot(self):
+        """Return a map of the files under the paths to their modification time
+        and size, and the set of the directories."""
+        stamps, dirs = {}, set()
+        for path in self.paths:
+            if isdir(path):
+                for root, dnames, fnames in os.walk(path):
+                    for r in self.ignores:
+                        try:
+                            dnames.remove(r)
+                        except ValueError:
+                            pass
+                    dirs.add(root)
+                    for x in fnames:
+                        self.stamp(join(root, x), stamps)
+            else:
+                self.stamp(path, stamps)
+        return stamps, dirs
+
+    def stamp(self, fn, stamps):
+        try:
+            st = os.stat(fn)
+        except OSError:
+            return
+        stamps[fn] = (st.st_mtime, st.st_size)
+
+    def changes(self):
+        "Generate (paths, dirs_changed) pairs for each batch of changes."
+        while 1:
+            time.sleep(self.interval)
+            stamps, dirs = self.snapshot()
+            paths = set(fn for fn, stamp in stamps.iteritems()
+                        if self.stamps.get(fn) != stamp)
+            paths.update(fn for fn in self.stamps if fn not in stamps)
+            paths.update(dirs.symmetric_difference(self.dirs))
+            dirs_changed = dirs != self.dirs
+            self.stamps, self.dirs = stamps, dirs
+            if paths:
+                yield paths, dirs_changed
+
+
+def watch_changes(paths, ignores, poll=None):
+    """Generate the batches of changes to the files under 'paths'.  If 'poll' is
+    given, poll for changes every 'poll' seconds instead of using inotify."""
+    if poll is None:
+        try:
+            watcher = InotifyWatcher(paths, ignores)
+        except (OSError, AttributeError), e:
+            logging.warning("Cannot use inotify (%s), polling for changes." % e)
+            watcher = PollingWatcher(paths, ignores)
+    else:
+        watcher = PollingWatcher(paths, ignores, poll)
+    return watcher.changes()
@@ -36,7 +36,7 @@ from the dependency list.
       url="http://furius.ca/snakefood",
       download_url="http://bitbucket.org/blais/snakefood",
       package_dir = {'': 'lib/python'},
-      packages = ['snakefood', 'snakefood/fallback'],
+      packages = ['snakefood', 'snakefood/fallback', 'snakefood/stdlib'],
       install_requires=[ 'six' ],
       setup_requires=['pytest-runner' ],
       tests_require=[ 'pytest' ],
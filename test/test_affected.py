@@ -0,0 +1,67 @@
+"""
+Test finding the files affected by changes.
+"""
+
+from __future__ import print_function
+
+import os, shutil, tempfile
+from subprocess import check_call
+from os.path import *
+from testsupport import *
+
+
+def test_affected():
+    "Test the reverse closure, from a dependencies file and from a scan."
+    projdir = realpath(join(data, 'project'))
+    tmpdir = tempfile.mkdtemp(prefix='sfood-affected-')
+    try:
+        depsfn = join(tmpdir, 'deps')
+        out, _ = run_sfood('sfood', projdir)
+        with open(depsfn, 'w') as f:
+            f.write(out)
+
+        changed = join(projdir, 'sub1', 'sub11', '__init__.py')
+        expected = [join(projdir, 'sub1', 'sub11'),
+                    join(projdir, 'sub1', 'sub11', 'relative_from.py')]
+        out, _ = run_sfood('sfood-affected', '--depends', depsfn, changed)
+        assert out.splitlines() == expected
+        out, _ = run_sfood('sfood-affected', '--scan', projdir, changed)
+        assert out.splitlines() == expected
+
+        out, _ = run_sfood('sfood-affected', '--depends', depsfn,
+                           '--tests', '--test-pattern', 'relative',
+                           join(projdir, 'bli.py'), changed)
+        assert out.splitlines() == expected[1:]
+    finally:
+        shutil.rmtree(tmpdir)
+
+
+def test_affected_git():
+    "Test the changed files from git, relative to the top of the repository."
+    tmpdir = realpath(tempfile.mkdtemp(prefix='sfood-affected-'))
+    try:
+        projdir = join(tmpdir, 'project')
+        shutil.copytree(join(data, 'project'), projdir)
+        def git(*args):
+            check_call(('git', '-c', 'user.name=test', '-c', 'user.email=test',
+                        '-C', tmpdir) + args)
+        git('init', '-q')
+        git('add', '.')
+        git('commit', '-q', '-m', 'Initial.')
+        with open(join(projdir, 'sub1', 'sub11', '__init__.py'), 'a') as f:
+            f.write('\n')
+
+        expected = [join(projdir, 'sub1', 'sub11'),
+                    join(projdir, 'sub1', 'sub11', 'relative_from.py')]
+        cwd = join(projdir, 'sub1')
+        out, _ = run_sfood('sfood-affected', '--scan', projdir, '--git', 'HEAD',
+                           cwd=cwd)
+        assert out.splitlines() == expected
+        out, _ = run_sfood('sfood-affected', '--scan', projdir, '-', cwd=cwd,
+                           input='project/sub1/sub11/__init__.py\n')
+        assert out.splitlines() == expected
+        out, _ = run_sfood('sfood-affected', '--scan', projdir, '-', cwd=cwd,
+                           input='sub11/__init__.py\n')
+        assert out.splitlines() == expected
+    finally:
+        shutil.rmtree(tmpdir)
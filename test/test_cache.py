@@ -0,0 +1,37 @@
+"""
+Test the persistent parse cache.
+"""
+
+from __future__ import print_function
+
+import os, shutil, tempfile
+from os.path import *
+from testsupport import *
+
+
+_files = [
+    'project/foo_from.py',
+    'simple/stdlib.py',
+    ]
+
+def test_cache():
+    "Test that cold and warm runs with a cache produce the same output."
+    cachedir = tempfile.mkdtemp(prefix='sfood-cache-')
+    try:
+        for fn in _files:
+            fn = join(data, fn)
+            for run in ('cold', 'warm'):
+                print('Testing %s cache for: %s' % (run, fn))
+                compare_expect(fn.replace('.py', '.expect'), None,
+                               'sfood', '--cache-dir', cachedir, fn,
+                               filterdir=(data, 'ROOT'))
+        assert os.listdir(cachedir)
+
+        # The unused imports are filtered from cached entries too.
+        fn = join(data, 'simple/unused.py')
+        for run in ('cold', 'warm'):
+            compare_expect(fn.replace('.py', '.expect'), None,
+                           'sfood', '--cache-dir', cachedir,
+                           '--ignore-unused', fn, filterdir=(data, 'ROOT'))
+    finally:
+        shutil.rmtree(cachedir)
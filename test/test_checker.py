@@ -6,11 +6,13 @@ import os
 from testsupport import *
 
 from snakefood.checker import *
-from snakefood.find import ImportVisitor
+from snakefood.find import ImportVisitor, ImportWalker
 
 
 def visit_source(source, cls):
-    mod = compiler.parse(source)
+    mod = source
+    if isinstance(source, str):
+        mod = compiler.parse(source)
     vis = cls()
     compiler.walk(mod, vis)
     return vis.finalize()
@@ -44,6 +46,30 @@ def test_checker_functional():
         assert actual == expected, (actual, expected)
 
 
+def test_source_visitor():
+    "Test that the combined visitor finds the same as the separate ones."
+    for dn in find_dirs(data):
+        for fn in os.listdir(dn):
+            fn = join(dn, fn)
+            if not fn.endswith('.py'):
+                continue
+            try:
+                mod = compiler.parse(open(fn, 'rU').read())
+            except SyntaxError:
+                continue
+            vis = ImportVisitor()
+            compiler.walk(mod, vis, ImportWalker(vis))
+            expected = (vis.finalize(),
+                        visit_source(mod, NamesVisitor),
+                        visit_source(mod, AllVisitor),
+                        visit_source(mod, AssignVisitor))
+
+            vis = SourceVisitor()
+            vis.walk(mod)
+            vis.finalize()
+            actual = ((vis.found_imports, vis.future_imports),
+                      (vis.dotted, vis.simple), vis.all, vis.assnames)
+            assert actual == expected, (fn, actual, expected)
 
 
 def test_checker_expected():
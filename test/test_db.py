@@ -0,0 +1,100 @@
+"""
+Test the SQLite database of the dependencies and its queries.
+"""
+
+from __future__ import print_function
+
+import os, shutil, tempfile, sqlite3
+from os.path import *
+from testsupport import *
+
+
+def test_db():
+    "Test writing, updating and querying a database of dependencies."
+    tmpdir = realpath(tempfile.mkdtemp(prefix='sfood-db-'))
+    try:
+        for fn, contents in (('app/__init__.py', ''),
+                             ('app/main.py', 'from app import views\n'),
+                             ('app/views.py', 'import models.user\n'
+                                              'import nosuchmodule\n'),
+                             ('models/__init__.py', ''),
+                             ('models/user.py', '')):
+            fn = join(tmpdir, fn)
+            if not exists(dirname(fn)):
+                os.makedirs(dirname(fn))
+            with open(fn, 'w') as f:
+                f.write(contents)
+        dbfn = join(tmpdir, 'deps.sqlite')
+        app = join(tmpdir, 'app')
+        main, views = join(app, 'main.py'), join(app, 'views.py')
+        user = join(tmpdir, 'models', 'user.py')
+
+        expected, _ = run_sfood('sfood', tmpdir)
+        out, log = run_sfood('sfood', '-v', '--db', dbfn, tmpdir)
+        assert out == ''
+        assert run_sfood('sfood-query', dbfn, 'dump')[0] == expected
+
+        assert run_sfood('sfood-query', dbfn, 'deps', main)[0].split() == [views]
+        assert run_sfood('sfood-query', dbfn, 'rdeps', '-t', user)[0].split() == [
+            main, views]
+        assert run_sfood('sfood-query', dbfn, 'path', main, user)[0].split() == [
+            main, views, user]
+        assert run_sfood('sfood-query', dbfn, 'path', user, main)[0] == ''
+        assert run_sfood('sfood-query', dbfn, 'fan')[0].splitlines() == [
+            '0\t1\t%s' % app, '1\t0\t%s' % join(tmpdir, 'models')]
+
+        conn = sqlite3.connect(dbfn)
+        assert conn.execute("SELECT line, kind, module FROM imports JOIN files "
+                            "ON files.node = imports.node WHERE filename = ?",
+                            (views,)).fetchall() == [(1, 'import', 'models.user'),
+                                                     (2, 'import', 'nosuchmodule')]
+        assert conn.execute("SELECT name FROM unresolved").fetchall() == [
+            ('nosuchmodule',)]
+        conn.close()
+
+        # Only the rows of the changed files are rewritten.
+        out, log = run_sfood('sfood', '-v', '--db', dbfn, tmpdir)
+        assert 'updated 0 sources and files' in log
+        with open(views, 'w') as f:
+            f.write('')
+        expected, _ = run_sfood('sfood', tmpdir)
+        out, log = run_sfood('sfood', '-v', '--db', dbfn, tmpdir)
+        assert 'updated 2 sources and files' in log
+        assert run_sfood('sfood-query', dbfn, 'dump')[0] == expected
+        assert run_sfood('sfood-query', dbfn, 'rdeps', user)[0] == ''
+    finally:
+        shutil.rmtree(tmpdir)
+
+
+def test_db_resolution():
+    "Test that the imports of unchanged files are updated as they resolve."
+    tmpdir = realpath(tempfile.mkdtemp(prefix='sfood-db-'))
+    try:
+        for fn, contents in (('app/__init__.py', ''),
+                             ('app/views.py', 'import models.user\n'),
+                             ('models/__init__.py', ''),
+                             ('models/user.py', '')):
+            fn = join(tmpdir, fn)
+            if not exists(dirname(fn)):
+                os.makedirs(dirname(fn))
+            with open(fn, 'w') as f:
+                f.write(contents)
+        dbfn = join(tmpdir, 'deps.sqlite')
+        user = join(tmpdir, 'models', 'user.py')
+        run_sfood('sfood', '--db', dbfn, tmpdir)
+
+        # Deleting the imported module leaves the importing file unchanged.
+        os.remove(user)
+        expected, _ = run_sfood('sfood', tmpdir)
+        run_sfood('sfood', '--db', dbfn, tmpdir)
+        assert run_sfood('sfood-query', dbfn, 'dump')[0] == expected
+        conn = sqlite3.connect(dbfn)
+        assert conn.execute("SELECT name FROM unresolved").fetchall() == [
+            ('models.user',)]
+        assert conn.execute("SELECT COUNT(*) FROM nodes WHERE filename = ?",
+                            (user,)).fetchone() == (0,)
+        assert conn.execute("SELECT dst FROM imports WHERE module = ?",
+                            ('models.user',)).fetchall() == [(None,)]
+        conn.close()
+    finally:
+        shutil.rmtree(tmpdir)
@@ -0,0 +1,54 @@
+"""
+Test reading dependencies files.
+"""
+
+from __future__ import print_function
+
+from os.path import *
+from subprocess import Popen, PIPE
+from testsupport import *
+from testsupport import bindir
+
+from snakefood.depends import parse_depends, read_depends, InvalidDepends
+from snakefood.depends import TRUNCATED
+
+
+def test_parse_depends():
+    "Test that the lines are parsed like they are evaluated."
+    for dep in [(('/a', 'b.py'), ('/c', 'd/e.py')),
+                (('/a', 'b.py'), (None, None)),
+                (('/a', 'b.py'), TRUNCATED),
+                (("/it's", 'say "hi".py'), ('/tab\there', 'back\\slash.py')),
+                ((u'/caf\xe9', u'q.py'), ('/a', 'b.py'))]:
+        line = '%r\n' % (dep,)
+        assert parse_depends(line) == eval(line)
+        assert [type(x) for x in parse_depends(line)[0]] == map(type, dep[0])
+    assert parse_depends("( ('/a','b.py') , (None,None) )") == (
+        ('/a', 'b.py'), (None, None))
+    for line in ["__import__('os').system('true')",
+                 "(('/a', 'b.py'), ('/c', 'd.py')) + ()",
+                 "(('/a', 'b.py'), ('/c', 'd.py', 'e'))",
+                 "(('/a', 'b.py'), ('/c', 1))"]:
+        assert parse_depends(line) is None
+
+
+def test_read_depends():
+    "Test the interning of the roots and the strict mode."
+    lines = ["(('/a', 'b.py'), ('/c', 'd.py'))\n",
+             "\n",
+             "(('/a', 'e.py'), ('/c', 'f.py'))\n",
+             "invalid\n"]
+    deps = list(read_depends(lines))
+    assert len(deps) == 2
+    assert deps[0][0][0] is deps[1][0][0]
+    assert deps[0][1][0] is deps[1][1][0]
+    try:
+        list(read_depends(lines, True, 'deps'))
+        assert False
+    except InvalidDepends, e:
+        assert str(e).startswith('deps:4: ')
+
+    p = Popen([join(bindir, 'sfood-cluster'), '--strict'],
+              stdin=PIPE, stdout=PIPE, stderr=PIPE)
+    out, err = p.communicate(''.join(lines))
+    assert p.returncode == 1 and '<stdin>:4: Invalid line' in err
@@ -0,0 +1,112 @@
+"""
+Test the index of the installed distributions.
+"""
+
+from __future__ import print_function
+
+import os, shutil, tempfile
+from os.path import *
+from testsupport import *
+
+from snakefood.dists import DistributionIndex, module_files
+
+
+def make_site(tmpdir):
+    "Create a directory with installed distributions."
+    site = join(tmpdir, 'site')
+    files = {
+        'alpha-1.0.dist-info/METADATA': 'Name: alpha\nVersion: 1.0\n\nText.\n',
+        'alpha-1.0.dist-info/RECORD': '\n'.join([
+            'alpha/__init__.py,sha256=x,1',
+            'alpha/core.py,sha256=x,1',
+            'ns/__init__.py,,',
+            'ns/a.py,,',
+            'alpha-1.0.dist-info/RECORD,,',
+            '../../bin/alpha,,']),
+        'alpha/__init__.py': 'from alpha import core\n',
+        'alpha/core.py': 'import beta\n',
+        'ns/__init__.py': '',
+        'ns/a.py': '',
+        'ns/b.py': 'import ns.a\n',
+        'beta-2.0-py2.7.egg-info/PKG-INFO': 'Metadata-Version: 1.0\nName: beta\nVersion: 2.0\n',
+        'beta-2.0-py2.7.egg-info/installed-files.txt': '../beta.py\n../ns/b.py\n',
+        'beta.py': 'import os\n',
+        'other.py': '',
+        }
+    make_tree(site, files.iteritems())
+    return site
+
+
+def test_module_files():
+    "Test finding the modules in the list of files of a distribution."
+    assert module_files(['a/__init__.py', 'a/b.py', 'a/c/d.py', 'e.py',
+                         'f/g.py', '../bin/x.py', 'a/data.txt']) == {
+        'a': 'a/__init__.py', 'a.b': 'a/b.py', 'a.c.d': 'a/c/d.py', 'e': 'e.py',
+        'f.g': 'f/g.py'}
+
+
+def test_index():
+    "Test the lookups in the index and its cache."
+    tmpdir = realpath(tempfile.mkdtemp(prefix='sfood-dists-'))
+    try:
+        site = make_site(tmpdir)
+        cachefn = join(tmpdir, 'cache', 'distributions')
+        index = DistributionIndex([site], cachefn)
+        assert sorted((d.name, d.version) for d in index.dists) == [
+            ('alpha', '1.0'), ('beta', '2.0')]
+        assert index.find_module('alpha.core') == join(site, 'alpha/core.py')
+        assert index.find_module('ns.b') == join(site, 'ns/b.py')
+        assert index.find_module('beta') == join(site, 'beta.py')
+        assert index.find_module('other') is None
+        assert index.distribution(join(site, 'alpha')).name == 'alpha'
+        assert index.distribution(join(site, 'ns/b.py')).name == 'beta'
+        assert index.distribution(join(site, 'beta.py')).node() == (
+            site, 'beta-2.0-py2.7.egg-info')
+        assert exists(cachefn)
+
+        # The cache is used while the directory does not change.
+        os.remove(join(site, 'beta-2.0-py2.7.egg-info', 'installed-files.txt'))
+        index = DistributionIndex([site], cachefn)
+        assert index.find_module('beta') == join(site, 'beta.py')
+
+        # Installing or removing distributions invalidates it.
+        shutil.rmtree(join(site, 'alpha-1.0.dist-info'))
+        st = os.stat(site)
+        os.utime(site, (st.st_atime, st.st_mtime + 10))
+        index = DistributionIndex([site], cachefn)
+        assert [d.name for d in index.dists] == ['beta']
+        assert index.find_module('alpha') is None
+        assert index.find_module('beta') is None
+    finally:
+        shutil.rmtree(tmpdir)
+
+
+def test_dist_options():
+    "Test resolving from the index and clustering by distribution."
+    tmpdir = realpath(tempfile.mkdtemp(prefix='sfood-dists-'))
+    try:
+        site = make_site(tmpdir)
+        src = join(tmpdir, 'src')
+        make_tree(src, [('app.py', 'import alpha.core, ns.b, other\n')])
+        with pythonpath(site):
+            cachedir = join(tmpdir, 'cache')
+            out, _ = run_sfood('sfood', join(src, 'app.py'))
+            out2, _ = run_sfood('sfood', '--dist-index', '--cache-dir',
+                                cachedir, join(src, 'app.py'))
+            assert out and out == out2
+
+            out, _ = run_sfood('sfood', '--cluster-by-distribution', '--follow',
+                               '--cache-dir', cachedir, join(src, 'app.py'))
+            deps = set(eval(x) for x in out.splitlines())
+            alpha = (site, 'alpha-1.0.dist-info')
+            beta = (site, 'beta-2.0-py2.7.egg-info')
+            assert ((src, 'app.py'), alpha) in deps
+            assert ((src, 'app.py'), beta) in deps
+            assert ((src, 'app.py'), (site, 'other.py')) in deps
+            assert (alpha, beta) in deps
+            assert (alpha, alpha) not in deps
+            assert not [to_ for _, to_ in deps
+                        if to_[0] is not None and ('alpha/' in to_[1] or
+                                                   to_[1] == 'beta.py')]
+    finally:
+        shutil.rmtree(tmpdir)
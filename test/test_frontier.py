@@ -0,0 +1,66 @@
+"""
+Test the bounded following of the dependencies.
+"""
+
+from __future__ import print_function
+
+import shutil, tempfile
+from os.path import *
+from testsupport import *
+
+from snakefood.frontier import FollowFrontier
+
+
+def test_expand():
+    "Test that the files are processed at the smallest depth they are reached."
+    frontier = FollowFrontier(1)
+    frontier.add_input('a.py')
+    assert frontier.expand('a.py', ['b.py', 'c.py']) == ['b.py', 'c.py']
+    assert frontier.expand('b.py', ['d.py']) == []
+    assert not frontier.within('d.py')
+    assert frontier.truncated() == ['d.py']
+
+    # A shorter path to a processed file reaches its dependencies again.
+    frontier = FollowFrontier(2)
+    frontier.add_input('a.py')
+    frontier.add_input('z.py')
+    assert frontier.expand('a.py', ['b.py']) == ['b.py']
+    assert frontier.expand('b.py', ['c.py']) == ['c.py']
+    assert frontier.expand('c.py', ['d.py']) == []
+    assert frontier.expand('z.py', ['c.py']) == ['d.py']
+
+
+def test_follow_limits():
+    "Test the output of sfood with --follow-depth and --follow-roots."
+    tmpdir = realpath(tempfile.mkdtemp(prefix='sfood-frontier-'))
+    try:
+        make_tree(tmpdir, [('src/app.py', 'import mine.one, vendor\n'),
+                           ('mine/mine/__init__.py', ''),
+                           ('mine/mine/one.py', 'from mine import two\n'),
+                           ('mine/mine/two.py', 'import vendor.deep\n'),
+                           ('lib/vendor/__init__.py', 'import vendor.deep\n'),
+                           ('lib/vendor/deep.py', 'import vendor.deeper\n'),
+                           ('lib/vendor/deeper.py', '')])
+        with pythonpath(join(tmpdir, 'mine'), join(tmpdir, 'lib')):
+            app = join(tmpdir, 'src', 'app.py')
+            def truncated(*args):
+                out, _ = run_sfood('sfood', *args + (app,))
+                deps = set(eval(x) for x in out.splitlines())
+                return sorted(relfn for (_, relfn), to_ in deps
+                              if to_ == (None, '...'))
+
+            out, _ = run_sfood('sfood', '--follow', app)
+            out2, _ = run_sfood('sfood', '--follow-depth', '10', app)
+            assert out and out == out2
+            assert truncated('--follow') == []
+            assert truncated('--follow-depth', '0') == ['mine/one.py', 'vendor']
+            assert truncated('--follow-depth', '1') == [
+                'mine/two.py', 'vendor/deep.py']
+            assert truncated('--follow-roots', 'mine') == [
+                'vendor', 'vendor/deep.py']
+            assert truncated('--follow-roots', 'mine',
+                             '--follow-depth', '1') == ['vendor/deeper.py']
+            assert truncated('--follow-roots', join(tmpdir, 'lib')) == [
+                'mine/one.py']
+    finally:
+        shutil.rmtree(tmpdir)
@@ -0,0 +1,47 @@
+"""
+Test the cache of filesystem metadata.
+"""
+
+from __future__ import print_function
+
+import os, shutil, tempfile
+from os.path import *
+
+from snakefood.fscache import FileSystemCache
+from snakefood.util import is_python
+
+
+def test_fscache():
+    "Test that the cache agrees with the filesystem."
+    tmpdir = realpath(tempfile.mkdtemp(prefix='sfood-fscache-'))
+    try:
+        os.makedirs(join(tmpdir, 'pkg', 'sub'))
+        for fn, contents in (('pkg/__init__.py', ''),
+                             ('pkg/sub/mod.py', 'import os\n'),
+                             ('script', '#!/usr/bin/env python\n'),
+                             ('data.txt', 'text\n')):
+            with open(join(tmpdir, fn), 'w') as f:
+                f.write(contents)
+        os.symlink(join(tmpdir, 'pkg'), join(tmpdir, 'linkdir'))
+        os.symlink(join(tmpdir, 'script'), join(tmpdir, 'linkfile'))
+        os.symlink(join(tmpdir, 'missing'), join(tmpdir, 'broken'))
+
+        fs = FileSystemCache()
+        paths = [tmpdir, join(tmpdir, 'missing'), join(tmpdir, 'missing', 'x'),
+                 join(tmpdir, 'linkdir', 'sub', 'mod.py'),
+                 join(tmpdir, 'linkdir', '..', 'script')]
+        for root, dirs, files in os.walk(tmpdir):
+            paths.extend(join(root, x) for x in dirs + files)
+        for path in paths:
+            for _ in range(2):
+                assert fs.exists(path) == exists(path), path
+                assert fs.isdir(path) == isdir(path), path
+                assert fs.isfile(path) == isfile(path), path
+                assert fs.realpath(path) == realpath(path), path
+                if isfile(path) and not path.endswith('.py'):
+                    assert fs.is_python(path) == bool(is_python(path)), path
+
+        assert list(fs.walk(tmpdir)) == list(os.walk(tmpdir))
+        assert fs.syscalls < fs.queries
+    finally:
+        shutil.rmtree(tmpdir)
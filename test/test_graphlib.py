@@ -0,0 +1,50 @@
+"""
+Test the compact dependency graph shared by the tools.
+"""
+
+from __future__ import print_function
+
+from os.path import *
+from testsupport import *
+
+from snakefood.depends import read_depends, flatten_depends, TRUNCATED
+from snakefood.graphlib import DependencyGraph
+
+
+def test_graph():
+    "Test building, iterating over and querying a graph."
+    a, b, c, d = [('/r', fn) for fn in ('a.py', 'b.py', 'c.py', 'd.py')]
+    depends = [(c, a), (a, b), (a, c), (b, c), (a, b), (d, (None, None)),
+               (b, TRUNCATED)]
+    g = DependencyGraph(depends)
+    assert len(g) == 6 and g.nedges == 6
+    assert list(g.depends()) == sorted(set(depends))
+    ia, ib, ic, id_ = map(g.node_id, (a, b, c, d))
+    assert g.node_id(('/r', 'x.py')) is None
+    assert list(g.targets(ia)) == [ib, ic]
+    assert list(g.sources(ic)) == [ia, ib]
+    assert (g.out_degree(ia), g.in_degree(ia), g.in_degree(id_)) == (2, 1, 0)
+    assert g.is_marker(g.node_id(TRUNCATED)) and not g.is_marker(ia)
+    assert g.reachable([ib]) == set([ia, ib, ic, g.node_id(TRUNCATED)])
+    assert g.reachable([id_], reverse=True) == set([id_])
+    assert list(g.subgraph([ia, ib]).depends()) == [(a, b)]
+    assert g.flatten() == list(flatten_depends(g.depends())) == [a, b, c, d]
+
+    # Clustering maps the nodes, and self-dependencies that result are
+    # replaced by (None, None).
+    cluster = lambda node: ('/r', 'ab') if node in (a, b) else node
+    assert list(g.map_nodes(cluster).depends()) == [
+        (('/r', 'ab'), (None, None)), (('/r', 'ab'), TRUNCATED), (('/r', 'ab'), c),
+        (c, ('/r', 'ab')), (d, (None, None))]
+
+    assert len(DependencyGraph()) == 0
+    assert list(DependencyGraph().depends()) == []
+
+
+def test_graph_order():
+    "Test that a graph outputs the dependencies of sfood in its sorted order."
+    out, _ = run_sfood('sfood', join(data, 'project'))
+    depends = list(read_depends(out.splitlines(True)))
+    g = DependencyGraph(reversed(depends))
+    assert list(g.depends()) == depends
+    assert g.flatten() == list(flatten_depends(depends))
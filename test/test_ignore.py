@@ -0,0 +1,85 @@
+"""
+Test the selection of source files with ignore patterns.
+"""
+
+from __future__ import print_function
+
+import os, shutil, tempfile
+from os.path import *
+from subprocess import call
+from testsupport import *
+
+from snakefood.util import iter_pyfiles, def_ignores
+from snakefood.ignore import IgnoreRules, PatternList
+from snakefood.fscache import fscache
+
+
+def test_patterns():
+    "Test the matching of gitignore-style patterns."
+    plist = PatternList(['# comment', '*.pyc', 'build/', '/top.py',
+                         'doc/**/gen_*.py', '!keep.pyc'], '/base')
+    for path, isdir, expected in (('/base/a.pyc', False, True),
+                                  ('/base/x/a.pyc', False, True),
+                                  ('/base/keep.pyc', False, False),
+                                  ('/base/x/build', True, True),
+                                  ('/base/x/build', False, None),
+                                  ('/base/top.py', False, True),
+                                  ('/base/x/top.py', False, None),
+                                  ('/base/doc/gen_a.py', False, True),
+                                  ('/base/doc/x/y/gen_a.py', False, True),
+                                  ('/base/gen_a.py', False, None)):
+        assert plist.match(path, isdir) == expected, path
+
+
+def test_ignore():
+    "Test the selection of files by walking and with git."
+    tmpdir = realpath(tempfile.mkdtemp(prefix='sfood-ignore-'))
+    try:
+        for fn, contents in (('a.py', ''),
+                             ('node_modules/x.py', ''),
+                             ('sub/.gitignore', 'gen_*.py\n'),
+                             ('sub/gen_1.py', ''),
+                             ('sub/ok.py', ''),
+                             ('sub/script', '#!/usr/bin/env python\n'),
+                             ('sub/image.png', '#!/usr/bin/env python\n')):
+            fn = join(tmpdir, fn)
+            if not exists(dirname(fn)):
+                os.makedirs(dirname(fn))
+            with open(fn, 'w') as f:
+                f.write(contents)
+
+        def files(**kw):
+            fscache.clear()
+            rules = IgnoreRules(**kw)
+            found = sorted(relpath(x, tmpdir) for x in
+                           iter_pyfiles([tmpdir], def_ignores, False, rules))
+            # The files are selected one by one in the same way.
+            for fn in everything:
+                if exists(join(tmpdir, fn)):
+                    assert rules.selects(join(tmpdir, fn), [tmpdir],
+                                         def_ignores) == (fn in found), fn
+            return found
+
+        everything = ['a.py', 'node_modules/x.py', 'sub/gen_1.py', 'sub/ok.py',
+                      'sub/script']
+        assert files() == everything
+        assert files(threads=3) == everything
+        assert files(patterns=['node_modules/']) == [
+            'a.py', 'sub/gen_1.py', 'sub/ok.py', 'sub/script']
+        assert files(patterns=['node_modules/'], gitignore=True) == [
+            'a.py', 'sub/ok.py', 'sub/script']
+
+        # Without a repository, the directories are walked.
+        assert files(git=True) == everything
+        call(['git', 'init', '-q', tmpdir])
+        call(['git', 'add', '-f', 'a.py', 'sub/gen_1.py'], cwd=tmpdir)
+        with open(join(tmpdir, '.gitignore'), 'w') as f:
+            f.write('node_modules\n')
+        os.remove(join(tmpdir, 'a.py'))
+        assert files(git=True) == ['sub/gen_1.py', 'sub/ok.py', 'sub/script']
+
+        out, _ = run_sfood('sfood', '--git-files', '--exclude=/sub/script', tmpdir)
+        assert sorted(set(eval(x)[0][1] for x in out.splitlines())) == [
+            'gen_1.py', 'ok.py']
+    finally:
+        shutil.rmtree(tmpdir)
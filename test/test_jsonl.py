@@ -0,0 +1,37 @@
+"""
+Test the JSON Lines format of the dependencies.
+"""
+
+from __future__ import print_function
+
+import json
+from os.path import *
+from testsupport import *
+
+from snakefood.depends import read_depends, InvalidDepends
+
+
+def test_jsonl():
+    "Test the records output by sfood and reading them back."
+    for path in join(data, 'project'), join(data, 'simple'):
+        out, _ = run_sfood('sfood', '--format=jsonl', path)
+        expected, _ = run_sfood('sfood', path)
+        assert (sorted(read_depends(out.splitlines(True))) ==
+                list(read_depends(expected.splitlines(True))))
+
+    records = [json.loads(x) for x in out.splitlines()]
+    notfound = [r for r in records if r['from'][1] == 'notfound.py']
+    assert {'from': notfound[0]['from'], 'to': None, 'kind': 'import',
+            'line': 4, 'unresolved': 'alien_module_yeah'} in notfound
+    stdlib = [r for r in records if r['from'][1] == 'stdlib.py' and
+              r['to'] and r['to'][1] == 'os.py']
+    assert stdlib[0]['imports'] == [
+        {'line': 10, 'kind': 'import', 'module': 'os'}]
+
+    lines = ['{"from": ["/a", "b.py"], "to": null}\n', '{"from": null}\n']
+    assert list(read_depends(lines)) == [(('/a', 'b.py'), (None, None))]
+    try:
+        list(read_depends(lines, True, 'deps'))
+        assert False
+    except InvalidDepends, e:
+        assert str(e).startswith('deps:2: ')
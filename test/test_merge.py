@@ -0,0 +1,47 @@
+"""
+Test the sharding of sfood and the merge of the outputs of the shards.
+"""
+
+from __future__ import print_function
+
+import shutil, tempfile
+from os.path import *
+from testsupport import *
+
+from snakefood.merge import merge_depends, sorted_depends
+
+
+def test_merge_depends():
+    "Test merging sorted dependencies."
+    a = [((None, 'a'), (None, None)), ((None, 'b'), (None, 'c'))]
+    b = [((None, 'a'), (None, 'b')), ((None, 'b'), (None, 'c'))]
+    assert list(merge_depends([a, b])) == [
+        ((None, 'a'), (None, None)), ((None, 'a'), (None, 'b')),
+        ((None, 'b'), (None, 'c'))]
+
+    lines = ['%r\n' % (dep,) for dep in reversed(a)]
+    try:
+        list(sorted_depends(lines))
+        assert False
+    except ValueError:
+        pass
+
+
+def test_shards():
+    "Test that the merged shards are identical to a single run."
+    tmpdir = realpath(tempfile.mkdtemp(prefix='sfood-merge-'))
+    try:
+        for args in ([join(data, 'project')],
+                     ['--follow', join(data, 'project'), join(data, 'roots')]):
+            expected, _ = run_sfood('sfood', *args)
+            shards = []
+            for k in 1, 2, 3:
+                out, _ = run_sfood('sfood', '--shard', '%d/3' % k, *args)
+                assert out != expected
+                shards.append(join(tmpdir, 'shard%d' % k))
+                with open(shards[-1], 'w') as f:
+                    f.write(out)
+            out, _ = run_sfood('sfood-merge', *shards)
+            assert out == expected
+    finally:
+        shutil.rmtree(tmpdir)
@@ -0,0 +1,108 @@
+"""
+Test the bounded cache of the module lookups.
+"""
+
+from __future__ import print_function
+
+import sys, os, shutil, tempfile
+from os.path import *
+from testsupport import *
+
+from snakefood import find
+from snakefood.util import LRUCache
+from snakefood.find import resolve_module, resolve_cache, clear_caches
+
+
+def test_lru():
+    "Test the eviction order and the counters of the LRU cache."
+    cache = LRUCache(2)
+    cache['a'] = 1
+    cache['b'] = 2
+    assert cache['a'] == 1      # 'a' is now the most recently used.
+    cache['c'] = 3
+    assert len(cache) == 2
+    try:
+        cache['b']
+        assert False
+    except KeyError:
+        pass
+    assert (cache['a'], cache['c']) == (1, 3)
+    assert (cache.hits, cache.misses) == (3, 1)
+
+    # Setting an entry again refreshes it.
+    cache['a'] = 4
+    cache['d'] = 5
+    assert sorted(cache.data) == ['a', 'd']
+    cache.resize(1)
+    assert list(cache.data) == ['d']
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_resolve_cache():
+    "Test that the lookups are cached by the right keys."
+    tmpdir = realpath(tempfile.mkdtemp(prefix='sfood-resolve-'))
+    oldpath = sys.path[:]
+    try:
+        for fn in ('lib/mod.py', 'pkg/__init__.py', 'pkg/mod.py', 'other/x.py'):
+            fn = join(tmpdir, fn)
+            if not exists(dirname(fn)):
+                os.makedirs(dirname(fn))
+            open(fn, 'w').close()
+        sys.path.insert(0, join(tmpdir, 'lib'))
+        clear_caches()
+        libmod = join(tmpdir, 'lib', 'mod.py')
+        pkgdir, otherdir = join(tmpdir, 'pkg'), join(tmpdir, 'other')
+        pkgmod = join(pkgdir, 'mod.py')
+
+        # Without absolute_import, the lookup from a package finds the module
+        # of the package, and elsewhere the one on the path.
+        assert resolve_module('mod', pkgdir, 0, False) == pkgmod
+        assert resolve_module('mod', otherdir, 0, False) == libmod
+
+        # Absolute lookups do not depend on the importing directory, and are
+        # shared with the implicit-relative lookups that fail, above.
+        misses = resolve_cache.misses
+        assert resolve_module('mod', pkgdir, 0, True) == libmod
+        assert resolve_module('mod', otherdir, 0, True) == libmod
+        assert resolve_cache.misses == misses
+        assert (None, 0, 'mod', True) in resolve_cache.data
+        assert (pkgdir, 0, 'mod', True) not in resolve_cache.data
+
+        # Relative lookups depend on it.
+        assert resolve_module('mod', pkgdir, 1, True) == pkgmod
+        assert resolve_module('mod', otherdir, 1, True) is None
+
+        # The cached results are returned again.
+        hits = resolve_cache.hits
+        assert resolve_module('mod', pkgdir, 0, False) == pkgmod
+        assert resolve_module('mod', otherdir, 1, True) is None
+        assert resolve_cache.hits == hits + 2
+    finally:
+        sys.path[:] = oldpath
+        clear_caches()
+        shutil.rmtree(tmpdir)
+
+
+def test_resolve_shared():
+    "Test that the absolute lookups of implicit-relative imports are shared."
+    tmpdir = realpath(tempfile.mkdtemp(prefix='sfood-resolve-'))
+    calls = []
+    def find_dotted(names, parentdir=None):
+        calls.append((names, parentdir))
+        return old_find_dotted(names, parentdir)
+    old_find_dotted = find.find_dotted
+    find.find_dotted = find_dotted
+    try:
+        clear_caches()
+        dirs = [join(tmpdir, x) for x in 'abc']
+        for dn in dirs:
+            os.makedirs(dn)
+            assert resolve_module('os', dn, 0, False) == resolve_module(
+                'os', None, 0, True)
+        assert calls.count((['os'], None)) == 1
+        assert len(resolve_cache) == 4
+    finally:
+        find.find_dotted = old_find_dotted
+        clear_caches()
+        shutil.rmtree(tmpdir)
@@ -4,6 +4,7 @@ Test roots computation.
 
 from __future__ import print_function
 
+import os
 from os.path import *
 from testsupport import *
 
@@ -14,3 +15,16 @@ def test_roots():
         print('Testing roots for: %s' % dn)
         compare_expect(join(dn, '.expect'), None,
                        'sfood', '--print-roots', dn, filterdir=(data, 'ROOT'))
+
+
+def test_root_index():
+    "Test that the root index agrees with searching the filesystem."
+    from snakefood.util import def_ignores
+    from snakefood.roots import RootIndex, search_package_root
+
+    index = RootIndex(def_ignores)
+    for dn in find_dirs(realpath(data)):
+        for fn in [dn] + [join(dn, x) for x in os.listdir(dn)]:
+            expected = search_package_root(fn, def_ignores)
+            assert index.find_package_root(fn) == expected
+            assert index.find_package_root(fn) == expected
@@ -0,0 +1,53 @@
+"""
+Test the dependency server and its client.
+"""
+
+from __future__ import print_function
+
+import os, time, shutil, tempfile
+from os.path import *
+from subprocess import Popen, PIPE
+from testsupport import *
+from testsupport import bindir
+
+
+def test_server():
+    "Test queries to a server on the project files."
+    tmpdir = tempfile.mkdtemp(prefix='sfood-server-')
+    sockfn = join(tmpdir, 'sock')
+    projdir = realpath(join(data, 'project'))
+    p = Popen([join(bindir, 'sfood-server'), '--socket', sockfn, projdir],
+              stderr=PIPE)
+    try:
+        for _ in range(100):
+            if exists(sockfn):
+                break
+            time.sleep(0.1)
+
+        def client(command, *paths):
+            out, _ = run_sfood('sfood-server', '--socket', sockfn,
+                               '--client', command, *paths)
+            return out.splitlines()
+
+        assert client('deps', join(projdir, 'foo_import.py')) == [
+            join(projdir, 'bar.py'),
+            join(projdir, 'bli.py'),
+            join(projdir, 'sub1', '__init__.py'),
+            join(projdir, 'sub1', 'test.py'),
+            join(projdir, 'sub2', '__init__.py')]
+        assert client('rdeps', join(projdir, 'bli.py')) == [
+            join(projdir, 'foo_import.py')]
+        assert client('root', join(projdir, 'sub1', 'test.py')) == [
+            '%s project/sub1/test.py' % dirname(projdir)]
+
+        unusedfn = realpath(join(data, 'simple', 'unused.py'))
+        unused = client('unused', unusedfn)
+        assert "%s:4:  Unused import 'sys'" % unusedfn in unused
+
+        client('shutdown', projdir)
+        p.wait()
+        assert not exists(sockfn)
+    finally:
+        if p.returncode is None:
+            p.kill()
+        shutil.rmtree(tmpdir)
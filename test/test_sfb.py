@@ -0,0 +1,57 @@
+"""
+Test the sfb binary format of the dependencies.
+"""
+
+from __future__ import print_function
+
+import shutil, tempfile
+from os.path import *
+from cStringIO import StringIO
+from testsupport import *
+
+from snakefood.depends import read_depends, output_depends, InvalidDepends
+from snakefood.depends import TRUNCATED
+
+
+depdict = {('/a', 'b.py'): set([(None, None), ('/a', 'c.py'), ('/d', 'e.py')]),
+           ('/a', 'c.py'): set([(None, None), ('/a', 'b.py'), TRUNCATED]),
+           ('/d', 'f.py'): set([(None, None)])}
+
+
+def test_sfb():
+    "Test that the sfb format and the compressed files read like the text."
+    text = StringIO()
+    output_depends(depdict, text)
+    expected = list(read_depends(StringIO(text.getvalue())))
+    for format, compression in (('sfb', None), ('sfb', 'gzip'),
+                                ('text', 'gzip')):
+        out = StringIO()
+        output_depends(depdict, out, format, compression)
+        data = out.getvalue()
+        assert list(read_depends(StringIO(data))) == expected
+        if format == 'sfb':
+            assert len(data) < len(text.getvalue())
+
+    out = StringIO()
+    output_depends(depdict, out, 'sfb')
+    for data in (out.getvalue()[:-1], out.getvalue() + 'x',
+                 '\x1f\x8b' + out.getvalue()):
+        try:
+            list(read_depends(StringIO(data), name='deps'))
+            assert False
+        except InvalidDepends, e:
+            assert str(e).startswith('deps: ')
+
+
+def test_sfood_format():
+    "Test the output of sfood in the sfb format."
+    tmpdir = realpath(tempfile.mkdtemp(prefix='sfood-sfb-'))
+    try:
+        fn = join(tmpdir, 'deps.sfb.gz')
+        run_sfood('sfood', '--format=sfb', '--compress=gzip', '-o', fn,
+                  join(data, 'project'))
+        expected, _ = run_sfood('sfood', join(data, 'project'))
+        out, _ = run_sfood('sfood-merge', fn)
+        assert out == expected
+    finally:
+        shutil.rmtree(tmpdir)
@@ -0,0 +1,45 @@
+"""
+Test incremental runs with a state file.
+"""
+
+from __future__ import print_function
+
+import os, stat, shutil, tempfile
+from os.path import *
+from testsupport import *
+
+
+def test_state():
+    "Test that incremental runs produce the same output as cold runs."
+    tmpdir = tempfile.mkdtemp(prefix='sfood-state-')
+    try:
+        projdir = join(tmpdir, 'project')
+        shutil.copytree(join(data, 'project'), projdir)
+        statefn = join(tmpdir, 'state')
+
+        def check():
+            cold, _ = run_sfood('sfood', projdir)
+            warm, _ = run_sfood('sfood', '--state', statefn, projdir)
+            assert cold and warm == cold
+
+        check()
+        check()
+
+        # The state file gets the permissions of a regular file.
+        umask = os.umask(0)
+        os.umask(umask)
+        assert stat.S_IMODE(os.stat(statefn).st_mode) == 0666 & ~umask
+
+        # Modify a file.
+        with open(join(projdir, 'sub1', 'test.py'), 'a') as f:
+            f.write('import project.bli\n')
+        check()
+
+        # Add and remove modules that change how imports resolve.
+        with open(join(projdir, 'alien.py'), 'w') as f:
+            f.write('\n')
+        check()
+        os.remove(join(projdir, 'bli.py'))
+        check()
+    finally:
+        shutil.rmtree(tmpdir)
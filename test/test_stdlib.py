@@ -0,0 +1,71 @@
+"""
+Test the tables of the standard library of target Python versions.
+"""
+
+from __future__ import print_function
+
+import shutil, tempfile
+from os.path import *
+from testsupport import *
+
+from snakefood.stdlib import load_table, versions
+
+
+def test_tables():
+    "Test the lookups in the tables."
+    for version in versions:
+        table = load_table(version, '/lib/python')
+        assert table.version == version
+        assert 'os' in table and 'os.path' in table
+        assert table.find_module('os') == '/lib/python/os.py'
+        assert table.find_builtin('sys') == '/lib/python/sys'
+        assert table.find_module('nosuchmodule') is None
+        assert table.relfile('/lib/python/json') == ('/lib/python', 'json')
+        assert table.relfile('/lib/python/json/decoder.py') == (
+            '/lib/python', 'json/decoder.py')
+        assert table.relfile('/lib/python/site-packages/foo.py') is None
+        assert table.package_name('/lib/python/json') == 'json'
+        assert table.package_name('/lib/python/site-packages') is None
+
+    table = load_table('2.7', '/lib/python')
+    assert table.find_module('StringIO') == '/lib/python/StringIO.py'
+    assert table.relfile(table.find_module('Tkinter')) == (
+        '/lib/python/lib-tk', 'Tkinter.py')
+
+    table = load_table('3.11', '/lib/python')
+    assert 'StringIO' not in table
+    assert table.find_module('urllib.request') == '/lib/python/urllib/request.py'
+    root, fn = table.relfile(table.find_module('_ssl'))
+    assert root == '/lib/python/lib-dynload' and fn.startswith('_ssl.')
+
+
+def test_target_python():
+    "Test resolving the standard library from the tables."
+    fn = join(data, 'simple/stdlib.py')
+    compare_expect(fn.replace('.py', '.expect'), None,
+                   'sfood', '--target-python=2.7', fn, filterdir=(data, 'ROOT'))
+
+    out, err = run_sfood('sfood', '--target-python=3.11', fn)
+    assert "Could not import module 'StringIO'" in err
+    assert "'ctypes/util.py')" in out
+    assert "'os.py')" in out
+
+
+def test_target_shadowing():
+    "Test that the modules of the input roots take precedence over the table."
+    tmpdir = realpath(tempfile.mkdtemp(prefix='sfood-stdlib-'))
+    try:
+        make_tree(tmpdir, [('main.py', 'from __future__ import absolute_import\n'
+                            'import test.helpers\nimport types\n'),
+                           ('test/__init__.py', ''),
+                           ('test/helpers.py', ''),
+                           ('types.py', '')])
+        fn = join(tmpdir, 'main.py')
+        expected, _ = run_sfood('sfood', fn)
+        out, err = run_sfood('sfood', '--target-python=2.7', fn)
+        assert "(%r, 'test/helpers.py'))" % tmpdir in out
+        assert "(%r, 'types.py'))" % tmpdir in out
+        assert out == expected
+        assert 'Could not import' not in err
+    finally:
+        shutil.rmtree(tmpdir)
@@ -0,0 +1,51 @@
+"""
+Test streaming the dependencies and sorting them within a memory budget.
+"""
+
+from __future__ import print_function
+
+import sys
+from os.path import *
+from testsupport import *
+
+from snakefood import stream
+from snakefood.stream import ExternalSort
+
+
+def test_stream():
+    "Test that the streamed dependencies are those of the sorted output."
+    for path in join(data, 'project'), join(data, 'simple'):
+        expected, _ = run_sfood('sfood', path)
+        out, _ = run_sfood('sfood', '--stream', path)
+        assert sorted(out.splitlines()) == sorted(expected.splitlines())
+        out, log = run_sfood('sfood', '-v', '--sort-budget', '0.001', path)
+        assert out == expected
+    assert 'sorted runs' in log
+
+
+def test_external_sort():
+    "Test the external merge sort, with more runs than are merged at once."
+    deps = [(('/r', 'm%03d.py' % (i * 37 % 100)), ('/r', 'n%d.py' % (i % 7)))
+            for i in range(300)]
+    oldmax = stream.MAX_RUNS
+    stream.MAX_RUNS = 3
+    try:
+        sorter = ExternalSort(5000)
+        for dep in deps:
+            sorter.add(dep)
+        assert 1 <= len(sorter.runs) < 3
+        assert list(sorter) == sorted(set(deps))
+        assert not sorter.runs
+    finally:
+        stream.MAX_RUNS = oldmax
+
+
+def test_sort_budget():
+    "Test that the budget accounts for the objects of the dependencies."
+    dep = (('/root', 'pkg/module.py'), ('/root', 'pkg/other.py'))
+    size = sys.getsizeof(dep) + sys.getsizeof([None]) - sys.getsizeof([])
+    for node in dep:
+        size += sys.getsizeof(node) + sum(sys.getsizeof(s) for s in node)
+    sorter = ExternalSort(10 ** 6)
+    sorter.add(dep)
+    assert sorter.size >= size > len(repr(dep)) * 2
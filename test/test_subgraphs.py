@@ -0,0 +1,82 @@
+"""
+Test the cache of the dependencies of the external code reached with --follow.
+"""
+
+from __future__ import print_function
+
+import re, shutil, tempfile
+from os.path import *
+from testsupport import *
+
+
+def test_subgraphs():
+    "Test that the cached subgraphs give the same results, until they change."
+    tmpdir = realpath(tempfile.mkdtemp(prefix='sfood-subgraphs-'))
+    try:
+        make_tree(tmpdir, [('src/app.py', 'import extlib.mod\n'),
+                           ('lib/extlib/__init__.py', ''),
+                           ('lib/extlib/mod.py', 'from extlib import util\n'
+                            'from extlib.sub import m\n'),
+                           ('lib/extlib/util.py', 'import os, helper\n'),
+                           ('lib/extlib/sub/__init__.py', ''),
+                           ('lib/extlib/sub/m.py', 'from .. import helper\n'
+                            'import shadowed\n'),
+                           ('lib/shadowed.py', ''),
+                           ('first/README', '')])
+        with pythonpath(join(tmpdir, 'first'), join(tmpdir, 'lib')):
+            app = join(tmpdir, 'src', 'app.py')
+            args = ('sfood', '-v', '--follow', '--cache-dir',
+                    join(tmpdir, 'cache'), '--cache-subgraphs', app)
+            expected, _ = run_sfood('sfood', '--follow', app)
+            out, log = run_sfood(*args)
+            assert out == expected
+            assert 'reused the results of 0 files' in log
+            out, log = run_sfood(*args)
+            assert out == expected
+            assert 'reused the results of 0 files' not in log
+            # The units are not counted as parsed files.
+            assert 'Parse cache: 1 hits, 0 misses.' in log
+
+            # The reused results are saved in the state file as well, so that
+            # the next run with the state file alone processes as few files as
+            # when the state file was saved without the subgraphs, i.e. only
+            # the builtin modules and the packages, which have no contents.
+            def state_run(statefn, *extra):
+                out, log = run_sfood('sfood', '-v', '--follow', '--state',
+                                     statefn, *(extra + (app,)))
+                assert out == expected
+                return re.search(r'State: .* processed (\d+) files',
+                                 log).group(1)
+            state_run(join(tmpdir, 'state1'))
+            nwarm = state_run(join(tmpdir, 'state1'))
+            state_run(join(tmpdir, 'state2'), '--cache-dir',
+                      join(tmpdir, 'cache'), '--cache-subgraphs')
+            assert state_run(join(tmpdir, 'state2')) == nwarm
+
+            # Changing the files of the external root invalidates its subgraph.
+            with open(join(tmpdir, 'lib/extlib/util.py'), 'w') as f:
+                f.write('import os, re, helper\n')
+            expected, _ = run_sfood('sfood', '--follow', app)
+            out, log = run_sfood(*args)
+            assert "'re.py')" in out
+            assert out == expected
+
+            # So does adding a module that an import now resolves to, in the
+            # same package or in a parent package.
+            with open(join(tmpdir, 'lib/extlib/helper.py'), 'w') as f:
+                f.write('\n')
+            expected, _ = run_sfood('sfood', '--follow', app)
+            out, log = run_sfood(*args)
+            assert "'extlib/sub/m.py'), (%r, 'extlib/helper.py'))" % join(
+                tmpdir, 'lib') in out
+            assert out == expected
+
+            # Or earlier on the search path.
+            with open(join(tmpdir, 'first/shadowed.py'), 'w') as f:
+                f.write('\n')
+            expected, _ = run_sfood('sfood', '--follow', app)
+            out, log = run_sfood(*args)
+            assert "(%r, 'shadowed.py'))" % join(tmpdir, 'first') in out
+            assert out == expected
+    finally:
+        shutil.rmtree(tmpdir)
@@ -27,3 +27,45 @@ def test_various():
         print('Testing for: %s' % fn)
         compare_expect(fn.replace('.py', '.expect'), None,
                        'sfood', fn, filterdir=(data, 'ROOT'))
+
+def test_various_fast():
+    "Test the same files with the tokenizer-based parser."
+
+    for fn in _files:
+        fn = join(data, fn)
+        print('Testing fast parser for: %s' % fn)
+        compare_expect(fn.replace('.py', '.expect'), None,
+                       'sfood', '--parser=fast', fn, filterdir=(data, 'ROOT'))
+
+def test_jobs():
+    "Test that processing files in parallel produces the same output."
+
+    for args in ([join(data, 'project')],
+                 ['--follow', join(data, 'double/double.py')]):
+        serial, _ = run_sfood('sfood', *args)
+        parallel, _ = run_sfood('sfood', '--jobs=3', *args)
+        assert serial and serial == parallel
+
+def test_various_index():
+    "Test the same files with the directory index resolver."
+
+    for fn in _files:
+        fn = join(data, fn)
+        print('Testing directory index for: %s' % fn)
+        compare_expect(fn.replace('.py', '.expect'), None,
+                       'sfood', '--resolver=index', fn, filterdir=(data, 'ROOT'))
+
+def test_scope():
+    "Test that --internal and --external only drop the edges out of scope."
+
+    def edges(*args):
+        out, _ = run_sfood('sfood', *args)
+        return set(x for x in map(eval, out.splitlines()) if x[1][0] is not None)
+
+    for path in (join(data, 'project'), join(data, 'roots')):
+        deps = edges(path)
+        roots = set(from_[0] for from_, _ in deps)
+        assert edges('--internal', path) == set(
+            (from_, to_) for from_, to_ in deps if to_[0] in roots)
+        assert edges('--external', path) == set(
+            (from_, to_) for from_, to_ in deps if to_[0] not in roots)
@@ -0,0 +1,134 @@
+"""
+Test watching for changes.
+"""
+
+from __future__ import print_function
+
+import os, time, shutil, tempfile, signal
+from os.path import *
+from subprocess import Popen, PIPE
+from testsupport import *
+from testsupport import bindir
+
+
+def read_edges(outfn):
+    "Return the set of edges of the output of --watch in file 'outfn'."
+    edges = set()
+    if not exists(outfn):
+        return edges
+    for line in open(outfn):
+        if not line.endswith('\n'):
+            break # Not completely written yet.
+        if line[0] == '+':
+            edges.add(line[1:])
+        elif line[0] == '-':
+            edges.discard(line[1:])
+        else:
+            edges.add(line)
+    return edges
+
+
+def wait_for(predicate, timeout=30):
+    "Wait until 'predicate' returns true, and return its last value."
+    deadline = time.time() + timeout
+    while not predicate() and time.time() < deadline:
+        time.sleep(0.05)
+    return predicate()
+
+
+def test_watch():
+    "Test that the output edge deltas bring the graph up to date."
+    tmpdir = tempfile.mkdtemp(prefix='sfood-watch-')
+    try:
+        projdir = join(tmpdir, 'project')
+        shutil.copytree(join(data, 'project'), projdir)
+        outfn = join(tmpdir, 'out')
+
+        cold, _ = run_sfood('sfood', projdir)
+        p = Popen([join(bindir, 'sfood'), '--watch', '--poll=0.1',
+                   '--output', outfn, projdir], stderr=PIPE)
+        try:
+            # The watcher is started before the initial output.
+            assert wait_for(lambda: read_edges(outfn) == set(cold.splitlines(True)))
+
+            # Modify, add and remove files.
+            with open(join(projdir, 'sub1', 'test.py'), 'a') as f:
+                f.write('import project.bli\n')
+            with open(join(projdir, 'alien.py'), 'w') as f:
+                f.write('import os\n')
+            os.remove(join(projdir, 'bli.py'))
+
+            expected, _ = run_sfood('sfood', projdir)
+            expected = set(expected.splitlines(True))
+            assert expected != set(cold.splitlines(True))
+            assert wait_for(lambda: read_edges(outfn) == expected)
+        finally:
+            os.kill(p.pid, signal.SIGINT)
+            p.communicate()
+    finally:
+        shutil.rmtree(tmpdir)
+
+
+def test_watch_state():
+    "Test that the files reused from a state file are processed on changes."
+    tmpdir = realpath(tempfile.mkdtemp(prefix='sfood-watch-'))
+    try:
+        srcdir = join(tmpdir, 'src')
+        os.mkdir(srcdir)
+        with open(join(srcdir, 'app.py'), 'w') as f:
+            f.write('import helper\n')
+        outfn = join(tmpdir, 'out')
+        statefn = join(tmpdir, 'state')
+        cold, _ = run_sfood('sfood', '--state', statefn, srcdir)
+
+        p = Popen([join(bindir, 'sfood'), '--watch', '--poll=0.1', '--state',
+                   statefn, '--output', outfn, srcdir], stderr=PIPE)
+        try:
+            assert wait_for(lambda: read_edges(outfn) == set(cold.splitlines(True)))
+
+            # Adding the imported module changes the dependencies of app.py.
+            with open(join(srcdir, 'helper.py'), 'w') as f:
+                f.write('')
+            expected, _ = run_sfood('sfood', srcdir)
+            expected = set(expected.splitlines(True))
+            assert [x for x in expected if "'app.py'), (" in x and 'helper' in x]
+            assert wait_for(lambda: read_edges(outfn) == expected)
+        finally:
+            os.kill(p.pid, signal.SIGINT)
+            p.communicate()
+    finally:
+        shutil.rmtree(tmpdir)
+
+
+def test_watch_exclude():
+    "Test that the changed files are selected like the input files."
+    tmpdir = realpath(tempfile.mkdtemp(prefix='sfood-watch-'))
+    try:
+        projdir = join(tmpdir, 'proj')
+        make_tree(projdir, [('a.py', ''), ('gen/b.py', 'import a\n')])
+        outfn = join(tmpdir, 'out')
+        cold, _ = run_sfood('sfood', '--exclude', 'gen/', projdir)
+
+        p = Popen([join(bindir, 'sfood'), '--watch', '--poll=0.1', '--exclude',
+                   'gen/', '--output', outfn, projdir], stderr=PIPE)
+        try:
+            assert wait_for(lambda: read_edges(outfn) == set(cold.splitlines(True)))
+
+            # Change and add excluded files, then an input file, which is
+            # seen after them.
+            with open(join(projdir, 'gen', 'b.py'), 'a') as f:
+                f.write('import os\n')
+            with open(join(projdir, 'gen', 'c.py'), 'w') as f:
+                f.write('import a\n')
+            with open(join(projdir, 'd.py'), 'w') as f:
+                f.write('import a\n')
+            expected, _ = run_sfood('sfood', '--exclude', 'gen/', projdir)
+            expected = set(expected.splitlines(True))
+            assert [x for x in expected if "'d.py'), (" in x]
+            assert wait_for(lambda: read_edges(outfn) == expected)
+            assert not [x for x in read_edges(outfn) if 'gen' in x]
+        finally:
+            os.kill(p.pid, signal.SIGINT)
+            p.communicate()
+    finally:
+        shutil.rmtree(tmpdir)
@@ -7,9 +7,11 @@ from __future__ import print_function
 import sys, os, re
 from os.path import *
 from subprocess import *
+from contextlib import contextmanager
 
 
-__all__ = ('data', 'find_dirs', 'run_sfood', 'compare_expect')
+__all__ = ('data', 'find_dirs', 'make_tree', 'pythonpath', 'run_sfood',
+           'compare_expect')
 
 # Root of the repo.
 _root = realpath(join(dirname(__file__), '..'))
@@ -29,18 +31,47 @@ def find_dirs(startdir):
     return rdirs
 
 
+def make_tree(rootdir, files):
+    """Create the files of the iterable of (filename, contents) pairs 'files',
+    with filenames relative to directory 'rootdir'."""
+    for fn, contents in files:
+        fn = join(rootdir, fn)
+        if not exists(dirname(fn)):
+            os.makedirs(dirname(fn))
+        with open(fn, 'w') as f:
+            f.write(contents)
+
+
+@contextmanager
+def pythonpath(*dirs):
+    "Append the given directories to $PYTHONPATH, for the programs run within."
+    oldpath = os.environ.get('PYTHONPATH')
+    os.environ['PYTHONPATH'] = os.pathsep.join(filter(None, (oldpath,) + dirs))
+    try:
+        yield
+    finally:
+        if oldpath is None:
+            del os.environ['PYTHONPATH']
+        else:
+            os.environ['PYTHONPATH'] = oldpath
+
+
 def run_sfood(*args, **kw):
     """
     Run sfood with the given args, and capture and return output.
     If 'filterdir' is provided, remove those strings are replaced in the output.
+    If 'cwd' is provided, run from that directory, and if 'input' is, feed it
+    to the standard input.
     """
     filterdir = kw.get('filterdir', None)
+    input = kw.get('input', None)
     cmd = [join(bindir, args[0])] + list(args[1:])
     sys.stderr.write('Running cmd:\n')
     sys.stderr.write(' '.join(cmd))
     sys.stderr.write('\n\n')
-    p = Popen(cmd, shell=False, stdout=PIPE, stderr=PIPE)
-    out, log = p.communicate()
+    p = Popen(cmd, shell=False, stdout=PIPE, stderr=PIPE,
+              stdin=PIPE if input is not None else None, cwd=kw.get('cwd'))
+    out, log = p.communicate(input)
     if not isinstance(out, str):
         out = out.decode('utf8')
     if not isinstance(log, str):